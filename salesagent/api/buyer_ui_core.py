@@ -0,0 +1,63 @@
+"""Core buyer UI router functionality."""
+
+import logging
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
+
+from flask import render_template, make_response
+
+from src.orchestrator.admission import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+FILTER_FIELDS = ("include_tenant_ids", "exclude_tenant_ids", "include_agent_ids")
+
+
+class BuyerUICore:
+    """Core functionality for the buyer UI router."""
+
+    @staticmethod
+    def get_filters(values) -> Dict[str, Optional[List[str]]]:
+        """Tenant and agent filters from form or query values, None where a list is empty."""
+        return {name: values.getlist(name) or None for name in FILTER_FIELDS}
+
+    @staticmethod
+    def busy_response(error: AdmissionRejected):
+        """503 results grid asking the buyer to retry once the orchestrator has capacity."""
+        response = make_response(render_template(
+            "ui/buyer/_results_grid.html", products=[],
+            error=f"Search is busy right now, please try again in {error.retry_after_seconds} seconds"
+        ), 503)
+        response.headers["Retry-After"] = str(error.retry_after_seconds)
+        return response
+
+    @staticmethod
+    def log_products(products: List[Dict[str, Any]]):
+        """Log the first products being passed to the template."""
+        logger.info(f"UI Router: Passing {len(products)} products to template")
+        for i, product in enumerate(products[:3]):
+            logger.info(f"UI Product {i+1}: {product.get('name', 'NO_NAME')} from {product.get('publisher_name', 'NO_PUBLISHER')}")
+            logger.info(f"  - Price: ${product.get('price_cpm', 0)} CPM")
+            logger.info(f"  - Delivery: {product.get('delivery_type', 'NO_TYPE')}")
+
+    @staticmethod
+    def stream_url(prompt: str, args) -> str:
+        """URL of the orchestrator's SSE endpoint, which renders the cards and final grid (format=html)."""
+        params = {"prompt": prompt, "max_results": args.get("max_results", 50, type=int), "format": "html"}
+        params.update({name: values for name, values in BuyerUICore.get_filters(args).items() if values})
+        return f"/buyer/orchestrate/stream?{urlencode(params, doseq=True)}"
+
+    @staticmethod
+    def product_from_form(form) -> Dict[str, Any]:
+        """Selection entry for a product card's add-to-selection form."""
+        return {
+            'id': form.get("product_id"),
+            'name': form.get("product_name"),
+            'publisher_name': form.get("publisher_name"),
+            'publisher_tenant_id': form.get("publisher_tenant_id"),
+            'price_cpm': float(form.get("price_cpm", 0)),
+            'delivery_type': form.get("delivery_type"),
+            'formats': form.getlist("formats"),
+            'image_url': form.get("image_url"),
+            'rationale': form.get("rationale", "")
+        }
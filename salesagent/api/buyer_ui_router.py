@@ -1,14 +1,15 @@
 """Buyer UI router for product search and selection."""
 
 from flask import Blueprint, request, render_template, jsonify, make_response
-from typing import List, Optional
-
 import sys
 import os
 # Add the salesagent directory to the path so we can import from services
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.buyer_search_service import search_products
+from src.orchestrator.admission import AdmissionRejected
+from src.orchestrator.buyers import buyer_key
+from .buyer_ui_core import BuyerUICore
 from services.buyer_session import (
     get_or_create_session_id, add_to_selection, remove_from_selection,
     list_selection, get_selection_count, clear_selection
@@ -42,40 +43,37 @@ def search_products_htmx():
     prompt = request.form.get("prompt", "").strip()
     max_results = int(request.form.get("max_results", 50))
     
-    # Get filter parameters
-    include_tenant_ids = request.form.getlist("include_tenant_ids")
-    exclude_tenant_ids = request.form.getlist("exclude_tenant_ids")
-    include_agent_ids = request.form.getlist("include_agent_ids")
-    
-    # Convert empty lists to None
-    include_tenant_ids = include_tenant_ids if include_tenant_ids else None
-    exclude_tenant_ids = exclude_tenant_ids if exclude_tenant_ids else None
-    include_agent_ids = include_agent_ids if include_agent_ids else None
-    
     if not prompt:
         return render_template("ui/buyer/_results_grid.html", products=[], error="Please enter a search prompt")
     
     # Search for products
-    products = search_products(
-        prompt=prompt,
-        max_results=max_results,
-        include_tenant_ids=include_tenant_ids,
-        exclude_tenant_ids=exclude_tenant_ids,
-        include_agent_ids=include_agent_ids
-    )
-    
-    # Add logging to see what products are being passed to template
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info(f"UI Router: Passing {len(products)} products to template")
-    for i, product in enumerate(products[:3]):
-        logger.info(f"UI Product {i+1}: {product.get('name', 'NO_NAME')} from {product.get('publisher_name', 'NO_PUBLISHER')}")
-        logger.info(f"  - Price: ${product.get('price_cpm', 0)} CPM")
-        logger.info(f"  - Delivery: {product.get('delivery_type', 'NO_TYPE')}")
+    try:
+        products = search_products(
+            prompt=prompt,
+            max_results=max_results,
+            **BuyerUICore.get_filters(request.form),
+            # Fair scheduling key; never the session token itself, which shows up in stats and traces
+            buyer_id=buyer_key(request.cookies.get("buyer_session_id"), "session")
+            or buyer_key(request.remote_addr, "client")
+        )
+    except AdmissionRejected as e:
+        return BuyerUICore.busy_response(e)
     
+    BuyerUICore.log_products(products)
     return render_template("ui/buyer/_results_grid.html", products=products)
 
 
+@buyer_ui_bp.route("/search/stream", methods=["GET"])
+def search_products_stream_htmx():
+    """HTMX endpoint that starts a streaming search: cards appear as each publisher answers."""
+    prompt = request.args.get("prompt", "").strip()
+    if not prompt:
+        return render_template("ui/buyer/_results_grid.html", products=[], error="Please enter a search prompt")
+    
+    stream_url = BuyerUICore.stream_url(prompt, request.args)
+    return render_template("ui/buyer/_results_stream.html", stream_url=stream_url)
+
+
 @buyer_ui_bp.route("/selection/add", methods=["POST"])
 def add_to_selection_htmx():
     """HTMX endpoint to add product to selection."""
@@ -83,17 +81,7 @@ def add_to_selection_htmx():
     session_id = get_or_create_session_id(request, response)
     
     product_key = request.form.get("product_key")
-    product_data = {
-        'id': request.form.get("product_id"),
-        'name': request.form.get("product_name"),
-        'publisher_name': request.form.get("publisher_name"),
-        'publisher_tenant_id': request.form.get("publisher_tenant_id"),
-        'price_cpm': float(request.form.get("price_cpm", 0)),
-        'delivery_type': request.form.get("delivery_type"),
-        'formats': request.form.getlist("formats"),
-        'image_url': request.form.get("image_url"),
-        'rationale': request.form.get("rationale", "")
-    }
+    product_data = BuyerUICore.product_from_form(request.form)
     
     if add_to_selection(session_id, product_key, product_data):
         count = get_selection_count(session_id)
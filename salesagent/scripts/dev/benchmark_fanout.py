@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Fanout load benchmark against local stub agents
+
+Starts N stub agents in a child process (HTTP /select_products agents and MCP
+JSON-RPC agents, one port each) with configurable latency distributions, error
+rates and payload sizes, then drives OrchestratorService.orchestrate at a target
+request rate (open loop: requests start on schedule whether or not earlier ones
+finished) and writes throughput, p50/p95/p99 latency, CPU and peak RSS of the
+orchestrator process as JSON. With --measure-memory N it then runs N orchestrations
+one at a time under tracemalloc and reports the peak Python heap growth of each.
+
+The stub agents live in benchmark_stubs.py, the load driver in benchmark_load.py
+and the results file and baseline comparison in benchmark_report.py.
+
+Latency distributions (milliseconds):
+    fixed:50  uniform:10:100  exp:40  lognormal:40:0.5 (median, sigma)
+
+Usage:
+    python scripts/dev/benchmark_fanout.py --http-agents 8 --mcp-agents 4 \\
+        --latency lognormal:40:0.5 --error-rate 0.02 --rate 50 --duration 30 \\
+        --output results.json
+    python scripts/dev/benchmark_fanout.py ... --baseline previous.json --max-regression 0.10
+    python scripts/dev/benchmark_fanout.py --products 2000 --payload-bytes 2048 \
+        --max-response-products 200 --measure-memory 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from benchmark_load import apply_response_limits, drive, measure_fanout_memory, stub_agent_configs
+from benchmark_report import compare, results_document
+from benchmark_stubs import LatencySpec, StubAgentSpec, start_stub_agents
+
+
+def build_specs(args):
+    specs = []
+    for protocol, count in (("http", args.http_agents), ("mcp", args.mcp_agents)):
+        for i in range(count):
+            specs.append(StubAgentSpec(
+                agent_id=f"{protocol}_{i}",
+                protocol=protocol,
+                latency=str(LatencySpec.parse(args.latency)),
+                error_rate=args.error_rate,
+                products=args.products,
+                payload_bytes=args.payload_bytes,
+                seed=args.seed + len(specs)
+            ))
+    return specs
+
+
+def run(args):
+    specs = build_specs(args)
+    process, ports = start_stub_agents(specs)
+    limits = None
+    try:
+        from src.services.agent_management_service import agent_management_service
+        from src.services.orchestrator_service import OrchestratorService
+
+        # Agent failures are expected at non-zero error rates; keep them off the measured path
+        logging.getLogger().setLevel(args.log_level)
+        agents = stub_agent_configs(specs, ports)
+        agent_management_service.discover_active_agents = lambda *a, **kw: list(agents)
+        limits = apply_response_limits(args)
+        service = OrchestratorService()
+
+        async def benchmark():
+            results = await drive(
+                service, args.rate, args.duration, args.distinct_prompts, args.buyers,
+                args.max_results, args.timeout_seconds
+            )
+            if args.measure_memory:
+                results["fanout_peak_bytes"] = await measure_fanout_memory(
+                    service, args.measure_memory, args.max_results, args.timeout_seconds
+                )
+            return results
+
+        results = asyncio.run(benchmark())
+    finally:
+        process.kill()
+        process.join(5)
+
+    return results_document(args, specs, limits, results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark orchestrator fanout against local stub agents")
+    parser.add_argument("--http-agents", type=int, default=8)
+    parser.add_argument("--mcp-agents", type=int, default=4)
+    parser.add_argument("--latency", default="lognormal:40:0.5", help="Stub latency distribution in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub responses that fail")
+    parser.add_argument("--products", type=int, default=10, help="Products per stub response")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="Description padding per product")
+    parser.add_argument("--rate", type=float, default=20.0, help="Orchestrations started per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to keep issuing requests")
+    parser.add_argument("--distinct-prompts", type=int, default=0,
+                        help="Cycle through this many prompts (0 = every request distinct, no cache hits)")
+    parser.add_argument("--buyers", type=int, default=4, help="Buyer ids to spread requests across")
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--timeout-seconds", type=int, default=10)
+    parser.add_argument("--max-response-bytes", type=int,
+                        help="Byte cap on each agent response (default: ORCHESTRATOR_AGENT_MAX_RESPONSE_BYTES)")
+    parser.add_argument("--max-response-products", type=int,
+                        help="Products kept per agent response (default: ORCHESTRATOR_AGENT_MAX_PRODUCTS)")
+    parser.add_argument("--measure-memory", type=int, default=0, metavar="N",
+                        help="After the load run, measure peak heap growth of N sequential orchestrations")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--log-level", default="CRITICAL", help="Orchestrator log level during the run")
+    parser.add_argument("--output", help="Write results JSON here instead of stdout")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.10,
+                        help="Allowed fractional throughput drop / latency increase against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Fanout benchmark load driver - open-loop orchestrations against the stub agents
+"""
+
+import asyncio
+import resource
+import sys
+import tracemalloc
+
+from benchmark_report import _percentile, _round
+
+
+def stub_agent_configs(specs, ports):
+    """Discovery results pointing the fanout at the stub agents"""
+    from src.core.schemas.agent import AgentConfig
+
+    agents = []
+    for spec, port in zip(specs, ports):
+        tenant_id = f"bench_{spec.agent_id}"
+        agent = AgentConfig(
+            agent_id=spec.agent_id,
+            tenant_id=tenant_id,
+            name=spec.agent_id,
+            type="mcp" if spec.protocol == "mcp" else "external",
+            endpoint_url=f"http://127.0.0.1:{port}" + ("/" if spec.protocol == "mcp" else "")
+        )
+        agents.append((agent, tenant_id, tenant_id))
+    return agents
+
+def _cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss_bytes():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def drive(service, rate, duration, distinct_prompts, buyers, max_results, timeout_seconds):
+    """Issue orchestrations on a fixed schedule and time each from its scheduled start"""
+    from src.core.schemas.agent import AgentSelectRequest
+    from src.core.metrics import metrics_registry
+    from src.orchestrator.admission import AdmissionRejected
+
+    latencies = []
+    outcomes = {"ok": 0, "rejected": 0, "error": 0}
+    agent_statuses = {}
+    truncated_agents = {}
+    total = int(rate * duration)
+    loop = asyncio.get_running_loop()
+
+    async def one(i, scheduled):
+        request = AgentSelectRequest(
+            prompt=f"benchmark brief {i % distinct_prompts if distinct_prompts else i}",
+            max_results=max_results,
+            timeout_seconds=timeout_seconds
+        )
+        try:
+            response = await service.orchestrate(request, buyer_id=f"bench_buyer_{i % buyers}")
+        except AdmissionRejected:
+            outcomes["rejected"] += 1
+            return
+        except Exception:
+            outcomes["error"] += 1
+            return
+        latencies.append((loop.time() - scheduled) * 1000)
+        outcomes["ok"] += 1
+        for report in response.get("agent_reports", []):
+            status = getattr(report.get("status"), "value", str(report.get("status")))
+            agent_statuses[status] = agent_statuses.get(status, 0) + 1
+            if report.get("truncated"):
+                reason = report.get("truncation_reason")
+                truncated_agents[reason] = truncated_agents.get(reason, 0) + 1
+
+    cpu_start = _cpu_seconds()
+    started = loop.time()
+    tasks = []
+    for i in range(total):
+        scheduled = started + i / rate
+        await asyncio.sleep(max(scheduled - loop.time(), 0))
+        tasks.append(asyncio.ensure_future(one(i, scheduled)))
+    await asyncio.gather(*tasks)
+    wall_seconds = loop.time() - started
+    cpu_seconds = _cpu_seconds() - cpu_start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "outcomes": outcomes,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(outcomes["ok"] / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            "p50": _round(_percentile(latencies, 0.50)),
+            "p95": _round(_percentile(latencies, 0.95)),
+            "p99": _round(_percentile(latencies, 0.99)),
+            "max": _round(latencies[-1] if latencies else None),
+            "mean": _round(sum(latencies) / len(latencies) if latencies else None)
+        },
+        "cpu_seconds": round(cpu_seconds, 3),
+        "cpu_percent": round(100 * cpu_seconds / wall_seconds, 1) if wall_seconds else 0.0,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "agent_statuses": agent_statuses,
+        "truncated_agents": truncated_agents,
+        "histograms": metrics_registry.get_stats()
+    }
+
+
+async def measure_fanout_memory(service, count, max_results, timeout_seconds):
+    """Peak traced heap growth of single orchestrations run one at a time, in bytes"""
+    from src.core.schemas.agent import AgentSelectRequest
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(count):
+            request = AgentSelectRequest(
+                prompt=f"benchmark memory brief {i}", max_results=max_results, timeout_seconds=timeout_seconds
+            )
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            try:
+                await service.orchestrate(request, buyer_id="bench_memory")
+            except Exception:
+                continue
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    peaks.sort()
+    return {"runs": len(peaks), "p50": _percentile(peaks, 0.50), "max": peaks[-1] if peaks else None}
+
+
+def apply_response_limits(args):
+    """Override the orchestrator's default agent response caps from the command line"""
+    from src.orchestrator.fanout import fanout_orchestrator
+    from src.orchestrator.mcp_client import mcp_client
+    from src.orchestrator.response_stream import ResponseLimits
+
+    limits = fanout_orchestrator.response_limits
+    limits = ResponseLimits(
+        max_bytes=args.max_response_bytes or limits.max_bytes,
+        max_products=args.max_response_products or limits.max_products
+    )
+    fanout_orchestrator.response_limits = limits
+    mcp_client.response_limits = limits
+    return limits
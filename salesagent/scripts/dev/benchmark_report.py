@@ -0,0 +1,65 @@
+"""
+Fanout benchmark results - percentiles, the results file and comparison against a baseline
+"""
+
+import math
+import os
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime, UTC
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(int(math.ceil(q * len(sorted_values))) - 1, len(sorted_values) - 1)
+    return sorted_values[max(index, 0)]
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(results, baseline, max_regression):
+    """Regressions beyond max_regression (a fraction) against a previous results file"""
+    regressions = []
+    old, new = baseline["results"], results["results"]
+    if old["throughput_rps"] and new["throughput_rps"] < old["throughput_rps"] * (1 - max_regression):
+        regressions.append(f"throughput {old['throughput_rps']} -> {new['throughput_rps']} rps")
+    for quantile in ("p50", "p95", "p99"):
+        before, after = old["latency_ms"].get(quantile), new["latency_ms"].get(quantile)
+        if before and after and after > before * (1 + max_regression):
+            regressions.append(f"{quantile} latency {before:.1f} -> {after:.1f} ms")
+    return regressions
+
+
+def results_document(args, specs, limits, results):
+    """The results file: the run's configuration next to its measurements"""
+    return {
+        "benchmark": "fanout",
+        "revision": _git_revision(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "config": {
+            "rate": args.rate,
+            "duration": args.duration,
+            "distinct_prompts": args.distinct_prompts,
+            "buyers": args.buyers,
+            "max_results": args.max_results,
+            "timeout_seconds": args.timeout_seconds,
+            "response_limits": asdict(limits) if limits else None,
+            "agents": [asdict(spec) for spec in specs]
+        },
+        "results": results
+    }
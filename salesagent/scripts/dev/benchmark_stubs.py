@@ -0,0 +1,140 @@
+"""
+Stub agents for the fanout benchmark
+
+HTTP /select_products agents and MCP JSON-RPC agents, one port each, with a
+configurable latency distribution, error rate and payload size, served from a
+child process so they do not share the orchestrator's CPU.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import random
+from dataclasses import dataclass
+
+from aiohttp import web
+
+
+@dataclass
+class LatencySpec:
+    """A latency distribution in milliseconds"""
+    kind: str
+    params: tuple
+
+    @classmethod
+    def parse(cls, text):
+        kind, *values = text.split(":")
+        expected = {"fixed": 1, "uniform": 2, "exp": 1, "lognormal": 2}
+        if kind not in expected or len(values) != expected[kind]:
+            raise ValueError(f"Bad latency spec {text!r}; use fixed:MS, uniform:MIN:MAX, exp:MEAN or lognormal:MEDIAN:SIGMA")
+        return cls(kind, tuple(float(value) for value in values))
+
+    def sample(self, rng):
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exp":
+            return rng.expovariate(1 / self.params[0])
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma)
+
+    def __str__(self):
+        return ":".join([self.kind, *(f"{value:g}" for value in self.params)])
+
+
+@dataclass
+class StubAgentSpec:
+    """One stub agent: protocol, latency, error rate and response size"""
+    agent_id: str
+    protocol: str
+    latency: str
+    error_rate: float = 0.0
+    products: int = 10
+    payload_bytes: int = 0
+    seed: int = 0
+
+
+def _stub_products(spec, rng):
+    padding = "x" * spec.payload_bytes
+    return [
+        {
+            "id": f"{spec.agent_id}_p{i}",
+            "product_id": f"{spec.agent_id}_p{i}",
+            "name": f"{spec.agent_id} product {i}",
+            "description": padding,
+            "price_cpm": round(rng.uniform(1, 30), 2),
+            "score": round(rng.random(), 4),
+            "formats": ["display"],
+            "delivery_type": "non_guaranteed"
+        }
+        for i in range(spec.products)
+    ]
+
+
+def build_stub_app(spec):
+    """aiohttp app answering as one stub agent"""
+    rng = random.Random(spec.seed)
+    latency = LatencySpec.parse(spec.latency)
+
+    async def respond():
+        delay_ms = latency.sample(rng)
+        await asyncio.sleep(delay_ms / 1000)
+        return delay_ms, rng.random() < spec.error_rate
+
+    async def select_products(request):
+        await request.read()
+        delay_ms, failed = await respond()
+        if failed:
+            return web.json_response({"error": "stub failure"}, status=500)
+        return web.json_response({"products": _stub_products(spec, rng), "execution_time_ms": int(delay_ms)})
+
+    async def answer(message):
+        if message.get("method") == "tools/list":
+            return {"jsonrpc": "2.0", "id": message.get("id"), "result": {"tools": [{"name": "select_products"}]}}
+        _, failed = await respond()
+        if failed:
+            return {"jsonrpc": "2.0", "id": message.get("id"),
+                    "error": {"code": -32000, "message": "stub failure"}}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": {"products": _stub_products(spec, rng)}}
+
+    async def mcp(request):
+        message = await request.json()
+        if isinstance(message, list):
+            # JSON-RPC batch - answer every call in one array
+            return web.json_response(list(await asyncio.gather(*(answer(item) for item in message))))
+        return web.json_response(await answer(message))
+
+    app = web.Application()
+    if spec.protocol == "mcp":
+        app.router.add_post("/", mcp)
+    else:
+        app.router.add_post("/select_products", select_products)
+    return app
+
+
+def _serve_stub_agents(specs, connection):
+    """Child process: start every stub agent on its own port, report the ports, serve until killed"""
+    async def serve():
+        ports = []
+        for spec in specs:
+            runner = web.AppRunner(build_stub_app(spec), access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+            await site.start()
+            ports.append(site._server.sockets[0].getsockname()[1])
+        connection.send(ports)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def start_stub_agents(specs):
+    """Start the stub agents in a child process so they do not share the orchestrator's CPU"""
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve_stub_agents, args=(specs, child), daemon=True)
+    process.start()
+    if not parent.poll(30):
+        process.kill()
+        raise RuntimeError("Stub agents did not start")
+    return process, parent.recv()
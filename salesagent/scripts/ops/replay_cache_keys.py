@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Replay a query log through the orchestration cache key logic and compare hit rates
+
+Each log line is either a JSON object with the AgentSelectRequest fields (plus
+optional include_tenant_ids / exclude_tenant_ids / include_agent_ids /
+agent_types) or a plain-text prompt. The script reports cache hit counters for
+raw request keys and for the canonical fingerprints under the configured
+ORCHESTRATOR_CACHE_KEY_* policy.
+
+Usage:
+    python scripts/ops/replay_cache_keys.py queries.jsonl [--ttl SECONDS]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.fingerprint import request_fingerprinter
+from src.orchestrator.cache_manager import CacheManager
+
+SCOPE_FIELDS = ("include_tenant_ids", "exclude_tenant_ids", "include_agent_ids", "agent_types")
+
+
+def parse_line(line):
+    """Parse a log line into a request and its tenant/agent scope"""
+    line = line.strip()
+    if not line:
+        return None
+    if not line.startswith("{"):
+        return AgentSelectRequest(prompt=line), {}
+
+    data = json.loads(line)
+    scope = {field: data.pop(field, None) for field in SCOPE_FIELDS}
+    return AgentSelectRequest(**data), scope
+
+
+def raw_key(request, scope):
+    """The un-normalized key: exact request fields"""
+    key_data = {**request.dict(exclude={"timeout_seconds"}), **scope}
+    return hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def replay(path, ttl_seconds):
+    raw_cache = CacheManager(max_size=1_000_000, ttl_seconds=ttl_seconds)
+    canonical_cache = CacheManager(max_size=1_000_000, ttl_seconds=ttl_seconds)
+
+    with open(path) as log_file:
+        for line in log_file:
+            parsed = parse_line(line)
+            if parsed is None:
+                continue
+            request, scope = parsed
+
+            for cache, key in (
+                (raw_cache, raw_key(request, scope)),
+                (canonical_cache, request_fingerprinter.fingerprint("orch_cache_", request, **scope))
+            ):
+                if cache.get(key) is None:
+                    cache.set(key, True)
+
+    return raw_cache.get_stats(), canonical_cache.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cache hit rates for raw and canonical request keys")
+    parser.add_argument("log", help="Query log, one JSON request or prompt per line")
+    parser.add_argument("--ttl", type=int, default=300, help="Cache TTL in seconds (default: 300)")
+    args = parser.parse_args()
+
+    raw_stats, canonical_stats = replay(args.log, args.ttl)
+
+    print(f"Fingerprint policy: {request_fingerprinter.policy}")
+    print("=" * 60)
+    for label, stats in (("Raw keys", raw_stats), ("Canonical keys", canonical_stats)):
+        print(f"{label:16} hits={stats['hits']:<8} misses={stats['misses']:<8} "
+              f"hit_rate={stats['hit_rate']:.1%} distinct_keys={stats['size']}")
+
+
+if __name__ == "__main__":
+    main()
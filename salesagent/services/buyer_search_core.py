@@ -0,0 +1,101 @@
+"""Long-lived buyer search component that runs searches through the orchestrator."""
+
+from typing import List, Dict, Any, Optional
+import logging
+import threading
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.admission import AdmissionRejected
+from .buyer_search_mocks import get_mock_products
+
+logger = logging.getLogger(__name__)
+
+
+class BuyerSearchService:
+    """Long-lived buyer search component, initialized once at startup.
+
+    Holds explicit references to the orchestrator service, the async runtime
+    it runs on and the database configuration it was started with, so a
+    search does no process-wide setup (environment, import path) per call.
+    With no orchestrator (it failed to import) searches return mock products.
+    """
+
+    def __init__(self, orchestrator=None, runtime=None, db_config: Optional[Dict[str, Any]] = None,
+                 timeout_seconds: int = 10):
+        self.orchestrator = orchestrator
+        self.runtime = runtime
+        self.db_config = db_config or {}
+        self.timeout_seconds = timeout_seconds
+        self._stats_lock = threading.Lock()
+        self.searches = 0
+        self.mock_searches = 0
+        self.errors = 0
+
+    def search_products(self, prompt: str, filters: Optional[Dict[str, Any]] = None,
+                        include_tenant_ids: Optional[List[str]] = None,
+                        exclude_tenant_ids: Optional[List[str]] = None,
+                        include_agent_ids: Optional[List[str]] = None,
+                        max_results: int = 50,
+                        buyer_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search for products using the orchestrator service."""
+        with self._stats_lock:
+            self.searches += 1
+            if self.orchestrator is None:
+                self.mock_searches += 1
+        if self.orchestrator is None:
+            return get_mock_products(prompt, max_results)
+
+        try:
+            # Build the request
+            request_data = AgentSelectRequest(
+                prompt=prompt,
+                max_results=max_results,
+                filters=filters or {},
+                locale="en-US",
+                currency="USD",
+                timeout_seconds=self.timeout_seconds
+            )
+
+            # Call the orchestrator on the shared async runtime
+            response = self.runtime.run(self.orchestrator.orchestrate(
+                request=request_data,
+                include_tenant_ids=include_tenant_ids,
+                exclude_tenant_ids=exclude_tenant_ids,
+                include_agent_ids=include_agent_ids,
+                buyer_id=buyer_id
+            ))
+
+            # Extract products from response
+            products = response.get("products", [])
+
+            logger.info(f"Search returned {len(products)} products for prompt: {prompt[:50]}...")
+
+            # Add detailed logging to see what products are being returned
+            for i, product in enumerate(products[:3]):  # Log first 3 products
+                logger.info(f"Product {i+1}: {product.get('name', 'NO_NAME')} from {product.get('publisher_name', 'NO_PUBLISHER')}")
+                logger.info(f"  - Description: {product.get('description', 'NO_DESC')[:100]}...")
+                logger.info(f"  - Price: ${product.get('price_cpm', 0)} CPM")
+                logger.info(f"  - Delivery: {product.get('delivery_type', 'NO_TYPE')}")
+                logger.info(f"  - Formats: {product.get('formats', [])}")
+                logger.info(f"  - Categories: {product.get('categories', [])}")
+
+            return products
+
+        except AdmissionRejected:
+            # Overloaded - let the caller answer 503 with Retry-After
+            raise
+        except Exception as e:
+            with self._stats_lock:
+                self.errors += 1
+            logger.error(f"Error searching products: {e}")
+            return []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buyer search statistics"""
+        return {
+            "orchestrator_available": self.orchestrator is not None,
+            "database_type": self.db_config.get("type"),
+            "searches": self.searches,
+            "mock_searches": self.mock_searches,
+            "errors": self.errors
+        }
@@ -0,0 +1,71 @@
+"""Mock products for buyer search when the orchestrator is unavailable."""
+
+from typing import List, Dict, Any
+
+
+def get_mock_products(prompt: str, max_results: int) -> List[Dict[str, Any]]:
+    """Return mock products for development/testing."""
+    mock_products = [
+        {
+            'id': 'mock-1',
+            'name': 'Premium Display Banner',
+            'description': 'High-impact display banner with premium placement and targeting capabilities.',
+            'image_url': 'https://via.placeholder.com/300x250/007bff/ffffff?text=Display+Banner',
+            'publisher_name': 'TechNews Daily',
+            'publisher_tenant_id': 'technews-daily',
+            'formats': ['display', 'banner'],
+            'targeting': {'geo': ['US', 'CA'], 'interests': ['technology', 'business']},
+            'price_cpm': 5.50,
+            'delivery_type': 'guaranteed',
+            'categories': ['technology', 'business'],
+            'metadata': {'placement': 'above-fold', 'viewability': 'high'},
+            'source_agent_id': 'agent-1',
+            'score': 0.95,
+            'rationale': 'Perfect match for technology-focused campaigns with premium placement.',
+            'latency_ms': 150
+        },
+        {
+            'id': 'mock-2',
+            'name': 'Video Pre-roll',
+            'description': 'Engaging video pre-roll with high completion rates and brand safety.',
+            'image_url': 'https://via.placeholder.com/640x360/28a745/ffffff?text=Video+Pre-roll',
+            'publisher_name': 'Entertainment Hub',
+            'publisher_tenant_id': 'entertainment-hub',
+            'formats': ['video', 'pre-roll'],
+            'targeting': {'geo': ['US'], 'demographics': ['18-34']},
+            'price_cpm': 12.00,
+            'delivery_type': 'non_guaranteed',
+            'categories': ['entertainment', 'lifestyle'],
+            'metadata': {'duration': '15s', 'completion_rate': '85%'},
+            'source_agent_id': 'agent-2',
+            'score': 0.88,
+            'rationale': 'Great for reaching young audiences with engaging video content.',
+            'latency_ms': 200
+        },
+        {
+            'id': 'mock-3',
+            'name': 'Native Article',
+            'description': 'Seamlessly integrated native content that matches editorial style.',
+            'image_url': 'https://via.placeholder.com/400x300/ffc107/000000?text=Native+Article',
+            'publisher_name': 'Lifestyle Magazine',
+            'publisher_tenant_id': 'lifestyle-mag',
+            'formats': ['native', 'article'],
+            'targeting': {'interests': ['lifestyle', 'health', 'wellness']},
+            'price_cpm': 8.25,
+            'delivery_type': 'guaranteed',
+            'categories': ['lifestyle', 'health'],
+            'metadata': {'word_count': '800', 'engagement_rate': 'high'},
+            'source_agent_id': 'agent-3',
+            'score': 0.82,
+            'rationale': 'Excellent for lifestyle and wellness brands with high engagement.',
+            'latency_ms': 180
+        }
+    ]
+    
+    # Filter based on prompt keywords (simple mock logic)
+    if 'video' in prompt.lower():
+        return [p for p in mock_products if 'video' in p['formats']][:max_results]
+    elif 'native' in prompt.lower():
+        return [p for p in mock_products if 'native' in p['formats']][:max_results]
+    else:
+        return mock_products[:max_results]
@@ -18,6 +18,9 @@ from enum import Enum
 from functools import wraps
 from typing import Any
 
+from src.adapters.gam_metrics import GAMMetrics
+from src.core.metrics import metrics_registry
+
 # Configure structured logging
 logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO)
 
@@ -265,74 +268,8 @@ def log_api_call(service: str, method: str, duration_ms: float | None = None):
     return decorator
 
 
-class GAMMetrics:
-    """Collect and report metrics for GAM operations."""
-
-    def __init__(self):
-        self.operation_counts = {}
-        self.operation_durations = {}
-        self.error_counts = {}
-        self.api_call_counts = {}
-
-    def record_operation(self, context: GAMLogContext):
-        """Record metrics from an operation context."""
-        op_name = context.operation.value
-
-        # Count operations
-        if op_name not in self.operation_counts:
-            self.operation_counts[op_name] = {"success": 0, "failure": 0}
-
-        if context.success:
-            self.operation_counts[op_name]["success"] += 1
-        else:
-            self.operation_counts[op_name]["failure"] += 1
-
-            # Count errors by type
-            error_type = type(context.error).__name__ if context.error else "Unknown"
-            if error_type not in self.error_counts:
-                self.error_counts[error_type] = 0
-            self.error_counts[error_type] += 1
-
-        # Record duration
-        if context.start_time and context.end_time:
-            duration = (context.end_time - context.start_time) * 1000
-            if op_name not in self.operation_durations:
-                self.operation_durations[op_name] = []
-            self.operation_durations[op_name].append(duration)
-
-        # Count API calls
-        for api_call in context.api_calls:
-            key = f"{api_call['service']}.{api_call['method']}"
-            if key not in self.api_call_counts:
-                self.api_call_counts[key] = 0
-            self.api_call_counts[key] += 1
-
-    def get_metrics(self) -> dict[str, Any]:
-        """Get current metrics summary."""
-        metrics = {
-            "operations": self.operation_counts,
-            "errors": self.error_counts,
-            "api_calls": self.api_call_counts,
-            "durations": {},
-        }
-
-        # Calculate duration statistics
-        for op_name, durations in self.operation_durations.items():
-            if durations:
-                metrics["durations"][op_name] = {
-                    "count": len(durations),
-                    "mean": sum(durations) / len(durations),
-                    "min": min(durations),
-                    "max": max(durations),
-                    "p50": sorted(durations)[len(durations) // 2],
-                    "p95": sorted(durations)[int(len(durations) * 0.95)],
-                }
-
-        return metrics
-
-
 # Global metrics instance
-_metrics = GAMMetrics()
+_metrics = GAMMetrics(registry=metrics_registry)
 
 
 def _send_metrics(context: GAMLogContext):
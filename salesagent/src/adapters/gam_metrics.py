@@ -0,0 +1,84 @@
+"""
+Metrics for Google Ad Manager operations.
+
+Operation latencies and API call counts go to the shared metrics registry,
+so they are exported alongside the orchestrator's histograms.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from src.core.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from src.adapters.gam_logging import GAMLogContext
+
+
+class GAMMetrics:
+    """Collect and report metrics for GAM operations."""
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        registry = registry or MetricsRegistry()
+        self.operation_counts = {}
+        self.error_counts = {}
+        self.api_call_counts = {}
+        self.operation_durations = registry.histogram(
+            "adapter_call_duration_seconds", "Ad server adapter operation latency", ("adapter", "operation", "status")
+        )
+        self.api_calls = registry.counter(
+            "adapter_api_calls_total", "Ad server API calls made by adapter operations", ("adapter", "call")
+        )
+
+    def record_operation(self, context: "GAMLogContext"):
+        """Record metrics from an operation context."""
+        op_name = context.operation.value
+
+        # Count operations
+        if op_name not in self.operation_counts:
+            self.operation_counts[op_name] = {"success": 0, "failure": 0}
+
+        if context.success:
+            self.operation_counts[op_name]["success"] += 1
+        else:
+            self.operation_counts[op_name]["failure"] += 1
+
+            # Count errors by type
+            error_type = type(context.error).__name__ if context.error else "Unknown"
+            if error_type not in self.error_counts:
+                self.error_counts[error_type] = 0
+            self.error_counts[error_type] += 1
+
+        # Record duration
+        if context.start_time and context.end_time:
+            self.operation_durations.observe(
+                context.end_time - context.start_time,
+                adapter="gam",
+                operation=op_name,
+                status="success" if context.success else "failure",
+            )
+
+        # Count API calls
+        for api_call in context.api_calls:
+            key = f"{api_call['service']}.{api_call['method']}"
+            if key not in self.api_call_counts:
+                self.api_call_counts[key] = 0
+            self.api_call_counts[key] += 1
+            self.api_calls.inc(adapter="gam", call=key)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get current metrics summary."""
+        metrics = {
+            "operations": self.operation_counts,
+            "errors": self.error_counts,
+            "api_calls": self.api_call_counts,
+            "durations": {},
+        }
+
+        # Duration statistics in milliseconds, estimated from the histogram buckets
+        for op_name in sorted({labels["operation"] for labels in self.operation_durations.label_sets()}):
+            summary = self.operation_durations.summary(adapter="gam", operation=op_name)
+            metrics["durations"][op_name] = {
+                "count": summary["count"],
+                **{key: summary[key] * 1000 for key in ("mean", "min", "max", "p50", "p95")},
+            }
+
+        return metrics
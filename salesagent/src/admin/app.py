@@ -36,6 +36,7 @@ from src.admin.blueprints.agent_providers import agent_providers_bp
 from src.admin.blueprints.mcp_management import mcp_management_bp
 from src.api.buyer_orchestrator_router import buyer_orchestrator_bp
 from src.api.performance_monitoring_router import performance_monitoring_bp
+from src.api.orchestrator_stats_router import orchestrator_stats_bp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -104,6 +105,7 @@ def create_app(config=None):
     app.register_blueprint(mcp_management_bp)  # MCP agent management
     app.register_blueprint(buyer_orchestrator_bp)  # Buyer orchestrator API
     app.register_blueprint(performance_monitoring_bp)  # Performance monitoring API
+    app.register_blueprint(orchestrator_stats_bp)  # Orchestrator stats and traces API
     app.register_blueprint(tenants_bp, url_prefix="/tenant")
     app.register_blueprint(products_bp, url_prefix="/tenant/<tenant_id>/products")
     app.register_blueprint(principals_bp, url_prefix="/tenant/<tenant_id>")
@@ -127,7 +129,9 @@ def create_app(config=None):
         # Add the salesagent directory to the path so we can import from api
         sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         from api.buyer_ui_router import buyer_ui_bp
+        from services.buyer_search_service import init_buyer_search_service
         app.register_blueprint(buyer_ui_bp)
+        init_buyer_search_service()
     except ImportError as e:
         logger.warning(f"buyer_ui_bp not found: {e}")
     
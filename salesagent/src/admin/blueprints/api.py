@@ -1,6 +1,5 @@
 """API management blueprint."""
 
-import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
@@ -12,6 +11,7 @@ from sqlalchemy import func, text
 from src.admin.utils import require_auth
 from src.core.database.database_session import get_db_session
 from src.core.database.models import MediaBuy, Principal, Product, SuperadminConfig
+from src.orchestrator.runtime import async_runtime
 
 logger = logging.getLogger(__name__)
 
@@ -445,11 +445,9 @@ def mcp_test_call():
                 else:
                     return str(result)
 
-        # Run the async function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run the async function on the shared async runtime
         try:
-            result = loop.run_until_complete(call_mcp())
+            result = async_runtime.run(call_mcp())
             return jsonify({"success": True, "result": result})
         except Exception as e:
             logger.error(f"MCP call failed: {str(e)}")
@@ -460,8 +458,6 @@ def mcp_test_call():
                     "details": {"tool": tool_name, "server_url": server_url, "params": params},
                 }
             )
-        finally:
-            loop.close()
 
     except Exception as e:
         logger.error(f"MCP test call error: {str(e)}")
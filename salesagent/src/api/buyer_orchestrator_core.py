@@ -0,0 +1,45 @@
+"""Core buyer orchestrator router functionality."""
+
+from typing import List, Optional, Tuple
+
+from flask import request, jsonify
+
+from src.orchestrator.admission import AdmissionRejected
+from src.orchestrator.buyers import authenticated_buyer_id, buyer_key
+
+FILTER_FIELDS = ("include_tenant_ids", "exclude_tenant_ids", "include_agent_ids", "agent_types")
+
+
+class BuyerOrchestratorCore:
+    """Request helpers shared by the buyer orchestrator JSON and streaming endpoints."""
+
+    @staticmethod
+    def overloaded_response(error: AdmissionRejected):
+        """503 with Retry-After for an orchestration shed by admission control."""
+        response = jsonify({
+            "error": f"Service overloaded: {error.reason}",
+            "status": "error",
+            "retry_after_seconds": error.retry_after_seconds
+        })
+        response.status_code = 503
+        response.headers["Retry-After"] = str(error.retry_after_seconds)
+        return response
+
+    @staticmethod
+    def get_buyer_id() -> Optional[str]:
+        """
+        Identify the buyer for fair scheduling. An X-Buyer-Id signed with X-Buyer-Signature is used as given,
+        so its configured weight applies. Otherwise the (unsigned) X-Buyer-Id, the buyer UI session cookie (sent
+        by the search page's EventSource) or the client address is passed through buyer_key, a one-way key that
+        can never claim a configured weight.
+        """
+        header_id = request.headers.get("X-Buyer-Id")
+        return authenticated_buyer_id(header_id, request.headers.get("X-Buyer-Signature")) \
+            or buyer_key(header_id, "buyer") \
+            or buyer_key(request.cookies.get("buyer_session_id"), "session") \
+            or buyer_key(request.remote_addr, "client")
+
+    @staticmethod
+    def get_filter_params() -> Tuple[Optional[List[str]], ...]:
+        """Read the tenant/agent filter lists from the query string (empty lists become None)."""
+        return tuple(request.args.getlist(name) or None for name in FILTER_FIELDS)
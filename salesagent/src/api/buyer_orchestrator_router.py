@@ -2,19 +2,24 @@
 Buyer Orchestrator API Router - Public endpoint for cross-tenant product discovery
 """
 import logging
-import asyncio
-from typing import List, Dict, Any, Optional
 
 from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 
 from src.core.schemas.agent import AgentSelectRequest
 from src.services.orchestrator_service import orchestrator_service
+from src.orchestrator.admission import AdmissionRejected
+from src.orchestrator.runtime import async_runtime
+from src.api.buyer_orchestrator_core import BuyerOrchestratorCore
+from src.api.buyer_orchestrator_stream import orchestrate_products_stream
 
 logger = logging.getLogger(__name__)
 
 # Create Blueprint
 buyer_orchestrator_bp = Blueprint("buyer_orchestrator", __name__, url_prefix="/buyer")
+buyer_orchestrator_bp.add_url_rule(
+    "/orchestrate/stream", view_func=orchestrate_products_stream, methods=["GET", "POST"]
+)
 
 
 @buyer_orchestrator_bp.route("/orchestrate", methods=["POST"])
@@ -44,16 +49,7 @@ def orchestrate_products():
             }), 400
         
         # Get filter parameters from query string
-        include_tenant_ids = request.args.getlist('include_tenant_ids')
-        exclude_tenant_ids = request.args.getlist('exclude_tenant_ids')
-        include_agent_ids = request.args.getlist('include_agent_ids')
-        agent_types = request.args.getlist('agent_types')
-        
-        # Convert empty lists to None
-        include_tenant_ids = include_tenant_ids if include_tenant_ids else None
-        exclude_tenant_ids = exclude_tenant_ids if exclude_tenant_ids else None
-        include_agent_ids = include_agent_ids if include_agent_ids else None
-        agent_types = agent_types if agent_types else None
+        include_tenant_ids, exclude_tenant_ids, include_agent_ids, agent_types = BuyerOrchestratorCore.get_filter_params()
         
         logger.info(f"Orchestration request: prompt='{agent_request.prompt[:100]}...', "
                    f"max_results={agent_request.max_results}, "
@@ -61,18 +57,21 @@ def orchestrate_products():
                    f"exclude_tenants={exclude_tenant_ids}, "
                    f"agent_types={agent_types}")
         
-        # Call orchestrator service
-        response = asyncio.run(orchestrator_service.orchestrate(
+        # Call orchestrator service on the shared async runtime
+        response = async_runtime.run(orchestrator_service.orchestrate(
             request=agent_request,
             include_tenant_ids=include_tenant_ids,
             exclude_tenant_ids=exclude_tenant_ids,
             include_agent_ids=include_agent_ids,
-            agent_types=agent_types
+            agent_types=agent_types,
+            buyer_id=BuyerOrchestratorCore.get_buyer_id()
         ))
         
         # Return response
         return jsonify(response)
         
+    except AdmissionRejected as e:
+        return BuyerOrchestratorCore.overloaded_response(e)
     except Exception as e:
         logger.error(f"Error in orchestration endpoint: {e}", exc_info=True)
         return jsonify({
@@ -0,0 +1,80 @@
+"""
+Buyer Orchestrator Stream - Server-Sent Events endpoint for cross-tenant product discovery
+"""
+from typing import Dict, Any
+
+from flask import request, jsonify, Response, render_template, stream_with_context
+from pydantic import ValidationError
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.services.orchestrator_service import orchestrator_service
+from src.api.buyer_orchestrator_core import BuyerOrchestratorCore
+from src.api.sse_stream import format_sse_event, iterate_async_stream
+
+
+def orchestrate_products_stream():
+    """
+    Server-Sent Events variant of /orchestrate
+    
+    Emits an "agent_result" event as each agent answers and a final "complete"
+    event with the merged top-k. GET takes the request fields as query parameters
+    (for EventSource / the HTMX sse extension), POST takes a JSON body.
+    With format=html the events carry rendered product cards / results grid.
+    """
+    request_data = request.get_json(silent=True) if request.method == "POST" else request.args.to_dict()
+    if not request_data:
+        return jsonify({
+            "error": "Request body is required",
+            "status": "error"
+        }), 400
+    
+    render_html = request_data.pop("format", request.args.get("format")) == "html"
+    
+    try:
+        agent_request = AgentSelectRequest(**request_data)
+    except ValidationError as e:
+        return jsonify({
+            "error": f"Invalid request format: {str(e)}",
+            "status": "error"
+        }), 400
+    
+    include_tenant_ids, exclude_tenant_ids, include_agent_ids, agent_types = BuyerOrchestratorCore.get_filter_params()
+    
+    stream = orchestrator_service.orchestrate_stream(
+        request=agent_request,
+        include_tenant_ids=include_tenant_ids,
+        exclude_tenant_ids=exclude_tenant_ids,
+        include_agent_ids=include_agent_ids,
+        agent_types=agent_types,
+        buyer_id=BuyerOrchestratorCore.get_buyer_id()
+    )
+    
+    def generate():
+        for event in iterate_async_stream(stream):
+            event_name = event.pop("event")
+            if render_html:
+                yield format_sse_event(event_name, _render_stream_event(event_name, event))
+            else:
+                yield format_sse_event(event_name, event)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _render_stream_event(event_name: str, event: Dict[str, Any]) -> str:
+    """
+    Render a streaming event as HTML for the buyer search grid
+    """
+    if event_name == "complete":
+        metadata = event.get("metadata", {})
+        error = None
+        if metadata.get("retry_after_seconds") is not None:
+            error = f"Search is busy right now, please try again in {metadata['retry_after_seconds']} seconds"
+        elif metadata.get("error"):
+            error = "Search failed, please try again"
+        return render_template("ui/buyer/_results_grid.html", products=event.get("products", []), error=error)
+    
+    return render_template("ui/buyer/_results_stream_cards.html", products=event.get("products", []))
@@ -0,0 +1,129 @@
+"""
+Orchestrator Stats API Router - Agent cache, admission, runtime and trace endpoints plus Prometheus export
+"""
+import logging
+
+from flask import Blueprint, Response, jsonify, request
+from src.admin.utils import require_auth
+from src.core.metrics import metrics_registry
+from src.core.tracing import tracer
+from src.orchestrator.agent_cache import agent_response_cache
+from src.orchestrator.admission import admission_controller
+from src.orchestrator.scheduler import agent_call_scheduler
+from src.orchestrator.runtime import async_runtime
+
+logger = logging.getLogger(__name__)
+
+# Create Blueprint (shares the /monitoring prefix with performance_monitoring_bp)
+orchestrator_stats_bp = Blueprint("orchestrator_stats", __name__, url_prefix="/monitoring")
+
+
+@orchestrator_stats_bp.route("/cache/agents", methods=["GET"])
+def get_agent_cache_stats():
+    """
+    Get per-agent response cache statistics and hit ratios
+    """
+    try:
+        stats = agent_response_cache.get_stats()
+        return jsonify(stats)
+        
+    except Exception as e:
+        logger.error(f"Error getting agent cache stats: {e}", exc_info=True)
+        return jsonify({
+            "error": f"Internal server error: {str(e)}",
+            "status": "error"
+        }), 500
+
+
+@orchestrator_stats_bp.route("/admission", methods=["GET"])
+def get_admission_stats():
+    """
+    Get admission control statistics (queue depth, rejections, in-flight agent calls)
+    """
+    try:
+        stats = {**admission_controller.get_stats(), "agent_calls": agent_call_scheduler.get_stats()}
+        return jsonify(stats)
+        
+    except Exception as e:
+        logger.error(f"Error getting admission stats: {e}", exc_info=True)
+        return jsonify({
+            "error": f"Internal server error: {str(e)}",
+            "status": "error"
+        }), 500
+
+
+@orchestrator_stats_bp.route("/runtime", methods=["GET"])
+def get_runtime_stats():
+    """
+    Get async runtime statistics including event loop lag
+    """
+    try:
+        stats = async_runtime.get_stats()
+        return jsonify(stats)
+        
+    except Exception as e:
+        logger.error(f"Error getting runtime stats: {e}", exc_info=True)
+        return jsonify({
+            "error": f"Internal server error: {str(e)}",
+            "status": "error"
+        }), 500
+
+
+@orchestrator_stats_bp.route("/traces", methods=["GET"])
+@require_auth(admin_only=True)
+def get_slow_traces():
+    """
+    Get the slowest recent requests with the time spent in each stage (super admins only)
+    """
+    try:
+        limit = request.args.get("limit", type=int)
+        return jsonify({
+            "traces": tracer.get_slow_traces(limit),
+            "tracing": tracer.get_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting slow traces: {e}", exc_info=True)
+        return jsonify({
+            "error": f"Internal server error: {str(e)}",
+            "status": "error"
+        }), 500
+
+
+@orchestrator_stats_bp.route("/traces/<trace_id>", methods=["GET"])
+@require_auth(admin_only=True)
+def get_trace(trace_id: str):
+    """
+    Get every span of a retained slow trace (?format=otlp for OTLP/JSON, super admins only)
+    """
+    try:
+        trace = tracer.get_trace(trace_id, otlp=request.args.get("format") == "otlp")
+        if trace is None:
+            return jsonify({
+                "error": f"Trace {trace_id} not found (only recent slow traces are kept)",
+                "status": "error"
+            }), 404
+        return jsonify(trace)
+        
+    except Exception as e:
+        logger.error(f"Error getting trace {trace_id}: {e}", exc_info=True)
+        return jsonify({
+            "error": f"Internal server error: {str(e)}",
+            "status": "error"
+        }), 500
+
+
+def wants_prometheus() -> bool:
+    """Prometheus scrapers ask for text/plain or OpenMetrics; the dashboard fetches JSON"""
+    if request.args.get("format") == "prometheus":
+        return True
+    accept = request.headers.get("Accept", "")
+    return "text/plain" in accept or "application/openmetrics-text" in accept
+
+
+def prometheus_response() -> Response:
+    """The metrics registry's histograms and counters in Prometheus text format"""
+    return Response(
+        metrics_registry.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -5,7 +5,16 @@ import logging
 from typing import Dict, Any
 
 from flask import Blueprint, jsonify, request
-from src.orchestrator.performance import performance_monitor, concurrency_optimizer, cache_manager
+from src.api.orchestrator_stats_router import prometheus_response, wants_prometheus
+from src.core.metrics import metrics_registry
+from src.orchestrator.performance import concurrency_optimizer
+from src.orchestrator.cache_manager import cache_manager
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.agent_cache import agent_response_cache
+from src.orchestrator.admission import admission_controller
+from src.orchestrator.scheduler import agent_call_scheduler
+from src.orchestrator.runtime import async_runtime
+from src.orchestrator.mcp_client import mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +126,7 @@ def clear_cache():
     """
     try:
         cache_manager.clear()
+        agent_response_cache.clear()
         return jsonify({
             "status": "success",
             "message": "Cache cleared successfully"
@@ -199,8 +209,14 @@ def monitoring_health():
 def get_all_metrics():
     """
     Get all monitoring metrics in one response
+    
+    Served as Prometheus text (latency histograms and counters) when the client
+    accepts text/plain or passes ?format=prometheus, and as JSON otherwise.
     """
     try:
+        if wants_prometheus():
+            return prometheus_response()
+        
         # Collect all metrics
         performance_summary = performance_monitor.get_performance_summary()
         concurrency_stats = concurrency_optimizer.get_stats()
@@ -212,6 +228,11 @@ def get_all_metrics():
             "performance": performance_summary,
             "concurrency": concurrency_stats,
             "cache": cache_stats,
+            "admission": admission_controller.get_stats(),
+            "agent_call_scheduler": agent_call_scheduler.get_stats(),
+            "runtime": async_runtime.get_stats(),
+            "mcp_client": mcp_client.get_stats(),
+            "histograms": metrics_registry.get_stats(),
             "errors": error_summary,
             "top_agents": top_agents,
             "timestamp": performance_summary.get("timestamp")
@@ -0,0 +1,27 @@
+"""
+Server-Sent Events helpers - bridge async orchestrator streams into Flask responses
+"""
+import json
+from typing import Any, AsyncIterator, Iterator
+
+from src.orchestrator.runtime import async_runtime
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """
+    Format one Server-Sent Event
+
+    Strings are sent as-is (e.g. rendered HTML), anything else is JSON encoded.
+    Multi-line payloads are split across several data: lines as the SSE spec requires.
+    """
+    payload = data if isinstance(data, str) else json.dumps(data, default=str)
+    data_lines = "\n".join(f"data: {line}" for line in payload.splitlines() or [""])
+    return f"event: {event}\n{data_lines}\n\n"
+
+
+def iterate_async_stream(stream: AsyncIterator[Any]) -> Iterator[Any]:
+    """
+    Consume an async generator from synchronous code (e.g. a Flask streaming response)
+    on the shared async runtime loop
+    """
+    return async_runtime.iterate(stream)
@@ -14,6 +14,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from src.core.database.db_config import DatabaseConfig
+from src.core.database.query_metrics import instrument_engine
 
 # Create engine and session factory
 engine = create_engine(DatabaseConfig.get_connection_string())
@@ -25,6 +26,8 @@ logger = logging.getLogger(__name__)
 # Thread-safe session factory
 db_session = scoped_session(SessionLocal)
 
+instrument_engine(engine)
+
 
 def get_engine():
     """Get the current database engine."""
@@ -46,7 +46,7 @@ class Tenant(Base, JSONValidatorMixin):
     name = Column(String(255), nullable=False)
     subdomain = Column(String(100), nullable=False)
     created_at = Column(DateTime, nullable=False)
-    updated_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False, onupdate=func.now())
     is_active = Column(Boolean)
     billing_plan = Column(String(50))
     billing_contact = Column(Text)
@@ -0,0 +1,51 @@
+"""
+Database query instrumentation.
+
+Times every statement an engine executes into the db_query_duration_seconds
+histogram and, inside a traced request, records it as a db.query span.
+"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.metrics import metrics_registry
+from src.core.tracing import tracer
+
+db_query_duration = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+_QUERY_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+        # Statements only become spans inside a traced request
+        if tracer.current_span() is not None:
+            context._query_span = tracer.start_span("db.query")
+
+
+def _record_query_duration(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].upper() if words else ""
+    operation = operation if operation in _QUERY_OPERATIONS else "OTHER"
+    db_query_duration.observe(time.perf_counter() - started_at, operation=operation)
+    span = getattr(context, "_query_span", None)
+    if span is not None:
+        # Only the operation: statements can carry literal values
+        span.set_attribute("operation", operation)
+        span.end()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record statement latencies (and db.query spans) for everything run on engine."""
+    event.listen(engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine, "after_cursor_execute", _record_query_duration)
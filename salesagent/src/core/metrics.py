@@ -0,0 +1,70 @@
+"""
+Metrics registry with fixed-bucket histograms and Prometheus text exposition.
+
+Histograms keep per-bucket counts, a sum and a count per label set, so
+recording costs one bisect with no sample storage, percentiles are estimated
+from the buckets without sorting, and series from several processes merge by
+adding bucket counts. Modules declare the metrics they record against the
+global registry at import time.
+"""
+
+import threading
+from typing import Any
+
+from src.core.metrics_counter import Counter
+from src.core.metrics_histogram import DEFAULT_LATENCY_BUCKETS, Histogram
+from src.core.metrics_prometheus import render_prometheus
+
+
+class MetricsRegistry:
+    """Named counters and histograms with Prometheus text exposition
+
+    Metrics are created on first use and returned on later calls with the same
+    name, so modules can declare the metrics they record at import time.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, label_names: tuple[str, ...], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, tuple(label_names), **kwargs)
+            elif not isinstance(metric, cls) or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} already registered as a different {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return render_prometheus(metrics)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Histogram summaries per label set, for the JSON monitoring endpoints"""
+        with self._lock:
+            histograms = [metric for metric in self._metrics.values() if isinstance(metric, Histogram)]
+        return {
+            histogram.name: [
+                {"labels": labels, **histogram.summary(**labels)} for labels in histogram.label_sets()
+            ]
+            for histogram in sorted(histograms, key=lambda histogram: histogram.name)
+        }
+
+
+# Global instance
+metrics_registry = MetricsRegistry()
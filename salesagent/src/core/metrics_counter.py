@@ -0,0 +1,39 @@
+"""
+Counter metric and the label handling shared by every metric type.
+"""
+
+import threading
+from typing import Any
+
+
+def label_key(label_names: tuple[str, ...], labels: dict[str, Any]) -> tuple[str, ...]:
+    """The series key for a label set, which must name exactly the metric's labels"""
+    if set(labels) != set(label_names):
+        raise ValueError(f"Expected labels {label_names}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in label_names)
+
+
+class Counter:
+    """Monotonically increasing count per label set; the name should end in _total"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(label_key(self.label_names, labels), 0.0)
+
+    def samples(self) -> list[tuple[str, list[tuple[str, str]], float]]:
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, list(zip(self.label_names, key, strict=True)), value) for key, value in sorted(values.items())]
@@ -0,0 +1,145 @@
+"""
+Fixed-bucket histogram metric - per-bucket counts, sum, count, min and max per label set.
+"""
+
+import bisect
+import math
+import threading
+from typing import Any
+
+from src.core.metrics_counter import label_key
+from src.core.metrics_prometheus import format_value
+
+# Seconds - spans fast in-process agents through slow remote calls
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _HistogramState:
+    __slots__ = ("bucket_counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets: int):
+        # One slot per finite bucket plus the +Inf overflow, not cumulative
+        self.bucket_counts = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class Histogram:
+    """Fixed-bucket histogram per label set
+
+    Percentiles are interpolated linearly inside the bucket that holds the
+    requested rank, clamped to the observed min and max.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ):
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("Histogram buckets must be a non-empty increasing sequence")
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._states: dict[tuple[str, ...], _HistogramState] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = label_key(self.label_names, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.buckets))
+            state.bucket_counts[index] += 1
+            state.count += 1
+            state.sum += value
+            state.min = min(state.min, value)
+            state.max = max(state.max, value)
+
+    def _merged(self, labels: dict[str, Any]) -> _HistogramState | None:
+        """State for the label set, or summed over every label set matching the given labels"""
+        with self._lock:
+            states = [
+                state for key, state in self._states.items()
+                if all(key[self.label_names.index(name)] == str(value) for name, value in labels.items())
+            ]
+            if not states:
+                return None
+            merged = _HistogramState(len(self.buckets))
+            for state in states:
+                merged.bucket_counts = [a + b for a, b in zip(merged.bucket_counts, state.bucket_counts, strict=True)]
+                merged.count += state.count
+                merged.sum += state.sum
+                merged.min = min(merged.min, state.min)
+                merged.max = max(merged.max, state.max)
+            return merged
+
+    def count(self, **labels: Any) -> int:
+        state = self._merged(labels)
+        return state.count if state else 0
+
+    def mean(self, **labels: Any) -> float:
+        state = self._merged(labels)
+        return state.sum / state.count if state and state.count else 0.0
+
+    def quantile(self, q: float, **labels: Any) -> float:
+        """Estimate the q-quantile (0..1) over the matching label sets; 0.0 with no data"""
+        state = self._merged(labels)
+        if state is None or not state.count:
+            return 0.0
+
+        rank = q * state.count
+        seen = 0
+        for index, bucket_count in enumerate(state.bucket_counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = max(self.buckets[index - 1] if index > 0 else state.min, state.min)
+                upper = min(self.buckets[index] if index < len(self.buckets) else state.max, state.max)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, state.min), state.max)
+            seen += bucket_count
+        return state.max
+
+    def summary(self, **labels: Any) -> dict[str, float]:
+        """Count, mean, min, max and estimated p50/p95/p99 over the matching label sets"""
+        state = self._merged(labels)
+        if state is None or not state.count:
+            return {"count": 0}
+        return {
+            "count": state.count,
+            "mean": state.sum / state.count,
+            "min": state.min,
+            "max": state.max,
+            "p50": self.quantile(0.5, **labels),
+            "p95": self.quantile(0.95, **labels),
+            "p99": self.quantile(0.99, **labels)
+        }
+
+    def label_sets(self) -> list[dict[str, str]]:
+        with self._lock:
+            keys = sorted(self._states)
+        return [dict(zip(self.label_names, key, strict=True)) for key in keys]
+
+    def samples(self) -> list[tuple[str, list[tuple[str, str]], float]]:
+        with self._lock:
+            states = {
+                key: (list(state.bucket_counts), state.count, state.sum)
+                for key, state in self._states.items()
+            }
+        samples = []
+        for key, (bucket_counts, count, total) in sorted(states.items()):
+            pairs = list(zip(self.label_names, key, strict=True))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), bucket_counts, strict=True):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", pairs + [("le", format_value(bound))], cumulative))
+            samples.append((f"{self.name}_sum", pairs, total))
+            samples.append((f"{self.name}_count", pairs, count))
+        return samples
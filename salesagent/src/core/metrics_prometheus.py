@@ -0,0 +1,37 @@
+"""
+Prometheus text exposition (version 0.0.4) for the metrics registry.
+"""
+
+import math
+from typing import Any
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(pairs: list[tuple[str, str]]) -> str:
+    """A sample's label pairs as {name="value",...}, or nothing without labels"""
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def format_value(value: float) -> str:
+    """A sample value or bucket bound, with integers unpadded and infinity as +Inf"""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(metrics: list[Any]) -> str:
+    """HELP, TYPE and sample lines for each metric, in the order given"""
+    lines = []
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        for sample_name, pairs, value in metric.samples():
+            lines.append(f"{sample_name}{format_labels(pairs)} {format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -13,6 +13,9 @@ class AgentStatus(str, Enum):
     INACTIVE = "inactive"
     ERROR = "error"
     TIMEOUT = "timeout"
+    CIRCUIT_OPEN = "circuit_open"
+    PRUNED = "pruned"
+    CANCELLED = "cancelled"
 
 
 class AgentType(str, Enum):
@@ -46,6 +49,13 @@ class AgentReport(BaseModel):
     latency_ms: Optional[int] = Field(None, description="Execution time in milliseconds")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     products_count: int = Field(0, description="Number of products returned")
+    timeout_ms: Optional[int] = Field(None, description="Adaptive timeout applied to the call")
+    hedged: bool = Field(False, description="Whether a hedged duplicate request was sent")
+    cached: bool = Field(False, description="Whether the products came from the per-agent response cache")
+    queue_wait_ms: Optional[int] = Field(None, description="Time the call waited for a scheduler slot")
+    truncated: bool = Field(False, description="Whether the response exceeded the agent's byte or product cap")
+    truncation_reason: Optional[str] = Field(None, description="Cap that cut the response short (byte_cap or product_cap)")
+    soft_deadline: bool = Field(False, description="Whether the call was cut off at the soft deadline")
     executed_at: datetime = Field(default_factory=lambda: datetime.now())
 
 
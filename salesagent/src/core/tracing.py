@@ -0,0 +1,127 @@
+"""
+Request tracing - lightweight in-process spans with W3C trace context propagation
+"""
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .tracing_spans import TRACEPARENT_HEADER, _TRACEPARENT, _current_span, Span
+from .tracing_store import TraceStoreMixin
+
+__all__ = ["TRACEPARENT_HEADER", "Span", "Tracer", "tracer"]
+
+
+class Tracer(TraceStoreMixin):
+    """Collect spans per trace and keep the slowest recent requests
+
+    The current span lives in a context variable, so it follows the request into
+    asyncio tasks, asyncio.to_thread() workers and the async runtime. A trace is
+    complete when its local root span ends (the first span in this process, or a
+    span continuing a traceparent header from another process); spans that end
+    after that are dropped, as are traces beyond max_active_traces in flight at once
+    (a root that never ends cannot grow the store without bound). Complete traces
+    slower than slow_threshold_ms are kept (the last max_slow_traces of them) and,
+    with export_path set, every complete trace is appended to that file as an
+    OTLP/JSON ExportTraceServiceRequest line.
+
+    Span attributes end up on admin endpoints and in export files, so they must
+    not carry credentials, session ids or raw SQL.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        slow_threshold_ms: float = 1000.0,
+        max_slow_traces: int = 50,
+        max_spans_per_trace: int = 500,
+        max_active_traces: int = 10_000,
+        export_path: Optional[str] = None,
+        service_name: str = "adcp-sales-agent"
+    ):
+        self.enabled = enabled
+        self.slow_threshold_ms = slow_threshold_ms
+        self.max_spans_per_trace = max_spans_per_trace
+        self.max_active_traces = max_active_traces
+        self.export_path = export_path
+        self.service_name = service_name
+        self.slow_traces: Deque[Dict[str, Any]] = deque(maxlen=max_slow_traces)
+        self._active: Dict[str, List[Span]] = {}
+        self._lock = threading.Lock()
+        self.completed_traces = 0
+        self.dropped_spans = 0
+        self.exported_traces = 0
+        self.export_errors = 0
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        traceparent: Optional[str] = None,
+        new_trace: bool = False,
+        **attributes: Any
+    ) -> Span:
+        """
+        Start a span without making it current
+
+        The parent is, in order: the given span, the current span, the remote parent
+        in a traceparent header, or none (a new trace). new_trace ignores all three.
+        """
+        if not new_trace:
+            parent = parent or self.current_span()
+        trace_id, parent_id = (parent.trace_id, parent.span_id) if parent and not new_trace else (None, None)
+        if trace_id is None and traceparent and not new_trace:
+            match = _TRACEPARENT.match(traceparent.strip().lower())
+            if match:
+                trace_id, parent_id = match.groups()
+
+        local_root = False
+        if trace_id is None:
+            trace_id = os.urandom(16).hex()
+        if self.enabled:
+            with self._lock:
+                if trace_id not in self._active and len(self._active) < self.max_active_traces:
+                    self._active[trace_id] = []
+                    local_root = True
+        return Span(self, name, trace_id, parent_id, local_root, attributes)
+
+    @contextmanager
+    def span(self, name: str, **kwargs: Any) -> Iterator[Span]:
+        """Start a span, make it current for the block and end it afterwards"""
+        span = self.start_span(name, **kwargs)
+        with self.activate(span):
+            try:
+                yield span
+            except BaseException as e:
+                span.record_error(e)
+                raise
+            finally:
+                span.end()
+
+    @contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """Make an already started span current for a block (without ending it)"""
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    def traceparent(self) -> Optional[str]:
+        """Header value propagating the current span, if any"""
+        span = self.current_span()
+        return span.traceparent() if span else None
+
+
+# Global instance
+tracer = Tracer(
+    enabled=os.environ.get("ORCHESTRATOR_TRACING_ENABLED", "true").lower() == "true",
+    slow_threshold_ms=float(os.environ.get("ORCHESTRATOR_TRACE_SLOW_MS", "1000")),
+    max_slow_traces=int(os.environ.get("ORCHESTRATOR_TRACE_MAX_SLOW", "50")),
+    max_spans_per_trace=int(os.environ.get("ORCHESTRATOR_TRACE_MAX_SPANS", "500")),
+    export_path=os.environ.get("ORCHESTRATOR_TRACE_EXPORT_PATH") or None
+)
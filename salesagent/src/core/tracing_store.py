@@ -0,0 +1,112 @@
+"""
+Request trace store - complete traces, the slowest recent ones and their OTLP/JSON export
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from .tracing_spans import Span, _otlp_attribute, _otlp_span
+
+logger = logging.getLogger(__name__)
+
+
+class TraceStoreMixin:
+    """Keep complete traces for Tracer (uses its lock, limits and export settings)"""
+
+    def _finish(self, span: Span) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            spans = self._active.get(span.trace_id)
+            if spans is None:
+                return
+            if len(spans) < self.max_spans_per_trace:
+                spans.append(span)
+            else:
+                self.dropped_spans += 1
+            if not span.local_root:
+                return
+            del self._active[span.trace_id]
+            self.completed_traces += 1
+
+        trace = {
+            "trace_id": span.trace_id,
+            "name": span.name,
+            "start_ns": span.start_ns,
+            "duration_ms": round(span.duration_ms, 3),
+            "error": span.error,
+            "spans": spans
+        }
+        if span.duration_ms >= self.slow_threshold_ms:
+            self.slow_traces.append(trace)
+        if self.export_path:
+            self._export(trace)
+
+    def get_slow_traces(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Summaries of the slowest recent traces, newest first"""
+        traces = list(self.slow_traces)[::-1][:limit]
+        return [
+            {
+                "trace_id": trace["trace_id"],
+                "name": trace["name"],
+                "duration_ms": trace["duration_ms"],
+                "error": trace["error"],
+                "span_count": len(trace["spans"]),
+                "stages_ms": self._stage_totals(trace["spans"])
+            }
+            for trace in traces
+        ]
+
+    def get_trace(self, trace_id: str, otlp: bool = False) -> Optional[Dict[str, Any]]:
+        """A retained slow trace with all its spans in start order, or as an OTLP/JSON request"""
+        for trace in self.slow_traces:
+            if trace["trace_id"] == trace_id:
+                if otlp:
+                    return self.to_otlp([trace])
+                spans = sorted(trace["spans"], key=lambda span: span.start_ns)
+                return {**trace, "spans": [span.to_dict() for span in spans]}
+        return None
+
+    @staticmethod
+    def _stage_totals(spans: List[Span]) -> Dict[str, float]:
+        """Total time per span name - where the request spent its time"""
+        totals: Dict[str, float] = {}
+        for span in spans:
+            totals[span.name] = round(totals.get(span.name, 0.0) + span.duration_ms, 3)
+        return totals
+
+    def to_otlp(self, traces: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest for complete traces"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "src.core.tracing"},
+                    "spans": [_otlp_span(span) for trace in traces for span in trace["spans"]]
+                }]
+            }]
+        }
+
+    def _export(self, trace: Dict[str, Any]) -> None:
+        try:
+            line = json.dumps(self.to_otlp([trace]), default=str)
+            with self._lock, open(self.export_path, "a") as export_file:
+                export_file.write(line + "\n")
+            self.exported_traces += 1
+        except Exception as e:
+            self.export_errors += 1
+            logger.warning(f"Failed to export trace {trace['trace_id']}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracing statistics"""
+        return {
+            "enabled": self.enabled,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "active_traces": len(self._active),
+            "completed_traces": self.completed_traces,
+            "slow_traces": len(self.slow_traces),
+            "dropped_spans": self.dropped_spans,
+            "export_path": self.export_path,
+            "exported_traces": self.exported_traces,
+            "export_errors": self.export_errors
+        }
@@ -0,0 +1,129 @@
+"""
+Adaptive per-agent timeouts and hedging delays from observed latency percentiles
+"""
+import math
+import os
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Any, List, Optional, Tuple
+
+from src.core.schemas.agent import AgentConfig
+
+
+def latency_percentile(samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a list of latency samples"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class AgentCallPlan:
+    """Timeout and hedging decisions for a single agent call"""
+    timeout_seconds: float
+    hedge_delay_seconds: Optional[float] = None
+    hedged: bool = False
+    hedge_won: bool = False
+    # Time the call waited in the agent call scheduler
+    queue_wait_ms: Optional[int] = None
+
+
+class AdaptiveTimeoutPolicy:
+    """Derive each agent's timeout from its rolling p99 latency and its hedge delay from p95
+
+    Latencies are the orchestrator's own wall-clock measurements per (tenant, agent),
+    not the agent's self-reported execution time, and a call that timed out counts
+    at its timeout, so a struggling agent's percentiles rise instead of looking fast.
+    Hedging needs min_hedge_samples samples and a delay of at least
+    min_hedge_delay_seconds; otherwise the call is not hedged.
+    """
+
+    def __init__(
+        self,
+        min_timeout_seconds: float = 0.5,
+        max_timeout_seconds: float = 10.0,
+        timeout_percentile: float = 99,
+        timeout_multiplier: float = 1.5,
+        hedge_percentile: float = 95,
+        hedging_enabled: bool = False,
+        min_samples: int = 10,
+        min_hedge_samples: int = 20,
+        min_hedge_delay_seconds: float = 0.01,
+        max_samples: int = 100
+    ):
+        self.min_timeout_seconds = min_timeout_seconds
+        self.max_timeout_seconds = max_timeout_seconds
+        self.timeout_percentile = timeout_percentile
+        self.timeout_multiplier = timeout_multiplier
+        self.hedge_percentile = hedge_percentile
+        self.hedging_enabled = hedging_enabled
+        self.min_samples = min_samples
+        self.min_hedge_samples = min_hedge_samples
+        self.min_hedge_delay_seconds = min_hedge_delay_seconds
+        self._samples: Dict[Tuple[str, str], Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples))
+        self._lock = threading.Lock()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def record_latency(self, tenant_id: str, agent_id: str, seconds: float) -> None:
+        """Record a call's measured latency (a timed-out call at its timeout)"""
+        with self._lock:
+            self._samples[(tenant_id, agent_id)].append(seconds)
+
+    def plan_call(
+        self,
+        agent: AgentConfig,
+        remaining_seconds: Optional[float] = None,
+        tenant_id: Optional[str] = None
+    ) -> AgentCallPlan:
+        """Decide the timeout and hedge delay for calling an agent"""
+        with self._lock:
+            samples = list(self._samples.get((tenant_id or agent.tenant_id, agent.agent_id), ()))
+        timeout = self.max_timeout_seconds
+        hedge_delay = None
+
+        if len(samples) >= self.min_samples:
+            observed = latency_percentile(samples, self.timeout_percentile) * self.timeout_multiplier
+            timeout = min(max(observed, self.min_timeout_seconds), self.max_timeout_seconds)
+
+            if self.hedging_enabled and agent.config.get("idempotent", True) \
+                    and len(samples) >= self.min_hedge_samples:
+                hedge_delay = latency_percentile(samples, self.hedge_percentile)
+
+        if remaining_seconds is not None:
+            timeout = min(timeout, remaining_seconds)
+        if hedge_delay is not None and not self.min_hedge_delay_seconds <= hedge_delay < timeout:
+            hedge_delay = None
+
+        return AgentCallPlan(timeout_seconds=timeout, hedge_delay_seconds=hedge_delay)
+
+    def record_hedge(self, plan: AgentCallPlan) -> None:
+        """Count a hedged call once it has finished"""
+        if plan.hedged:
+            self.hedges_sent += 1
+        if plan.hedge_won:
+            self.hedges_won += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get adaptive timeout and hedging statistics"""
+        return {
+            "min_timeout_seconds": self.min_timeout_seconds,
+            "max_timeout_seconds": self.max_timeout_seconds,
+            "timeout_percentile": self.timeout_percentile,
+            "timeout_multiplier": self.timeout_multiplier,
+            "hedging_enabled": self.hedging_enabled,
+            "hedge_percentile": self.hedge_percentile,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "agents_tracked": len(self._samples)
+        }
+
+
+# Global instance
+adaptive_timeout_policy = AdaptiveTimeoutPolicy(
+    min_timeout_seconds=float(os.environ.get("ORCHESTRATOR_MIN_AGENT_TIMEOUT_SECONDS", "0.5")),
+    max_timeout_seconds=float(os.environ.get("ORCHESTRATOR_MAX_AGENT_TIMEOUT_SECONDS", "10")),
+    timeout_multiplier=float(os.environ.get("ORCHESTRATOR_AGENT_TIMEOUT_MULTIPLIER", "1.5")),
+    hedging_enabled=os.environ.get("ORCHESTRATOR_HEDGING_ENABLED", "false").lower() == "true"
+)
@@ -0,0 +1,79 @@
+"""
+Admission control - cap concurrent fanouts, shedding excess load
+"""
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+
+from src.orchestrator.slot_limiter import AdmissionRejected, SlotLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Global admission control for orchestrations
+
+    Caps how many fanouts run at once; in-flight agent calls across all of them
+    are capped by the agent call scheduler. Fanouts beyond the cap wait in a
+    bounded queue for at most max_queue_wait_seconds; when the queue is full or
+    the wait runs out they are rejected with AdmissionRejected so callers can
+    answer 503.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_concurrent_fanouts: int = 8,
+        max_queued_fanouts: int = 32,
+        max_queue_wait_seconds: float = 2.0
+    ):
+        self.enabled = enabled
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.fanouts = SlotLimiter("fanout", max_concurrent_fanouts, max_waiters=max_queued_fanouts)
+
+    @asynccontextmanager
+    async def fanout_slot(self, remaining_seconds: Optional[float] = None) -> AsyncIterator[float]:
+        """
+        Admit a fanout, waiting no longer than the queue bound or the request's remaining time
+
+        Yields:
+            Seconds spent queued
+        """
+        if not self.enabled:
+            yield 0.0
+            return
+
+        timeout = self.max_queue_wait_seconds
+        if remaining_seconds is not None:
+            timeout = max(0.0, min(timeout, remaining_seconds))
+
+        try:
+            waited = await self.fanouts.acquire(timeout)
+        except AdmissionRejected as e:
+            logger.warning(f"Rejecting orchestration: {e.reason} (retry after {e.retry_after_seconds}s)")
+            raise
+
+        started = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self.fanouts.release(time.monotonic() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics"""
+        return {
+            "enabled": self.enabled,
+            "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            "fanouts": self.fanouts.get_stats()
+        }
+
+
+# Global instance
+admission_controller = AdmissionController(
+    enabled=os.environ.get("ORCHESTRATOR_ADMISSION_ENABLED", "true").lower() == "true",
+    max_concurrent_fanouts=int(os.environ.get("ORCHESTRATOR_MAX_CONCURRENT_FANOUTS", "8")),
+    max_queued_fanouts=int(os.environ.get("ORCHESTRATOR_MAX_QUEUED_FANOUTS", "32")),
+    max_queue_wait_seconds=float(os.environ.get("ORCHESTRATOR_MAX_QUEUE_WAIT_SECONDS", "2.0"))
+)
@@ -0,0 +1,90 @@
+"""
+Per-agent response cache - reuse each agent's products across orchestrations
+"""
+import os
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.cache_backends import create_cache_backend
+from src.orchestrator.fingerprint import RequestFingerprinter, request_fingerprinter
+from src.orchestrator.cache_manager import CacheManager
+
+
+class AgentResponseCache:
+    """Cache each agent's raw product list by agent and request parameters
+
+    Orchestrations with different tenant/agent filters share agent responses,
+    so only agents without a cached response need to be called.
+    """
+
+    def __init__(self, cache: CacheManager, enabled: bool = True, fingerprinter: RequestFingerprinter = request_fingerprinter):
+        self.cache = cache
+        self.fingerprinter = fingerprinter
+        self.enabled = enabled
+        self.agent_hits: Dict[str, int] = defaultdict(int)
+        self.agent_misses: Dict[str, int] = defaultdict(int)
+
+    def get(self, tenant_id: str, agent_id: str, request: AgentSelectRequest) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached products for an agent, if present"""
+        if not self.enabled:
+            return None
+
+        products = self.cache.get(self._generate_key(tenant_id, agent_id, request))
+        if products is None:
+            self.agent_misses[agent_id] += 1
+            return None
+
+        self.agent_hits[agent_id] += 1
+        return [dict(product) for product in products]
+
+    def set(self, tenant_id: str, agent_id: str, request: AgentSelectRequest, products: List[Dict[str, Any]]) -> None:
+        """Cache the products an agent returned"""
+        if self.enabled:
+            self.cache.set(self._generate_key(tenant_id, agent_id, request), [dict(product) for product in products])
+
+    def clear(self) -> None:
+        """Clear all cached agent responses and counters"""
+        self.cache.clear()
+        self.agent_hits.clear()
+        self.agent_misses.clear()
+
+    def _generate_key(self, tenant_id: str, agent_id: str, request: AgentSelectRequest) -> str:
+        """Generate a cache key for an agent's response to the request"""
+        return self.fingerprinter.fingerprint("agent_cache_", request, tenant_id=tenant_id, agent_id=agent_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics including per-agent hit ratios"""
+        agents = {}
+        for agent_id in sorted(set(self.agent_hits) | set(self.agent_misses)):
+            hits = self.agent_hits[agent_id]
+            misses = self.agent_misses[agent_id]
+            agents[agent_id] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0
+            }
+
+        return {
+            "enabled": self.enabled,
+            **self.cache.get_stats(),
+            "agents": agents
+        }
+
+
+# Global instance
+agent_response_cache = AgentResponseCache(
+    cache=CacheManager(
+        max_size=int(os.environ.get("ORCHESTRATOR_AGENT_CACHE_MAX_ENTRIES", "5000")),
+        ttl_seconds=int(os.environ.get("ORCHESTRATOR_AGENT_CACHE_TTL_SECONDS", "300")),
+        max_bytes=int(os.environ.get("ORCHESTRATOR_AGENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        backend=create_cache_backend(
+            os.environ.get("ORCHESTRATOR_CACHE_BACKEND", "memory"),
+            max_size=int(os.environ.get("ORCHESTRATOR_AGENT_CACHE_MAX_ENTRIES", "5000")),
+            max_bytes=int(os.environ.get("ORCHESTRATOR_AGENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            path=os.environ.get("ORCHESTRATOR_CACHE_PATH"),
+            table="agent_response_cache"
+        )
+    ),
+    enabled=os.environ.get("ORCHESTRATOR_AGENT_CACHE_ENABLED", "true").lower() == "true"
+)
@@ -0,0 +1,148 @@
+"""
+Agent calls - reach one agent provider, in-process, over MCP or over HTTP
+"""
+import asyncio
+import logging
+import time
+from typing import List, Dict, Any, Tuple
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.core.tracing import TRACEPARENT_HEADER, tracer
+from src.orchestrator.mcp_client import mcp_client
+from src.orchestrator.response_limits import AgentProducts
+from src.orchestrator.response_stream import ERROR_TEXT_BYTES, read_json_stream, read_text
+from src.services.product_selection_service import product_selection_service
+
+logger = logging.getLogger(__name__)
+
+# The select_products request body sent to HTTP agents
+SELECT_PAYLOAD_FIELDS = {"prompt", "max_results", "filters", "locale", "currency", "timeout_seconds"}
+
+
+def _tag_products(products: List[Dict[str, Any]], agent_id: str, tenant_id: str) -> None:
+    """Add source information to products"""
+    for product in products:
+        product["source_agent_id"] = agent_id
+        product["publisher_tenant_id"] = tenant_id
+
+
+class AgentCallMixin:
+    """Per-transport agent calls for FanoutOrchestrator (uses its http_pool, base_url and limits)"""
+
+    async def _call_agent_provider(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call a single agent provider endpoint
+        """
+        start_time = time.time()
+
+        try:
+            if agent.type == "mcp":
+                return await self._call_mcp_agent(agent, request)
+            elif agent.endpoint_url and agent.endpoint_url.startswith('http'):
+                return await self._call_external_agent(agent, request)
+            elif self.local_agents_in_process:
+                return await self.call_local_agent_in_process(agent, tenant_id, request)
+            else:
+                # Local agent over HTTP loopback
+                return await self._call_local_agent(agent, tenant_id, request)
+
+        except asyncio.TimeoutError:
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            logger.warning(f"Agent {agent.agent_id} timed out after {execution_time_ms}ms")
+            raise Exception(f"Timeout after {execution_time_ms}ms")
+
+        except Exception as e:
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            logger.error(f"Agent {agent.agent_id} failed after {execution_time_ms}ms: {e}")
+            raise
+
+    async def _call_mcp_agent(self, agent: AgentConfig, request: AgentSelectRequest) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call an MCP-compliant agent
+        """
+        result = await mcp_client.call_mcp_agent(
+            endpoint_url=agent.endpoint_url,
+            request=request,
+            agent_config=agent.config
+        )
+        if result.get("status") == "error":
+            raise Exception(result.get("error_message") or "MCP agent returned an error")
+
+        products = AgentProducts(result.get("products", []), truncated=result.get("truncated"))
+        _tag_products(products, agent.agent_id, agent.tenant_id)
+        return products, result.get("execution_time_ms", 0)
+
+    async def _call_external_agent(
+        self,
+        agent: AgentConfig,
+        request: AgentSelectRequest
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call an external agent with custom endpoint, parsing the body as it arrives under the agent's caps
+        """
+        limits = self.response_limits.for_agent(agent.config)
+        payload = request.model_dump(include=SELECT_PAYLOAD_FIELDS)
+        async with self.http_pool.stream("POST", f"{agent.endpoint_url}/select_products", json=payload,
+                                         timeout=self.timeout, headers=self._trace_headers()) as response:
+            if response.status_code != 200:
+                error_text = await read_text(response.aiter_bytes(), ERROR_TEXT_BYTES)
+                raise Exception(f"HTTP {response.status_code}: {error_text}")
+            data, truncated = await read_json_stream(response.aiter_bytes(), limits)
+
+        data = data if isinstance(data, dict) else {}
+        products = data.get("products")
+        if not isinstance(products, AgentProducts):
+            products = AgentProducts()
+        products.truncated = products.truncated or truncated
+        _tag_products(products, agent.agent_id, agent.tenant_id)
+        return products, data.get("execution_time_ms", 0)
+
+    @staticmethod
+    def _trace_headers() -> Dict[str, str]:
+        """Propagate the current span to the agent as a W3C traceparent header"""
+        traceparent = tracer.traceparent()
+        return {TRACEPARENT_HEADER: traceparent} if traceparent else {}
+
+    async def _call_local_agent(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call a local agent over HTTP loopback, through the shared keep-alive pool
+        """
+        url = f"{self.base_url}/tenant/{tenant_id}/agent/{agent.type}/select_products"
+        payload = request.model_dump(include=SELECT_PAYLOAD_FIELDS)
+        response = await self.http_pool.post(url, json=payload, timeout=self.timeout, headers=self._trace_headers())
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
+
+        data = response.json()
+        products = data.get("products", [])
+        _tag_products(products, agent.agent_id, tenant_id)
+        return products, data.get("execution_time_ms", 0)
+
+    async def call_local_agent_in_process(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call a local agent in-process (avoiding HTTP loopback to our own server)
+        """
+        data = await product_selection_service.select_products(agent, tenant_id, request)
+
+        # Same contract as the HTTP endpoint, which answers 500 whenever error_message is set
+        if data.get("error_message"):
+            raise Exception(data["error_message"])
+
+        products = data.get("products", [])
+        _tag_products(products, agent.agent_id, tenant_id)
+        return products, data.get("execution_time_ms", 0)
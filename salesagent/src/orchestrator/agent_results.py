@@ -0,0 +1,107 @@
+"""
+Agent results - turn agent calls, cache hits, open circuits and cancellations into reports
+"""
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, UTC
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.adaptive_timeout import AgentCallPlan
+from src.orchestrator.agent_calls import _tag_products
+
+logger = logging.getLogger(__name__)
+
+
+def _report(agent: AgentConfig, tenant_id: str, status: AgentStatus, plan: Optional[AgentCallPlan] = None,
+            **fields: Any) -> AgentReport:
+    """Build an agent report, with the timeout and hedging details of the call plan if there was one"""
+    if plan is not None:
+        fields.update(timeout_ms=int(plan.timeout_seconds * 1000), hedged=plan.hedged,
+                      queue_wait_ms=plan.queue_wait_ms)
+    fields.setdefault("products_count", 0)
+    return AgentReport(agent_id=agent.agent_id, tenant_id=tenant_id, status=status,
+                       executed_at=datetime.now(UTC), **fields)
+
+
+class AgentResultMixin:
+    """Result handling for FanoutOrchestrator (uses its agent_cache, circuit_breaker and early_exit)"""
+
+    @staticmethod
+    def _pruned_report(agent: AgentConfig, tenant_id: str, reason: str) -> AgentReport:
+        """Report an agent capability routing skipped"""
+        return _report(agent, tenant_id, AgentStatus.PRUNED, error_message=f"Pruned: {reason}")
+
+    async def _skipped_result(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest
+    ) -> Optional[Tuple[List[Dict[str, Any]], AgentReport]]:
+        """
+        The result of an agent that needs no call - its cached response, or nothing if its circuit is open
+
+        The cache lookup runs in a worker thread, as a shared backend reads from disk.
+        """
+        cached_products = await asyncio.to_thread(self.agent_cache.get, tenant_id, agent.agent_id, request)
+        if cached_products is not None:
+            return cached_products, _report(agent, tenant_id, AgentStatus.ACTIVE, cached=True,
+                                            products_count=len(cached_products))
+
+        if not self.circuit_breaker.allow_request(tenant_id, agent.agent_id):
+            logger.info(f"Skipping agent {agent.agent_id}: circuit open")
+            return [], _report(agent, tenant_id, AgentStatus.CIRCUIT_OPEN,
+                               error_message="Skipped: circuit breaker open after repeated failures")
+        return None
+
+    def _build_agent_result(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        task: asyncio.Future,
+        plan: AgentCallPlan
+    ) -> Tuple[List[Dict[str, Any]], AgentReport]:
+        """
+        Turn a finished agent task into its products and report
+        """
+        self.timeout_policy.record_hedge(plan)
+        error = task.exception()
+
+        if error is not None:
+            logger.error(f"Agent {agent.agent_id} failed: {error}")
+            return [], _report(agent, tenant_id, AgentStatus.ERROR, plan, error_message=str(error))
+
+        products, execution_time_ms = task.result()
+        truncated = getattr(products, "truncated", None)
+        if truncated:
+            logger.warning(f"Agent {agent.agent_id} response truncated at its {truncated.replace('_', ' ')}")
+        _tag_products(products, agent.agent_id, tenant_id)
+
+        logger.info(f"Agent {agent.agent_id} returned {len(products)} products in {execution_time_ms}ms")
+        return products, _report(agent, tenant_id, AgentStatus.ACTIVE, plan, latency_ms=execution_time_ms,
+                                 truncated=bool(truncated), truncation_reason=truncated,
+                                 products_count=len(products))
+
+    async def _record_result(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest,
+        products: List[Dict[str, Any]],
+        report: AgentReport,
+        tracker=None
+    ) -> None:
+        """
+        Feed a finished call to the circuit breaker, the response cache and early exit
+
+        Responses truncated at a byte or product cap are not cached - a cache hit
+        would serve the incomplete products as if they were the agent's full answer.
+        """
+        succeeded = report.status == AgentStatus.ACTIVE
+        self.circuit_breaker.record_result(tenant_id, agent.agent_id, succeeded)
+        if succeeded:
+            if not report.truncated:
+                await asyncio.to_thread(self.agent_cache.set, tenant_id, agent.agent_id, request, products)
+            self.early_exit.record_response(agent.agent_id, products)
+        if tracker:
+            tracker.add_result(products, agent.agent_id)
@@ -0,0 +1,64 @@
+"""
+Buyer identity for fair scheduling - signed buyer ids, one-way keys, configured weights and bounded state
+"""
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ANONYMOUS_BUYER = "anonymous"
+# Calls of buyers without a configured weight are counted together in the stats
+OTHER_BUYERS = "other"
+# Per-process key for buyer_key(), so session tokens and addresses cannot be recovered or brute-forced
+_BUYER_KEY_SECRET = secrets.token_bytes(32)
+# Shared with buyers that have a configured weight, who sign their buyer id with it; unset, no id is trusted
+_BUYER_ID_SECRET = os.environ.get("ORCHESTRATOR_BUYER_ID_SECRET", "")
+
+
+def buyer_key(value: Optional[str], prefix: str = "buyer") -> Optional[str]:
+    """A stable, one-way scheduling key for a buyer credential such as a session token or client address"""
+    if not value:
+        return None
+    digest = hmac.new(_BUYER_KEY_SECRET, value.encode(), hashlib.sha256).hexdigest()[:16]
+    return f"{prefix}_{digest}"
+
+
+def sign_buyer_id(buyer_id: str, secret: str) -> str:
+    """The X-Buyer-Signature for a buyer id: hex HMAC-SHA256 of the id under the shared secret"""
+    return hmac.new(secret.encode(), buyer_id.encode(), hashlib.sha256).hexdigest()
+
+
+def authenticated_buyer_id(buyer_id: Optional[str], signature: Optional[str]) -> Optional[str]:
+    """The buyer id as given when its signature checks out under ORCHESTRATOR_BUYER_ID_SECRET, else None"""
+    if not (buyer_id and signature and _BUYER_ID_SECRET):
+        return None
+    if not hmac.compare_digest(sign_buyer_id(buyer_id, _BUYER_ID_SECRET), signature.strip().lower()):
+        return None
+    return buyer_id
+
+
+def parse_buyer_weights(value: Optional[str]) -> Dict[str, float]:
+    """Parse "buyer_a:2,buyer_b:0.5" into a weight per buyer"""
+    weights = {}
+    for item in (value or "").split(","):
+        buyer_id, _, weight = item.strip().rpartition(":")
+        if not buyer_id:
+            continue
+        try:
+            weights[buyer_id] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring invalid buyer weight '{item.strip()}'")
+    return weights
+
+
+def prune_finish_tags(finish_tags: Dict[str, float], virtual_time: float, max_buyers: int) -> Dict[str, float]:
+    """Forget idle buyers (they restart from the virtual clock anyway), then the oldest tags"""
+    finish_tags = {buyer_id: tag for buyer_id, tag in finish_tags.items() if tag > virtual_time}
+    if len(finish_tags) > max_buyers:
+        newest = sorted(finish_tags.items(), key=lambda item: item[1])[-max_buyers // 2:]
+        finish_tags = dict(newest)
+    return finish_tags
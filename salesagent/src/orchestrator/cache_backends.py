@@ -0,0 +1,103 @@
+"""
+Storage backends for CacheManager - the backend interface and a factory for the in-process
+memory and shared SQLite file backends
+"""
+import json
+import logging
+import os
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its size and timestamps (wall clock, so shareable across processes)"""
+    value: Any
+    size_bytes: int
+    created_at: float
+    last_accessed: float
+    expires_at: float
+
+
+def default_cache_path() -> str:
+    """The shared cache file in the application's private data directory (not /tmp)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "salesagent", "orchestrator_cache.db")
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """Approximate the memory footprint of a cached value by its JSON size"""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries, bounded by entry count and optional byte budget
+
+    Backends evict least recently used entries to stay within budget. TTL
+    policy and hit/miss accounting live in CacheManager.
+    """
+
+    name = "base"
+    shared = False
+
+    def __init__(self, max_size: int = 1000, max_bytes: Optional[int] = None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key without changing its recency"""
+
+    @abstractmethod
+    def touch(self, key: str, now: float) -> None:
+        """Mark an entry as most recently used"""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any existing one"""
+
+    @abstractmethod
+    def add(self, key: str, entry: CacheEntry, now: float) -> bool:
+        """Atomically store an entry unless a live (unexpired) one exists; returns whether it was stored"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry"""
+
+    @abstractmethod
+    def compare_and_delete(self, key: str, value: Any) -> bool:
+        """Atomically remove an entry only if it still holds value; returns whether it was removed"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries"""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend size statistics"""
+
+
+def create_cache_backend(
+    backend: str,
+    max_size: int,
+    max_bytes: Optional[int] = None,
+    path: Optional[str] = None,
+    table: str = "cache_entries"
+) -> CacheBackend:
+    """Build a cache backend by name ("memory" or "sqlite")"""
+    if backend == "sqlite":
+        # Imported here - the backend modules build on this one
+        from src.orchestrator.sqlite_cache_backend import SQLiteCacheBackend
+        return SQLiteCacheBackend(path or default_cache_path(), table=table, max_size=max_size, max_bytes=max_bytes)
+    if backend != "memory":
+        logger.warning(f"Unknown cache backend '{backend}', using memory")
+    from src.orchestrator.memory_cache_backend import MemoryCacheBackend
+    return MemoryCacheBackend(max_size=max_size, max_bytes=max_bytes)
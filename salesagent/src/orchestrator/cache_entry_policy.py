@@ -0,0 +1,47 @@
+"""
+Cache entry policy - byte budget and absolute, sliding and hard TTLs for CacheManager entries
+"""
+import time
+import logging
+import os
+from typing import Any, Optional
+
+from src.orchestrator.cache_backends import CacheEntry, estimate_size_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def default_hard_ttl_seconds() -> Optional[float]:
+    """How long expired results are kept to be served stale: only with stale-while-revalidate on"""
+    if os.environ.get("ORCHESTRATOR_CACHE_HARD_TTL_SECONDS"):
+        return float(os.environ["ORCHESTRATOR_CACHE_HARD_TTL_SECONDS"])
+    if os.environ.get("ORCHESTRATOR_STALE_WHILE_REVALIDATE", "false").lower() == "true":
+        return 900.0
+    return None
+
+
+class CacheEntryPolicyMixin:
+    """Entry rules for CacheManager (uses its max_bytes, ttl_seconds, idle_ttl_seconds and hard_ttl_seconds)"""
+    
+    def _build_entry(self, key: str, value: Any, ttl_seconds: Optional[float]) -> Optional[CacheEntry]:
+        """Build an entry for a value, or None if it exceeds the byte budget"""
+        size_bytes = estimate_size_bytes(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            self.rejected += 1
+            logger.warning(f"Not caching {key}: {size_bytes} bytes exceeds the {self.max_bytes} byte budget")
+            return None
+        
+        now = time.time()
+        return CacheEntry(
+            value=value,
+            size_bytes=size_bytes,
+            created_at=now,
+            last_accessed=now,
+            expires_at=now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        )
+    
+    def _is_expired(self, entry: CacheEntry, now: float) -> bool:
+        """Whether an entry is past its hard or sliding TTL and can no longer be served"""
+        if now > max(entry.created_at + (self.hard_ttl_seconds or 0), entry.expires_at):
+            return True
+        return self.idle_ttl_seconds is not None and now - entry.last_accessed > self.idle_ttl_seconds
@@ -0,0 +1,148 @@
+"""
+CacheManager - TTL and byte-budgeted cache over a pluggable backend, and the orchestration result cache
+"""
+import time
+import logging
+import os
+from typing import Any, Optional, Tuple
+
+from src.orchestrator.cache_backends import CacheBackend, create_cache_backend
+from src.orchestrator.cache_entry_policy import CacheEntryPolicyMixin, default_hard_ttl_seconds
+from src.orchestrator.cache_manager_stats import CacheManagerStatsMixin
+from src.orchestrator.memory_cache_backend import MemoryCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManager(CacheEntryPolicyMixin, CacheManagerStatsMixin):
+    """LRU cache with entry and byte budgets, absolute/sliding TTLs and a pluggable backend
+    
+    Entries expire ttl_seconds after they were stored, and optionally earlier if
+    they have not been read for idle_ttl_seconds. With hard_ttl_seconds, expired
+    entries are kept until that age so they can still be served stale through
+    lookup(). Storage defaults to an in-process O(1) LRU; a shared backend (e.g.
+    SQLite on local disk) lets all workers on a host use one cache.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 300,
+        max_bytes: Optional[int] = None,
+        idle_ttl_seconds: Optional[float] = None,
+        hard_ttl_seconds: Optional[float] = None,
+        backend: Optional[CacheBackend] = None
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.hard_ttl_seconds = hard_ttl_seconds
+        self.backend = backend or MemoryCacheBackend(max_size=max_size, max_bytes=max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.expirations = 0
+        self.rejected = 0
+    
+    @property
+    def shared(self) -> bool:
+        """Whether the cache is shared with other worker processes"""
+        return self.backend.shared
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        value, _ = self.lookup(key)
+        return value
+    
+    def lookup(self, key: str, allow_stale: bool = False) -> Tuple[Optional[Any], bool]:
+        """
+        Get value from cache, optionally accepting an entry past its TTL
+        
+        Returns:
+            Tuple of (value, stale); stale entries are only returned with allow_stale
+            and never once they are past hard_ttl_seconds (or ttl_seconds without
+            one), at which point they are evicted
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        
+        now = time.time()
+        if self._is_expired(entry, now):
+            self.backend.delete(key)
+            self.expirations += 1
+            self.misses += 1
+            return None, False
+        
+        stale = now > entry.expires_at
+        if stale and not allow_stale:
+            self.misses += 1
+            return None, False
+        
+        # Mark as most recently used
+        self.backend.touch(key, now)
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return entry.value, stale
+    
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a fresh value without counting a lookup or changing its recency"""
+        entry = self.backend.get(key)
+        if entry is None or time.time() > entry.expires_at:
+            return None
+        return entry.value
+    
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Set value in cache"""
+        entry = self._build_entry(key, value, ttl_seconds)
+        if entry is None:
+            self.backend.delete(key)
+            return
+        self.backend.set(key, entry)
+    
+    def add(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Atomically set a value unless the key already holds an unexpired one
+        
+        Returns:
+            True if the value was stored
+        """
+        entry = self._build_entry(key, value, ttl_seconds)
+        if entry is None:
+            return False
+        return self.backend.add(key, entry, entry.created_at)
+    
+    def delete(self, key: str) -> None:
+        """Remove key from cache"""
+        self.backend.delete(key)
+    
+    def compare_and_delete(self, key: str, value: Any) -> bool:
+        """Atomically remove key only if it still holds value; returns whether it was removed"""
+        return self.backend.compare_and_delete(key, value)
+    
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        self.backend.clear()
+
+
+# Global instance
+cache_manager = CacheManager(
+    max_size=int(os.environ.get("ORCHESTRATOR_CACHE_MAX_ENTRIES", "1000")),
+    ttl_seconds=int(os.environ.get("ORCHESTRATOR_CACHE_TTL_SECONDS", "300")),
+    max_bytes=int(os.environ.get("ORCHESTRATOR_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    idle_ttl_seconds=float(os.environ["ORCHESTRATOR_CACHE_IDLE_TTL_SECONDS"])
+    if os.environ.get("ORCHESTRATOR_CACHE_IDLE_TTL_SECONDS") else None,
+    hard_ttl_seconds=default_hard_ttl_seconds(),
+    backend=create_cache_backend(
+        os.environ.get("ORCHESTRATOR_CACHE_BACKEND", "memory"),
+        max_size=int(os.environ.get("ORCHESTRATOR_CACHE_MAX_ENTRIES", "1000")),
+        max_bytes=int(os.environ.get("ORCHESTRATOR_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        path=os.environ.get("ORCHESTRATOR_CACHE_PATH"),
+        table="orchestration_cache"
+    )
+)
+
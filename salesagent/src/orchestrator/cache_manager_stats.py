@@ -0,0 +1,26 @@
+"""
+Cache statistics - hit, miss and expiry counters reported by CacheManager
+"""
+from typing import Dict, Any
+
+
+class CacheManagerStatsMixin:
+    """Reporting for CacheManager (reads its settings, counters and backend stats)"""
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            **self.backend.get_stats(),
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "hard_ttl_seconds": self.hard_ttl_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expirations": self.expirations,
+            "rejected": self.rejected
+        }
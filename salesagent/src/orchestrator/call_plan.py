@@ -0,0 +1,143 @@
+"""
+Planned agent calls - adaptive timeout, hedged duplicate requests and fair scheduling
+"""
+import asyncio
+import logging
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentReport
+from src.core.tracing import Span, tracer
+from src.orchestrator.adaptive_timeout import AgentCallPlan
+from src.orchestrator.deadline import OrchestrationDeadline, agent_call_deadline
+
+logger = logging.getLogger(__name__)
+
+
+class PlannedCallMixin:
+    """Run FanoutOrchestrator agent calls under their plan (uses its timeout_policy and scheduler)"""
+
+    async def _start_calls(
+        self,
+        agents_data: List[Tuple[AgentConfig, str, str]],
+        request: AgentSelectRequest,
+        deadline: OrchestrationDeadline,
+        buyer_id: Optional[str],
+        fanout_span: Span
+    ) -> Tuple[Dict[asyncio.Future, Tuple[AgentConfig, str, AgentCallPlan]], List[Tuple[List[Dict[str, Any]], AgentReport]]]:
+        """
+        Start a planned call per agent, except for cached agents and those with an open circuit
+
+        Returns:
+            Tuple of (task -> (agent, tenant_id, plan), skipped agent results)
+        """
+        tasks, skipped = {}, []
+        results = await asyncio.gather(*(
+            self._skipped_result(agent, tenant_id, request) for agent, tenant_id, _ in agents_data
+        ))
+        for (agent, tenant_id, _), result in zip(agents_data, results):
+            if result is not None:
+                skipped.append(result)
+                continue
+            plan = self.timeout_policy.plan_call(agent, deadline.hard_timeout_seconds - deadline.elapsed_seconds, tenant_id)
+            with tracer.activate(fanout_span):
+                # The task copies the context, so its agent.call span nests under the fanout
+                task = asyncio.ensure_future(self._call_agent_with_plan(agent, tenant_id, request, plan, buyer_id))
+            tasks[task] = (agent, tenant_id, plan)
+        return tasks, skipped
+
+    async def _call_agent_with_plan(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest,
+        plan: AgentCallPlan,
+        buyer_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call an agent under its adaptive timeout (which includes any time spent queued)
+        """
+        start_time = time.time()
+
+        with tracer.span("agent.call", agent_id=agent.agent_id, tenant_id=tenant_id,
+                         agent_type=agent.type, timeout_ms=int(plan.timeout_seconds * 1000)) as span:
+            try:
+                with agent_call_deadline(plan.timeout_seconds):
+                    products, execution_time_ms = await asyncio.wait_for(
+                        self._call_agent_hedged(agent, tenant_id, request, plan, buyer_id),
+                        timeout=plan.timeout_seconds
+                    )
+                span.set_attribute("products", len(products))
+                # Measured here rather than trusting the agent's own execution_time_ms, and without queueing
+                queue_wait_seconds = (plan.queue_wait_ms or 0) / 1000
+                self.timeout_policy.record_latency(
+                    tenant_id, agent.agent_id, max(time.time() - start_time - queue_wait_seconds, 0.0)
+                )
+                return products, execution_time_ms
+            except asyncio.TimeoutError:
+                self.timeout_policy.record_latency(tenant_id, agent.agent_id, plan.timeout_seconds)
+                execution_time_ms = int((time.time() - start_time) * 1000)
+                logger.warning(f"Agent {agent.agent_id} exceeded its {plan.timeout_seconds:.2f}s timeout")
+                raise Exception(f"Timeout after {execution_time_ms}ms")
+            finally:
+                span.set_attribute("hedged", plan.hedged)
+                span.set_attribute("queue_wait_ms", plan.queue_wait_ms)
+
+    async def _call_agent_hedged(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest,
+        plan: AgentCallPlan,
+        buyer_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call an agent, sending a duplicate request if the first is slower than its hedge delay
+
+        The first successful attempt wins and the other is cancelled.
+        """
+        if plan.hedge_delay_seconds is None:
+            return await self._call_agent_scheduled(agent, tenant_id, request, plan, buyer_id)
+
+        primary = asyncio.ensure_future(self._call_agent_scheduled(agent, tenant_id, request, plan, buyer_id))
+        attempts = {primary}
+
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=plan.hedge_delay_seconds)
+            if not done:
+                logger.info(f"Agent {agent.agent_id} slower than {plan.hedge_delay_seconds:.2f}s, sending hedged request")
+                attempts.add(asyncio.ensure_future(self._call_agent_scheduled(agent, tenant_id, request, plan, buyer_id)))
+                plan.hedged = True
+
+            pending = set(attempts)
+            last_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        plan.hedge_won = attempt is not primary
+                        return attempt.result()
+                    last_error = attempt.exception()
+
+            raise last_error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _call_agent_scheduled(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest,
+        plan: AgentCallPlan,
+        buyer_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Call an agent once the shared scheduler admits it, recording the queue wait on the plan
+        """
+        agent_cap = agent.config.get("max_concurrent_calls")
+        async with self.scheduler.slot(buyer_id, tenant_id, agent.agent_id, agent_cap) as waited:
+            if plan.queue_wait_ms is None:
+                # The primary attempt's wait; a hedge queues separately
+                plan.queue_wait_ms = int(waited * 1000)
+            return await self._call_agent_provider(agent, tenant_id, request)
@@ -0,0 +1,139 @@
+"""
+Agent capabilities - summaries of what an agent's catalog can offer, and the requests they rule out
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from src.core.schemas.agent import AgentSelectRequest
+
+# The summary fields an agent reports (or declares in its config under "capabilities")
+CAPABILITY_FIELDS = ("formats", "channels", "countries", "min_cpm", "max_cpm", "product_count")
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Coerce a JSON column or config value into a list"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        try:
+            decoded = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return [value]
+        return decoded if isinstance(decoded, list) else [decoded]
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _as_number(value: Any, cast) -> Optional[Any]:
+    """value as a float or int, or None when it is missing or not a number"""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_id_and_channel(format_value: Any) -> Tuple[str, str]:
+    """Format id and channel (format type) for a format entry, e.g. "display_300x250" -> display"""
+    if isinstance(format_value, dict):
+        format_id = str(format_value.get("format_id") or format_value.get("id") or format_value.get("name") or "")
+        channel = str(format_value.get("type") or format_id.split("_")[0])
+    else:
+        format_id = str(format_value)
+        channel = format_id.split("_")[0]
+    return format_id.lower(), channel.lower()
+
+
+@dataclass
+class AgentCapabilities:
+    """What an agent's catalog can offer; None means unknown, which never prunes"""
+    formats: Optional[Set[str]] = None
+    channels: Optional[Set[str]] = None
+    countries: Optional[Set[str]] = None
+    min_cpm: Optional[float] = None
+    max_cpm: Optional[float] = None
+    product_count: Optional[int] = None
+    refreshed_at: float = 0.0
+
+    @classmethod
+    def from_products(cls, products: List[Dict[str, Any]]) -> "AgentCapabilities":
+        """Summarize a catalog of products with formats, countries and price_cpm"""
+        formats, channels, countries, prices = set(), set(), set(), []
+        any_country = False
+
+        for product in products:
+            for format_value in _as_list(product.get("formats")):
+                format_id, channel = _format_id_and_channel(format_value)
+                formats.add(format_id)
+                channels.add(channel)
+
+            product_countries = _as_list(product.get("countries"))
+            if product_countries:
+                countries.update(str(country).upper() for country in product_countries)
+            else:
+                # A product without a country list can run anywhere
+                any_country = True
+
+            price = _as_number(product.get("price_cpm"), float)
+            if price is not None:
+                prices.append(price)
+
+        return cls(
+            formats=formats,
+            channels=channels,
+            countries=None if any_country else countries,
+            min_cpm=min(prices) if prices else None,
+            max_cpm=max(prices) if prices else None,
+            product_count=len(products),
+            refreshed_at=time.monotonic()
+        )
+
+    @classmethod
+    def from_config(cls, capabilities: Dict[str, Any]) -> "AgentCapabilities":
+        """Capabilities a remote agent declares in its config under "capabilities\""""
+        def optional_set(key: str, transform) -> Optional[Set[str]]:
+            return {transform(str(value)) for value in _as_list(capabilities[key])} if key in capabilities else None
+
+        return cls(
+            formats=optional_set("formats", str.lower),
+            channels=optional_set("channels", str.lower),
+            countries=optional_set("countries", str.upper),
+            min_cpm=_as_number(capabilities.get("min_cpm"), float),
+            max_cpm=_as_number(capabilities.get("max_cpm"), float),
+            product_count=_as_number(capabilities.get("product_count"), int),
+            refreshed_at=time.monotonic()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The summary in the form agents report it, leaving out unknown fields"""
+        summary = {key: getattr(self, key) for key in CAPABILITY_FIELDS if getattr(self, key) is not None}
+        return {key: sorted(value) if isinstance(value, set) else value for key, value in summary.items()}
+
+    def prune_reason(self, request: AgentSelectRequest) -> Optional[str]:
+        """Why this agent cannot contribute to the request, or None if it might"""
+        if self.product_count == 0:
+            return "catalog is empty"
+
+        filters = request.filters or {}
+        checks = (
+            ("formats", self.formats, str.lower),
+            ("channels", self.channels, str.lower),
+            ("countries", self.countries, str.upper),
+        )
+        for key, offered, transform in checks:
+            wanted = {transform(str(value)) for value in _as_list(filters.get(key))}
+            if wanted and offered is not None and not wanted & offered:
+                return f"no products for {key} {', '.join(sorted(wanted))}"
+
+        # A filter that is not a number rules nothing out
+        max_cpm, min_cpm = _as_number(filters.get("max_cpm"), float), _as_number(filters.get("min_cpm"), float)
+        if max_cpm is not None and self.min_cpm is not None and self.min_cpm > max_cpm:
+            return f"cheapest product CPM {self.min_cpm} is above max_cpm {filters['max_cpm']}"
+        if min_cpm is not None and self.max_cpm is not None and self.max_cpm < min_cpm:
+            return f"most expensive product CPM {self.max_cpm} is below min_cpm {filters['min_cpm']}"
+
+        return None
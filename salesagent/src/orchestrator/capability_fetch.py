@@ -0,0 +1,55 @@
+"""
+Capability fetching - summarize local agents from the database and ask remote agents for theirs
+"""
+import asyncio
+import json
+import logging
+from typing import Dict, Any, Optional
+
+from src.core.schemas.agent import AgentConfig
+from src.orchestrator.capabilities import CAPABILITY_FIELDS, AgentCapabilities
+from src.orchestrator.mcp_client import mcp_client
+from src.orchestrator.response_stream import read_text
+from src.services.product_selection_service import product_selection_service
+
+logger = logging.getLogger(__name__)
+
+CAPABILITY_FETCH_TIMEOUT_SECONDS = 5.0
+CAPABILITY_MAX_BYTES = 256 * 1024
+
+
+class CapabilityFetchMixin:
+    """Capability loading for CapabilityRouter (uses its http_pool and counts remote_fetch_failures)"""
+
+    async def _load_capabilities(self, agent: AgentConfig, tenant_id: str) -> AgentCapabilities:
+        """Summarize an agent's catalog: local agents from the database, remote ones by asking the agent"""
+        is_remote = agent.type == "mcp" or (agent.endpoint_url or "").startswith("http")
+        if not is_remote:
+            products = await asyncio.to_thread(product_selection_service.load_catalog_attributes, agent, tenant_id)
+            return AgentCapabilities.from_products(products)
+
+        capabilities = dict(agent.config.get("capabilities") or {})
+        try:
+            if agent.type == "mcp":
+                reported = await mcp_client.get_agent_capabilities(agent.endpoint_url)
+            else:
+                reported = await self._fetch_capabilities(agent.endpoint_url)
+        except Exception as e:
+            self.remote_fetch_failures += 1
+            logger.warning(f"Could not fetch capabilities from agent {agent.agent_id}, using its config: {e}")
+            reported = None
+        if reported:
+            capabilities.update({key: reported[key] for key in CAPABILITY_FIELDS if key in reported})
+        return AgentCapabilities.from_config(capabilities)
+
+    async def _fetch_capabilities(self, endpoint_url: str) -> Optional[Dict[str, Any]]:
+        """GET an external agent's capability summary; None if it does not serve one"""
+        async with self.http_pool.stream("GET", f"{endpoint_url}/capabilities",
+                                         timeout=CAPABILITY_FETCH_TIMEOUT_SECONDS) as response:
+            if response.status_code == 404:
+                return None
+            body = await read_text(response.aiter_bytes(), CAPABILITY_MAX_BYTES)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}: {body[:200]}")
+        reported = json.loads(body)
+        return reported if isinstance(reported, dict) else None
@@ -0,0 +1,66 @@
+"""
+Capability refresh - rebuild agent capability summaries off the request path
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from typing import List, Tuple
+
+from src.core.schemas.agent import AgentConfig
+from src.orchestrator.capabilities import AgentCapabilities
+from src.orchestrator.runtime import async_runtime
+
+logger = logging.getLogger(__name__)
+
+
+class CapabilityRefreshMixin:
+    """Background and periodic refreshes for CapabilityRouter (uses its capabilities and _load_capabilities)"""
+
+    async def refresh(self, agents: List[Tuple[AgentConfig, str]]) -> None:
+        """Rebuild the capability summaries for the given agents, concurrently"""
+        await asyncio.gather(*(self._refresh_agent(agent, tenant_id) for agent, tenant_id in agents))
+
+    async def _refresh_agent(self, agent: AgentConfig, tenant_id: str) -> None:
+        try:
+            self.capabilities[(tenant_id, agent.agent_id)] = await self._load_capabilities(agent, tenant_id)
+            self.refreshes += 1
+        except Exception as e:
+            logger.warning(f"Could not refresh capabilities for agent {agent.agent_id}: {e}")
+            # Unknown capabilities never prune; retry after the refresh interval
+            self.capabilities[(tenant_id, agent.agent_id)] = AgentCapabilities(refreshed_at=time.monotonic())
+
+    def _refresh_in_background(self, agents: List[Tuple[AgentConfig, str]]) -> None:
+        """Start refreshing the given agents on the running loop, skipping those already being refreshed"""
+        pending = [(agent, tenant_id) for agent, tenant_id in agents
+                   if (tenant_id, agent.agent_id) not in self._refreshing]
+        if not pending:
+            return
+
+        keys = {(tenant_id, agent.agent_id) for agent, tenant_id in pending}
+        self._refreshing.update(keys)
+        # A fresh context, so the refresh is not tied to the request's deadline or trace
+        task = asyncio.get_running_loop().create_task(self.refresh(pending), context=contextvars.Context())
+        self._tasks.add(task)
+
+        def refreshed(task: asyncio.Task) -> None:
+            self._tasks.discard(task)
+            self._refreshing.difference_update(keys)
+
+        task.add_done_callback(refreshed)
+
+    def _ensure_periodic_refresh(self) -> None:
+        """Start the periodic refresh on the async runtime's loop, once per loop"""
+        if not async_runtime.in_runtime_thread():
+            return
+        loop = asyncio.get_running_loop()
+        if self._periodic is None or self._periodic.done() or self._periodic.get_loop() is not loop:
+            self._periodic = loop.create_task(self._refresh_periodically(), context=contextvars.Context())
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh(list(self._agents.values()))
+            except Exception as e:
+                logger.warning(f"Periodic capability refresh failed: {e}")
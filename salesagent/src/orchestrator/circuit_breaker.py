@@ -0,0 +1,136 @@
+"""
+Per-agent circuit breaker driven by PerformanceMonitor call history
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Any, Optional, Tuple
+
+from src.orchestrator.performance_monitor import PerformanceMonitor, performance_monitor
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state enumeration"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitStatus:
+    """Breaker state for a single (tenant, agent)"""
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probe_started_at: Optional[float] = None
+    times_opened: int = 0
+
+
+class AgentCircuitBreaker:
+    """Skip agents whose recent calls mostly failed, probing them again after a cool-down"""
+
+    def __init__(
+        self,
+        monitor: PerformanceMonitor,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 5,
+        window: int = 10,
+        open_seconds: float = 30.0
+    ):
+        self.monitor = monitor
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self.circuits: Dict[Tuple[str, str], CircuitStatus] = {}
+        self.skipped_calls = 0
+
+    def allow_request(self, tenant_id: str, agent_id: str) -> bool:
+        """Whether the agent should be called now"""
+        circuit = self.circuits.get((tenant_id, agent_id))
+        if circuit is None or circuit.state == CircuitState.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self.open_seconds:
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probe_started_at = None
+            logger.info(f"Circuit for agent {agent_id} (tenant {tenant_id}) is half-open")
+
+        # Half-open: let a single probe through; retry the probe if it never reported back
+        probe_stale = circuit.probe_started_at is None or now - circuit.probe_started_at >= self.open_seconds
+        if circuit.state == CircuitState.HALF_OPEN and probe_stale:
+            circuit.probe_started_at = now
+            return True
+
+        self.skipped_calls += 1
+        return False
+
+    def record_result(self, tenant_id: str, agent_id: str, success: bool) -> None:
+        """Record a call outcome and update the circuit state"""
+        key = (tenant_id, agent_id)
+        self.monitor.record_agent_outcome(tenant_id, agent_id, success)
+        circuit = self.circuits.setdefault(key, CircuitStatus())
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            if success:
+                circuit.state = CircuitState.CLOSED
+                self.monitor.reset_agent_outcomes(tenant_id, agent_id)
+                logger.info(f"Circuit for agent {agent_id} (tenant {tenant_id}) closed after successful probe")
+            else:
+                self._open(circuit, agent_id, tenant_id)
+            return
+
+        if circuit.state == CircuitState.CLOSED and not success:
+            outcomes = self.monitor.get_recent_outcomes(tenant_id, agent_id, self.window)
+            failure_rate = outcomes.count(False) / len(outcomes)
+            if len(outcomes) >= self.min_calls and failure_rate >= self.failure_rate_threshold:
+                self._open(circuit, agent_id, tenant_id)
+
+    def get_state(self, tenant_id: str, agent_id: str) -> CircuitState:
+        """Get the current circuit state for an agent"""
+        circuit = self.circuits.get((tenant_id, agent_id))
+        return circuit.state if circuit else CircuitState.CLOSED
+
+    def clear(self) -> None:
+        """Close every circuit and forget the monitor's call outcomes"""
+        self.circuits.clear()
+        self.skipped_calls = 0
+        self.monitor.clear_agent_outcomes()
+
+    def _open(self, circuit: CircuitStatus, agent_id: str, tenant_id: str) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.times_opened += 1
+        logger.warning(f"Circuit for agent {agent_id} (tenant {tenant_id}) opened for {self.open_seconds}s")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics"""
+        not_closed = {
+            f"{tenant_id}:{agent_id}": circuit.state.value
+            for (tenant_id, agent_id), circuit in self.circuits.items()
+            if circuit.state != CircuitState.CLOSED
+        }
+        return {
+            "tracked_agents": len(self.circuits),
+            "open_circuits": list(not_closed.values()).count(CircuitState.OPEN.value),
+            "half_open_circuits": list(not_closed.values()).count(CircuitState.HALF_OPEN.value),
+            "circuits": not_closed,
+            "skipped_calls": self.skipped_calls,
+            "failure_rate_threshold": self.failure_rate_threshold,
+            "min_calls": self.min_calls,
+            "open_seconds": self.open_seconds
+        }
+
+
+# Global instance
+circuit_breaker = AgentCircuitBreaker(
+    monitor=performance_monitor,
+    failure_rate_threshold=float(os.environ.get("ORCHESTRATOR_BREAKER_FAILURE_RATE", "0.5")),
+    min_calls=int(os.environ.get("ORCHESTRATOR_BREAKER_MIN_CALLS", "5")),
+    window=int(os.environ.get("ORCHESTRATOR_BREAKER_WINDOW", "10")),
+    open_seconds=float(os.environ.get("ORCHESTRATOR_BREAKER_OPEN_SECONDS", "30"))
+)
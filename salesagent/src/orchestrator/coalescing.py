@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing of identical concurrent orchestrations
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Awaitable, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCoalescer:
+    """Let concurrent callers with the same key share one in-flight computation
+
+    In-flight work is tracked with thread-safe futures, so requests served on
+    different threads and event loops still coalesce onto a single fanout.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.leader_requests = 0
+        self.coalesced_requests = 0
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run func once for all concurrent callers with the same key
+
+        Returns:
+            Tuple of (result, coalesced) where coalesced is True if the result
+            came from another caller's in-flight run
+        """
+        if not self.enabled:
+            return await func(), False
+
+        while True:
+            with self._lock:
+                future = self._in_flight.get(key)
+                # A cancelled leader that has not cleaned up yet is not joined again
+                leader = future is None or future.cancelled()
+                if leader:
+                    future = Future()
+                    self._in_flight[key] = future
+                    self.leader_requests += 1
+                else:
+                    self.coalesced_requests += 1
+
+            if leader:
+                break
+            try:
+                # Shielded: a follower giving up (agent timeout, early exit) must not cancel the shared run
+                return await asyncio.shield(asyncio.wrap_future(future)), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled rather than failing; run it ourselves
+                logger.info(f"In-flight request {key} was cancelled, running it again")
+
+        try:
+            result = await func()
+            future.set_result(result)
+            return result, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request coalescing statistics"""
+        total = self.leader_requests + self.coalesced_requests
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._in_flight),
+            "leader_requests": self.leader_requests,
+            "coalesced_requests": self.coalesced_requests,
+            "coalesced_ratio": self.coalesced_requests / total if total else 0.0
+        }
+
+
+# Global instance
+request_coalescer = RequestCoalescer(
+    enabled=os.environ.get("ORCHESTRATOR_COALESCE_REQUESTS", "true").lower() == "true"
+)
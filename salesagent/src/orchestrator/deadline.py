@@ -0,0 +1,100 @@
+"""
+Orchestration deadlines - hard end-to-end limit and soft early-return deadline
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from src.core.schemas.agent import AgentSelectRequest
+
+# Monotonic time by which the current agent call must finish (follows the call into its tasks)
+_agent_call_deadline: ContextVar[Optional[float]] = ContextVar("agent_call_deadline", default=None)
+
+
+@contextmanager
+def agent_call_deadline(timeout_seconds: float) -> Iterator[None]:
+    """Make an agent call's timeout visible to the clients it calls through"""
+    token = _agent_call_deadline.set(time.monotonic() + timeout_seconds)
+    try:
+        yield
+    finally:
+        _agent_call_deadline.reset(token)
+
+
+def remaining_call_seconds() -> Optional[float]:
+    """Seconds left before the current agent call's timeout, or None outside a planned call"""
+    deadline = _agent_call_deadline.get()
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+
+@dataclass
+class DeadlinePolicy:
+    """Deployment-wide deadline settings for orchestrations"""
+    # Hard limit for the whole orchestration; None means use request.timeout_seconds
+    hard_timeout_seconds: Optional[float] = None
+    # Once this much time has passed, return early if enough products are in
+    soft_deadline_seconds: Optional[float] = None
+    # Products needed to return at the soft deadline; None means request.max_results
+    soft_deadline_min_products: Optional[int] = None
+
+
+@dataclass
+class OrchestrationDeadline:
+    """Deadline tracker for a single orchestration"""
+    hard_timeout_seconds: float
+    soft_deadline_seconds: Optional[float] = None
+    soft_deadline_min_products: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def start(cls, policy: DeadlinePolicy, request: AgentSelectRequest) -> "OrchestrationDeadline":
+        """Start the clock for a request under the given policy"""
+        hard_timeout = policy.hard_timeout_seconds or float(request.timeout_seconds)
+        min_products = policy.soft_deadline_min_products
+        return cls(
+            hard_timeout_seconds=hard_timeout,
+            soft_deadline_seconds=policy.soft_deadline_seconds,
+            soft_deadline_min_products=request.max_results if min_products is None else min_products
+        )
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the orchestration started"""
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        """Whether the hard deadline has passed"""
+        return self.elapsed_seconds >= self.hard_timeout_seconds
+
+    def next_wait_seconds(self) -> float:
+        """How long to wait for the next agent before re-checking deadlines"""
+        remaining = self.hard_timeout_seconds - self.elapsed_seconds
+        if self.soft_deadline_seconds is not None:
+            until_soft = self.soft_deadline_seconds - self.elapsed_seconds
+            if until_soft > 0:
+                remaining = min(remaining, until_soft)
+        return max(remaining, 0.0)
+
+    def soft_deadline_reached(self, products_count: int) -> bool:
+        """Whether the soft deadline has passed with enough products collected"""
+        if self.soft_deadline_seconds is None:
+            return False
+        return (self.elapsed_seconds >= self.soft_deadline_seconds
+                and products_count >= self.soft_deadline_min_products)
+
+
+def _optional_env(name: str, cast):
+    value = os.environ.get(name)
+    return cast(value) if value else None
+
+
+# Global instance
+deadline_policy = DeadlinePolicy(
+    hard_timeout_seconds=_optional_env("ORCHESTRATOR_DEADLINE_SECONDS", float),
+    soft_deadline_seconds=_optional_env("ORCHESTRATOR_SOFT_DEADLINE_SECONDS", float),
+    soft_deadline_min_products=_optional_env("ORCHESTRATOR_SOFT_DEADLINE_MIN_PRODUCTS", int)
+)
@@ -0,0 +1,112 @@
+"""
+Early termination - stop waiting for agents once the top-k result set is settled
+"""
+import os
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Deque
+
+from src.orchestrator.early_exit_tracker import EarlyExitTracker, product_score
+
+
+class EarlyExitPolicy:
+    """Decide when a fanout can stop waiting for its remaining agents
+
+    Two optional rules, either of which ends the wait:
+    - the current top-k cannot be displaced: every pending agent has enough
+      history and none of its recent best scores beat the current k-th score
+    - a target fraction of the agents has answered
+
+    Per-agent score ceilings are the maximum product score over each agent's
+    last history_size responses, learned from the agents' own answers. An agent
+    that early exit keeps cancelling would never answer again and keep its old
+    ceiling, so after probe_every - 1 consecutive cancellations its ceiling is
+    treated as unknown and the next fanout waits for it (1 in probe_every
+    orchestrations); probe_every = 0 turns probing off.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        target_fraction: Optional[float] = None,
+        min_history: int = 5,
+        history_size: int = 20,
+        probe_every: int = 10
+    ):
+        self.enabled = enabled
+        self.target_fraction = target_fraction
+        self.min_history = min_history
+        self.history_size = history_size
+        self.probe_every = probe_every
+        self.max_scores: Dict[str, Deque[float]] = {}
+        self.early_exits: Dict[str, int] = defaultdict(int)
+        # Consecutive early-exit cancellations since each agent last finished a call
+        self.skipped: Dict[str, int] = {}
+        self.cancelled_agents = 0
+
+    def start(self, max_results: int, total_agents: int) -> Optional[EarlyExitTracker]:
+        """Begin tracking one fanout, or None when early exit is off"""
+        if not self.enabled:
+            return None
+        return EarlyExitTracker(self, max_results, total_agents)
+
+    def record_response(self, agent_id: str, products: List[Dict[str, Any]]) -> None:
+        """Remember the best score an agent returned"""
+        scores = [product_score(product) for product in products]
+        history = self.max_scores.get(agent_id)
+        if history is None:
+            history = self.max_scores[agent_id] = deque(maxlen=self.history_size)
+        history.append(max(scores, default=0.0))
+
+    def score_ceiling(self, agent_id: str) -> Optional[float]:
+        """Highest score the agent returned recently, or None without enough history or when due a probe"""
+        if self.probe_every and self.skipped.get(agent_id, 0) >= self.probe_every - 1:
+            return None
+        history = self.max_scores.get(agent_id)
+        if history is None or len(history) < self.min_history:
+            return None
+        return max(history)
+
+    def record_finished(self, agent_id: str) -> None:
+        """An agent's call finished (answered, failed or timed out) rather than being cut off"""
+        self.skipped.pop(agent_id, None)
+
+    def record_exit(self, rule: str, cancelled_agent_ids: List[str]) -> None:
+        """Count an early exit and the agents it cancelled"""
+        self.early_exits[rule] += 1
+        self.cancelled_agents += len(cancelled_agent_ids)
+        for agent_id in cancelled_agent_ids:
+            self.skipped[agent_id] = self.skipped.get(agent_id, 0) + 1
+
+    def clear(self) -> None:
+        """Forget every agent's score history and the early exit counts"""
+        self.max_scores.clear()
+        self.early_exits.clear()
+        self.skipped.clear()
+        self.cancelled_agents = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get early exit statistics"""
+        return {
+            "enabled": self.enabled,
+            "target_fraction": self.target_fraction,
+            "min_history": self.min_history,
+            "probe_every": self.probe_every,
+            "tracked_agents": len(self.max_scores),
+            "early_exits": dict(self.early_exits),
+            "cancelled_agents": self.cancelled_agents
+        }
+
+
+def _optional_float(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+# Global instance
+early_exit_policy = EarlyExitPolicy(
+    enabled=os.environ.get("ORCHESTRATOR_EARLY_EXIT", "false").lower() == "true",
+    target_fraction=_optional_float("ORCHESTRATOR_EARLY_EXIT_TARGET_FRACTION"),
+    min_history=int(os.environ.get("ORCHESTRATOR_EARLY_EXIT_MIN_HISTORY", "5")),
+    history_size=int(os.environ.get("ORCHESTRATOR_EARLY_EXIT_HISTORY_SIZE", "20")),
+    probe_every=int(os.environ.get("ORCHESTRATOR_EARLY_EXIT_PROBE_EVERY", "10"))
+)
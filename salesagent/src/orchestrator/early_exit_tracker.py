@@ -0,0 +1,63 @@
+"""
+Early exit tracking - running top-k state of a single fanout
+"""
+import heapq
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+if TYPE_CHECKING:
+    from src.orchestrator.early_exit import EarlyExitPolicy
+
+
+class EarlyExitTracker:
+    """Running k-th best score and answer count for a single fanout"""
+
+    def __init__(self, policy: "EarlyExitPolicy", max_results: int, total_agents: int):
+        self.policy = policy
+        self.max_results = max(max_results, 1)
+        self.total_agents = total_agents
+        self.answered = 0
+        self.best_scores: Dict[str, float] = {}
+
+    def add_result(self, products: List[Dict[str, Any]], agent_id: Optional[str] = None) -> None:
+        """Fold one agent's answer (or a cached answer, without agent_id) into the running state"""
+        self.answered += 1
+        if agent_id is not None:
+            self.policy.record_finished(agent_id)
+        for product in products:
+            key = f"{product.get('publisher_tenant_id', '')}_{product.get('product_id', '')}"
+            score = product_score(product)
+            if score > self.best_scores.get(key, float("-inf")):
+                self.best_scores[key] = score
+
+    def kth_score(self) -> Optional[float]:
+        """Score of the k-th best distinct product so far, or None with fewer than k"""
+        if len(self.best_scores) < self.max_results:
+            return None
+        return heapq.nlargest(self.max_results, self.best_scores.values())[-1]
+
+    def stop_reason(self, pending_agent_ids: List[str]) -> Optional[str]:
+        """Why the remaining agents need not be awaited, or None to keep waiting"""
+        if not pending_agent_ids:
+            return None
+
+        target = self.policy.target_fraction
+        if target is not None and self.answered >= target * self.total_agents:
+            return f"target_fraction: {self.answered}/{self.total_agents} agents answered"
+
+        kth_score = self.kth_score()
+        if kth_score is None:
+            return None
+        for agent_id in pending_agent_ids:
+            ceiling = self.policy.score_ceiling(agent_id)
+            # Equal scores can still displace on price or name
+            if ceiling is None or ceiling >= kth_score:
+                return None
+        return f"top_k_settled: no pending agent has scored above the k-th score {kth_score:.3f}"
+
+
+def product_score(product: Dict[str, Any]) -> float:
+    """A product's score as a float (0.0 when missing or malformed)"""
+    try:
+        return float(product.get("score", 0.0))
+    except (TypeError, ValueError):
+        return 0.0
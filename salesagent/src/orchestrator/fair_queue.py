@@ -0,0 +1,89 @@
+"""
+Weighted fair queue of agent calls - virtual finish tags per buyer and per-agent caps
+"""
+import asyncio
+import bisect
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from src.orchestrator.buyers import OTHER_BUYERS, prune_finish_tags
+
+AgentKey = Tuple[str, str]
+
+
+@dataclass(order=True)
+class _Ticket:
+    """A queued agent call, ordered by its virtual finish tag"""
+    tag: float
+    seq: int
+    buyer_id: str = field(compare=False)
+    agent_key: AgentKey = field(compare=False)
+    agent_cap: int = field(compare=False)
+    loop: Optional[asyncio.AbstractEventLoop] = field(default=None, compare=False)
+    future: Optional[asyncio.Future] = field(default=None, compare=False)
+    granted: bool = field(default=False, compare=False)
+
+
+class FairQueueMixin:
+    """Start-time fair queueing for AgentCallScheduler (all methods run under its lock)"""
+
+    def _weight(self, buyer_id: str) -> float:
+        return max(self.buyer_weights.get(buyer_id, 1.0), 0.01)
+
+    def _enqueue_locked(self, buyer_id: str, agent_key: AgentKey, agent_cap: int) -> _Ticket:
+        """Tag a call after the buyer's previous one and admit whatever is eligible"""
+        loop = asyncio.get_running_loop()
+        tag = max(self._virtual_time, self._finish_tags.get(buyer_id, 0.0)) + 1.0 / self._weight(buyer_id)
+        self._finish_tags[buyer_id] = tag
+        ticket = _Ticket(
+            tag=tag,
+            seq=next(self._seq),
+            buyer_id=buyer_id,
+            agent_key=agent_key,
+            agent_cap=agent_cap,
+            loop=loop,
+            future=loop.create_future()
+        )
+        bisect.insort(self._waiters, ticket)
+        self._dispatch_locked()
+        return ticket
+
+    def _release_locked(self, agent_key: AgentKey) -> None:
+        self.in_flight -= 1
+        self.agent_in_flight[agent_key] -= 1
+        if not self.agent_in_flight[agent_key]:
+            del self.agent_in_flight[agent_key]
+        self._dispatch_locked()
+
+    def _dispatch_locked(self) -> None:
+        """Admit waiting calls in tag order, skipping those whose agent is at its cap"""
+        index = 0
+        while index < len(self._waiters) and self.in_flight < self.max_inflight_calls:
+            ticket = self._waiters[index]
+            if self.agent_in_flight.get(ticket.agent_key, 0) >= ticket.agent_cap:
+                index += 1
+                continue
+
+            del self._waiters[index]
+            if ticket.future.done():
+                continue
+            try:
+                ticket.loop.call_soon_threadsafe(self._wake, ticket.future)
+            except RuntimeError:
+                # Waiter's event loop already closed
+                continue
+
+            ticket.granted = True
+            self.in_flight += 1
+            self.agent_in_flight[ticket.agent_key] += 1
+            self.granted += 1
+            self.buyer_calls[ticket.buyer_id if ticket.buyer_id in self.buyer_weights else OTHER_BUYERS] += 1
+            self._virtual_time = max(self._virtual_time, ticket.tag - 1.0 / self._weight(ticket.buyer_id))
+
+        if len(self._finish_tags) > self.max_tracked_buyers:
+            self._finish_tags = prune_finish_tags(self._finish_tags, self._virtual_time, self.max_tracked_buyers)
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
@@ -3,315 +3,147 @@ Fanout Orchestrator - Calls all agent provider endpoints concurrently
 """
 import asyncio
 import logging
+import os
 import time
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, UTC
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 
-import httpx
-
-from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentReport, AgentStatus
+from src.core.schemas.agent import AgentSelectRequest, AgentReport
 from src.services.agent_management_service import agent_management_service
-from src.orchestrator.mcp_client import mcp_client
+from src.orchestrator.http_pool import http_client_pool
+from src.orchestrator.deadline import OrchestrationDeadline, deadline_policy
+from src.orchestrator.circuit_breaker import circuit_breaker
+from src.orchestrator.adaptive_timeout import adaptive_timeout_policy
+from src.orchestrator.agent_cache import agent_response_cache
+from src.orchestrator.agent_calls import AgentCallMixin
+from src.orchestrator.agent_results import AgentResultMixin
+from src.orchestrator.call_plan import PlannedCallMixin
+from src.orchestrator.routing import capability_router
+from src.orchestrator.scheduler import agent_call_scheduler
+from src.orchestrator.stragglers import StragglerMixin
+from src.orchestrator.early_exit import early_exit_policy
+from src.core.metrics import metrics_registry
+from src.core.tracing import Span, tracer
+from src.orchestrator.response_limits import default_response_limits
 
 logger = logging.getLogger(__name__)
 
+fanout_duration = metrics_registry.histogram(
+    "orchestrator_fanout_duration_seconds",
+    "Time from fanout start until every contacted agent answered or was cancelled"
+)
+
 
-class FanoutOrchestrator:
+class FanoutOrchestrator(PlannedCallMixin, AgentCallMixin, AgentResultMixin, StragglerMixin):
     """Orchestrator that fans out requests to all agent provider endpoints"""
-    
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 10, max_concurrency: int = 12):
+
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 10, local_agents_in_process: bool = True):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.max_concurrency = max_concurrency
-        self.semaphore = asyncio.Semaphore(max_concurrency)
-    
+        self.local_agents_in_process = local_agents_in_process
+        # Shared by every orchestration - fair across buyers, capped per agent
+        self.scheduler = agent_call_scheduler
+        self.early_exit = early_exit_policy
+        self.http_pool = http_client_pool
+        self.deadline_policy = deadline_policy
+        self.circuit_breaker = circuit_breaker
+        self.timeout_policy = adaptive_timeout_policy
+        self.agent_cache = agent_response_cache
+        self.router = capability_router
+        self.response_limits = default_response_limits
+
     async def fanout_to_agents(
         self,
         request: AgentSelectRequest,
         include_tenant_ids: Optional[List[str]] = None,
         exclude_tenant_ids: Optional[List[str]] = None,
         include_agent_ids: Optional[List[str]] = None,
-        agent_types: Optional[List[str]] = None
+        agent_types: Optional[List[str]] = None,
+        deadline: Optional[OrchestrationDeadline] = None,
+        buyer_id: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], List[AgentReport]]:
         """
         Fan out request to all active agents and collect results
-        
+
         Returns:
             Tuple of (products_list, agent_reports)
         """
         start_time = time.time()
-        
+        all_products, agent_reports = [], []
         try:
-            # Discover all active agents
-            agents_data = agent_management_service.discover_active_agents(
-                include_tenant_ids=include_tenant_ids,
-                exclude_tenant_ids=exclude_tenant_ids,
-                include_agent_ids=include_agent_ids,
-                agent_types=agent_types
-            )
-            
-            logger.info(f"Fanning out to {len(agents_data)} agents")
-            
-            if not agents_data:
-                logger.warning("No active agents found for fanout")
-                return [], []
-            
-            # Create tasks for all agents
-            tasks = []
-            for agent, tenant_id, tenant_name in agents_data:
-                task = self._call_agent_provider(agent, tenant_id, request)
-                tasks.append(task)
-            
-            # Execute all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            all_products = []
-            agent_reports = []
-            
-            for i, result in enumerate(results):
-                agent, tenant_id, tenant_name = agents_data[i]
-                
-                if isinstance(result, Exception):
-                    # Agent call failed
-                    report = AgentReport(
-                        agent_id=agent.agent_id,
-                        tenant_id=tenant_id,
-                        status=AgentStatus.ERROR,
-                        error_message=str(result),
-                        products_count=0,
-                        executed_at=datetime.now(UTC)
-                    )
-                    agent_reports.append(report)
-                    logger.error(f"Agent {agent.agent_id} failed: {result}")
-                    
-                else:
-                    # Agent call succeeded
-                    products, execution_time_ms = result
-                    
-                    # Add products to collection
-                    for product in products:
-                        product["source_agent_id"] = agent.agent_id
-                        product["publisher_tenant_id"] = tenant_id
-                        all_products.append(product)
-                    
-                    # Create report
-                    report = AgentReport(
-                        agent_id=agent.agent_id,
-                        tenant_id=tenant_id,
-                        status=AgentStatus.ACTIVE,
-                        latency_ms=execution_time_ms,
-                        products_count=len(products),
-                        executed_at=datetime.now(UTC)
-                    )
-                    agent_reports.append(report)
-                    
-                    logger.info(f"Agent {agent.agent_id} returned {len(products)} products in {execution_time_ms}ms")
-            
-            total_time_ms = int((time.time() - start_time) * 1000)
-            logger.info(f"Fanout completed in {total_time_ms}ms - {len(all_products)} total products from {len(agent_reports)} agents")
-            
-            return all_products, agent_reports
-            
+            async for products, report in self.stream_agent_results(
+                request, include_tenant_ids, exclude_tenant_ids, include_agent_ids, agent_types, deadline, buyer_id
+            ):
+                all_products.extend(products)
+                agent_reports.append(report)
         except Exception as e:
             logger.error(f"Error in fanout orchestration: {e}", exc_info=True)
             return [], []
-    
-    async def _call_agent_provider(
-        self, 
-        agent: AgentConfig, 
-        tenant_id: str, 
-        request: AgentSelectRequest
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """
-        Call a single agent provider endpoint
-        """
-        async with self.semaphore:
-            start_time = time.time()
-            
-            try:
-                # Handle different agent types
-                if agent.type == "mcp":
-                    # MCP agent - use MCP client
-                    return await self._call_mcp_agent(agent, request)
-                elif agent.endpoint_url and agent.endpoint_url.startswith('http'):
-                    # External agent with custom endpoint
-                    return await self._call_external_agent(agent, request)
-                else:
-                    # Local agent
-                    return await self._call_local_agent(agent, tenant_id, request)
-                        
-            except asyncio.TimeoutError:
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                logger.warning(f"Agent {agent.agent_id} timed out after {execution_time_ms}ms")
-                raise Exception(f"Timeout after {execution_time_ms}ms")
-                
-            except Exception as e:
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                logger.error(f"Agent {agent.agent_id} failed after {execution_time_ms}ms: {e}")
-                raise
-    
-    async def _call_mcp_agent(
-        self, 
-        agent: AgentConfig, 
-        request: AgentSelectRequest
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """
-        Call an MCP-compliant agent
-        """
-        try:
-            result = await mcp_client.call_mcp_agent(
-                endpoint_url=agent.endpoint_url,
-                request=request,
-                agent_config=agent.config
-            )
-            
-            products = result.get("products", [])
-            execution_time_ms = result.get("execution_time_ms", 0)
-            
-            # Add source information to products
-            for product in products:
-                product["source_agent_id"] = agent.agent_id
-                product["publisher_tenant_id"] = agent.tenant_id
-            
-            return products, execution_time_ms
-            
-        except Exception as e:
-            logger.error(f"MCP agent {agent.agent_id} failed: {e}")
-            raise
-    
-    async def _call_external_agent(
-        self, 
-        agent: AgentConfig, 
-        request: AgentSelectRequest
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """
-        Call an external agent with custom endpoint
-        """
-        try:
-            url = f"{agent.endpoint_url}/select_products"
-            
-            # Prepare request payload
-            payload = {
-                "prompt": request.prompt,
-                "max_results": request.max_results,
-                "filters": request.filters,
-                "locale": request.locale,
-                "currency": request.currency,
-                "timeout_seconds": request.timeout_seconds
-            }
-            
-            # Make HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    products = data.get("products", [])
-                    execution_time_ms = data.get("execution_time_ms", 0)
-                    
-                    # Add source information to products
-                    for product in products:
-                        product["source_agent_id"] = agent.agent_id
-                        product["publisher_tenant_id"] = agent.tenant_id
-                    
-                    return products, execution_time_ms
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
-                    raise Exception(error_msg)
-                    
-        except Exception as e:
-            logger.error(f"External agent {agent.agent_id} failed: {e}")
-            raise
-    
-    async def _call_local_agent(
-        self, 
-        agent: AgentConfig, 
-        tenant_id: str, 
-        request: AgentSelectRequest
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """
-        Call a local agent
-        """
-        try:
-            agent_type = agent.type
-            url = f"{self.base_url}/tenant/{tenant_id}/agent/{agent_type}/select_products"
-            
-            # Prepare request payload
-            payload = {
-                "prompt": request.prompt,
-                "max_results": request.max_results,
-                "filters": request.filters,
-                "locale": request.locale,
-                "currency": request.currency,
-                "timeout_seconds": request.timeout_seconds
-            }
-            
-            # Make HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    products = data.get("products", [])
-                    execution_time_ms = data.get("execution_time_ms", 0)
-                    
-                    # Add source information to products
-                    for product in products:
-                        product["source_agent_id"] = agent.agent_id
-                        product["publisher_tenant_id"] = tenant_id
-                    
-                    return products, execution_time_ms
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
-                    raise Exception(error_msg)
-                    
-        except Exception as e:
-            logger.error(f"Local agent {agent.agent_id} failed: {e}")
-            raise
-    
-    async def call_local_agent_in_process(
+
+        total_time_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"Fanout completed in {total_time_ms}ms - {len(all_products)} total products from {len(agent_reports)} agents")
+        return all_products, agent_reports
+
+    async def stream_agent_results(
         self,
-        agent: AgentConfig,
-        tenant_id: str,
-        request: AgentSelectRequest
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]] = None,
+        exclude_tenant_ids: Optional[List[str]] = None,
+        include_agent_ids: Optional[List[str]] = None,
+        agent_types: Optional[List[str]] = None,
+        deadline: Optional[OrchestrationDeadline] = None,
+        buyer_id: Optional[str] = None,
+        parent_span: Optional[Span] = None
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], AgentReport]]:
         """
-        Call a local agent in-process (avoiding HTTP overhead)
+        Fan out request to all active agents and yield each agent's result as soon as it finishes
+
+        Agents pruned by capability routing, cached or with an open circuit are not called
+        and are reported first. The rest queue in the shared scheduler under the buyer's
+        fair share; those still running at the hard deadline, once the soft deadline passes
+        with enough products, or once early exit settles the top-k are cancelled and
+        reported as timeout or cancelled. The fanout is traced under parent_span.
+
+        Yields:
+            Tuple of (agent_products, agent_report) in completion order
         """
-        start_time = time.time()
-        
+        if deadline is None:
+            deadline = OrchestrationDeadline.start(self.deadline_policy, request)
+
+        # A generator cannot hold the span current across yields, so it is activated per step
+        fanout_span = tracer.start_span("fanout", parent=parent_span)
+        tasks = {}
         try:
-            # Import the local agent provider function
-            from src.admin.blueprints.agent_providers import select_products
-            
-            # Create a mock request object for the Flask function
-            class MockRequest:
-                def __init__(self, json_data):
-                    self.json_data = json_data
-                
-                def get_json(self):
-                    return self.json_data
-            
-            # Call the local function directly
-            mock_request = MockRequest({
-                "prompt": request.prompt,
-                "max_results": request.max_results,
-                "filters": request.filters,
-                "locale": request.locale,
-                "currency": request.currency,
-                "timeout_seconds": request.timeout_seconds
-            })
-            
-            # Note: This would need to be adapted to work with Flask's request context
-            # For now, we'll use the HTTP approach for consistency
-            return await self._call_agent_provider(agent, tenant_id, request)
-            
-        except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"In-process call to agent {agent.agent_id} failed: {e}")
-            raise
+            with tracer.activate(fanout_span):
+                filters = dict(include_tenant_ids=include_tenant_ids, exclude_tenant_ids=exclude_tenant_ids,
+                               include_agent_ids=include_agent_ids, agent_types=agent_types)
+                # Discovery queries the database, so it runs in a thread (still under the fanout span)
+                agents_data = await asyncio.to_thread(agent_management_service.discover_active_agents, **filters)
+                if not agents_data:
+                    logger.warning("No active agents found for fanout")
+                    return
+                agents_data, pruned = await self.router.route(agents_data, request)
+            fanout_span.set_attribute("agents", len(agents_data))
+            fanout_span.set_attribute("pruned_agents", len(pruned))
+            logger.info(f"Fanning out to {len(agents_data)} agents ({len(pruned)} pruned by capability routing)")
+
+            tasks, skipped = await self._start_calls(agents_data, request, deadline, buyer_id, fanout_span)
+            for (agent, tenant_id, _), reason in pruned:
+                yield [], self._pruned_report(agent, tenant_id, reason)
+            tracker = self._start_early_exit(request, tasks, skipped)
+            for products, report in skipped:
+                yield products, report
+
+            async for products, report in self._stream_calls(tasks, request, deadline, tracker):
+                yield products, report
+        finally:
+            # Consumer stopped early - don't leave agent calls running
+            for task in tasks:
+                task.cancel()
+            fanout_duration.observe(deadline.elapsed_seconds)
+            fanout_span.end()
 
 
 # Global instance
-fanout_orchestrator = FanoutOrchestrator()
+fanout_orchestrator = FanoutOrchestrator(
+    local_agents_in_process=os.environ.get("ORCHESTRATOR_LOCAL_AGENTS_IN_PROCESS", "true").lower() == "true"
+)
@@ -0,0 +1,100 @@
+"""
+Request fingerprinting - canonical cache keys for equivalent orchestration requests
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet
+
+from src.core.schemas.agent import AgentSelectRequest
+
+DEFAULT_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "i", "in", "is", "it",
+    "looking", "me", "my", "need", "of", "on", "or", "our", "please", "show", "some", "that",
+    "the", "to", "us", "want", "we", "with"
+})
+
+
+@dataclass
+class FingerprintPolicy:
+    """Deployment settings for which request differences still share a cache entry"""
+    # "Sports Video" and "sports video" share an entry
+    fold_case: bool = True
+    # "video sports" and "sports video" share an entry
+    sort_terms: bool = False
+    # "video for sports" and "sports video" share an entry (with sort_terms)
+    strip_stopwords: bool = False
+    # Lower-case words ignored when strip_stopwords is on
+    stopwords: FrozenSet[str] = field(default_factory=lambda: DEFAULT_STOPWORDS)
+
+
+class RequestFingerprinter:
+    """Canonicalize requests so equivalent ones produce the same cache key
+
+    Whitespace is always collapsed, filter lists are sorted and empty or unset
+    optional fields are dropped; prompt case, term order and stopwords are
+    folded according to the policy.
+    """
+
+    def __init__(self, policy: FingerprintPolicy):
+        self.policy = policy
+
+    def canonical_prompt(self, prompt: str) -> str:
+        """Canonical form of a buyer prompt"""
+        if self.policy.fold_case:
+            prompt = prompt.casefold()
+
+        if not (self.policy.sort_terms or self.policy.strip_stopwords):
+            return " ".join(prompt.split())
+
+        terms = re.findall(r"\w+", prompt)
+        if self.policy.strip_stopwords:
+            # Keep all-stopword prompts as they are rather than reducing them to nothing
+            terms = [term for term in terms if term.casefold() not in self.policy.stopwords] or terms
+        if self.policy.sort_terms:
+            terms = sorted(terms)
+        return " ".join(terms)
+
+    def canonicalize(self, request: AgentSelectRequest, **scope: Any) -> Dict[str, Any]:
+        """
+        Canonical key data for a request plus any scoping fields (agent, tenant filters...)
+        """
+        key_data = {
+            "prompt": self.canonical_prompt(request.prompt),
+            "max_results": request.max_results,
+            "filters": request.filters,
+            "locale": request.locale,
+            "currency": request.currency,
+            **scope
+        }
+        return self._canonical_value(key_data)
+
+    def fingerprint(self, prefix: str, request: AgentSelectRequest, **scope: Any) -> str:
+        """Hash the canonical form of a request into a cache key"""
+        key_string = json.dumps(self.canonicalize(request, **scope), sort_keys=True, default=str)
+        return f"{prefix}{hashlib.md5(key_string.encode()).hexdigest()}"
+
+    def _canonical_value(self, value: Any) -> Any:
+        """Recursively drop empty fields, sort lists and trim strings"""
+        if isinstance(value, dict):
+            canonical = {str(key): self._canonical_value(item) for key, item in value.items()}
+            return {key: item for key, item in canonical.items() if item not in (None, "", [], {})}
+        if isinstance(value, (list, tuple, set)):
+            items = [self._canonical_value(item) for item in value]
+            return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+        if isinstance(value, str):
+            return " ".join(value.split())
+        return value
+
+
+# Global instance
+request_fingerprinter = RequestFingerprinter(FingerprintPolicy(
+    fold_case=os.environ.get("ORCHESTRATOR_CACHE_KEY_FOLD_CASE", "true").lower() == "true",
+    sort_terms=os.environ.get("ORCHESTRATOR_CACHE_KEY_SORT_TERMS", "false").lower() == "true",
+    strip_stopwords=os.environ.get("ORCHESTRATOR_CACHE_KEY_STRIP_STOPWORDS", "false").lower() == "true",
+    stopwords=frozenset(
+        word.strip().casefold() for word in os.environ["ORCHESTRATOR_CACHE_KEY_STOPWORDS"].split(",") if word.strip()
+    ) if os.environ.get("ORCHESTRATOR_CACHE_KEY_STOPWORDS") else DEFAULT_STOPWORDS
+))
@@ -0,0 +1,150 @@
+"""
+Shared HTTP client pool for orchestrator agent calls
+"""
+import asyncio
+import logging
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.orchestrator.http_pool_stats import HttpPoolStats, host_connections
+from src.orchestrator.runtime import async_runtime
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  # HTTP/2 needs the h2 package, which is not a project dependency
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HttpClientPool:
+    """Long-lived keep-alive httpx clients, one per agent host and event loop
+
+    Connections are bound to the loop that opened them, so each loop gets its
+    own set of clients; requests normally all run on the async runtime's loop,
+    whose clients are aclose()d on that loop when the runtime shuts down.
+    Clients left behind by a loop that has since closed (or by the parent
+    process, after a fork) can no longer be aclose()d; they are dropped when
+    the next new loop asks for clients and their connections close as they
+    are garbage collected.
+
+    HTTP/2 is off by default: it is only used when asked for and the h2
+    package (httpx[http2]) has been installed alongside the project.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 20,
+        max_keepalive_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        http2: bool = False
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_per_host = max_keepalive_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = \
+            weakref.WeakKeyDictionary()
+        self._pid = os.getpid()
+        self.stats = HttpPoolStats()
+        self.clients_created = 0
+        self.stale_clients_dropped = 0
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Get the pooled client for the host of the given URL"""
+        clients = self._clients_for_loop(asyncio.get_running_loop())
+        host_key = self._host_key(url)
+        client = clients.get(host_key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_keepalive_per_host,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+            clients[host_key] = client
+            self.clients_created += 1
+            logger.info(f"Opened pooled HTTP client for {host_key} (http2={self.http2})")
+
+        return client
+
+    async def post(self, url: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """POST through the pooled client for the URL's host"""
+        client = self.get_client(url)
+        with self.stats.track(self._host_key(url)) as extensions:
+            return await client.post(url, timeout=timeout or self.timeout, extensions=extensions, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, timeout: Optional[float] = None, **kwargs):
+        """Send a request through the pooled client for the URL's host, reading the body incrementally
+
+        Use as ``async with http_pool.stream("POST", url, json=...) as response``.
+        """
+        client = self.get_client(url)
+        with self.stats.track(self._host_key(url)) as extensions:
+            async with client.stream(method, url, timeout=timeout or self.timeout,
+                                     extensions=extensions, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        """Close the pooled clients of the running loop"""
+        clients = list(self._loop_clients.pop(asyncio.get_running_loop(), {}).values())
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing pooled HTTP client: {e}")
+
+    def _clients_for_loop(self, loop: asyncio.AbstractEventLoop) -> Dict[str, httpx.AsyncClient]:
+        clients = self._loop_clients.get(loop)
+        if clients is None:
+            self._drop_stale_clients()
+            clients = self._loop_clients[loop] = {}
+        return clients
+
+    def _drop_stale_clients(self) -> None:
+        """Drop the clients of loops that have closed, and all clients inherited across a fork"""
+        forked = self._pid != os.getpid()
+        self._pid = os.getpid()
+        for loop, clients in list(self._loop_clients.items()):
+            if forked or loop.is_closed():
+                del self._loop_clients[loop]
+                self.stale_clients_dropped += len(clients)
+
+    def _host_key(self, url: str) -> str:
+        """Build the pool key (scheme://host:port) for a URL"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics"""
+        return {
+            **self.stats.snapshot(host_connections(list(self._loop_clients.values()))),
+            "clients_created": self.clients_created,
+            "stale_clients_dropped": self.stale_clients_dropped,
+            "http2_enabled": self.http2,
+            "max_connections_per_host": self.max_connections_per_host,
+            "max_keepalive_per_host": self.max_keepalive_per_host,
+            "keepalive_expiry": self.keepalive_expiry
+        }
+
+
+# Global instance
+http_client_pool = HttpClientPool(
+    max_connections_per_host=int(os.environ.get("ORCHESTRATOR_HTTP_MAX_CONNECTIONS_PER_HOST", "20")),
+    max_keepalive_per_host=int(os.environ.get("ORCHESTRATOR_HTTP_MAX_KEEPALIVE_PER_HOST", "10")),
+    keepalive_expiry=float(os.environ.get("ORCHESTRATOR_HTTP_KEEPALIVE_EXPIRY", "30")),
+    http2=os.environ.get("ORCHESTRATOR_HTTP2", "false").lower() == "true"
+)
+async_runtime.add_shutdown_hook(http_client_pool.aclose)
@@ -0,0 +1,69 @@
+"""
+HTTP pool statistics - per-host counters kept by the pool itself
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import httpx
+
+
+def host_connections(loop_clients: List[Dict[str, httpx.AsyncClient]]) -> Dict[str, List[Any]]:
+    """The httpcore connections held by each host's client transports, across event loops"""
+    connections: Dict[str, List[Any]] = {}
+    for clients in loop_clients:
+        for host_key, client in list(clients.items()):
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections.setdefault(host_key, []).extend(getattr(pool, "connections", []))
+    return connections
+
+
+class HttpPoolStats:
+    """Requests sent and in flight, and connections opened, per agent host
+
+    connections_opened is cumulative: it is counted from httpcore's trace
+    extension, passed with each request, and never goes down when a
+    connection closes (httpcore emits no trace event for that). The open and
+    idle connection counts are instead read from the transport pools when a
+    snapshot is taken.
+    """
+
+    def __init__(self):
+        self.hosts: Dict[str, Dict[str, int]] = {}
+        self.requests_sent = 0
+
+    @contextmanager
+    def track(self, host_key: str) -> Iterator[Dict[str, Any]]:
+        """Count a request to the host while it runs; yields the request extensions to send it with"""
+        stats = self.hosts.setdefault(host_key, {"requests_sent": 0, "in_flight_requests": 0, "connections_opened": 0})
+        stats["requests_sent"] += 1
+        stats["in_flight_requests"] += 1
+        self.requests_sent += 1
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats["connections_opened"] += 1
+
+        try:
+            yield {"trace": trace}
+        finally:
+            stats["in_flight_requests"] -= 1
+
+    def snapshot(self, connections: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Per-host counters and their totals, with open and idle counts from each host's pooled connections"""
+        hosts = {}
+        for host_key, stats in self.hosts.items():
+            live = [connection for connection in connections.get(host_key, []) if not connection.is_closed()]
+            hosts[host_key] = {
+                **stats,
+                "open_connections": len(live),
+                "idle_connections": sum(1 for connection in live if connection.is_idle())
+            }
+        return {
+            "in_flight_requests": sum(stats["in_flight_requests"] for stats in hosts.values()),
+            "connections_opened": sum(stats["connections_opened"] for stats in hosts.values()),
+            "open_connections": sum(stats["open_connections"] for stats in hosts.values()),
+            "idle_connections": sum(stats["idle_connections"] for stats in hosts.values()),
+            "requests_sent": self.requests_sent,
+            "hosts": hosts,
+            "total_hosts": len(hosts)
+        }
@@ -0,0 +1,32 @@
+"""
+Event loop lag - how late the async runtime's loop wakes from a timer
+"""
+import asyncio
+import time
+
+from src.core.metrics import metrics_registry
+
+# Seconds - a healthy loop wakes within a millisecond or two of its timer
+LOOP_LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+loop_lag = metrics_registry.histogram(
+    "orchestrator_event_loop_lag_seconds",
+    "How late the async runtime's event loop woke from a timer, sampled every lag interval",
+    buckets=LOOP_LAG_BUCKETS
+)
+
+
+class LoopLagMonitorMixin:
+    """Lag monitor task for AsyncRuntime (keeps its lag_* counters)"""
+
+    async def _monitor_lag(self) -> None:
+        """Measure how late the loop wakes from a fixed sleep"""
+        while True:
+            expected = time.monotonic() + self.lag_interval_seconds
+            await asyncio.sleep(self.lag_interval_seconds)
+            lag = max(time.monotonic() - expected, 0.0)
+            self.lag_seconds = lag
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            self.avg_lag_seconds = lag if not self.lag_samples else 0.9 * self.avg_lag_seconds + 0.1 * lag
+            self.lag_samples += 1
+            loop_lag.observe(lag)
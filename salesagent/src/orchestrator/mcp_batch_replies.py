@@ -0,0 +1,83 @@
+"""
+MCP batch replies - hand each caller of a batch its own reply, under its own caps
+"""
+import json
+from typing import Dict, Any, Optional, Tuple
+
+from src.orchestrator.response_limits import BYTE_CAP, AgentProducts
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")).encode())
+
+
+def cap_reply_bytes(
+    reply: Dict[str, Any],
+    max_bytes: int,
+    truncated: Optional[str] = None
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Hold one caller's reply from a shared batch to the caller's own byte cap, measured as compact JSON
+
+    Like a capped unbatched read, an oversized reply keeps the products that fit and is flagged byte_cap.
+
+    Returns:
+        Tuple of (reply, truncated)
+
+    Raises:
+        ValueError: the reply is over the cap and has no products array to cut
+    """
+    if _json_size(reply) <= max_bytes:
+        return reply, truncated
+    result = reply.get("result")
+    products = result.get("products") if isinstance(result, dict) else None
+    if not isinstance(products, list):
+        raise ValueError(f"MCP batch reply for request {reply.get('id')} exceeds its {max_bytes} byte cap")
+
+    kept = AgentProducts(truncated=BYTE_CAP)
+    budget = max_bytes - _json_size({**reply, "result": {**result, "products": []}})
+    for product in products:
+        budget -= _json_size(product) + 1
+        if budget < 0:
+            break
+        kept.append(product)
+    return {**reply, "result": {**result, "products": kept}}, BYTE_CAP
+
+
+def deliver_replies(batch: list, reply: Any, truncated: Optional[str]) -> None:
+    """
+    Resolve each (message, limits, future) in the batch with its reply and whether it was cut off
+
+    The batch was read under the sum of its callers' byte caps, so every caller's
+    own byte cap is applied to its reply here (its product cap is applied when
+    the reply is parsed).
+    """
+    replies = reply if isinstance(reply, list) and len(batch) > 1 else [reply]
+    replies = [item for item in replies if isinstance(item, dict)]
+    # With a byte cap, only the last reply read is incomplete; later ones never arrived
+    partial_reply = replies[-1] if truncated and replies else None
+    by_id = {item["id"]: item for item in replies if item.get("id") is not None}
+    # A complete error reply without an id is an error for the whole batch; any other reply
+    # without an id (such as one cut off before its id) belongs to no caller
+    batch_error = next((
+        item for item in replies if item.get("id") is None and "error" in item and item is not partial_reply
+    ), None)
+    for message, limits, future in batch:
+        if future.done():
+            continue
+        reply = by_id.get(message["id"], batch_error)
+        if reply is None and len(batch) == 1 and replies:
+            # A lone request's reply is its own, id or not
+            reply = replies[0]
+        if reply is None:
+            problem = "cut off at the byte cap before" if truncated else "is missing"
+            future.set_exception(Exception(f"MCP batch reply {problem} request {message['id']}"))
+            continue
+        reply_truncated = truncated if reply is partial_reply else None
+        if len(batch) > 1 and reply is not batch_error:
+            try:
+                reply, reply_truncated = cap_reply_bytes(reply, limits.max_bytes, reply_truncated)
+            except ValueError as e:
+                future.set_exception(e)
+                continue
+        future.set_result((reply, reply_truncated))
@@ -0,0 +1,101 @@
+"""
+MCP call batching - concurrent calls to one endpoint sent as a single JSON-RPC batch array
+"""
+import asyncio
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from src.orchestrator.deadline import remaining_call_seconds
+from src.orchestrator.mcp_batch_replies import deliver_replies
+from src.orchestrator.response_limits import ResponseLimits
+
+
+class MCPBatchingMixin:
+    """Batching for MCPClient
+
+    Calls to a batch-capable endpoint wait up to batch_window_seconds for other
+    calls to the same endpoint (other agents and tenants in the same fanout) and
+    are sent together as one batch of up to max_batch_size requests, one round
+    trip instead of many. A batch is given the latest of its callers' deadlines
+    and is cancelled once every caller has given up.
+    """
+
+    async def _call_batched(
+        self,
+        endpoint_url: str,
+        message: Dict[str, Any],
+        limits: ResponseLimits
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Queue a call for the endpoint's next batch and wait for its reply (and whether it was cut off)"""
+        loop = asyncio.get_running_loop()
+        batches = self._loop_batches.setdefault(loop, {})
+        batch = batches.get(endpoint_url)
+        if batch is None:
+            batch = batches[endpoint_url] = []
+            loop.call_later(self.batch_window_seconds, self._flush_batch, batches, endpoint_url, batch)
+        
+        future = loop.create_future()
+        remaining_seconds = remaining_call_seconds()
+        deadline = None if remaining_seconds is None else time.monotonic() + remaining_seconds
+        batch.append((message, limits, deadline, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush_batch(batches, endpoint_url, batch)
+        return await future
+    
+    def _flush_batch(self, batches: Dict[str, list], endpoint_url: str, batch: list) -> None:
+        """Send a batch once its window closes or it is full (whichever comes first)"""
+        if batches.get(endpoint_url) is not batch:
+            return
+        del batches[endpoint_url]
+        task = asyncio.ensure_future(self._send_batch(endpoint_url, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _send_batch(self, endpoint_url: str, batch: list) -> None:
+        """Send the batch as one JSON-RPC array and hand each caller the reply with its id"""
+        # Callers that gave up (agent timeout, early exit) are left out
+        live = [entry for entry in batch if not entry[-1].done()]
+        if not live:
+            return
+        batch = [(message, limits, future) for message, limits, _, future in live]
+        deadlines = [deadline for _, _, deadline, _ in live]
+        
+        # Wait as long as the most patient caller, no longer
+        timeout = self._call_timeout(
+            None if None in deadlines else max(deadlines) - time.monotonic()
+        )
+        if len(batch) == 1:
+            message, limits, _ = batch[0]
+        else:
+            self.batches_sent += 1
+            self.batched_calls += len(batch)
+            # The batch is read under the sum of its callers' byte caps; each caller's own byte
+            # and product caps are then applied to its reply
+            limits = ResponseLimits(
+                max_bytes=sum(limits.max_bytes for _, limits, _ in batch),
+                max_products=max(limits.max_products for _, limits, _ in batch)
+            )
+            message = [message for message, _, _ in batch]
+        post = asyncio.ensure_future(self._post(endpoint_url, message, timeout, limits))
+        
+        def cancel_if_abandoned(_) -> None:
+            if not post.done() and not post.cancelling() and all(future.done() for _, _, future in batch):
+                self.abandoned_batches += 1
+                post.cancel()
+        
+        for _, _, future in batch:
+            future.add_done_callback(cancel_if_abandoned)
+        
+        try:
+            reply, truncated = await post
+        except asyncio.CancelledError:
+            if all(future.done() for _, _, future in batch):
+                return
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        deliver_replies(batch, reply, truncated)
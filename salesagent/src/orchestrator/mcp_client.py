@@ -2,24 +2,69 @@
 MCP (Model Context Protocol) Client for 3rd party agent communication
 """
 import asyncio
-import json
+import itertools
 import logging
+import os
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime, UTC
+import weakref
+from typing import Dict, Any
 
-import httpx
-
-from src.core.schemas.agent import AgentSelectRequest, AgentStatus
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.coalescing import RequestCoalescer
+from src.orchestrator.deadline import remaining_call_seconds
+from src.orchestrator.http_pool import http_client_pool
+from src.orchestrator.mcp_batching import MCPBatchingMixin
+from src.orchestrator.mcp_discovery import MCPDiscoveryMixin
+from src.orchestrator.mcp_messages import MCPMessageMixin
+from src.orchestrator.mcp_products import MCPProductMixin
+from src.orchestrator.mcp_stats import MCPStatsMixin
+from src.orchestrator.mcp_transport import MCPError, MCPTransportMixin
+from src.orchestrator.response_limits import default_response_limits
 
 logger = logging.getLogger(__name__)
 
 
-class MCPClient:
-    """Client for communicating with MCP-compliant agent endpoints"""
+class MCPClient(MCPTransportMixin, MCPDiscoveryMixin, MCPBatchingMixin, MCPMessageMixin, MCPProductMixin,
+                MCPStatsMixin):
+    """Client for communicating with MCP-compliant agent endpoints
+
+    Endpoints' tools/list results and batch support are discovered in the
+    background and cached (MCPDiscoveryMixin); any Mcp-Session-Id an endpoint
+    assigns is kept and sent back on every later request. Calls to a
+    batch-capable endpoint are sent together as JSON-RPC batches
+    (MCPBatchingMixin).
+    """
     
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        batching: bool = True,
+        batch_window_seconds: float = 0.002,
+        max_batch_size: int = 20,
+        capabilities_ttl_seconds: float = 300.0
+    ):
         self.timeout = timeout
+        self.http_pool = http_client_pool
+        self.batching = batching
+        self.batch_window_seconds = batch_window_seconds
+        self.max_batch_size = max_batch_size
+        self.capabilities_ttl_seconds = capabilities_ttl_seconds
+        self.response_limits = default_response_limits
+        self._capabilities: Dict[str, Dict[str, Any]] = {}
+        self._sessions: Dict[str, str] = {}
+        self._discovery = RequestCoalescer()
+        # Calls waiting for their batch to be sent, per event loop and endpoint
+        self._loop_batches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, list]]" = \
+            weakref.WeakKeyDictionary()
+        self._batch_tasks = set()
+        self._refreshing = set()
+        self._request_ids = itertools.count(1)
+        self.calls = 0
+        self.batched_calls = 0
+        self.batches_sent = 0
+        self.capability_hits = 0
+        self.capability_misses = 0
+        self.abandoned_batches = 0
     
     async def call_mcp_agent(
         self,
@@ -39,30 +84,30 @@ class MCPClient:
             Dict containing products and metadata
         """
         start_time = time.time()
+        self.calls += 1
         
         try:
             # Prepare MCP request
             mcp_request = self._build_mcp_request(request, agent_config)
             
-            # Make HTTP request to MCP endpoint
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint_url,
-                    json=mcp_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json"
-                    }
+            limits = self.response_limits.for_agent(agent_config)
+            
+            capabilities = self._known_capabilities(endpoint_url) if self.batching else None
+            if capabilities and capabilities["batch"]:
+                mcp_response, truncated = await self._call_batched(endpoint_url, mcp_request, limits)
+            else:
+                mcp_response, truncated = await self._post(
+                    endpoint_url, mcp_request, self._call_timeout(remaining_call_seconds()), limits
                 )
+            result = self._parse_mcp_response(mcp_response, start_time, limits.max_products)
+            if truncated and result["status"] == "active":
+                result["truncated"] = truncated
+            return result
+        
+        except MCPError as e:
+            logger.error(f"MCP call failed: {e}")
+            return self._create_error_response(str(e), start_time)
                 
-                if response.status_code == 200:
-                    mcp_response = response.json()
-                    return self._parse_mcp_response(mcp_response, start_time)
-                else:
-                    error_msg = f"MCP endpoint returned {response.status_code}: {response.text}"
-                    logger.error(f"MCP call failed: {error_msg}")
-                    return self._create_error_response(error_msg, start_time)
-                    
         except asyncio.TimeoutError:
             execution_time_ms = int((time.time() - start_time) * 1000)
             error_msg = f"MCP call timed out after {execution_time_ms}ms"
@@ -75,182 +120,27 @@ class MCPClient:
             logger.error(error_msg)
             return self._create_error_response(error_msg, start_time)
     
-    def _build_mcp_request(self, request: AgentSelectRequest, agent_config: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Build MCP-compliant request
-        """
-        # Standard MCP request format
-        mcp_request = {
-            "jsonrpc": "2.0",
-            "id": f"mcp_{int(time.time())}",
-            "method": "tools/call",
-            "params": {
-                "name": "select_products",
-                "arguments": {
-                    "prompt": request.prompt,
-                    "max_results": request.max_results,
-                    "filters": request.filters or {},
-                    "locale": request.locale,
-                    "currency": request.currency,
-                    "timeout_seconds": request.timeout_seconds
-                }
-            }
-        }
-        
-        # Add agent-specific configuration if provided
-        if agent_config:
-            mcp_request["params"]["arguments"]["agent_config"] = agent_config
-        
-        return mcp_request
-    
-    def _parse_mcp_response(self, mcp_response: Dict[str, Any], start_time: float) -> Dict[str, Any]:
-        """
-        Parse MCP response and convert to standard format
-        """
-        execution_time_ms = int((time.time() - start_time) * 1000)
-        
-        try:
-            # Check for MCP error
-            if "error" in mcp_response:
-                error_msg = f"MCP error: {mcp_response['error'].get('message', 'Unknown error')}"
-                return self._create_error_response(error_msg, start_time)
-            
-            # Extract result from MCP response
-            result = mcp_response.get("result", {})
-            
-            # Parse products from MCP format
-            products = self._parse_mcp_products(result.get("products", []))
-            
-            return {
-                "products": products,
-                "total_found": len(products),
-                "execution_time_ms": execution_time_ms,
-                "status": "active",
-                "error_message": None,
-                "mcp_metadata": {
-                    "response_id": mcp_response.get("id"),
-                    "mcp_version": mcp_response.get("jsonrpc")
-                }
-            }
-            
-        except Exception as e:
-            error_msg = f"Failed to parse MCP response: {str(e)}"
-            logger.error(error_msg)
-            return self._create_error_response(error_msg, start_time)
-    
-    def _parse_mcp_products(self, mcp_products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Parse products from MCP format to standard format
+    async def test_mcp_endpoint(self, endpoint_url: str) -> Dict[str, Any]:
         """
-        products = []
-        
-        for mcp_product in mcp_products:
-            try:
-                # Convert MCP product to standard format
-                product = {
-                    "product_id": str(mcp_product.get("id", "")),
-                    "name": str(mcp_product.get("name", "Unknown Product")),
-                    "description": str(mcp_product.get("description", "")),
-                    "price_cpm": float(mcp_product.get("price_cpm", 0.0)),
-                    "score": float(mcp_product.get("score", 0.0)),
-                    "formats": self._parse_list_field(mcp_product.get("formats", [])),
-                    "categories": self._parse_list_field(mcp_product.get("categories", [])),
-                    "targeting": self._parse_list_field(mcp_product.get("targeting", [])),
-                    "image_url": str(mcp_product.get("image_url", "")),
-                    "delivery_type": str(mcp_product.get("delivery_type", "standard")),
-                    "rationale": str(mcp_product.get("rationale", "")),
-                    "merchandising_blurb": str(mcp_product.get("merchandising_blurb", "")),
-                    "publisher_tenant_id": str(mcp_product.get("publisher_tenant_id", "")),
-                    "source_agent_id": str(mcp_product.get("source_agent_id", "")),
-                    "mcp_metadata": mcp_product.get("metadata", {})
-                }
-                
-                # Validate required fields
-                if product["product_id"] and product["name"]:
-                    products.append(product)
-                else:
-                    logger.warning(f"Skipping MCP product with missing required fields: {mcp_product}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to parse MCP product: {e}")
-                continue
+        Test MCP endpoint connectivity and basic functionality
         
-        return products
-    
-    def _parse_list_field(self, value: Any) -> List[str]:
-        """
-        Parse a field that should be a list of strings
+        Always asks the endpoint (refreshing its cached capabilities for later calls).
         """
-        if isinstance(value, str):
-            return [item.strip() for item in value.split(",") if item.strip()]
-        elif isinstance(value, list):
-            return [str(item).strip() for item in value if item]
-        else:
-            return []
-    
-    def _create_error_response(self, error_message: str, start_time: float) -> Dict[str, Any]:
-        """
-        Create error response
-        """
-        execution_time_ms = int((time.time() - start_time) * 1000)
-        
+        capabilities = await self.get_capabilities(endpoint_url, refresh=True)
         return {
-            "products": [],
-            "total_found": 0,
-            "execution_time_ms": execution_time_ms,
-            "status": "error",
-            "error_message": error_message,
-            "mcp_metadata": {}
+            "status": capabilities["status"],
+            "response_time_ms": capabilities["response_time_ms"],
+            "endpoint_url": endpoint_url,
+            "message": capabilities["message"],
+            "tools": capabilities["tools"],
+            "batch_supported": capabilities["batch"]
         }
-    
-    async def test_mcp_endpoint(self, endpoint_url: str) -> Dict[str, Any]:
-        """
-        Test MCP endpoint connectivity and basic functionality
-        """
-        start_time = time.time()
-        
-        try:
-            # Simple health check request
-            test_request = {
-                "jsonrpc": "2.0",
-                "id": "health_check",
-                "method": "tools/list",
-                "params": {}
-            }
-            
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.post(
-                    endpoint_url,
-                    json=test_request,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                
-                if response.status_code == 200:
-                    return {
-                        "status": "healthy",
-                        "response_time_ms": execution_time_ms,
-                        "endpoint_url": endpoint_url,
-                        "message": "MCP endpoint is responding correctly"
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "response_time_ms": execution_time_ms,
-                        "endpoint_url": endpoint_url,
-                        "message": f"HTTP {response.status_code}: {response.text}"
-                    }
-                    
-        except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            return {
-                "status": "error",
-                "response_time_ms": execution_time_ms,
-                "endpoint_url": endpoint_url,
-                "message": f"Connection failed: {str(e)}"
-            }
 
 
 # Global instance
-mcp_client = MCPClient()
+mcp_client = MCPClient(
+    batching=os.environ.get("ORCHESTRATOR_MCP_BATCHING", "true").lower() == "true",
+    batch_window_seconds=float(os.environ.get("ORCHESTRATOR_MCP_BATCH_WINDOW_MS", "2")) / 1000,
+    max_batch_size=int(os.environ.get("ORCHESTRATOR_MCP_MAX_BATCH_SIZE", "20")),
+    capabilities_ttl_seconds=float(os.environ.get("ORCHESTRATOR_MCP_CAPABILITIES_TTL_SECONDS", "300"))
+)
@@ -0,0 +1,146 @@
+"""
+MCP capability discovery - cached tools/list results, batch support and agent catalog summaries
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from functools import partial
+from typing import Dict, Any, Optional
+
+from src.orchestrator.mcp_transport import MCPError
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_TIMEOUT_SECONDS = 5
+FAILED_DISCOVERY_TTL_SECONDS = 30.0
+# Optional tool through which an agent reports its catalog summary for capability routing
+CAPABILITIES_TOOL = "get_capabilities"
+
+
+class MCPDiscoveryMixin:
+    """Capability discovery for MCPClient
+
+    Each endpoint's tools/list result and batch support (an array reply to a
+    one-element batch) are cached for capabilities_ttl_seconds. Discovery never
+    runs inside an agent call: an unknown or expired endpoint is refreshed in the
+    background while calls go out unbatched (or on the last known capabilities).
+    """
+
+    def _known_capabilities(self, endpoint_url: str) -> Optional[Dict[str, Any]]:
+        """
+        The endpoint's last discovered capabilities without waiting for discovery
+        
+        A missing or expired entry is refreshed in the background; an expired one is
+        still used until the refresh lands.
+        """
+        capabilities = self._capabilities.get(endpoint_url)
+        if capabilities and capabilities["expires_at"] > time.monotonic():
+            self.capability_hits += 1
+            return capabilities
+        
+        self.capability_misses += 1
+        self.refresh_in_background(endpoint_url)
+        return capabilities
+    
+    def refresh_in_background(self, endpoint_url: str) -> None:
+        """Start discovering an endpoint on the running loop unless a refresh is already under way"""
+        if endpoint_url in self._refreshing:
+            return
+        self._refreshing.add(endpoint_url)
+        # A fresh context, so the refresh is not part of the calling request's trace or deadline
+        task = asyncio.get_running_loop().create_task(
+            self.get_capabilities(endpoint_url, refresh=True), context=contextvars.Context()
+        )
+        self._batch_tasks.add(task)
+        
+        def refreshed(task: asyncio.Task) -> None:
+            self._batch_tasks.discard(task)
+            self._refreshing.discard(endpoint_url)
+        
+        task.add_done_callback(refreshed)
+    
+    async def get_capabilities(self, endpoint_url: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        The endpoint's cached tools/list result and batch support, discovered once per TTL
+        
+        Concurrent callers for the same endpoint share a single discovery request.
+        """
+        capabilities = self._capabilities.get(endpoint_url)
+        if capabilities and not refresh and capabilities["expires_at"] > time.monotonic():
+            self.capability_hits += 1
+            return capabilities
+        
+        self.capability_misses += 1
+        capabilities, _ = await self._discovery.run(endpoint_url, partial(self._discover, endpoint_url))
+        return capabilities
+    
+    async def _discover(self, endpoint_url: str) -> Dict[str, Any]:
+        """List the endpoint's tools with a one-element batch, falling back to a plain request"""
+        start_time = time.time()
+        list_request = {
+            "jsonrpc": "2.0",
+            "id": f"tools_list_{next(self._request_ids)}",
+            "method": "tools/list",
+            "params": {}
+        }
+        capabilities = {
+            "endpoint_url": endpoint_url,
+            "status": "healthy",
+            "message": "MCP endpoint is responding correctly",
+            "tools": [],
+            "batch": False
+        }
+        
+        try:
+            try:
+                reply, _ = await self._post(endpoint_url, [list_request], DISCOVERY_TIMEOUT_SECONDS)
+            except MCPError:
+                reply = None
+            if isinstance(reply, list):
+                capabilities["batch"] = True
+                reply = next((item for item in reply if isinstance(item, dict)), {})
+            elif not isinstance(reply, dict) or "result" not in reply:
+                # Not a batch-capable server; ask again without the array
+                reply, _ = await self._post(endpoint_url, list_request, DISCOVERY_TIMEOUT_SECONDS)
+            capabilities["tools"] = [
+                tool.get("name") for tool in reply.get("result", {}).get("tools", []) if isinstance(tool, dict)
+            ]
+        except MCPError as e:
+            capabilities.update(status="unhealthy", message=f"HTTP {e.status_code}: {e.text}")
+        except Exception as e:
+            capabilities.update(status="error", message=f"Connection failed: {str(e)}")
+        
+        capabilities["response_time_ms"] = int((time.time() - start_time) * 1000)
+        # A failed discovery is retried sooner, so a briefly unavailable server is not left unbatched
+        ttl = self.capabilities_ttl_seconds if capabilities["status"] == "healthy" else \
+            min(self.capabilities_ttl_seconds, FAILED_DISCOVERY_TTL_SECONDS)
+        capabilities["expires_at"] = time.monotonic() + ttl
+        self._capabilities[endpoint_url] = capabilities
+        logger.info(f"Discovered MCP endpoint {endpoint_url}: {len(capabilities['tools'])} tools, "
+                    f"batch={capabilities['batch']}, status={capabilities['status']}")
+        return capabilities
+
+    async def get_agent_capabilities(self, endpoint_url: str) -> Optional[Dict[str, Any]]:
+        """
+        The catalog summary an MCP agent reports through its get_capabilities tool
+
+        Returns:
+            Dict with any of formats, channels, countries, min_cpm, max_cpm and
+            product_count, or None if the agent does not offer the tool
+
+        Raises:
+            MCPError: for a non-200 response
+        """
+        capabilities = await self.get_capabilities(endpoint_url)
+        if CAPABILITIES_TOOL not in capabilities["tools"]:
+            return None
+
+        message = {"jsonrpc": "2.0", "id": f"capabilities_{next(self._request_ids)}", "method": "tools/call",
+                   "params": {"name": CAPABILITIES_TOOL, "arguments": {}}}
+        reply, _ = await self._post(endpoint_url, message, DISCOVERY_TIMEOUT_SECONDS)
+        if not isinstance(reply, dict) or "error" in reply:
+            error = reply.get("error") if isinstance(reply, dict) else None
+            raise ValueError(f"get_capabilities failed: {error or 'malformed reply'}")
+        result = reply.get("result")
+        return result if isinstance(result, dict) else None
@@ -0,0 +1,103 @@
+"""
+MCP messages - select_products requests and their replies in the agent provider format
+"""
+import logging
+import time
+from typing import Dict, Any, Optional
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.response_limits import PRODUCT_CAP
+
+logger = logging.getLogger(__name__)
+
+
+class MCPMessageMixin:
+    """JSON-RPC request building and reply parsing for MCPClient (products via MCPProductMixin)"""
+
+    def _build_mcp_request(self, request: AgentSelectRequest, agent_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build MCP-compliant request
+        """
+        # Standard MCP request format
+        mcp_request = {
+            "jsonrpc": "2.0",
+            "id": f"mcp_{next(self._request_ids)}",
+            "method": "tools/call",
+            "params": {
+                "name": "select_products",
+                "arguments": {
+                    "prompt": request.prompt,
+                    "max_results": request.max_results,
+                    "filters": request.filters or {},
+                    "locale": request.locale,
+                    "currency": request.currency,
+                    "timeout_seconds": request.timeout_seconds
+                }
+            }
+        }
+        
+        # Add agent-specific configuration if provided
+        if agent_config:
+            mcp_request["params"]["arguments"]["agent_config"] = agent_config
+        
+        return mcp_request
+    
+    def _parse_mcp_response(
+        self,
+        mcp_response: Dict[str, Any],
+        start_time: float,
+        max_products: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse MCP response and convert to standard format, keeping at most max_products products
+        """
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        
+        try:
+            # Check for MCP error
+            if "error" in mcp_response:
+                error_msg = f"MCP error: {mcp_response['error'].get('message', 'Unknown error')}"
+                return self._create_error_response(error_msg, start_time)
+            
+            # Extract result from MCP response
+            result = mcp_response.get("result", {})
+            
+            # Parse products from MCP format
+            mcp_products = result.get("products", [])
+            products = self._parse_mcp_products(mcp_products)
+            truncated = getattr(mcp_products, "truncated", None)
+            if max_products is not None and len(products) > max_products:
+                products, truncated = products[:max_products], PRODUCT_CAP
+            
+            return {
+                "products": products,
+                "total_found": len(products),
+                "execution_time_ms": execution_time_ms,
+                "status": "active",
+                "error_message": None,
+                "truncated": truncated,
+                "mcp_metadata": {
+                    "response_id": mcp_response.get("id"),
+                    "mcp_version": mcp_response.get("jsonrpc")
+                }
+            }
+            
+        except Exception as e:
+            error_msg = f"Failed to parse MCP response: {str(e)}"
+            logger.error(error_msg)
+            return self._create_error_response(error_msg, start_time)
+    
+    def _create_error_response(self, error_message: str, start_time: float) -> Dict[str, Any]:
+        """
+        Create error response
+        """
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        
+        return {
+            "products": [],
+            "total_found": 0,
+            "execution_time_ms": execution_time_ms,
+            "status": "error",
+            "error_message": error_message,
+            "mcp_metadata": {}
+        }
@@ -0,0 +1,61 @@
+"""
+MCP products - conversion of MCP product objects to the agent provider format
+"""
+import logging
+from typing import List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class MCPProductMixin:
+    """Product parsing for MCPClient"""
+
+    def _parse_mcp_products(self, mcp_products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse products from MCP format to standard format
+        """
+        products = []
+        
+        for mcp_product in mcp_products:
+            try:
+                # Convert MCP product to standard format
+                product = {
+                    "product_id": str(mcp_product.get("id", "")),
+                    "name": str(mcp_product.get("name", "Unknown Product")),
+                    "description": str(mcp_product.get("description", "")),
+                    "price_cpm": float(mcp_product.get("price_cpm", 0.0)),
+                    "score": float(mcp_product.get("score", 0.0)),
+                    "formats": self._parse_list_field(mcp_product.get("formats", [])),
+                    "categories": self._parse_list_field(mcp_product.get("categories", [])),
+                    "targeting": self._parse_list_field(mcp_product.get("targeting", [])),
+                    "image_url": str(mcp_product.get("image_url", "")),
+                    "delivery_type": str(mcp_product.get("delivery_type", "standard")),
+                    "rationale": str(mcp_product.get("rationale", "")),
+                    "merchandising_blurb": str(mcp_product.get("merchandising_blurb", "")),
+                    "publisher_tenant_id": str(mcp_product.get("publisher_tenant_id", "")),
+                    "source_agent_id": str(mcp_product.get("source_agent_id", "")),
+                    "mcp_metadata": mcp_product.get("metadata", {})
+                }
+                
+                # Validate required fields
+                if product["product_id"] and product["name"]:
+                    products.append(product)
+                else:
+                    logger.warning(f"Skipping MCP product with missing required fields: {mcp_product}")
+                    
+            except Exception as e:
+                logger.warning(f"Failed to parse MCP product: {e}")
+                continue
+        
+        return products
+    
+    def _parse_list_field(self, value: Any) -> List[str]:
+        """
+        Parse a field that should be a list of strings
+        """
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        elif isinstance(value, list):
+            return [str(item).strip() for item in value if item]
+        else:
+            return []
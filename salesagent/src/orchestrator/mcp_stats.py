@@ -0,0 +1,31 @@
+"""
+MCP client statistics - batching and the per-endpoint capability cache
+"""
+from typing import Dict, Any
+
+
+class MCPStatsMixin:
+    """Reporting for MCPClient"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get MCP call batching and capability cache statistics"""
+        return {
+            "batching": self.batching,
+            "batch_window_ms": self.batch_window_seconds * 1000,
+            "calls": self.calls,
+            "batches_sent": self.batches_sent,
+            "batched_calls": self.batched_calls,
+            "avg_batch_size": round(self.batched_calls / self.batches_sent, 2) if self.batches_sent else 0.0,
+            "capability_cache_hits": self.capability_hits,
+            "capability_cache_misses": self.capability_misses,
+            "abandoned_batches": self.abandoned_batches,
+            "endpoints": {
+                endpoint_url: {
+                    "status": capabilities["status"],
+                    "tools": capabilities["tools"],
+                    "batch": capabilities["batch"],
+                    "has_session": endpoint_url in self._sessions
+                }
+                for endpoint_url, capabilities in list(self._capabilities.items())
+            }
+        }
@@ -0,0 +1,68 @@
+"""
+MCP transport - JSON-RPC messages over the shared keep-alive pool, in each endpoint's session
+"""
+from typing import Any, Optional, Tuple
+
+from src.orchestrator.response_limits import ResponseLimits
+from src.orchestrator.response_stream import ANY_ELEMENT, ERROR_TEXT_BYTES, read_json_stream, read_text
+
+MCP_SESSION_HEADER = "Mcp-Session-Id"
+# Products in a reply, or in each reply of a batch
+MCP_PRODUCTS_PATH = (ANY_ELEMENT, "result", "products")
+
+
+class MCPError(Exception):
+    """An MCP endpoint answered with an HTTP error"""
+
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"MCP endpoint returned {status_code}: {text}")
+        self.status_code = status_code
+        self.text = text
+
+
+class MCPTransportMixin:
+    """HTTP for MCPClient (uses its http_pool, timeout, response_limits, _sessions and _capabilities)"""
+
+    async def _post(
+        self,
+        endpoint_url: str,
+        message: Any,
+        timeout: float,
+        limits: Optional[ResponseLimits] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        POST a JSON-RPC message (or batch array) over the shared keep-alive pool, in the endpoint's session
+        
+        The reply is parsed as it arrives, keeping at most limits.max_products
+        products per reply and reading at most limits.max_bytes.
+        
+        Returns:
+            Tuple of (reply, truncated) where truncated is "byte_cap" if the body was cut off
+        
+        Raises:
+            MCPError: for a non-200 response
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        session_id = self._sessions.get(endpoint_url)
+        if session_id:
+            headers[MCP_SESSION_HEADER] = session_id
+        
+        async with self.http_pool.stream("POST", endpoint_url, json=message, headers=headers,
+                                         timeout=timeout) as response:
+            if response.status_code != 200:
+                if response.status_code == 404 and session_id:
+                    # The server ended the session; start a new one and rediscover the endpoint
+                    self._sessions.pop(endpoint_url, None)
+                    self._capabilities.pop(endpoint_url, None)
+                raise MCPError(response.status_code, await read_text(response.aiter_bytes(), ERROR_TEXT_BYTES))
+            
+            if response.headers.get(MCP_SESSION_HEADER):
+                self._sessions[endpoint_url] = response.headers[MCP_SESSION_HEADER]
+            return await read_json_stream(response.aiter_bytes(), limits or self.response_limits, MCP_PRODUCTS_PATH)
+    
+    def _call_timeout(self, remaining_seconds: Optional[float]) -> float:
+        """HTTP timeout for a call: the client timeout, or less if the caller's deadline is sooner"""
+        return self.timeout if remaining_seconds is None else min(self.timeout, max(remaining_seconds, 0.001))
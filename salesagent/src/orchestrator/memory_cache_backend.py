@@ -0,0 +1,84 @@
+"""
+In-process memory storage backend for CacheManager
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from src.orchestrator.cache_backends import CacheBackend, CacheEntry
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU store; O(1) get, set and evict"""
+
+    name = "memory"
+
+    def __init__(self, max_size: int = 1000, max_bytes: Optional[int] = None):
+        super().__init__(max_size, max_bytes)
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.size_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self.entries.get(key)
+
+    def touch(self, key: str, now: float) -> None:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry.last_accessed = now
+                self.entries.move_to_end(key)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._store(key, entry)
+
+    def add(self, key: str, entry: CacheEntry, now: float) -> bool:
+        with self._lock:
+            existing = self.entries.get(key)
+            if existing is not None and existing.expires_at > now:
+                return False
+            self._store(key, entry)
+            return True
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._remove(key)
+        self.entries[key] = entry
+        self.size_bytes += entry.size_bytes
+
+        # Evict least recently used entries until within budget
+        while len(self.entries) > self.max_size or (
+            self.max_bytes is not None and self.size_bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def compare_and_delete(self, key: str, value: Any) -> bool:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.value != value:
+                return False
+            self._remove(key)
+            return True
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry.size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self.size_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "size": len(self.entries),
+            "size_bytes": self.size_bytes,
+            "evictions": self.evictions
+        }
@@ -5,6 +5,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, UTC
 
+from src.orchestrator.topk_merge import TopKProductMerger
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,10 +29,11 @@ class ProductNormalizer:
         Normalize product format and ensure all required fields are present
         """
         normalized_products = []
+        normalized_at = datetime.now(UTC).isoformat()
         
         for product in products:
             try:
-                normalized = self._normalize_single_product(product)
+                normalized = self._normalize_single_product(product, normalized_at)
                 if normalized:
                     normalized_products.append(normalized)
             except Exception as e:
@@ -40,7 +43,11 @@ class ProductNormalizer:
         logger.info(f"Normalized {len(normalized_products)} products from {len(products)} input products")
         return normalized_products
     
-    def _normalize_single_product(self, product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _normalize_single_product(
+        self,
+        product: Dict[str, Any],
+        normalized_at: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Normalize a single product
         """
@@ -73,7 +80,7 @@ class ProductNormalizer:
             normalized["merchandising_blurb"] = str(product.get("merchandising_blurb", ""))
             
             # Add metadata
-            normalized["normalized_at"] = datetime.now(UTC).isoformat()
+            normalized["normalized_at"] = normalized_at or datetime.now(UTC).isoformat()
             
             return normalized
             
@@ -172,23 +179,22 @@ class ProductNormalizer:
     ) -> List[Dict[str, Any]]:
         """
         Complete processing pipeline: normalize, deduplicate, sort, truncate
+        
+        Runs as a bounded top-k merge, so only products that make the top
+        max_results are normalized and the full list is never sorted.
         """
         logger.info(f"Processing {len(products)} products with max_results={max_results}")
         
-        # Step 1: Normalize
-        normalized = self.normalize_products(products)
-        
-        # Step 2: Deduplicate
-        deduplicated = self.deduplicate_products(normalized)
-        
-        # Step 3: Sort
-        sorted_products = self.sort_products(deduplicated)
-        
-        # Step 4: Truncate
-        final_products = self.truncate_products(sorted_products, max_results)
+        merger = self.create_merger(max_results)
+        merger.add_products(products)
+        final_products = merger.results()
         
         logger.info(f"Processing complete: {len(products)} input -> {len(final_products)} output")
         return final_products
+    
+    def create_merger(self, max_results: int) -> TopKProductMerger:
+        """Create a merger that folds in agent results as they arrive"""
+        return TopKProductMerger(self, max_results)
 
 
 # Global instance
@@ -0,0 +1,95 @@
+"""
+PerformanceMonitor - orchestration and agent latency histograms, call outcomes and errors
+"""
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+
+from src.core.metrics import MetricsRegistry, metrics_registry
+from src.orchestrator.performance import PerformanceMetrics
+from src.orchestrator.performance_summary import PerformanceSummaryMixin
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMonitor(PerformanceSummaryMixin):
+    """Monitor and track orchestrator performance metrics
+    
+    Request and agent latencies are recorded into fixed-bucket histograms in
+    the metrics registry, so summaries cover every operation since startup
+    without re-sorting samples. Recent raw samples are kept only per agent.
+    """
+    
+    def __init__(self, max_history: int = 1000, registry: Optional[MetricsRegistry] = None):
+        self.max_history = max_history
+        registry = registry or MetricsRegistry()
+        self.request_latency = registry.histogram(
+            "orchestrator_request_duration_seconds",
+            "End-to-end orchestration latency including normalization"
+        )
+        self.agent_latency = registry.histogram(
+            "orchestrator_agent_response_seconds",
+            "Latency of successful, uncached agent responses",
+            ("agent_id",)
+        )
+        self.metrics_history: deque = deque(maxlen=max_history)
+        self.agent_performance: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.tenant_performance: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.error_counts: Dict[str, int] = defaultdict(int)
+        # Recent call outcomes (True = success) per (tenant_id, agent_id)
+        self.agent_outcomes: Dict[Tuple[str, str], deque] = defaultdict(lambda: deque(maxlen=100))
+        self.total_requests = 0
+        self.total_successful_requests = 0
+    
+    def start_operation(self) -> PerformanceMetrics:
+        """Start tracking a new operation"""
+        metrics = PerformanceMetrics(start_time=time.time())
+        return metrics
+    
+    def end_operation(self, metrics: PerformanceMetrics) -> None:
+        """End tracking an operation and store metrics"""
+        metrics.end_time = time.time()
+        self.metrics_history.append(metrics)
+        self.total_requests += 1
+        
+        if metrics.successful_agents > 0:
+            self.total_successful_requests += 1
+        
+        self.request_latency.observe(metrics.duration_ms / 1000)
+        
+        # Track agent performance
+        for agent_id, response_time in metrics.agent_response_times.items():
+            self.agent_performance[agent_id].append(response_time)
+            self.agent_latency.observe(response_time / 1000, agent_id=agent_id)
+        
+        # Track errors
+        for error in metrics.errors:
+            self.error_counts[error] += 1
+        
+        logger.info(f"Operation completed: {metrics.duration_ms:.2f}ms, "
+                   f"Success rate: {metrics.success_rate:.1f}%, "
+                   f"Products: {metrics.total_products_after_sort}")
+    
+    def record_agent_outcome(self, tenant_id: str, agent_id: str, success: bool) -> None:
+        """Record whether a single agent call succeeded"""
+        self.agent_outcomes[(tenant_id, agent_id)].append(success)
+    
+    def get_recent_outcomes(self, tenant_id: str, agent_id: str, window: int) -> List[bool]:
+        """Get the most recent call outcomes for an agent, oldest first"""
+        outcomes = self.agent_outcomes.get((tenant_id, agent_id))
+        if not outcomes:
+            return []
+        return list(outcomes)[-window:]
+    
+    def reset_agent_outcomes(self, tenant_id: str, agent_id: str) -> None:
+        """Forget the outcome history for an agent"""
+        self.agent_outcomes.pop((tenant_id, agent_id), None)
+    
+    def clear_agent_outcomes(self) -> None:
+        """Forget the outcome history for every agent"""
+        self.agent_outcomes.clear()
+
+
+# Global instance
+performance_monitor = PerformanceMonitor(registry=metrics_registry)
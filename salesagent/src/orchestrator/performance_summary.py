@@ -0,0 +1,87 @@
+"""
+Performance summaries for PerformanceMonitor
+"""
+import statistics
+from typing import Dict, List, Any
+from datetime import datetime, UTC
+
+
+class PerformanceSummaryMixin:
+    """Summaries for PerformanceMonitor (uses its histograms, metrics_history, agent_performance and error_counts)"""
+    
+    def get_performance_summary(self) -> Dict[str, Any]:
+        """Get comprehensive performance summary"""
+        if not self.metrics_history:
+            return {"status": "no_data"}
+        
+        recent_metrics = list(self.metrics_history)[-100:]  # Last 100 operations
+        success_rates = [m.success_rate for m in recent_metrics]
+        
+        # Latencies come from the histograms (all operations since startup)
+        durations = self.request_latency.summary()
+        response_times = self.agent_latency.summary()
+        
+        summary = {
+            "total_requests": self.total_requests,
+            "total_successful_requests": self.total_successful_requests,
+            "overall_success_rate": (self.total_successful_requests / max(self.total_requests, 1)) * 100,
+            "recent_operations": len(recent_metrics),
+            "avg_duration_ms": durations.get("mean", 0) * 1000,
+            "median_duration_ms": durations.get("p50", 0) * 1000,
+            "p95_duration_ms": durations.get("p95", 0) * 1000,
+            "max_duration_ms": durations.get("max", 0) * 1000,
+            "min_duration_ms": durations.get("min", 0) * 1000,
+            "avg_success_rate": statistics.mean(success_rates) if success_rates else 0,
+            "avg_response_time_ms": response_times.get("mean", 0) * 1000,
+            "median_response_time_ms": response_times.get("p50", 0) * 1000,
+            "p95_response_time_ms": response_times.get("p95", 0) * 1000,
+            "total_agents_tracked": len(self.agent_performance),
+            "total_errors": sum(self.error_counts.values()),
+            "top_errors": dict(sorted(self.error_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
+            "timestamp": datetime.now(UTC).isoformat()
+        }
+        
+        return summary
+    
+    def get_agent_performance(self, agent_id: str) -> Dict[str, Any]:
+        """Get performance metrics for a specific agent"""
+        if agent_id not in self.agent_performance:
+            return {"status": "agent_not_found"}
+        
+        response_times = list(self.agent_performance[agent_id])
+        
+        return {
+            "agent_id": agent_id,
+            "total_calls": len(response_times),
+            "avg_response_time_ms": statistics.mean(response_times) if response_times else 0,
+            "median_response_time_ms": statistics.median(response_times) if response_times else 0,
+            "max_response_time_ms": max(response_times) if response_times else 0,
+            "min_response_time_ms": min(response_times) if response_times else 0,
+            "recent_response_times": response_times[-10:]  # Last 10 calls
+        }
+    
+    def get_top_performing_agents(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get top performing agents by average response time"""
+        agent_stats = []
+        
+        for agent_id, response_times in self.agent_performance.items():
+            if response_times:
+                avg_time = statistics.mean(response_times)
+                agent_stats.append({
+                    "agent_id": agent_id,
+                    "avg_response_time_ms": avg_time,
+                    "total_calls": len(response_times)
+                })
+        
+        # Sort by average response time (fastest first)
+        agent_stats.sort(key=lambda x: x["avg_response_time_ms"])
+        return agent_stats[:limit]
+    
+    def get_error_summary(self) -> Dict[str, Any]:
+        """Get error summary and trends"""
+        return {
+            "total_errors": sum(self.error_counts.values()),
+            "error_breakdown": dict(self.error_counts),
+            "top_errors": dict(sorted(self.error_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        }
+
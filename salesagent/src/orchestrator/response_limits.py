@@ -0,0 +1,40 @@
+"""
+Caps on agent responses: how much of a body is read and how many products are kept
+"""
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Why an agent's products were cut short
+BYTE_CAP = "byte_cap"
+PRODUCT_CAP = "product_cap"
+
+
+class AgentProducts(list):
+    """Products parsed from an agent response; truncated names the cap that cut them short, if any"""
+
+    def __init__(self, products=(), truncated: Optional[str] = None):
+        super().__init__(products)
+        self.truncated = truncated
+
+
+@dataclass(frozen=True)
+class ResponseLimits:
+    """Caps on an agent response: bytes read from the body and products kept"""
+    max_bytes: int
+    max_products: int
+
+    def for_agent(self, agent_config: Optional[Dict[str, Any]]) -> "ResponseLimits":
+        """These limits with the agent's max_response_bytes / max_response_products overrides applied"""
+        config = agent_config or {}
+        return ResponseLimits(
+            max_bytes=int(config.get("max_response_bytes", self.max_bytes)),
+            max_products=int(config.get("max_response_products", self.max_products))
+        )
+
+
+# Global defaults, overridable per agent through its config
+default_response_limits = ResponseLimits(
+    max_bytes=int(os.environ.get("ORCHESTRATOR_AGENT_MAX_RESPONSE_BYTES", str(8 * 1024 * 1024))),
+    max_products=int(os.environ.get("ORCHESTRATOR_AGENT_MAX_PRODUCTS", "1000"))
+)
@@ -0,0 +1,129 @@
+"""
+Incremental parsing of agent responses under byte and product caps
+"""
+from typing import Any, AsyncIterator, Callable, Optional, Sequence, Tuple
+
+from src.orchestrator.response_limits import BYTE_CAP, PRODUCT_CAP, AgentProducts, ResponseLimits
+from src.orchestrator.stream_reader import ByteCapReached, StreamReader
+
+# Path element matching every element of an array (or the value itself when it is not an array)
+ANY_ELEMENT = "*"
+# How much of an error response body to keep for its message
+ERROR_TEXT_BYTES = 2048
+
+
+async def _read_array(reader: StreamReader, read_item: Callable[[], Any]) -> None:
+    await reader.expect("[")
+    if await reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        await read_item()
+        if await reader.close("]"):
+            return
+
+
+async def _read_products(reader: StreamReader, products: AgentProducts, max_products: int) -> None:
+    """Keep the first max_products items; later ones are decoded one at a time and dropped"""
+    async def read_item() -> None:
+        product = await reader.value()
+        if len(products) < max_products:
+            products.append(product)
+        else:
+            products.truncated = PRODUCT_CAP
+
+    reader.products = products
+    await _read_array(reader, read_item)
+    reader.products = None
+
+
+async def _read(
+    reader: StreamReader,
+    path: Tuple[str, ...],
+    max_products: int,
+    store: Callable[[Any], None]
+) -> None:
+    """
+    Read the value at the reader's position into store(), capping the products array at path
+
+    Containers on the path are stored before they are filled, so a byte cap leaves
+    everything read up to that point in place.
+    """
+    char = await reader.peek()
+    if not path:
+        if char != "[":
+            store(await reader.value())
+            return
+        products = AgentProducts()
+        store(products)
+        await _read_products(reader, products, max_products)
+        return
+
+    key, rest = path[0], path[1:]
+    if key == ANY_ELEMENT:
+        if char != "[":
+            await _read(reader, rest, max_products, store)
+            return
+        items = []
+        store(items)
+        await _read_array(reader, lambda: _read(reader, rest, max_products, items.append))
+        return
+
+    if char != "{":
+        store(await reader.value())
+        return
+    obj = {}
+    store(obj)
+    reader.pos += 1
+    if await reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        name = await reader.value()
+        await reader.expect(":")
+        if name == key:
+            await _read(reader, rest, max_products, lambda value, name=name: obj.__setitem__(name, value))
+        else:
+            obj[name] = await reader.value()
+        if await reader.close("}"):
+            return
+
+
+async def read_json_stream(
+    chunks: AsyncIterator[bytes],
+    limits: ResponseLimits,
+    products_path: Sequence[str] = ("products",)
+) -> Tuple[Any, Optional[str]]:
+    """
+    Parse a JSON response body as it arrives, without holding the whole body in memory
+
+    The array at products_path becomes an AgentProducts of at most
+    limits.max_products items (flagged product_cap when more were sent). Reading
+    stops after limits.max_bytes; the value then holds what arrived before the
+    cap, and the array being read when it was hit is flagged byte_cap.
+
+    Returns:
+        Tuple of (value, truncated) where truncated is BYTE_CAP if the body was cut off
+
+    Raises:
+        json.JSONDecodeError: for a malformed body
+    """
+    reader = StreamReader(chunks, limits.max_bytes)
+    root = []
+    try:
+        await _read(reader, tuple(products_path), limits.max_products, root.append)
+    except ByteCapReached:
+        if reader.products is not None:
+            reader.products.truncated = BYTE_CAP
+        return (root[0] if root else None), BYTE_CAP
+    return root[0], None
+
+
+async def read_text(chunks: AsyncIterator[bytes], max_bytes: int) -> str:
+    """The start of a response body as text (for error messages), reading at most max_bytes"""
+    data = bytearray()
+    async for chunk in chunks:
+        data += chunk[:max_bytes - len(data)]
+        if len(data) >= max_bytes:
+            break
+    return data.decode("utf-8", errors="replace")
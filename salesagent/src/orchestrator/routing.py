@@ -0,0 +1,126 @@
+"""
+Capability-based routing - skip agents whose catalogs cannot match the request
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.capabilities import AgentCapabilities
+from src.orchestrator.capability_fetch import CapabilityFetchMixin
+from src.orchestrator.capability_refresh import CapabilityRefreshMixin
+from src.orchestrator.http_pool import http_client_pool
+
+logger = logging.getLogger(__name__)
+
+AgentEntry = Tuple[AgentConfig, str, str]
+
+
+class CapabilityRouter(CapabilityFetchMixin, CapabilityRefreshMixin):
+    """Keep a periodically refreshed capability summary per agent and prune agents that cannot match
+
+    Routing never waits for a refresh: it uses the last snapshot (an agent not
+    yet summarized is never pruned) and refreshes missing or stale summaries in
+    the background. Inside the async runtime a periodic task also refreshes every
+    agent seen so far once per refresh_seconds, so summaries rarely go stale on
+    the request path. Local agents are summarized from the database; remote
+    agents are asked for their capabilities (GET {endpoint_url}/capabilities, or
+    the MCP get_capabilities tool), falling back to the "capabilities" declared
+    in their config.
+    """
+
+    def __init__(self, enabled: bool = True, refresh_seconds: float = 300.0):
+        self.enabled = enabled
+        self.refresh_seconds = refresh_seconds
+        self.http_pool = http_client_pool
+        self.capabilities: Dict[Tuple[str, str], AgentCapabilities] = {}
+        # Every agent routed so far, for the periodic refresh
+        self._agents: Dict[Tuple[str, str], Tuple[AgentConfig, str]] = {}
+        self._refreshing: Set[Tuple[str, str]] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._periodic: Optional[asyncio.Task] = None
+        self.pruned_calls = 0
+        self.refreshes = 0
+        self.remote_fetch_failures = 0
+
+    async def route(
+        self,
+        agents: List[AgentEntry],
+        request: AgentSelectRequest
+    ) -> Tuple[List[AgentEntry], List[Tuple[AgentEntry, str]]]:
+        """
+        Split agents into those worth calling and those that cannot contribute
+
+        Returns:
+            Tuple of (agents_to_call, [(pruned_agent, reason), ...])
+        """
+        if not self.enabled or not request.filters:
+            return agents, []
+
+        stale = []
+        for agent, tenant_id, _ in agents:
+            key = (tenant_id, agent.agent_id)
+            self._agents[key] = (agent, tenant_id)
+            if self._is_stale(self.capabilities.get(key)):
+                stale.append((agent, tenant_id))
+        if stale:
+            self._refresh_in_background(stale)
+        self._ensure_periodic_refresh()
+
+        kept, pruned = [], []
+        for entry in agents:
+            agent, tenant_id, _ = entry
+            reason = self._prune_reason(self.capabilities.get((tenant_id, agent.agent_id)), request, agent)
+            if reason:
+                pruned.append((entry, reason))
+            else:
+                kept.append(entry)
+
+        if pruned:
+            self.pruned_calls += len(pruned)
+            logger.info(f"Capability routing pruned {len(pruned)} of {len(agents)} agents")
+        return kept, pruned
+
+    def _prune_reason(
+        self,
+        capabilities: Optional[AgentCapabilities],
+        request: AgentSelectRequest,
+        agent: AgentConfig
+    ) -> Optional[str]:
+        """Why to skip the agent; a summary that cannot be checked counts as unknown, so the agent is called"""
+        if capabilities is None:
+            return None
+        try:
+            return capabilities.prune_reason(request)
+        except Exception as e:
+            logger.warning(f"Could not check capabilities of agent {agent.agent_id}, calling it: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Drop all capability summaries so the next route refreshes them"""
+        self.capabilities.clear()
+        self._agents.clear()
+
+    def _is_stale(self, capabilities: Optional[AgentCapabilities]) -> bool:
+        return capabilities is None or time.monotonic() - capabilities.refreshed_at > self.refresh_seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics"""
+        return {
+            "enabled": self.enabled,
+            "tracked_agents": len(self.capabilities),
+            "pruned_calls": self.pruned_calls,
+            "refreshes": self.refreshes,
+            "refreshing": len(self._refreshing),
+            "remote_fetch_failures": self.remote_fetch_failures,
+            "refresh_seconds": self.refresh_seconds
+        }
+
+
+# Global instance
+capability_router = CapabilityRouter(
+    enabled=os.environ.get("ORCHESTRATOR_CAPABILITY_ROUTING", "true").lower() == "true",
+    refresh_seconds=float(os.environ.get("ORCHESTRATOR_CAPABILITY_REFRESH_SECONDS", "300"))
+)
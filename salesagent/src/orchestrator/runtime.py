@@ -0,0 +1,139 @@
+"""
+Async runtime - one long-lived event loop thread per process for sync request handlers
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from src.orchestrator.loop_lag import LoopLagMonitorMixin
+from src.orchestrator.runtime_shutdown import RuntimeShutdownMixin
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRuntime(LoopLagMonitorMixin, RuntimeShutdownMixin):
+    """A persistent event loop running on a daemon thread
+
+    Sync Flask handlers dispatch coroutines into it with run()/submit() instead
+    of creating and destroying a loop per request, so loop-bound resources
+    (pooled HTTP clients, scheduler waiters, background refreshes) live across
+    requests. The loop starts lazily and is restarted in forked workers.
+    Shutdown hooks run on the loop before it stops, so those resources can be
+    closed on the loop they belong to.
+
+    A monitor task sleeps for lag_interval_seconds and records how late it
+    wakes up, in get_stats() and the orchestrator_event_loop_lag_seconds
+    histogram; sustained lag means callbacks are blocking the loop.
+    """
+
+    def __init__(self, lag_interval_seconds: float = 0.5):
+        self.lag_interval_seconds = lag_interval_seconds
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+        self.submitted = 0
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self.avg_lag_seconds = 0.0
+        self.lag_samples = 0
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not already running in this process"""
+        with self._lock:
+            if self.loop is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return self.loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.create_task(self._monitor_lag())
+                loop.run_forever()
+
+            thread = threading.Thread(target=run, name="async-runtime", daemon=True)
+            thread.start()
+            ready.wait()
+
+            self.loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            logger.info(f"Started async runtime loop in process {self._pid}")
+            return loop
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the runtime loop from any thread; returns a concurrent future"""
+        loop = self.start()
+        self.submitted += 1
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the runtime loop and block the calling thread for its result
+
+        Raises:
+            RuntimeError: when called from the runtime loop itself (it would deadlock)
+        """
+        if self.in_runtime_thread():
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop; await the coroutine instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+        except BaseException:
+            # Caller interrupted - don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def iterate(self, stream: AsyncIterator[T]) -> Iterator[T]:
+        """Consume an async generator from synchronous code, one item at a time on the runtime loop"""
+        try:
+            while True:
+                try:
+                    item = self.run(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield item
+        finally:
+            # Client disconnected or stream finished - let the generator cancel outstanding work
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                self.run(aclose())
+
+    def in_runtime_thread(self) -> bool:
+        """Whether the caller is running on the runtime loop thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runtime statistics including event loop lag"""
+        loop = self.loop
+        return {
+            "running": loop is not None and loop.is_running(),
+            "pid": self._pid,
+            "submitted": self.submitted,
+            "pending_tasks": len(asyncio.all_tasks(loop)) if loop is not None and loop.is_running() else 0,
+            "loop_lag_ms": round(self.lag_seconds * 1000, 2),
+            "avg_loop_lag_ms": round(self.avg_lag_seconds * 1000, 2),
+            "max_loop_lag_ms": round(self.max_lag_seconds * 1000, 2),
+            "lag_interval_ms": int(self.lag_interval_seconds * 1000)
+        }
+
+
+# Global instance
+async_runtime = AsyncRuntime(
+    lag_interval_seconds=float(os.environ.get("ORCHESTRATOR_LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+)
+atexit.register(async_runtime.shutdown)
@@ -0,0 +1,55 @@
+"""
+Async runtime shutdown - close loop-bound resources, cancel tasks and stop the loop
+"""
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class RuntimeShutdownMixin:
+    """Shutdown for AsyncRuntime: hooks run on the loop before its tasks are cancelled and it stops"""
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine function to run on the loop when the runtime shuts down"""
+        self._shutdown_hooks.append(hook)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for its thread to exit"""
+        with self._lock:
+            loop, thread = self.loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                return
+            self.loop = None
+            self._thread = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._run_shutdown_hooks(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Async runtime shutdown hooks did not finish: {e}")
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Async runtime tasks did not finish cancelling: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+    async def _run_shutdown_hooks(self) -> None:
+        """Run every shutdown hook, logging (not raising) failures"""
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.warning(f"Async runtime shutdown hook failed: {e}")
+
+    @staticmethod
+    async def _cancel_tasks() -> None:
+        """Cancel everything still running on the loop (including the lag monitor)"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
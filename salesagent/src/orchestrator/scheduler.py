@@ -0,0 +1,128 @@
+"""
+Agent call scheduler - weighted fair queueing of outbound agent calls across buyers
+"""
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, AsyncIterator
+
+from src.orchestrator.buyers import ANONYMOUS_BUYER, parse_buyer_weights
+from src.orchestrator.fair_queue import AgentKey, FairQueueMixin, _Ticket
+from src.orchestrator.scheduler_stats import SchedulerStatsMixin
+
+logger = logging.getLogger(__name__)
+
+
+class AgentCallScheduler(FairQueueMixin, SchedulerStatsMixin):
+    """Shared scheduler for outbound agent calls from every concurrent orchestration
+
+    Calls are admitted in weighted fair order across buyers (start-time fair
+    queueing on virtual finish tags), so a buyer issuing many searches only gets
+    its weighted share of the in-flight slots when others are waiting. Each
+    agent also has its own concurrency cap, so one slow agent cannot hold most
+    of the slots; calls to an agent at its cap wait without blocking calls to
+    other agents. Like the admission limiters, slots are counted under a
+    thread lock so callers on any event loop share them.
+
+    Fairness state is kept for at most max_tracked_buyers buyers; idle buyers
+    are forgotten first and simply restart from the virtual clock. Per-buyer
+    call counts are only reported for buyers with a configured weight.
+    """
+
+    def __init__(
+        self,
+        max_inflight_calls: int = 64,
+        max_calls_per_agent: int = 8,
+        buyer_weights: Optional[Dict[str, float]] = None,
+        max_tracked_buyers: int = 1000
+    ):
+        self.max_inflight_calls = max_inflight_calls
+        self.max_calls_per_agent = max_calls_per_agent
+        self.buyer_weights = buyer_weights or {}
+        self.max_tracked_buyers = max_tracked_buyers
+        self.in_flight = 0
+        self.agent_in_flight: Dict[AgentKey, int] = defaultdict(int)
+        self._waiters: List[_Ticket] = []
+        self._finish_tags: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.queued = 0
+        self.buyer_calls: Dict[str, int] = defaultdict(int)
+        self.agent_wait_seconds: Dict[str, float] = defaultdict(float)
+        self.agent_queued: Dict[str, int] = defaultdict(int)
+        self.peak_queue_depth = 0
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        buyer_id: Optional[str],
+        tenant_id: str,
+        agent_id: str,
+        agent_cap: Optional[int] = None
+    ) -> AsyncIterator[float]:
+        """
+        Hold an in-flight slot for one call to an agent
+
+        Yields:
+            Seconds the call spent queued before it was admitted
+        """
+        waited = await self.acquire(buyer_id, tenant_id, agent_id, agent_cap)
+        try:
+            yield waited
+        finally:
+            self.release(tenant_id, agent_id)
+
+    async def acquire(
+        self,
+        buyer_id: Optional[str],
+        tenant_id: str,
+        agent_id: str,
+        agent_cap: Optional[int] = None
+    ) -> float:
+        """Queue a call in fair order and wait until it may run; returns the queue wait in seconds"""
+        buyer_id = buyer_id or ANONYMOUS_BUYER
+        with self._lock:
+            ticket = self._enqueue_locked(buyer_id, (tenant_id, agent_id), agent_cap or self.max_calls_per_agent)
+            if ticket.granted:
+                return 0.0
+            self.queued += 1
+            self.agent_queued[agent_id] += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiters))
+
+        started = time.monotonic()
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if ticket.granted:
+                    # Admitted as we were cancelled - give the slot back
+                    self._release_locked(ticket.agent_key)
+                elif ticket in self._waiters:
+                    self._waiters.remove(ticket)
+            raise
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self.agent_wait_seconds[agent_id] += waited
+        return waited
+
+    def release(self, tenant_id: str, agent_id: str) -> None:
+        """Finish a call and admit whichever waiting calls are now eligible"""
+        with self._lock:
+            self._release_locked((tenant_id, agent_id))
+
+
+# Global instance
+agent_call_scheduler = AgentCallScheduler(
+    max_inflight_calls=int(os.environ.get("ORCHESTRATOR_MAX_INFLIGHT_AGENT_CALLS", "64")),
+    max_calls_per_agent=int(os.environ.get("ORCHESTRATOR_MAX_CALLS_PER_AGENT", "8")),
+    buyer_weights=parse_buyer_weights(os.environ.get("ORCHESTRATOR_BUYER_WEIGHTS")),
+    max_tracked_buyers=int(os.environ.get("ORCHESTRATOR_MAX_TRACKED_BUYERS", "1000"))
+)
@@ -0,0 +1,34 @@
+"""
+Agent call scheduler statistics - global and per-agent queueing
+"""
+from typing import Dict, Any
+
+
+class SchedulerStatsMixin:
+    """Reporting for AgentCallScheduler (reads its counters under its lock)"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics including per-agent queueing"""
+        with self._lock:
+            agents = {}
+            for agent_id in sorted(set(self.agent_queued) | {key[1] for key in self.agent_in_flight}):
+                queued = self.agent_queued.get(agent_id, 0)
+                agents[agent_id] = {
+                    "in_flight": sum(count for key, count in self.agent_in_flight.items() if key[1] == agent_id),
+                    "queued": queued,
+                    "avg_queue_wait_ms": int(self.agent_wait_seconds.get(agent_id, 0.0) / queued * 1000)
+                    if queued else 0
+                }
+
+            return {
+                "max_inflight_calls": self.max_inflight_calls,
+                "max_calls_per_agent": self.max_calls_per_agent,
+                "in_flight": self.in_flight,
+                "queue_depth": len(self._waiters),
+                "peak_queue_depth": self.peak_queue_depth,
+                "granted": self.granted,
+                "queued": self.queued,
+                "tracked_buyers": len(self._finish_tags),
+                "buyer_calls": dict(self.buyer_calls),
+                "agents": agents
+            }
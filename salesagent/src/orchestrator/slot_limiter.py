@@ -0,0 +1,144 @@
+"""
+Slot limiter - FIFO counting limiter behind admission control
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, AsyncIterator
+
+from src.orchestrator.slot_limiter_stats import SlotLimiterStatsMixin
+
+
+class AdmissionRejected(Exception):
+    """Raised when an orchestration is shed instead of queued; maps to HTTP 503 with Retry-After"""
+
+    def __init__(self, reason: str, retry_after_seconds: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+
+
+class SlotLimiter(SlotLimiterStatsMixin):
+    """FIFO counting limiter shared by every thread and event loop in the process
+
+    Requests normally share the async runtime's loop, but callers on other
+    loops (scripts, background threads) must count against the same slots, so
+    slots are counted under a thread lock and handed to the next waiter on its
+    own loop rather than using an asyncio.Semaphore.
+    """
+
+    def __init__(self, name: str, limit: int, max_waiters: Optional[int] = None):
+        self.name = name
+        self.limit = limit
+        self.max_waiters = max_waiters
+        self.in_use = 0
+        self._waiters: "deque[_Waiter]" = deque()
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.queued = 0
+        self.rejections = 0
+        self.timeouts = 0
+        self.peak_in_use = 0
+        self.peak_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        # Smoothed slot hold time, used to suggest a Retry-After
+        self.avg_hold_seconds = 1.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Take a slot, queueing for at most timeout seconds
+
+        Returns:
+            Seconds spent waiting in the queue
+
+        Raises:
+            AdmissionRejected: the queue is full or the wait exceeded the timeout
+        """
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self._take_locked()
+                return 0.0
+            if self.max_waiters is not None and len(self._waiters) >= self.max_waiters:
+                self.rejections += 1
+                raise AdmissionRejected(f"{self.name} queue full", self._retry_after_locked())
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+            self.queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiters))
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter.granted:
+                    # Slot was handed over as we gave up - pass it on
+                    self._release_locked()
+                else:
+                    self._waiters.remove(waiter)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.timeouts += 1
+                    raise AdmissionRejected(
+                        f"{self.name} queue wait exceeded {timeout:.2f}s", self._retry_after_locked()
+                    ) from None
+            raise
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self.admitted += 1
+            self.total_wait_seconds += waited
+        return waited
+
+    def release(self, held_seconds: Optional[float] = None) -> None:
+        """Return a slot, handing it straight to the longest waiter if any"""
+        with self._lock:
+            if held_seconds is not None:
+                self.avg_hold_seconds = 0.8 * self.avg_hold_seconds + 0.2 * held_seconds
+            self._release_locked()
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """Hold a slot for the duration of the block; yields the queue wait in seconds"""
+        waited = await self.acquire(timeout)
+        started = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self.release(time.monotonic() - started)
+
+    def _take_locked(self) -> None:
+        self.in_use += 1
+        self.admitted += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _release_locked(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            try:
+                waiter.loop.call_soon_threadsafe(self._wake, waiter.future)
+            except RuntimeError:
+                # Waiter's event loop already closed
+                continue
+            waiter.granted = True
+            return
+        self.in_use -= 1
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
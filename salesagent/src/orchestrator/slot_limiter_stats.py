@@ -0,0 +1,30 @@
+"""
+Slot limiter statistics - counters reported by the limiter and its Retry-After hint
+"""
+import math
+from typing import Dict, Any
+
+
+class SlotLimiterStatsMixin:
+    """Reporting for SlotLimiter (reads the counters it keeps under its lock)"""
+
+    def _retry_after_locked(self) -> int:
+        """Seconds until the queue is likely to have drained enough to admit a new request"""
+        return max(1, math.ceil(self.avg_hold_seconds * (len(self._waiters) + 1) / self.limit))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        return {
+            "limit": self.limit,
+            "in_use": self.in_use,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self.max_waiters,
+            "peak_in_use": self.peak_in_use,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejections": self.rejections,
+            "timeouts": self.timeouts,
+            "avg_queue_wait_ms": int(self.total_wait_seconds / self.queued * 1000) if self.queued else 0,
+            "avg_hold_ms": int(self.avg_hold_seconds * 1000)
+        }
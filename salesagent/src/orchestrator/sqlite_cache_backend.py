@@ -0,0 +1,156 @@
+"""
+Shared SQLite storage backend for CacheManager - one cache file for every worker on the host
+"""
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Dict, Any, Optional
+
+from src.orchestrator.cache_backends import CacheBackend, CacheEntry
+from src.orchestrator.sqlite_cache_schema import create_cache_schema, create_private_file
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON values found in cached responses (report models, timestamps)"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """LRU store in a local SQLite file in WAL mode, shared by every worker on the host
+
+    Values are stored as JSON (models and timestamps come back as plain dicts
+    and ISO strings), so a tampered file can at worst poison the cache, never run
+    code. The directory is created private (0700) and the file 0600. Entry count
+    and byte totals are kept by triggers in a one-row totals table, so a write
+    only scans for LRU victims when it takes the cache over budget.
+    """
+
+    name = "sqlite"
+    shared = True
+
+    def __init__(self, path: str, table: str = "cache_entries", max_size: int = 1000, max_bytes: Optional[int] = None):
+        super().__init__(max_size, max_bytes)
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+        create_private_file(path)
+
+        with self._connection() as conn:
+            create_cache_schema(conn, table)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection to the cache file"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection().execute(
+            f"SELECT value, size_bytes, created_at, last_accessed, expires_at FROM {self.table} WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            value = json.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+        return CacheEntry(value=value, size_bytes=row[1], created_at=row[2], last_accessed=row[3], expires_at=row[4])
+
+    def touch(self, key: str, now: float) -> None:
+        with self._connection() as conn:
+            conn.execute(f"UPDATE {self.table} SET last_accessed = ? WHERE key = ?", (now, key))
+
+    def _upsert_sql(self) -> str:
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete would skip the totals trigger
+        return (
+            f"INSERT INTO {self.table} "
+            "(key, value, size_bytes, created_at, last_accessed, expires_at) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size_bytes = excluded.size_bytes, "
+            "created_at = excluded.created_at, last_accessed = excluded.last_accessed, "
+            "expires_at = excluded.expires_at"
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._connection() as conn:
+            conn.execute(self._upsert_sql(), self._row(key, entry))
+            self._evict(conn)
+
+    def add(self, key: str, entry: CacheEntry, now: float) -> bool:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"{self._upsert_sql()} WHERE {self.table}.expires_at <= ?",
+                (*self._row(key, entry), now)
+            )
+            stored = cursor.rowcount == 1
+            if stored:
+                self._evict(conn)
+            return stored
+
+    def _row(self, key: str, entry: CacheEntry) -> tuple:
+        return (key, json.dumps(entry.value, default=_json_default), entry.size_bytes, entry.created_at,
+                entry.last_accessed, entry.expires_at)
+
+    def _totals(self, conn: sqlite3.Connection) -> tuple:
+        return conn.execute(f"SELECT entries, size_bytes FROM {self.table}_totals").fetchone()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used rows until within budget (runs inside the write transaction)"""
+        count, total_bytes = self._totals(conn)
+        over_count = count - self.max_size
+        over_bytes = total_bytes - self.max_bytes if self.max_bytes is not None else 0
+        if over_count <= 0 and over_bytes <= 0:
+            return
+
+        victims = []
+        # Walks the last_accessed index from the oldest row and stops once within budget
+        for key, size_bytes in conn.execute(f"SELECT key, size_bytes FROM {self.table} ORDER BY last_accessed"):
+            if over_count <= 0 and over_bytes <= 0:
+                break
+            victims.append((key,))
+            over_count -= 1
+            over_bytes -= size_bytes
+
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def compare_and_delete(self, key: str, value: Any) -> bool:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM {self.table} WHERE key = ? AND value = ?",
+                (key, json.dumps(value, default=_json_default))
+            )
+            return cursor.rowcount == 1
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute(f"DELETE FROM {self.table}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        count, total_bytes = self._totals(self._connection())
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "size": count,
+            "size_bytes": total_bytes,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,47 @@
+"""
+SQLite cache schema - the private cache file, entry table and trigger-maintained totals
+"""
+import os
+import sqlite3
+
+
+def create_private_file(path: str) -> None:
+    """Create the cache directory (0700) and file (0600) before SQLite opens it"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    os.close(fd)
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"Refusing to use cache file {path} owned by another user")
+    os.chmod(path, 0o600)
+
+
+def create_cache_schema(conn: sqlite3.Connection, table: str) -> None:
+    """Create the entry table, its LRU index and the one-row totals table with the triggers that keep it"""
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table} ("
+        "key TEXT PRIMARY KEY, value BLOB NOT NULL, size_bytes INTEGER NOT NULL, "
+        "created_at REAL NOT NULL, last_accessed REAL NOT NULL, expires_at REAL NOT NULL)"
+    )
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_last_accessed ON {table} (last_accessed)")
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table}_totals ("
+        "id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, size_bytes INTEGER NOT NULL)"
+    )
+    conn.execute(
+        f"INSERT OR IGNORE INTO {table}_totals (id, entries, size_bytes) "
+        f"SELECT 0, COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {table}"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {table}_totals_insert AFTER INSERT ON {table} BEGIN "
+        f"UPDATE {table}_totals SET entries = entries + 1, size_bytes = size_bytes + NEW.size_bytes; END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {table}_totals_delete AFTER DELETE ON {table} BEGIN "
+        f"UPDATE {table}_totals SET entries = entries - 1, size_bytes = size_bytes - OLD.size_bytes; END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {table}_totals_update AFTER UPDATE OF size_bytes ON {table} BEGIN "
+        f"UPDATE {table}_totals SET size_bytes = size_bytes - OLD.size_bytes + NEW.size_bytes; END"
+    )
@@ -0,0 +1,107 @@
+"""
+Stragglers - stop waiting on agent calls at the deadline or on early exit, and report them
+"""
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.adaptive_timeout import AgentCallPlan
+from src.orchestrator.agent_results import _report
+from src.orchestrator.deadline import OrchestrationDeadline
+
+logger = logging.getLogger(__name__)
+
+
+class StragglerMixin:
+    """Wait on FanoutOrchestrator agent calls until they finish or are not worth waiting for"""
+
+    def _start_early_exit(self, request: AgentSelectRequest, tasks: Dict, skipped: List[Tuple[List, AgentReport]]):
+        """
+        Start tracking the fanout for early exit, if enabled, counting cached responses as answered
+        """
+        cached = [products for products, report in skipped if report.cached]
+        tracker = self.early_exit.start(request.max_results, len(tasks) + len(cached))
+        if tracker:
+            for products in cached:
+                tracker.add_result(products)
+        return tracker
+
+    async def _stream_calls(
+        self,
+        tasks: Dict[asyncio.Future, Tuple[AgentConfig, str, AgentCallPlan]],
+        request: AgentSelectRequest,
+        deadline: OrchestrationDeadline,
+        tracker=None
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], AgentReport]]:
+        """
+        Yield each call's result as it finishes, then cancel and report the calls still running
+
+        Calls still running at the hard deadline, once the soft deadline passes with enough
+        products, or once early exit settles the top-k are cancelled.
+        """
+        pending = set(tasks)
+        products_count = 0
+        early_exit_reason = None
+        while pending and not deadline.expired:
+            done, pending = await asyncio.wait(
+                pending, timeout=deadline.next_wait_seconds(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                agent, tenant_id, plan = tasks[task]
+                products, report = self._build_agent_result(agent, tenant_id, task, plan)
+                await self._record_result(agent, tenant_id, request, products, report, tracker)
+                products_count += len(products)
+                yield products, report
+
+            if pending and deadline.soft_deadline_reached(products_count):
+                logger.info(f"Soft deadline reached with {products_count} products, "
+                           f"not waiting for {len(pending)} agents")
+                break
+            if pending:
+                early_exit_reason = self._early_exit_reason(tracker, [tasks[task][0].agent_id for task in pending])
+                if early_exit_reason:
+                    break
+
+        for task in pending:
+            task.cancel()
+            agent, tenant_id, plan = tasks[task]
+            yield [], self._straggler_report(agent, tenant_id, plan, deadline, early_exit_reason)
+
+    def _early_exit_reason(self, tracker, pending_agent_ids: List[str]) -> Optional[str]:
+        """
+        Why the agents still running need not be waited for, recording the exit, or None
+        """
+        reason = tracker.stop_reason(pending_agent_ids) if tracker else None
+        if reason:
+            logger.info(f"Early exit ({reason}), not waiting for {len(pending_agent_ids)} agents")
+            self.early_exit.record_exit(reason.split(":")[0], pending_agent_ids)
+        return reason
+
+    def _straggler_report(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        plan: AgentCallPlan,
+        deadline: OrchestrationDeadline,
+        early_exit_reason: Optional[str] = None
+    ) -> AgentReport:
+        """
+        Report an agent cancelled at the hard or soft deadline (timeout) or by early exit (cancelled)
+        """
+        self.timeout_policy.record_hedge(plan)
+        elapsed_ms = int(deadline.elapsed_seconds * 1000)
+        if early_exit_reason:
+            return _report(agent, tenant_id, AgentStatus.CANCELLED, plan, latency_ms=elapsed_ms,
+                           error_message=f"Cancelled by early exit after {elapsed_ms}ms ({early_exit_reason})")
+
+        if not deadline.expired:
+            # An early return at the soft deadline does not count against the agent
+            logger.info(f"Agent {agent.agent_id} cancelled at soft deadline after {elapsed_ms}ms")
+            return _report(agent, tenant_id, AgentStatus.TIMEOUT, plan, latency_ms=elapsed_ms, soft_deadline=True,
+                           error_message=f"Cancelled at soft deadline after {elapsed_ms}ms, with enough products in")
+
+        logger.warning(f"Agent {agent.agent_id} cancelled at orchestration deadline after {elapsed_ms}ms")
+        self.circuit_breaker.record_result(tenant_id, agent.agent_id, False)
+        return _report(agent, tenant_id, AgentStatus.TIMEOUT, plan, latency_ms=elapsed_ms,
+                       error_message=f"Cancelled at orchestration deadline after {elapsed_ms}ms")
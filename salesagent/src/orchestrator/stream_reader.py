@@ -0,0 +1,101 @@
+"""
+StreamReader - characters of a capped UTF-8 byte stream, decoded as chunks arrive
+"""
+import codecs
+import json
+from typing import Any, AsyncIterator, Optional
+
+from src.orchestrator.response_limits import AgentProducts
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+_decoder = json.JSONDecoder()
+
+
+class ByteCapReached(Exception):
+    """The response body is larger than its byte cap"""
+
+
+class StreamReader:
+    """Characters of a UTF-8 byte stream, decoded as chunks arrive and capped at max_bytes
+
+    The buffer only holds the value being decoded: text before the read position
+    is dropped whenever another chunk is appended.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], max_bytes: int):
+        self._chunks = chunks.__aiter__()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+        self.capped = False
+        # The products array being filled, flagged if the byte cap cuts it off
+        self.products: Optional[AgentProducts] = None
+
+    async def _fill(self) -> None:
+        """Append the next chunk (or mark the end of the stream)"""
+        if self.capped:
+            raise ByteCapReached()
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.exhausted = True
+            chunk, final = b"", True
+        else:
+            final = False
+            if len(chunk) > self.max_bytes - self.bytes_read:
+                chunk = chunk[:self.max_bytes - self.bytes_read]
+                self.capped = True
+            self.bytes_read += len(chunk)
+        self.buffer = self.buffer[self.pos:] + self._text_decoder.decode(chunk, final)
+        self.pos = 0
+
+    async def peek(self) -> str:
+        """The next non-whitespace character, or '' at the end of the stream"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.exhausted:
+                return ""
+            await self._fill()
+
+    async def expect(self, char: str) -> None:
+        found = await self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    async def close(self, char: str) -> bool:
+        """Consume a ',' (False: more members follow) or the closing char (True)"""
+        found = await self.peek()
+        if found not in (",", char):
+            raise json.JSONDecodeError(f"Expected ',' or {char!r}, found {found!r}", self.buffer, self.pos)
+        self.pos += 1
+        return found == char
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value, reading as much of the stream as it needs"""
+        await self.peek()
+        retry_at = 0
+        while True:
+            if self.exhausted or len(self.buffer) - self.pos >= retry_at:
+                try:
+                    value, end = _decoder.raw_decode(self.buffer, self.pos)
+                except json.JSONDecodeError:
+                    if self.exhausted:
+                        raise
+                else:
+                    # Only a number can run on into the next chunk ("1." + "5"): it is complete
+                    # once a character that cannot continue it follows
+                    if self.exhausted or not isinstance(value, (int, float)) or isinstance(value, bool) \
+                            or (end < len(self.buffer) and self.buffer[end] not in _NUMBER_CHARS):
+                        self.pos = end
+                        return value
+                # Retry once the buffer has doubled, so a large value is decoded in linear time
+                retry_at = 2 * (len(self.buffer) - self.pos)
+            await self._fill()
@@ -0,0 +1,122 @@
+"""
+Top-k merge - streaming deduplicating merge of agent products into the best max_results
+"""
+import heapq
+import itertools
+import logging
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+from datetime import datetime, UTC
+
+if TYPE_CHECKING:
+    from src.orchestrator.normalize import ProductNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+class _RankedProduct:
+    """Heap entry ordered so the worst-ranked product is at the top of a min-heap"""
+    __slots__ = ("rank", "dedup_key", "product", "removed")
+    
+    def __init__(self, rank: Tuple, dedup_key: str, product: Dict[str, Any]):
+        self.rank = rank
+        self.dedup_key = dedup_key
+        self.product = product
+        self.removed = False
+    
+    def __lt__(self, other: "_RankedProduct") -> bool:
+        return self.rank > other.rank
+
+
+class TopKProductMerger:
+    """Streaming deduplicating top-k merge of agent products
+    
+    Gives the same result as normalize -> deduplicate -> sort -> truncate:
+    one product per publisher_tenant_id + product_id (the first with the
+    highest score), ordered by score (descending), price, name, with ties in
+    order of first appearance. Memory is bounded by max_results products plus
+    one best score per distinct product key.
+    """
+    
+    def __init__(self, normalizer: "ProductNormalizer", max_results: int):
+        self.normalizer = normalizer
+        self.max_results = max(max_results, 0)
+        self.heap: List[_RankedProduct] = []
+        self.entries: Dict[str, _RankedProduct] = {}
+        self.best_scores: Dict[str, float] = {}
+        self.first_seen: Dict[str, int] = {}
+        self.sequence = itertools.count()
+        self.products_seen = 0
+    
+    def add_products(self, products: List[Dict[str, Any]]) -> None:
+        """Fold a batch of raw agent products into the running top-k"""
+        normalized_at = datetime.now(UTC).isoformat()
+        for product in products:
+            self.products_seen += 1
+            self._add_product(product, normalized_at)
+    
+    def add_normalized_products(self, products: List[Dict[str, Any]]) -> None:
+        """Fold a batch of products that already went through normalize_products"""
+        for product in products:
+            self.products_seen += 1
+            self._add_product(product, None)
+    
+    def _add_product(self, product: Dict[str, Any], normalized_at: Optional[str]) -> None:
+        """Rank a product; normalized_at is None when it is already normalized"""
+        try:
+            # Same coercions as _normalize_single_product, without building the dict
+            product_id = str(product.get("product_id", ""))
+            publisher_tenant_id = str(product.get("publisher_tenant_id", ""))
+            score = float(product.get("score", 0.0))
+            price = float(product.get("price_cpm", 0.0))
+            name = str(product.get("name", "Unknown Product")).lower()
+        except Exception as e:
+            logger.warning(f"Failed to normalize product {product.get('product_id', 'unknown')}: {e}")
+            return
+        
+        if not product_id or not publisher_tenant_id:
+            logger.warning(f"Product missing required fields: {product}")
+            return
+        
+        # Deduplicate: only a strictly higher score replaces a product already seen
+        dedup_key = f"{publisher_tenant_id}_{product_id}"
+        best_score = self.best_scores.get(dedup_key)
+        if best_score is not None and score <= best_score:
+            return
+        self.best_scores[dedup_key] = score
+        sequence = self.first_seen.setdefault(dedup_key, next(self.sequence))
+        rank = (-score, price, name, sequence)
+        
+        previous = self.entries.get(dedup_key)
+        evict = previous is None and len(self.entries) >= self.max_results
+        if evict:
+            worst = self._worst()
+            if worst is None or rank >= worst.rank:
+                return
+        
+        normalized = product if normalized_at is None else self.normalizer._normalize_single_product(
+            product, normalized_at
+        )
+        if normalized is None:
+            return
+        
+        if evict:
+            heapq.heappop(self.heap)
+            del self.entries[worst.dedup_key]
+        elif previous is not None:
+            # Superseded by a higher-scoring duplicate; drop it lazily from the heap
+            previous.removed = True
+        entry = _RankedProduct(rank, dedup_key, normalized)
+        self.entries[dedup_key] = entry
+        heapq.heappush(self.heap, entry)
+    
+    def _worst(self) -> Optional[_RankedProduct]:
+        """The lowest-ranked live entry, discarding superseded ones"""
+        while self.heap and self.heap[0].removed:
+            heapq.heappop(self.heap)
+        return self.heap[0] if self.heap else None
+    
+    def results(self) -> List[Dict[str, Any]]:
+        """The current top-k products, best first"""
+        ranked = sorted(self.entries.values(), key=lambda entry: entry.rank)
+        logger.info(f"Merged {self.products_seen} products into {len(ranked)} top results")
+        return [entry.product for entry in ranked]
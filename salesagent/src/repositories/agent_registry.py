@@ -0,0 +1,132 @@
+"""
+Agent Registry - In-process snapshot of active agents across tenants
+"""
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple, Dict, Any
+
+from sqlalchemy import func
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import Tenant
+from src.core.schemas.agent import AgentStatus
+from src.repositories.agent_registry_snapshot import AgentEntry, AgentRegistrySnapshot
+from src.repositories.agents_repo import AgentRepository, agent_repository
+
+logger = logging.getLogger(__name__)
+
+class AgentRegistry:
+    """Serve agent discovery from a snapshot rebuilt only when agent configuration changes
+
+    Each lookup runs a cheap staleness check - the tenant count and latest
+    updated_at, plus an in-process write version bumped by invalidate() - and
+    rebuilds the snapshot only if either moved or it is older than max_age_seconds.
+    """
+
+    def __init__(self, repository: AgentRepository, max_age_seconds: float = 300.0):
+        self.repository = repository
+        self.max_age_seconds = max_age_seconds
+        self.snapshot: Optional[AgentRegistrySnapshot] = None
+        self._lock = threading.Lock()
+        # Bumped on every agent configuration write, so a rebuild racing a write is not kept
+        self.version = 0
+        self.rebuilds = 0
+        self.lookups = 0
+
+    def find_agents(
+        self,
+        include_tenant_ids: Optional[List[str]] = None,
+        exclude_tenant_ids: Optional[List[str]] = None,
+        include_agent_ids: Optional[List[str]] = None,
+        agent_types: Optional[List[str]] = None
+    ) -> List[AgentEntry]:
+        """
+        Find active agents matching the filters
+
+        Returns:
+            List of tuples: (AgentConfig, tenant_id, tenant_name)
+        """
+        snapshot = self.get_snapshot()
+        self.lookups += 1
+
+        if include_tenant_ids and agent_types:
+            candidates = [
+                entry
+                for tenant_id in dict.fromkeys(include_tenant_ids)
+                for agent_type in dict.fromkeys(agent_types)
+                for entry in snapshot.by_tenant_and_type.get((tenant_id, agent_type), [])
+            ]
+        elif include_tenant_ids:
+            candidates = [
+                entry for tenant_id in dict.fromkeys(include_tenant_ids) for entry in snapshot.by_tenant.get(tenant_id, [])
+            ]
+        elif agent_types:
+            candidates = [
+                entry for agent_type in dict.fromkeys(agent_types) for entry in snapshot.by_type.get(agent_type, [])
+            ]
+        else:
+            candidates = snapshot.agents
+
+        excluded = set(exclude_tenant_ids or [])
+        agent_ids = set(include_agent_ids or [])
+        return [
+            entry for entry in candidates
+            if entry[1] not in excluded and (not agent_ids or entry[0].agent_id in agent_ids)
+        ]
+
+    def get_snapshot(self) -> AgentRegistrySnapshot:
+        """Get the current snapshot, rebuilding it if agent configuration changed"""
+        with get_db_session() as db_session:
+            watermark = self._read_watermark(db_session)
+            version = self.version
+
+            with self._lock:
+                snapshot = self.snapshot
+                if snapshot is None or self._is_stale(snapshot, watermark, version):
+                    agents = self.repository._list_agents_with_session(db_session, status=AgentStatus.ACTIVE)
+                    snapshot = AgentRegistrySnapshot.build(agents, watermark, version)
+                    self.snapshot = snapshot
+                    self.rebuilds += 1
+                    logger.info(f"Rebuilt agent registry snapshot: {len(agents)} active agents "
+                               f"across {len(snapshot.by_tenant)} tenants")
+
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Force the next lookup to rebuild the snapshot (call after every agent configuration write)"""
+        with self._lock:
+            self.version += 1
+            self.snapshot = None
+
+    def _read_watermark(self, db_session) -> Tuple[Any, ...]:
+        """Tenant count and most recent tenant update - changes whenever a tenant is added, removed or edited"""
+        count, last_updated = db_session.query(func.count(Tenant.tenant_id), func.max(Tenant.updated_at)).one()
+        return count, last_updated
+
+    def _is_stale(self, snapshot: AgentRegistrySnapshot, watermark: Tuple[Any, ...], version: int) -> bool:
+        return (
+            snapshot.watermark != watermark
+            or snapshot.version != version
+            or time.monotonic() - snapshot.built_at > self.max_age_seconds
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        snapshot = self.snapshot
+        return {
+            "agents": len(snapshot.agents) if snapshot else 0,
+            "tenants": len(snapshot.by_tenant) if snapshot else 0,
+            "snapshot_age_seconds": time.monotonic() - snapshot.built_at if snapshot else None,
+            "rebuilds": self.rebuilds,
+            "lookups": self.lookups,
+            "max_age_seconds": self.max_age_seconds
+        }
+
+
+# Global instance for easy access
+agent_registry = AgentRegistry(
+    repository=agent_repository,
+    max_age_seconds=float(os.environ.get("AGENT_REGISTRY_MAX_AGE_SECONDS", "300"))
+)
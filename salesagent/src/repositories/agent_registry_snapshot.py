@@ -0,0 +1,46 @@
+"""
+Agent Registry Snapshot - Active agents indexed by tenant and agent type
+"""
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Any
+
+from src.core.schemas.agent import AgentConfig
+
+AgentEntry = Tuple[AgentConfig, str, str]
+
+
+@dataclass
+class AgentRegistrySnapshot:
+    """Active agents indexed by tenant and agent type"""
+    watermark: Tuple[Any, ...]
+    version: int
+    built_at: float
+    agents: List[AgentEntry] = field(default_factory=list)
+    by_tenant: Dict[str, List[AgentEntry]] = field(default_factory=dict)
+    by_type: Dict[str, List[AgentEntry]] = field(default_factory=dict)
+    by_tenant_and_type: Dict[Tuple[str, str], List[AgentEntry]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, agents: List[AgentEntry], watermark: Tuple[Any, ...], version: int) -> "AgentRegistrySnapshot":
+        """Index a list of (AgentConfig, tenant_id, tenant_name) entries"""
+        by_tenant = defaultdict(list)
+        by_type = defaultdict(list)
+        by_tenant_and_type = defaultdict(list)
+
+        for entry in agents:
+            agent, tenant_id, _ = entry
+            by_tenant[tenant_id].append(entry)
+            by_type[agent.type].append(entry)
+            by_tenant_and_type[(tenant_id, agent.type)].append(entry)
+
+        return cls(
+            watermark=watermark,
+            version=version,
+            built_at=time.monotonic(),
+            agents=agents,
+            by_tenant=dict(by_tenant),
+            by_type=dict(by_type),
+            by_tenant_and_type=dict(by_tenant_and_type)
+        )
@@ -6,6 +6,7 @@ from datetime import datetime, UTC
 import logging
 
 from src.repositories.agents_repo import agent_repository
+from src.repositories.agent_registry import agent_registry
 from src.core.schemas.agent import AgentConfig, AgentStatus, AgentType, AgentReport
 
 
@@ -17,6 +18,7 @@ class AgentManagementService:
     
     def __init__(self):
         self.repository = agent_repository
+        self.registry = agent_registry
     
     def discover_active_agents(
         self,
@@ -35,12 +37,11 @@ class AgentManagementService:
             logger.info(f"Discovering active agents - include_tenants: {include_tenant_ids}, "
                        f"exclude_tenants: {exclude_tenant_ids}, agent_types: {agent_types}")
             
-            agents = self.repository.list_active_agents_across_tenants(
+            agents = self.registry.find_agents(
                 include_tenant_ids=include_tenant_ids,
                 exclude_tenant_ids=exclude_tenant_ids,
                 include_agent_ids=include_agent_ids,
-                agent_types=agent_types,
-                status=AgentStatus.ACTIVE
+                agent_types=agent_types
             )
             
             logger.info(f"Discovered {len(agents)} active agents")
@@ -65,6 +66,7 @@ class AgentManagementService:
             success = self.repository.update_agent_status(agent_id, tenant_id, status)
             
             if success:
+                self.registry.invalidate()
                 logger.info(f"Successfully updated agent {agent_id} status to {status}")
             else:
                 logger.warning(f"Failed to update agent {agent_id} status to {status}")
@@ -80,6 +82,7 @@ class AgentManagementService:
         try:
             logger.info(f"Creating default agents for tenant {tenant_id}")
             agents = self.repository.create_default_agents_for_tenant(tenant_id)
+            self.registry.invalidate()
             
             logger.info(f"Created {len(agents)} default agents for tenant {tenant_id}")
             return agents
@@ -91,7 +94,7 @@ class AgentManagementService:
     def get_agent_statistics(self) -> Dict[str, Any]:
         """Get statistics about agents across all tenants"""
         try:
-            all_agents = self.repository.list_active_agents_across_tenants()
+            all_agents = self.registry.find_agents()
             
             stats = {
                 'total_agents': len(all_agents),
@@ -161,7 +164,7 @@ class AgentManagementService:
     def add_agent_to_tenant(self, tenant_id: str, agent_id: str, agent_config: Dict[str, Any]) -> bool:
         """Add a new agent to a tenant"""
         try:
-            return self.repository.add_agent_to_tenant(tenant_id, agent_id, agent_config)
+            return self._invalidate_on_success(self.repository.add_agent_to_tenant(tenant_id, agent_id, agent_config))
         except Exception as e:
             logger.error(f"Error adding agent {agent_id} to tenant {tenant_id}: {e}")
             return False
@@ -169,7 +172,7 @@ class AgentManagementService:
     def update_agent_config(self, agent_id: str, tenant_id: str, config_updates: Dict[str, Any]) -> bool:
         """Update agent configuration"""
         try:
-            return self.repository.update_agent_config(agent_id, tenant_id, config_updates)
+            return self._invalidate_on_success(self.repository.update_agent_config(agent_id, tenant_id, config_updates))
         except Exception as e:
             logger.error(f"Error updating agent {agent_id} config: {e}")
             return False
@@ -177,10 +180,16 @@ class AgentManagementService:
     def delete_agent(self, agent_id: str, tenant_id: str) -> bool:
         """Delete an agent"""
         try:
-            return self.repository.delete_agent(agent_id, tenant_id)
+            return self._invalidate_on_success(self.repository.delete_agent(agent_id, tenant_id))
         except Exception as e:
             logger.error(f"Error deleting agent {agent_id}: {e}")
             return False
+    
+    def _invalidate_on_success(self, success: bool) -> bool:
+        """Drop the registry snapshot after a successful agent configuration write"""
+        if success:
+            self.registry.invalidate()
+        return success
 
 
 # Global instance for easy access
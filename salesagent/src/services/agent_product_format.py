@@ -0,0 +1,23 @@
+"""
+Agent Product Format - Product rows in the agent provider response format
+"""
+from typing import Any, Dict
+
+from src.core.database.models import Product
+
+
+def to_agent_product(product: Product, agent_id: str, tenant_id: str) -> Dict[str, Any]:
+    """Convert a product row to the dict a local agent returns for it"""
+    return {
+        "product_id": product.product_id,
+        "name": product.name,
+        "description": product.description,
+        "price_cpm": float(product.cpm) if product.cpm else 0.0,
+        "formats": product.formats if isinstance(product.formats, list) else [],
+        "categories": [],  # Product model doesn't have categories field
+        "targeting": product.targeting_template if isinstance(product.targeting_template, list) else [],
+        "image_url": None,  # Product model doesn't have image_url field
+        "delivery_type": product.delivery_type,
+        "publisher_tenant_id": tenant_id,
+        "source_agent_id": agent_id
+    }
@@ -5,6 +5,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from decimal import Decimal
 
+from src.core.tracing import tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,8 +33,10 @@ class AIRankingCore:
             logger.info(f"Ranking {len(products)} products")
             
             # Call Gemini
-            response = model.generate_content(prompt)
-            response_text = response.text
+            with tracer.span("ai.gemini", model="gemini-2.0-flash-exp", prompt_chars=len(prompt),
+                             products=len(products)):
+                response = model.generate_content(prompt)
+                response_text = response.text
             
             logger.info(f"Gemini response received: {len(response_text)} characters")
             
@@ -0,0 +1,84 @@
+"""
+Keyword-based product ranking used when AI ranking is unavailable
+"""
+import logging
+from typing import List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def fallback_keyword_ranking(
+    prompt: str, 
+    products: List[Dict[str, Any]], 
+    max_results: int
+) -> List[Dict[str, Any]]:
+    """
+    Fallback keyword-based ranking when AI fails
+    """
+    try:
+        # Enhanced keyword matching with semantic understanding
+        prompt_lower = prompt.lower()
+        keywords = prompt_lower.split()
+        
+        # Define keyword categories for better matching
+        crime_keywords = ["crime", "true crime", "murder", "mystery", "detective", "investigation", "criminal", "law", "justice"]
+        entertainment_keywords = ["entertainment", "streaming", "video", "movie", "show", "series", "drama", "thriller", "documentary"]
+        tech_keywords = ["tech", "technology", "mobile", "digital", "app", "software", "startup", "innovation"]
+        sports_keywords = ["sports", "athletic", "fitness", "game", "competition", "team", "player"]
+        
+        scored_products = []
+        
+        for product in products:
+            score = 0.0
+            
+            # Check product name
+            if product.get("name"):
+                name_lower = product["name"].lower()
+                for keyword in keywords:
+                    if keyword in name_lower:
+                        score += 2.0  # Higher weight for name matches
+            
+            # Check description
+            if product.get("description"):
+                desc_lower = product["description"].lower()
+                for keyword in keywords:
+                    if keyword in desc_lower:
+                        score += 1.0
+            
+            # Semantic matching for "true crime"
+            if "true crime" in prompt_lower or "crime" in prompt_lower:
+                # Boost entertainment and streaming products
+                if any(word in product.get("name", "").lower() for word in ["entertainment", "streaming", "video", "movie", "show"]):
+                    score += 3.0
+                if any(word in product.get("description", "").lower() for word in ["entertainment", "streaming", "video", "movie", "show"]):
+                    score += 2.0
+            
+            # Check categories
+            if product.get("categories"):
+                for category in product["categories"]:
+                    category_lower = category.lower()
+                    for keyword in keywords:
+                        if keyword in category_lower:
+                            score += 0.5
+            
+            # Add base score and price factor
+            product["score"] = score + 0.1  # Base score
+            if product.get("price_cpm"):
+                product["price_factor"] = 1.0 / (1.0 + product["price_cpm"] / 1000.0)
+            else:
+                product["price_factor"] = 0.5
+            
+            scored_products.append(product)
+        
+        # Sort by score (descending) and price (ascending)
+        scored_products.sort(
+            key=lambda x: (x["score"], -x.get("price_factor", 0)), 
+            reverse=True
+        )
+        
+        # Return top results
+        return scored_products[:max_results]
+        
+    except Exception as e:
+        logger.error(f"Fallback ranking error: {e}")
+        return products[:max_results] if products else []
@@ -0,0 +1,147 @@
+"""
+Orchestrator Cache - Cached orchestration results, stale-while-revalidate and shared-cache fill claims
+"""
+import asyncio
+import logging
+import os
+import uuid
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.performance import PerformanceMetrics
+from src.orchestrator.cache_manager import cache_manager
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.deadline import OrchestrationDeadline
+from src.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# Background refreshes share one scheduler flow instead of borrowing a buyer's share
+REVALIDATION_BUYER_ID = "stale_revalidation"
+
+
+class OrchestratorCacheMixin:
+    """Result caching for OrchestratorService - every cache_manager access goes through here, in a worker thread"""
+
+    def _generate_cache_key(
+        self,
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]] = None,
+        exclude_tenant_ids: Optional[List[str]] = None,
+        include_agent_ids: Optional[List[str]] = None,
+        agent_types: Optional[List[str]] = None
+    ) -> str:
+        """Generate a cache key from the canonical fingerprint of the request"""
+        return self.fingerprinter.fingerprint(
+            "orch_cache_",
+            request,
+            include_tenant_ids=include_tenant_ids,
+            exclude_tenant_ids=exclude_tenant_ids,
+            include_agent_ids=include_agent_ids,
+            agent_types=agent_types
+        )
+
+    async def _get_cached_result(
+        self,
+        cache_key: str,
+        metrics: PerformanceMetrics,
+        revalidate: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached orchestration result and close out its metrics, if present"""
+        cached_result, stale = await asyncio.to_thread(
+            cache_manager.lookup, cache_key, allow_stale=self.stale_while_revalidate
+        )
+        if not cached_result:
+            return None
+
+        if stale:
+            logger.info("Returning stale cached result and refreshing it in the background")
+            if revalidate:
+                self._revalidate_in_background(cache_key, revalidate)
+            cached_result = {**cached_result, "metadata": {**cached_result["metadata"], "stale": True}}
+        else:
+            logger.info("Returning cached result")
+
+        metrics.total_products_found = len(cached_result.get("products", []))
+        metrics.total_products_after_sort = len(cached_result.get("products", []))
+        performance_monitor.end_operation(metrics)
+        return cached_result
+
+    @staticmethod
+    async def _cache_result(cache_key: str, response: Dict[str, Any]) -> None:
+        """Cache an orchestration result"""
+        await asyncio.to_thread(cache_manager.set, cache_key, response)
+
+    def _revalidate_in_background(self, cache_key: str, revalidate: Callable[[], Awaitable[None]]) -> None:
+        """Refresh a stale cache entry as a task on the async runtime loop, once per key at a time"""
+        with self._revalidation_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+            self.revalidations += 1
+
+        def finished(_future) -> None:
+            with self._revalidation_lock:
+                self._revalidating.discard(cache_key)
+
+        self.runtime.submit(revalidate()).add_done_callback(finished)
+
+    async def _revalidate(
+        self,
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]],
+        exclude_tenant_ids: Optional[List[str]],
+        include_agent_ids: Optional[List[str]],
+        agent_types: Optional[List[str]],
+        cache_key: str
+    ) -> None:
+        """Re-run an orchestration to refresh its cache entry, traced separately from the request that found it stale"""
+        metrics = performance_monitor.start_operation()
+        deadline = OrchestrationDeadline.start(self.deadline_policy, request)
+
+        async def run_fanout() -> Dict[str, Any]:
+            return await self._fanout_and_build(
+                request, include_tenant_ids, exclude_tenant_ids, include_agent_ids,
+                agent_types, cache_key, metrics, deadline, buyer_id=REVALIDATION_BUYER_ID
+            )
+
+        with tracer.span("revalidate", new_trace=True, cache_key=cache_key):
+            try:
+                await self.coalescer.run(cache_key, run_fanout)
+            except Exception as e:
+                logger.warning(f"Background refresh of {cache_key} failed: {e}")
+                metrics.errors.append(str(e))
+                performance_monitor.end_operation(metrics)
+
+    async def _await_cache_fill(
+        self,
+        cache_key: str,
+        deadline: OrchestrationDeadline
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Claim the right to fill a shared cache key, or wait for the worker that holds it
+
+        Returns:
+            Tuple of (result stored by another worker, claim token). Both are None
+            when the cache is not shared or the deadline passed while waiting; with
+            a claim token this worker runs the fanout and releases the claim after.
+        """
+        if not cache_manager.shared:
+            return None, None
+
+        claim_key = f"fill_claim_{cache_key}"
+        claim = f"{os.getpid()}:{uuid.uuid4().hex}"
+        ttl_seconds = deadline.hard_timeout_seconds
+        while not await asyncio.to_thread(cache_manager.add, claim_key, claim, ttl_seconds=ttl_seconds):
+            if deadline.expired:
+                return None, None
+            await asyncio.sleep(self.fill_poll_seconds)
+            result = await asyncio.to_thread(cache_manager.peek, cache_key)
+            if result is not None:
+                return result, None
+        return None, claim
+
+    @staticmethod
+    async def _release_fill_claim(cache_key: str, claim: str) -> None:
+        """Release this worker's fill claim, unless it expired and another worker has taken it"""
+        await asyncio.to_thread(cache_manager.compare_and_delete, f"fill_claim_{cache_key}", claim)
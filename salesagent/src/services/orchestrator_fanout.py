@@ -0,0 +1,98 @@
+"""
+Orchestrator Fanout - Fan out once admitted (and once this worker holds the shared-cache fill claim)
+"""
+import logging
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport
+from src.orchestrator.performance import PerformanceMetrics
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.deadline import OrchestrationDeadline
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestratorFanoutMixin:
+    """Fanout, response building and caching for OrchestratorService"""
+
+    async def _fanout_and_build(
+        self,
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]],
+        exclude_tenant_ids: Optional[List[str]],
+        include_agent_ids: Optional[List[str]],
+        agent_types: Optional[List[str]],
+        cache_key: str,
+        metrics: PerformanceMetrics,
+        deadline: OrchestrationDeadline,
+        buyer_id: Optional[str] = None,
+        on_agent_result: Optional[Callable[[List[Dict[str, Any]], AgentReport], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fan out to agents, build the response and cache it
+
+        With on_agent_result, each agent's products are normalized and merged as they
+        arrive and passed to it along with the agent's report (for streaming responses).
+        """
+        # With a shared cache, only one worker fills each key
+        filled_result, claim = await self._await_cache_fill(cache_key, deadline)
+        if filled_result is not None:
+            return self._shared_response(filled_result, metrics, "another worker's fanout, from the shared cache")
+        if deadline.expired:
+            # A fanout now would only time out every agent and count it against their breakers
+            raise Exception("Orchestration deadline passed while waiting for another worker's results")
+
+        try:
+            # Step 1: Fan out to all agents, once admitted
+            remaining_seconds = deadline.hard_timeout_seconds - deadline.elapsed_seconds
+            fanout_filters = dict(include_tenant_ids=include_tenant_ids, exclude_tenant_ids=exclude_tenant_ids,
+                                  include_agent_ids=include_agent_ids, agent_types=agent_types,
+                                  deadline=deadline, buyer_id=buyer_id)
+            processed_products = None
+            async with self.admission.fanout_slot(remaining_seconds):
+                if on_agent_result is None:
+                    all_products, agent_reports = await self.fanout.fanout_to_agents(request=request, **fanout_filters)
+                else:
+                    all_products, agent_reports, processed_products = await self._stream_fanout(
+                        request, fanout_filters, on_agent_result
+                    )
+
+            # Steps 2-3: Process products and build the response
+            response = self._build_response(request, all_products, agent_reports, metrics, deadline,
+                                            processed_products=processed_products)
+
+            # Cache the result, unless agents were cut off: a partial result would be served to every later buyer
+            if not response["metadata"]["partial_results"]:
+                await self._cache_result(cache_key, response)
+        finally:
+            if claim is not None:
+                await self._release_fill_claim(cache_key, claim)
+
+        # End performance monitoring
+        performance_monitor.end_operation(metrics)
+
+        return response
+
+    async def _stream_fanout(
+        self,
+        request: AgentSelectRequest,
+        fanout_filters: Dict[str, Any],
+        on_agent_result: Callable[[List[Dict[str, Any]], AgentReport], None]
+    ) -> Tuple[List[Dict[str, Any]], List[AgentReport], List[Dict[str, Any]]]:
+        """
+        Fan out, merging each agent's products as they arrive and passing them to on_agent_result
+
+        Each batch is normalized once and the same products go to the merger and the callback.
+
+        Returns:
+            Tuple of (all_products, agent_reports, merged top-k products)
+        """
+        all_products, agent_reports = [], []
+        merger = self.normalizer.create_merger(request.max_results)
+        async for products, report in self.fanout.stream_agent_results(request=request, **fanout_filters):
+            all_products.extend(products)
+            agent_reports.append(report)
+            normalized = self.normalizer.normalize_products(products)
+            merger.add_normalized_products(normalized)
+            on_agent_result(normalized, report)
+        return all_products, agent_reports, merger.results()
@@ -0,0 +1,151 @@
+"""
+Orchestrator Response - Build orchestration responses and the statistics about them
+"""
+import logging
+import time
+from typing import List, Dict, Any, Optional
+from datetime import datetime, UTC
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.performance import PerformanceMetrics
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.deadline import OrchestrationDeadline
+from src.core.tracing import Span, tracer
+
+logger = logging.getLogger(__name__)
+
+
+def _report_metadata(agent_reports: List[AgentReport]) -> Dict[str, Any]:
+    """Per-agent response metadata - timeouts, early exit, breakers, routing, hedging, caching and truncation"""
+    timed_out_agents = [r.agent_id for r in agent_reports if r.status == AgentStatus.TIMEOUT]
+    return {
+        "timed_out_agents": timed_out_agents,
+        "partial_results": bool(timed_out_agents),
+        "soft_deadline_agents": [r.agent_id for r in agent_reports if getattr(r, 'soft_deadline', False) is True],
+        "early_exit_cancelled_agents": [r.agent_id for r in agent_reports if r.status == AgentStatus.CANCELLED],
+        "circuit_open_agents": [r.agent_id for r in agent_reports if r.status == AgentStatus.CIRCUIT_OPEN],
+        "pruned_agents": [
+            {"agent_id": r.agent_id, "tenant_id": r.tenant_id, "reason": r.error_message}
+            for r in agent_reports if r.status == AgentStatus.PRUNED
+        ],
+        "adaptive_timeouts": {
+            "timeouts_ms": {r.agent_id: r.timeout_ms for r in agent_reports
+                            if isinstance(getattr(r, 'timeout_ms', None), int)},
+            "hedged_agents": [r.agent_id for r in agent_reports if getattr(r, 'hedged', False) is True]
+        },
+        "cached_agents": [r.agent_id for r in agent_reports if getattr(r, 'cached', False) is True],
+        "truncated_agents": [
+            {"agent_id": r.agent_id, "reason": r.truncation_reason}
+            for r in agent_reports if getattr(r, 'truncated', False) is True
+        ],
+    }
+
+
+def _record_agent_metrics(metrics: PerformanceMetrics, agent_reports: List[AgentReport]) -> None:
+    """Extract agent response times and product counts from reports"""
+    for report in agent_reports:
+        if getattr(report, 'cached', False) is True:
+            # Cached responses say nothing about the agent's current latency
+            metrics.agent_product_counts[report.agent_id] = report.products_count
+            continue
+        latency_ms = getattr(report, 'latency_ms', None)
+        if report.status == "active" and isinstance(latency_ms, (int, float)):
+            metrics.agent_response_times[report.agent_id] = latency_ms
+        elif hasattr(report, 'response_time_ms') and report.response_time_ms:
+            metrics.agent_response_times[report.agent_id] = report.response_time_ms
+        if hasattr(report, 'products_count'):
+            metrics.agent_product_counts[report.agent_id] = report.products_count
+
+
+class OrchestratorResponseMixin:
+    """Response building for OrchestratorService"""
+
+    def _build_response(
+        self,
+        request: AgentSelectRequest,
+        all_products: List[Dict[str, Any]],
+        agent_reports: List[AgentReport],
+        metrics: PerformanceMetrics,
+        deadline: Optional[OrchestrationDeadline] = None,
+        processed_products: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Normalize, dedupe, sort and truncate agent products and build the orchestration response"""
+        # Step 2: Process products (normalize, dedupe, sort, truncate) unless already merged
+        if processed_products is None:
+            with tracer.span("normalize", products=len(all_products)):
+                processed_products = self.normalizer.process_products(products=all_products, max_results=request.max_results)
+
+        # Step 3: Calculate statistics; pruned agents were never contacted
+        total_time_ms = int((time.time() - metrics.start_time) * 1000)
+        contacted_reports = [r for r in agent_reports if r.status != AgentStatus.PRUNED]
+        successful_agents = [r for r in contacted_reports if r.status == "active"]
+        # Agents cancelled by early exit could not have changed the top-k, so they are not failures
+        failed_agents = [r for r in contacted_reports if r.status not in ("active", AgentStatus.CANCELLED)]
+        total_products_found = sum(r.products_count for r in successful_agents)
+
+        # Update performance metrics
+        metrics.total_agents_contacted = len(contacted_reports)
+        metrics.successful_agents = len(successful_agents)
+        metrics.failed_agents = len(failed_agents)
+        metrics.total_products_found = total_products_found
+        metrics.total_products_after_dedupe = metrics.total_products_after_sort = len(processed_products)
+        _record_agent_metrics(metrics, agent_reports)
+
+        response = {
+            "products": processed_products,
+            "agent_reports": [report.dict() for report in agent_reports],
+            "metadata": {
+                "total_agents_contacted": len(contacted_reports),
+                "successful_agents": len(successful_agents),
+                "failed_agents": len(failed_agents),
+                "total_products_found": total_products_found,
+                "total_products_after_dedupe": len(processed_products),
+                "orchestration_time_ms": total_time_ms,
+                "stale": False,
+                **_report_metadata(agent_reports),
+                "deadline": {
+                    "hard_timeout_ms": int(deadline.hard_timeout_seconds * 1000) if deadline else None,
+                    "soft_deadline_ms": int(deadline.soft_deadline_seconds * 1000)
+                    if deadline and deadline.soft_deadline_seconds is not None else None
+                },
+                "request_id": f"orch_{int(metrics.start_time)}",
+                "timestamp": datetime.now(UTC).isoformat(),
+                "performance": {
+                    "avg_response_time_ms": metrics.avg_response_time_ms,
+                    "median_response_time_ms": metrics.median_response_time_ms,
+                    "success_rate": metrics.success_rate
+                }
+            }
+        }
+
+        logger.info(f"Orchestration completed in {total_time_ms}ms: {len(successful_agents)}/{len(contacted_reports)} agents "
+                   f"successful, {total_products_found} products found, {len(processed_products)} products returned")
+        return response
+
+    def _build_error_response(self, error: Exception, metrics: PerformanceMetrics) -> Dict[str, Any]:
+        """Record a failed orchestration and build an empty response"""
+        total_time_ms = int((time.time() - metrics.start_time) * 1000)
+        logger.error(f"Orchestration failed after {total_time_ms}ms: {error}", exc_info=True)
+        metrics.errors.append(str(error))
+        performance_monitor.end_operation(metrics)
+
+        return {
+            "products": [],
+            "agent_reports": [],
+            "metadata": {
+                "total_agents_contacted": 0,
+                "successful_agents": 0,
+                "failed_agents": 0,
+                "total_products_found": 0,
+                "total_products_after_dedupe": 0,
+                "orchestration_time_ms": int((time.time() - metrics.start_time) * 1000),
+                "request_id": f"orch_{int(metrics.start_time)}",
+                "timestamp": datetime.now(UTC).isoformat(),
+                "error": str(error)
+            }
+        }
+
+    @staticmethod
+    def _with_trace_id(response: Dict[str, Any], span: Span) -> Dict[str, Any]:
+        """Copy of a response whose metadata names this request's trace (cached responses carry an older one)"""
+        return {**response, "metadata": {**response.get("metadata", {}), "trace_id": span.trace_id}}
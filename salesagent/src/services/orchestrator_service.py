@@ -1,214 +1,120 @@
 """
 Orchestrator Service - Main service for coordinating multi-agent product discovery
 """
-import asyncio
 import logging
-import time
+import os
+import threading
+from functools import partial
 from typing import List, Dict, Any, Optional
-from datetime import datetime, UTC
 
-from src.core.schemas.agent import AgentSelectRequest, AgentReport
+from src.core.schemas.agent import AgentSelectRequest
 from src.orchestrator.fanout import fanout_orchestrator
 from src.orchestrator.normalize import product_normalizer
-from src.services.agent_management_service import agent_management_service
-from src.orchestrator.performance import performance_monitor, concurrency_optimizer, cache_manager
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.deadline import OrchestrationDeadline, deadline_policy
+from src.orchestrator.coalescing import request_coalescer
+from src.orchestrator.fingerprint import request_fingerprinter
+from src.orchestrator.admission import AdmissionRejected, admission_controller
+from src.orchestrator.runtime import async_runtime
+from src.orchestrator.buyers import buyer_key
+from src.core.tracing import tracer
+from src.services.orchestrator_cache import OrchestratorCacheMixin
+from src.services.orchestrator_fanout import OrchestratorFanoutMixin
+from src.services.orchestrator_response import OrchestratorResponseMixin
+from src.services.orchestrator_stats import OrchestratorStatsMixin
+from src.services.orchestrator_stream import OrchestratorStreamMixin
 
 logger = logging.getLogger(__name__)
 
 
-class OrchestratorService:
+class OrchestratorService(OrchestratorFanoutMixin, OrchestratorCacheMixin, OrchestratorResponseMixin,
+                          OrchestratorStatsMixin, OrchestratorStreamMixin):
     """Main orchestrator service for multi-agent product discovery"""
-    
+
     def __init__(self):
         self.fanout = fanout_orchestrator
         self.normalizer = product_normalizer
-    
+        self.deadline_policy = deadline_policy
+        self.coalescer = request_coalescer
+        self.fingerprinter = request_fingerprinter
+        self.admission = admission_controller
+        self.runtime = async_runtime
+        # Serve expired-but-recent cache entries while refreshing them in the background
+        self.stale_while_revalidate = os.environ.get("ORCHESTRATOR_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+        self._revalidating = set()
+        self._revalidation_lock = threading.Lock()
+        self.revalidations = 0
+        # How often to check a shared cache for a result another worker is filling
+        self.fill_poll_seconds = 0.05
+
     async def orchestrate(
         self,
         request: AgentSelectRequest,
         include_tenant_ids: Optional[List[str]] = None,
         exclude_tenant_ids: Optional[List[str]] = None,
         include_agent_ids: Optional[List[str]] = None,
-        agent_types: Optional[List[str]] = None
+        agent_types: Optional[List[str]] = None,
+        buyer_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Main orchestration method - fan out to all agents, aggregate, normalize, dedupe, sort
-        
+
+        buyer_id identifies the caller for fair scheduling of agent calls across buyers.
+
         Returns:
-            Dict with products, agent_reports, and metadata
+            Dict with products, agent_reports, and metadata (including the trace_id of
+            this request's trace)
         """
-        # Start performance monitoring
+        with tracer.span("orchestrate", buyer=buyer_key(buyer_id), max_results=request.max_results) as span:
+            response = await self._orchestrate(
+                request, include_tenant_ids, exclude_tenant_ids, include_agent_ids, agent_types, buyer_id
+            )
+            span.set_attribute("products", len(response.get("products", [])))
+            return self._with_trace_id(response, span)
+
+    async def _orchestrate(
+        self,
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]],
+        exclude_tenant_ids: Optional[List[str]],
+        include_agent_ids: Optional[List[str]],
+        agent_types: Optional[List[str]],
+        buyer_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Serve an orchestration from the cache, an identical in-flight fanout or a new fanout"""
+        # Start performance monitoring and the end-to-end deadline clock
         metrics = performance_monitor.start_operation()
-        
+        deadline = OrchestrationDeadline.start(self.deadline_policy, request)
+
         try:
             logger.info(f"Starting orchestration with prompt: '{request.prompt[:100]}...'")
-            
+
             # Check cache for similar requests
-            cache_key = self._generate_cache_key(request, include_tenant_ids, exclude_tenant_ids, 
+            cache_key = self._generate_cache_key(request, include_tenant_ids, exclude_tenant_ids,
                                                include_agent_ids, agent_types)
-            cached_result = cache_manager.get(cache_key)
+            revalidate = partial(self._revalidate, request, include_tenant_ids, exclude_tenant_ids,
+                                 include_agent_ids, agent_types, cache_key)
+            cached_result = await self._get_cached_result(cache_key, metrics, revalidate)
             if cached_result:
-                logger.info("Returning cached result")
-                metrics.total_products_found = len(cached_result.get("products", []))
-                metrics.total_products_after_sort = len(cached_result.get("products", []))
-                performance_monitor.end_operation(metrics)
                 return cached_result
-            
-            # Step 1: Fan out to all agents
-            all_products, agent_reports = await self.fanout.fanout_to_agents(
-                request=request,
-                include_tenant_ids=include_tenant_ids,
-                exclude_tenant_ids=exclude_tenant_ids,
-                include_agent_ids=include_agent_ids,
-                agent_types=agent_types
-            )
-            
-            # Step 2: Process products (normalize, dedupe, sort, truncate)
-            processed_products = self.normalizer.process_products(
-                products=all_products,
-                max_results=request.max_results
-            )
-            
-            # Step 3: Calculate statistics
-            total_time_ms = int((time.time() - metrics.start_time) * 1000)
-            
-            # Count successful vs failed agents
-            successful_agents = [r for r in agent_reports if r.status == "active"]
-            failed_agents = [r for r in agent_reports if r.status != "active"]
-            
-            # Calculate total products found by successful agents
-            total_products_found = sum(r.products_count for r in successful_agents)
-            
-            # Update performance metrics
-            metrics.total_agents_contacted = len(agent_reports)
-            metrics.successful_agents = len(successful_agents)
-            metrics.failed_agents = len(failed_agents)
-            metrics.total_products_found = total_products_found
-            metrics.total_products_after_dedupe = len(processed_products)
-            metrics.total_products_after_sort = len(processed_products)
-            
-            # Extract agent response times from reports
-            for report in agent_reports:
-                if hasattr(report, 'response_time_ms') and report.response_time_ms:
-                    metrics.agent_response_times[report.agent_id] = report.response_time_ms
-                if hasattr(report, 'products_count'):
-                    metrics.agent_product_counts[report.agent_id] = report.products_count
-            
-            # Build response
-            response = {
-                "products": processed_products,
-                "agent_reports": [report.dict() for report in agent_reports],
-                "metadata": {
-                    "total_agents_contacted": len(agent_reports),
-                    "successful_agents": len(successful_agents),
-                    "failed_agents": len(failed_agents),
-                    "total_products_found": total_products_found,
-                    "total_products_after_dedupe": len(processed_products),
-                    "orchestration_time_ms": total_time_ms,
-                    "request_id": f"orch_{int(metrics.start_time)}",
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "performance": {
-                        "avg_response_time_ms": metrics.avg_response_time_ms,
-                        "median_response_time_ms": metrics.median_response_time_ms,
-                        "success_rate": metrics.success_rate
-                    }
-                }
-            }
-            
-            # Cache the result
-            cache_manager.set(cache_key, response)
-            
-            logger.info(f"Orchestration completed in {total_time_ms}ms: "
-                       f"{len(successful_agents)}/{len(agent_reports)} agents successful, "
-                       f"{total_products_found} products found, "
-                       f"{len(processed_products)} products returned")
-            
-            # End performance monitoring
-            performance_monitor.end_operation(metrics)
-            
-            return response
-            
-        except Exception as e:
-            total_time_ms = int((time.time() - metrics.start_time) * 1000)
-            logger.error(f"Orchestration failed after {total_time_ms}ms: {e}", exc_info=True)
-            
-            # Update metrics for error case
+
+            # Identical concurrent requests share a single in-flight fanout
+            async def run_fanout() -> Dict[str, Any]:
+                return await self._fanout_and_build(
+                    request, include_tenant_ids, exclude_tenant_ids, include_agent_ids,
+                    agent_types, cache_key, metrics, deadline, buyer_id
+                )
+
+            response, coalesced = await self.coalescer.run(cache_key, run_fanout)
+            return self._coalesced_response(response, metrics) if coalesced else response
+
+        except AdmissionRejected as e:
+            # Shed load - let the caller answer 503 with Retry-After
             metrics.errors.append(str(e))
             performance_monitor.end_operation(metrics)
-            
-            return {
-                "products": [],
-                "agent_reports": [],
-                "metadata": {
-                    "total_agents_contacted": 0,
-                    "successful_agents": 0,
-                    "failed_agents": 0,
-                    "total_products_found": 0,
-                    "total_products_after_dedupe": 0,
-                    "orchestration_time_ms": int((time.time() - metrics.start_time) * 1000),
-                    "request_id": f"orch_{int(metrics.start_time)}",
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "error": str(e)
-                }
-            }
-    
-    def _generate_cache_key(
-        self,
-        request: AgentSelectRequest,
-        include_tenant_ids: Optional[List[str]] = None,
-        exclude_tenant_ids: Optional[List[str]] = None,
-        include_agent_ids: Optional[List[str]] = None,
-        agent_types: Optional[List[str]] = None
-    ) -> str:
-        """Generate a cache key for the request"""
-        import hashlib
-        import json
-        
-        # Create a unique key based on request parameters
-        key_data = {
-            "prompt": request.prompt,
-            "max_results": request.max_results,
-            "filters": request.filters,
-            "locale": request.locale,
-            "currency": request.currency,
-            "include_tenant_ids": sorted(include_tenant_ids or []),
-            "exclude_tenant_ids": sorted(exclude_tenant_ids or []),
-            "include_agent_ids": sorted(include_agent_ids or []),
-            "agent_types": sorted(agent_types or [])
-        }
-        
-        key_string = json.dumps(key_data, sort_keys=True)
-        return f"orch_cache_{hashlib.md5(key_string.encode()).hexdigest()}"
-    
-    def get_orchestration_statistics(self) -> Dict[str, Any]:
-        """
-        Get statistics about the orchestrator including performance metrics
-        """
-        try:
-            # Get agent statistics
-            agent_stats = agent_management_service.get_agent_statistics()
-            
-            # Get performance metrics
-            performance_summary = performance_monitor.get_performance_summary()
-            concurrency_stats = concurrency_optimizer.get_stats()
-            cache_stats = cache_manager.get_stats()
-            
-            return {
-                "orchestrator_status": "active",
-                "agent_statistics": agent_stats,
-                "performance_metrics": performance_summary,
-                "concurrency_stats": concurrency_stats,
-                "cache_stats": cache_stats,
-                "last_updated": datetime.now(UTC).isoformat()
-            }
-            
+            raise
         except Exception as e:
-            logger.error(f"Error getting orchestration statistics: {e}")
-            return {
-                "orchestrator_status": "error",
-                "error": str(e),
-                "last_updated": datetime.now(UTC).isoformat()
-            }
+            return self._build_error_response(e, metrics)
 
 
 # Global instance
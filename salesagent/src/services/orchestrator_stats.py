@@ -0,0 +1,95 @@
+"""
+Orchestrator Stats - Performance metrics of results served without a fanout, and orchestrator statistics
+"""
+import logging
+from typing import Dict, Any
+from datetime import datetime, UTC
+
+from src.services.agent_management_service import agent_management_service
+from src.orchestrator.performance import concurrency_optimizer, PerformanceMetrics
+from src.orchestrator.cache_manager import cache_manager
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.http_pool import http_client_pool
+from src.orchestrator.circuit_breaker import circuit_breaker
+from src.orchestrator.adaptive_timeout import adaptive_timeout_policy
+from src.orchestrator.agent_cache import agent_response_cache
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestratorStatsMixin:
+    """Metrics and statistics for OrchestratorService"""
+
+    @staticmethod
+    def _shared_response(response: Dict[str, Any], metrics: PerformanceMetrics, source: str) -> Dict[str, Any]:
+        """Record a result another orchestration built - an identical in-flight one or another worker's"""
+        logger.info(f"Returning result of {source}")
+        metrics.total_products_found = response["metadata"].get("total_products_found", 0)
+        metrics.total_products_after_sort = len(response.get("products", []))
+        performance_monitor.end_operation(metrics)
+        return response
+
+    @classmethod
+    def _coalesced_response(cls, response: Dict[str, Any], metrics: PerformanceMetrics) -> Dict[str, Any]:
+        """Record and mark a result taken from an identical in-flight orchestration"""
+        cls._shared_response(response, metrics, "an identical in-flight orchestration")
+        return {**response, "metadata": {**response["metadata"], "coalesced": True}}
+
+    def get_orchestration_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the orchestrator including performance metrics
+        """
+        try:
+            # Get agent statistics
+            agent_stats = agent_management_service.get_agent_statistics()
+
+            # Get performance metrics
+            performance_summary = performance_monitor.get_performance_summary()
+            concurrency_stats = concurrency_optimizer.get_stats()
+            cache_stats = cache_manager.get_stats()
+            http_pool_stats = http_client_pool.get_stats()
+            circuit_breaker_stats = circuit_breaker.get_stats()
+            adaptive_timeout_stats = adaptive_timeout_policy.get_stats()
+            coalescing_stats = self.coalescer.get_stats()
+            agent_cache_stats = agent_response_cache.get_stats()
+            agent_registry_stats = agent_management_service.registry.get_stats()
+            capability_routing_stats = self.fanout.router.get_stats()
+            admission_stats = self.admission.get_stats()
+            scheduler_stats = self.fanout.scheduler.get_stats()
+            early_exit_stats = self.fanout.early_exit.get_stats()
+            runtime_stats = self.runtime.get_stats()
+            revalidation_stats = {
+                "enabled": self.stale_while_revalidate,
+                "in_progress": len(self._revalidating),
+                "revalidations": self.revalidations
+            }
+
+            return {
+                "orchestrator_status": "active",
+                "agent_statistics": agent_stats,
+                "performance_metrics": performance_summary,
+                "concurrency_stats": concurrency_stats,
+                "cache_stats": cache_stats,
+                "http_pool_stats": http_pool_stats,
+                "circuit_breaker_stats": circuit_breaker_stats,
+                "adaptive_timeout_stats": adaptive_timeout_stats,
+                "coalescing_stats": coalescing_stats,
+                "agent_cache_stats": agent_cache_stats,
+                "agent_registry_stats": agent_registry_stats,
+                "capability_routing_stats": capability_routing_stats,
+                "admission_stats": admission_stats,
+                "agent_call_scheduler_stats": scheduler_stats,
+                "early_exit_stats": early_exit_stats,
+                "runtime_stats": runtime_stats,
+                "stale_while_revalidate_stats": revalidation_stats,
+                "last_updated": datetime.now(UTC).isoformat()
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting orchestration statistics: {e}")
+            return {
+                "orchestrator_status": "error",
+                "error": str(e),
+                "last_updated": datetime.now(UTC).isoformat()
+            }
+
@@ -0,0 +1,105 @@
+"""
+Orchestrator Stream - Streaming orchestration, yielding each agent's products as soon as it answers
+"""
+import asyncio
+import logging
+from functools import partial
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport
+from src.orchestrator.performance_monitor import performance_monitor
+from src.orchestrator.deadline import OrchestrationDeadline
+from src.orchestrator.admission import AdmissionRejected
+from src.orchestrator.buyers import buyer_key
+from src.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestratorStreamMixin:
+    """Streaming orchestration for OrchestratorService"""
+
+    async def orchestrate_stream(
+        self,
+        request: AgentSelectRequest,
+        include_tenant_ids: Optional[List[str]] = None,
+        exclude_tenant_ids: Optional[List[str]] = None,
+        include_agent_ids: Optional[List[str]] = None,
+        agent_types: Optional[List[str]] = None,
+        buyer_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming orchestration - yield each agent's normalized products as soon as it answers
+
+        Served through the same cache, shared-cache fill claim and request
+        coalescing as orchestrate(). A stream that joins an identical in-flight
+        orchestration gets only its complete event.
+
+        Yields:
+            {"event": "agent_result", "agent_report": ..., "products": [...]} per agent,
+            then {"event": "complete", ...} with the merged, deduplicated top-k response
+        """
+        metrics = performance_monitor.start_operation()
+        deadline = OrchestrationDeadline.start(self.deadline_policy, request)
+        # Not made current: a generator's context does not carry across its yields
+        span = tracer.start_span("orchestrate_stream", buyer=buyer_key(buyer_id), max_results=request.max_results)
+        run = None
+
+        try:
+            logger.info(f"Starting streaming orchestration with prompt: '{request.prompt[:100]}...'")
+
+            cache_key = self._generate_cache_key(request, include_tenant_ids, exclude_tenant_ids,
+                                               include_agent_ids, agent_types)
+            revalidate = partial(self._revalidate, request, include_tenant_ids, exclude_tenant_ids,
+                                 include_agent_ids, agent_types, cache_key)
+            cached_result = await self._get_cached_result(cache_key, metrics, revalidate)
+            if cached_result:
+                yield {"event": "complete", **self._with_trace_id(cached_result, span)}
+                return
+
+            # Agent results reach the stream through a queue; None marks the end of the run
+            events: asyncio.Queue = asyncio.Queue()
+
+            # Products arrive normalized, the same dicts the fanout merges into the top-k
+            def on_agent_result(products: List[Dict[str, Any]], report: AgentReport) -> None:
+                events.put_nowait({
+                    "event": "agent_result",
+                    "agent_report": report.dict(),
+                    "products": products
+                })
+
+            async def run_fanout() -> Dict[str, Any]:
+                return await self._fanout_and_build(
+                    request, include_tenant_ids, exclude_tenant_ids, include_agent_ids,
+                    agent_types, cache_key, metrics, deadline, buyer_id, on_agent_result
+                )
+
+            with tracer.activate(span):
+                # The task copies the context, so the fanout's spans nest under this stream's span
+                run = asyncio.ensure_future(self.coalescer.run(cache_key, run_fanout))
+            run.add_done_callback(lambda _: events.put_nowait(None))
+
+            while (event := await events.get()) is not None:
+                yield event
+
+            response, coalesced = run.result()
+            if coalesced:
+                response = self._coalesced_response(response, metrics)
+            span.set_attribute("products", len(response.get("products", [])))
+
+            yield {"event": "complete", **self._with_trace_id(response, span)}
+
+        except AdmissionRejected as e:
+            # The event stream has already started, so report the rejection in its final event
+            span.record_error(e)
+            error_response = self._build_error_response(e, metrics)
+            error_response["metadata"]["retry_after_seconds"] = e.retry_after_seconds
+            yield {"event": "complete", **self._with_trace_id(error_response, span)}
+        except Exception as e:
+            span.record_error(e)
+            yield {"event": "complete", **self._with_trace_id(self._build_error_response(e, metrics), span)}
+        finally:
+            # A client that disconnects mid-stream stops the run (identical requests it leads rerun it)
+            if run is not None and not run.done():
+                run.cancel()
+            span.end()
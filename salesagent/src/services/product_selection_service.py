@@ -0,0 +1,139 @@
+"""
+Product Selection Service - Rank a tenant's products for a local agent
+
+Shared by the agent provider HTTP endpoint and the orchestrator's in-process
+local agent path, so both return exactly the same results.
+"""
+import asyncio
+import logging
+import time
+from typing import List, Dict, Any, Optional
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import Product
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.core.tracing import tracer
+from src.services.agent_product_format import to_agent_product
+from src.services.ai_ranking_service import select_products_for_tenant
+from src.services.keyword_ranking import fallback_keyword_ranking
+
+logger = logging.getLogger(__name__)
+
+
+class ProductSelectionService:
+    """Select and rank products on behalf of a local agent"""
+
+    async def select_products(
+        self,
+        agent: AgentConfig,
+        tenant_id: str,
+        request: AgentSelectRequest
+    ) -> Dict[str, Any]:
+        """
+        Rank the tenant's products for the request
+
+        Blocking DB and AI calls run in worker threads so the event loop stays free
+        for the other agents in the fanout.
+
+        Returns:
+            Dict in the agent provider response format
+        """
+        start_time = time.time()
+
+        logger.info(f"Processing product selection request for agent {agent.agent_id} "
+                   f"with prompt: '{request.prompt[:100]}...'")
+
+        # to_thread() copies the context, so statements in the worker nest under these spans
+        with tracer.span("db.load_products", tenant_id=tenant_id) as span:
+            products_list = await asyncio.to_thread(self._load_products, agent, tenant_id)
+            span.set_attribute("products", len(products_list))
+
+        if not products_list:
+            logger.warning(f"No products found for tenant {tenant_id}")
+            return self._build_response(
+                agent.agent_id, tenant_id, [], 0, start_time,
+                "No products available for this tenant"
+            )
+
+        try:
+            with tracer.span("ai.rank_products", products=len(products_list)):
+                ranked_products = await asyncio.to_thread(
+                    self._rank_products_with_ai, request.prompt, products_list, request.max_results
+                )
+            return self._build_response(agent.agent_id, tenant_id, ranked_products, len(products_list), start_time)
+
+        except Exception as ai_error:
+            logger.error(f"AI ranking failed for agent {agent.agent_id}: {ai_error}")
+
+            # Fallback to simple keyword matching
+            fallback_products = fallback_keyword_ranking(request.prompt, products_list, request.max_results)
+
+            return self._build_response(
+                agent.agent_id, tenant_id, fallback_products, len(products_list),
+                start_time, f"AI ranking failed, using fallback: {str(ai_error)}"
+            )
+
+    def _query_products(self, db_session, agent: AgentConfig, tenant_id: str) -> List[Product]:
+        """Products a local agent selects from: its own tenant's catalog"""
+        return db_session.query(Product).filter_by(tenant_id=tenant_id).all()
+    
+    def load_catalog_attributes(self, agent: AgentConfig, tenant_id: str) -> List[Dict[str, Any]]:
+        """Load the formats, countries and CPM of each product the agent selects from"""
+        with get_db_session() as db_session:
+            return [
+                {"formats": product.formats, "countries": product.countries, "price_cpm": product.cpm}
+                for product in self._query_products(db_session, agent, tenant_id)
+            ]
+    
+    def _load_products(self, agent: AgentConfig, tenant_id: str) -> List[Dict[str, Any]]:
+        """Load products from the database in the agent provider format"""
+        with get_db_session() as db_session:
+            return [
+                to_agent_product(product, agent.agent_id, tenant_id)
+                for product in self._query_products(db_session, agent, tenant_id)
+            ]
+
+    def _rank_products_with_ai(
+        self,
+        prompt: str,
+        products: List[Dict[str, Any]],
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """Rank products using the AI ranking service"""
+        ranked_products = select_products_for_tenant(
+            tenant_id=products[0]["publisher_tenant_id"],
+            prompt=prompt,
+            products=products,
+            max_results=max_results
+        )
+
+        # Add source information to each product
+        for product in ranked_products:
+            product["source_agent_id"] = products[0]["source_agent_id"]
+            product["publisher_tenant_id"] = products[0]["publisher_tenant_id"]
+
+        return ranked_products
+
+    def _build_response(
+        self,
+        agent_id: str,
+        tenant_id: str,
+        products: List[Dict[str, Any]],
+        total_found: int,
+        start_time: float,
+        error_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create the standardized agent provider response"""
+        return {
+            "agent_id": agent_id,
+            "tenant_id": tenant_id,
+            "products": products,
+            "total_found": total_found,
+            "execution_time_ms": int((time.time() - start_time) * 1000),
+            "status": "error" if error_message else "active",
+            "error_message": error_message
+        }
+
+
+# Global instance
+product_selection_service = ProductSelectionService()
@@ -7,12 +7,9 @@ import time
 from unittest.mock import Mock, patch
 from datetime import datetime, UTC
 
-from src.orchestrator.performance import (
-    PerformanceMetrics, 
-    PerformanceMonitor, 
-    ConcurrencyOptimizer, 
-    CacheManager
-)
+from src.orchestrator.performance import PerformanceMetrics, ConcurrencyOptimizer
+from src.orchestrator.cache_manager import CacheManager
+from src.orchestrator.performance_monitor import PerformanceMonitor
 
 
 class TestPerformanceMonitoring:
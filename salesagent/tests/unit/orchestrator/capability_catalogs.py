@@ -0,0 +1,28 @@
+"""
+Agent catalogs shared by the capability routing tests
+"""
+from src.core.schemas.agent import AgentConfig
+
+CATALOGS = {
+    "ctv": [{"formats": '[{"format_id": "ctv_30s", "type": "video"}]', "countries": ["US"], "price_cpm": 40.0}],
+    "display": [
+        {"formats": ["display_300x250"], "countries": ["US", "GB"], "price_cpm": 5.0},
+        {"formats": ["display_728x90"], "countries": ["GB"], "price_cpm": 8.0}
+    ],
+    "empty": []
+}
+
+
+def _agent(agent_id: str) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id=f"tenant_{agent_id}", name=agent_id, type="local_ai")
+
+
+AGENTS = [(_agent(agent_id), f"tenant_{agent_id}", agent_id) for agent_id in CATALOGS]
+# Agents whose catalog was loaded, in order
+LOADS = []
+
+
+def load_catalog(agent, tenant_id):
+    """Stand-in for load_catalog_attributes that records each load"""
+    LOADS.append(agent.agent_id)
+    return CATALOGS[agent.agent_id]
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for orchestrator unit tests
+"""
+import pytest
+
+from src.orchestrator.agent_cache import agent_response_cache
+from src.orchestrator.circuit_breaker import circuit_breaker
+from src.orchestrator.early_exit import early_exit_policy
+from src.orchestrator.routing import capability_router
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_response_cache():
+    """Keep cached agent responses from leaking between tests"""
+    agent_response_cache.clear()
+    yield
+    agent_response_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_capability_summaries():
+    """Keep agent capability summaries from leaking between tests"""
+    capability_router.clear()
+    yield
+    capability_router.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_agent_health():
+    """Keep circuit breaker, call outcome and early exit history from leaking between tests"""
+    circuit_breaker.clear()
+    early_exit_policy.clear()
+    yield
+    circuit_breaker.clear()
+    early_exit_policy.clear()
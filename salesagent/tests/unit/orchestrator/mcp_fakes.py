@@ -0,0 +1,70 @@
+"""
+Fake MCP server and client helpers shared by the MCP client tests
+"""
+import asyncio
+import json as jsonlib
+from contextlib import asynccontextmanager
+
+from src.orchestrator.mcp_client import MCPClient
+from src.orchestrator.mcp_transport import MCP_SESSION_HEADER
+
+ENDPOINT = "http://mcp.example.com/mcp"
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200, headers=None, chunk_size=16):
+        self._data = jsonlib.dumps(body).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+
+    async def aiter_bytes(self):
+        for start in range(0, len(self._data), self.chunk_size):
+            yield self._data[start:start + self.chunk_size]
+
+
+class FakeMCPServer:
+    """Answers tools/list and select_products, recording every POST"""
+
+    def __init__(self, batch=True, session_id=None, delays=None):
+        self.batch = batch
+        self.session_id = session_id
+        # Seconds to wait before answering, per JSON-RPC method
+        self.delays = delays or {}
+        self.posts = []
+        self.timeouts = []
+        self.cancelled = 0
+
+    def answer(self, message):
+        if message["method"] == "tools/list":
+            return {"jsonrpc": "2.0", "id": message["id"], "result": {"tools": [{"name": "select_products"}]}}
+        prompt = message["params"]["arguments"]["prompt"]
+        return {"jsonrpc": "2.0", "id": message["id"],
+                "result": {"products": [{"id": f"p_{prompt}", "name": prompt}]}}
+
+    async def post(self, url, json=None, headers=None, timeout=None):
+        self.posts.append((json, dict(headers or {})))
+        self.timeouts.append(timeout)
+        method = (json[0] if isinstance(json, list) else json)["method"]
+        try:
+            await asyncio.sleep(self.delays.get(method, 0))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        response_headers = {MCP_SESSION_HEADER: self.session_id} if self.session_id else {}
+        if isinstance(json, list):
+            if not self.batch:
+                return FakeResponse({"error": "batch not supported"}, status_code=400)
+            return FakeResponse([self.answer(message) for message in json], headers=response_headers)
+        return FakeResponse(self.answer(json), headers=response_headers)
+
+    @asynccontextmanager
+    async def stream(self, method, url, json=None, headers=None, timeout=None):
+        yield await self.post(url, json=json, headers=headers, timeout=timeout)
+
+
+def fake_client(server, **kwargs):
+    """An MCPClient whose HTTP pool is the fake server"""
+    client = MCPClient(**kwargs)
+    client.http_pool = server
+    return client
@@ -0,0 +1,98 @@
+"""
+Unit tests for adaptive per-agent timeouts and hedged requests
+"""
+import asyncio
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig
+from src.orchestrator.adaptive_timeout import AdaptiveTimeoutPolicy, AgentCallPlan, latency_percentile
+from src.orchestrator.fanout import FanoutOrchestrator
+
+pytestmark = pytest.mark.unit
+
+
+def _agent(agent_id: str = "a1", **config) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id="t1", name=agent_id, type="local_ai", config=config)
+
+
+def _policy(samples_ms, **kwargs) -> AdaptiveTimeoutPolicy:
+    policy = AdaptiveTimeoutPolicy(min_samples=5, **kwargs)
+    for sample in samples_ms:
+        policy.record_latency("t1", "a1", sample / 1000)
+    return policy
+
+
+class TestAdaptiveTimeoutPolicy:
+    """Test cases for AdaptiveTimeoutPolicy"""
+
+    def test_percentile(self):
+        """Nearest-rank percentile over unsorted samples"""
+        samples = [float(v) for v in range(100, 0, -1)]
+        assert latency_percentile(samples, 95) == 95.0
+        assert latency_percentile(samples, 99) == 99.0
+        assert latency_percentile([5.0], 50) == 5.0
+
+    def test_unknown_agent_gets_max_timeout(self):
+        """Agents without enough history get the configured upper bound"""
+        plan = _policy([100.0], max_timeout_seconds=8).plan_call(_agent())
+        assert plan.timeout_seconds == 8
+        assert plan.hedge_delay_seconds is None
+
+    def test_timeout_follows_p99_within_bounds(self):
+        """Timeout is p99 * multiplier, clamped to the configured bounds"""
+        assert _policy([300.0] * 10, timeout_multiplier=2).plan_call(_agent()).timeout_seconds == pytest.approx(0.6)
+        assert _policy([20.0] * 10, min_timeout_seconds=1).plan_call(_agent()).timeout_seconds == 1
+        assert _policy([200.0] * 10).plan_call(_agent(), remaining_seconds=0.1).timeout_seconds == 0.1
+
+    def test_hedging_only_for_idempotent_agents(self):
+        """Hedge delay is p95 when enabled and the agent is idempotent"""
+        policy = _policy([100.0] * 19 + [1000.0], hedging_enabled=True, max_timeout_seconds=5)
+        assert policy.plan_call(_agent()).hedge_delay_seconds == pytest.approx(0.1)
+        assert policy.plan_call(_agent(idempotent=False)).hedge_delay_seconds is None
+
+    def test_no_hedge_without_enough_samples_or_delay(self):
+        """A thin history or a near-zero delay never fires an immediate duplicate"""
+        assert _policy([100.0] * 10, hedging_enabled=True).plan_call(_agent()).hedge_delay_seconds is None
+        assert _policy([0.0] * 20, hedging_enabled=True).plan_call(_agent()).hedge_delay_seconds is None
+
+    def test_samples_are_per_tenant(self):
+        policy = _policy([100.0] * 10)
+        assert policy.plan_call(_agent(), tenant_id="t1").timeout_seconds == pytest.approx(0.5)
+        assert policy.plan_call(_agent(), tenant_id="t2").timeout_seconds == policy.max_timeout_seconds
+
+
+class TestHedgedCalls:
+    """Test cases for hedged and timed-out agent calls in the fanout"""
+
+    async def test_hedge_wins_when_primary_is_slow(self, monkeypatch):
+        """A slow first attempt triggers a duplicate request, and the faster answer is used"""
+        delays = [0.5, 0.01]
+
+        async def fake_call(self, agent, tenant_id, request):
+            await asyncio.sleep(delays.pop(0))
+            return [{"product_id": "p1"}], 10
+
+        monkeypatch.setattr(FanoutOrchestrator, "_call_agent_provider", fake_call)
+        plan = AgentCallPlan(timeout_seconds=2, hedge_delay_seconds=0.05)
+
+        products, _ = await FanoutOrchestrator()._call_agent_with_plan(_agent(), "t1", None, plan)
+
+        assert products == [{"product_id": "p1"}]
+        assert plan.hedged and plan.hedge_won
+
+    async def test_adaptive_timeout_raises(self, monkeypatch):
+        """A call slower than its planned timeout fails with a timeout error"""
+        async def slow_call(self, agent, tenant_id, request):
+            await asyncio.sleep(1)
+
+        monkeypatch.setattr(FanoutOrchestrator, "_call_agent_provider", slow_call)
+
+        fanout = FanoutOrchestrator()
+        fanout.timeout_policy = AdaptiveTimeoutPolicy(min_samples=1, min_timeout_seconds=0.01)
+
+        with pytest.raises(Exception, match="Timeout after"):
+            await fanout._call_agent_with_plan(_agent(), "t1", None, AgentCallPlan(timeout_seconds=0.05))
+
+        # The timeout counts at its full value, so the next plan does not shrink below it
+        assert fanout.timeout_policy.plan_call(_agent()).timeout_seconds == pytest.approx(0.05 * 1.5)
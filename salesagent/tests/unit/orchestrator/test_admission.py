@@ -0,0 +1,143 @@
+"""
+Unit tests for admission control and load shedding
+"""
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from src.api.buyer_orchestrator_router import buyer_orchestrator_bp
+from src.orchestrator.admission import AdmissionController, AdmissionRejected
+from src.orchestrator.slot_limiter import SlotLimiter
+
+pytestmark = pytest.mark.unit
+
+
+class TestSlotLimiter:
+    """Test cases for SlotLimiter"""
+
+    async def test_caps_concurrency(self):
+        """No more than limit holders run at once; the rest queue in order"""
+        limiter = SlotLimiter("test", limit=2)
+        running = []
+        peak = 0
+
+        async def work(i):
+            nonlocal peak
+            async with limiter.slot():
+                running.append(i)
+                peak = max(peak, len(running))
+                await asyncio.sleep(0.01)
+                running.remove(i)
+
+        await asyncio.gather(*(work(i) for i in range(6)))
+
+        assert peak == 2
+        stats = limiter.get_stats()
+        assert stats["in_use"] == 0
+        assert stats["queued"] == 4
+        assert stats["peak_queue_depth"] == 4
+
+    async def test_full_queue_rejects_immediately(self):
+        """Requests beyond the queue bound are shed with a Retry-After hint"""
+        limiter = SlotLimiter("test", limit=1, max_waiters=1)
+        await limiter.acquire()
+        queued = asyncio.ensure_future(limiter.acquire(timeout=1.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire(timeout=1.0)
+        assert rejected.value.retry_after_seconds >= 1
+        assert limiter.get_stats()["rejections"] == 1
+
+        limiter.release()
+        await queued
+        assert limiter.in_use == 1
+
+    async def test_queue_wait_is_bounded(self):
+        """A queued request gives up after its wait bound and leaves the queue"""
+        limiter = SlotLimiter("test", limit=1, max_waiters=5)
+        await limiter.acquire()
+
+        with pytest.raises(AdmissionRejected):
+            await limiter.acquire(timeout=0.02)
+
+        stats = limiter.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["queue_depth"] == 0
+        limiter.release()
+        assert limiter.in_use == 0
+
+    def test_slots_shared_across_event_loops(self):
+        """A slot released on one thread's loop wakes a waiter on another thread's loop"""
+        limiter = SlotLimiter("test", limit=1)
+        held = threading.Event()
+        release = threading.Event()
+        acquired = []
+
+        def holder():
+            async def run():
+                await limiter.acquire()
+                held.set()
+                await asyncio.to_thread(release.wait)
+                limiter.release()
+            asyncio.run(run())
+
+        def waiter():
+            async def run():
+                waited = await limiter.acquire(timeout=2.0)
+                acquired.append(waited)
+                limiter.release()
+            asyncio.run(run())
+
+        threads = [threading.Thread(target=holder)]
+        threads[0].start()
+        held.wait(1.0)
+        threads.append(threading.Thread(target=waiter))
+        threads[1].start()
+        release.set()
+        for thread in threads:
+            thread.join(2.0)
+
+        assert len(acquired) == 1
+        assert limiter.in_use == 0
+
+
+class TestAdmissionController:
+    """Test cases for AdmissionController"""
+
+    async def test_fanout_wait_capped_by_remaining_time(self):
+        """A request never queues longer than its own remaining deadline"""
+        controller = AdmissionController(max_concurrent_fanouts=1, max_queue_wait_seconds=10.0)
+
+        async with controller.fanout_slot():
+            with pytest.raises(AdmissionRejected):
+                async with controller.fanout_slot(remaining_seconds=0.02):
+                    pass
+
+        assert controller.get_stats()["fanouts"]["timeouts"] == 1
+
+    async def test_disabled_controller_admits_everything(self):
+        """With admission control off nothing is counted or queued"""
+        controller = AdmissionController(enabled=False, max_concurrent_fanouts=1)
+
+        async with controller.fanout_slot(), controller.fanout_slot():
+            pass
+
+        assert controller.get_stats()["fanouts"]["admitted"] == 0
+
+
+@patch("src.api.buyer_orchestrator_router.orchestrator_service.orchestrate",
+       side_effect=AdmissionRejected("fanout queue full", 3))
+def test_orchestrate_endpoint_answers_503(mock_orchestrate):
+    """A shed orchestration is a fast 503 with Retry-After"""
+    app = Flask(__name__)
+    app.register_blueprint(buyer_orchestrator_bp)
+
+    response = app.test_client().post("/buyer/orchestrate", json={"prompt": "sports video"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert response.get_json()["retry_after_seconds"] == 3
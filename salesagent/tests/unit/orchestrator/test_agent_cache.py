@@ -0,0 +1,107 @@
+"""
+Unit tests for the per-agent response cache
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.agent_cache import AgentResponseCache
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.cache_manager import CacheManager
+
+pytestmark = pytest.mark.unit
+
+
+def _agent(agent_id: str) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id=f"tenant_{agent_id}", name=agent_id, type="local_ai")
+
+
+AGENTS = {agent_id: (_agent(agent_id), f"tenant_{agent_id}", agent_id) for agent_id in ("a", "b", "c")}
+CALLS = []
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    CALLS.append(agent.agent_id)
+    return [{"product_id": f"p_{agent.agent_id}", "name": agent.agent_id}], 20
+
+
+def _discover(include_tenant_ids=None, **kwargs):
+    """Fake discovery honouring the tenant filter"""
+    return [AGENTS[t.replace("tenant_", "")] for t in include_tenant_ids] if include_tenant_ids else list(AGENTS.values())
+
+
+class TestAgentResponseCache:
+    """Test cases for AgentResponseCache"""
+
+    def test_key_covers_request_parameters(self):
+        """Responses are only reused for the same agent and request parameters"""
+        cache = AgentResponseCache(CacheManager())
+        request = AgentSelectRequest(prompt="sports")
+        cache.set("t1", "a", request, [{"product_id": "p1"}])
+
+        assert cache.get("t1", "a", AgentSelectRequest(prompt="sports")) == [{"product_id": "p1"}]
+        assert cache.get("t1", "b", request) is None
+        assert cache.get("t1", "a", AgentSelectRequest(prompt="sports", currency="EUR")) is None
+        assert cache.get("t1", "a", AgentSelectRequest(prompt="sports", max_results=5)) is None
+
+    def test_per_agent_hit_ratio(self):
+        """Hits and misses are tracked per agent"""
+        cache = AgentResponseCache(CacheManager())
+        request = AgentSelectRequest(prompt="news")
+        cache.get("t1", "a", request)
+        cache.set("t1", "a", request, [])
+        cache.get("t1", "a", request)
+        cache.get("t1", "a", request)
+
+        assert cache.get_stats()["agents"]["a"] == {"hits": 2, "misses": 1, "hit_ratio": pytest.approx(2 / 3)}
+
+    def test_cached_products_are_copies(self):
+        """Mutating returned products does not change the cached response"""
+        cache = AgentResponseCache(CacheManager())
+        request = AgentSelectRequest(prompt="news")
+        cache.set("t1", "a", request, [{"product_id": "p1"}])
+        cache.get("t1", "a", request)[0]["product_id"] = "changed"
+
+        assert cache.get("t1", "a", request) == [{"product_id": "p1"}]
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", side_effect=_discover)
+async def test_different_filters_only_call_missing_agents(mock_discover):
+    """A second orchestration with an overlapping filter only calls uncached agents"""
+    CALLS.clear()
+    fanout = FanoutOrchestrator()
+    request = AgentSelectRequest(prompt="sports video")
+
+    await fanout.fanout_to_agents(request, include_tenant_ids=["tenant_a", "tenant_b"])
+    products, reports = await fanout.fanout_to_agents(request, include_tenant_ids=["tenant_b", "tenant_c"])
+
+    assert CALLS == ["a", "b", "c"]
+    assert {p["product_id"] for p in products} == {"p_b", "p_c"}
+    cached = {report.agent_id: report.cached for report in reports}
+    assert cached == {"b": True, "c": False}
+    assert products[0]["publisher_tenant_id"] == "tenant_b"
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", side_effect=_discover)
+async def test_cache_reads_and_writes_run_off_the_event_loop(mock_discover):
+    """A shared (on-disk) agent cache does not block the loop the fanout runs on"""
+    fanout = FanoutOrchestrator()
+    cache_threads = []
+    get, set_ = fanout.agent_cache.get, fanout.agent_cache.set
+
+    def record_thread(method):
+        def wrapper(*args):
+            cache_threads.append(threading.current_thread())
+            return method(*args)
+        return wrapper
+
+    with patch.object(fanout.agent_cache, "get", record_thread(get)), \
+            patch.object(fanout.agent_cache, "set", record_thread(set_)):
+        await fanout.fanout_to_agents(AgentSelectRequest(prompt="off loop"), include_tenant_ids=["tenant_a"])
+
+    assert len(cache_threads) == 2
+    assert threading.current_thread() not in cache_threads
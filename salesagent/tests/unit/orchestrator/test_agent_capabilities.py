@@ -0,0 +1,56 @@
+"""
+Unit tests for agent capability summaries
+"""
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.capabilities import AgentCapabilities
+from tests.unit.orchestrator.capability_catalogs import CATALOGS
+
+pytestmark = pytest.mark.unit
+
+
+class TestAgentCapabilities:
+    """Test cases for capability summaries"""
+
+    def test_summarizes_catalog(self):
+        """Formats, channels, countries and price range are collected from the products"""
+        capabilities = AgentCapabilities.from_products(CATALOGS["display"])
+
+        assert capabilities.formats == {"display_300x250", "display_728x90"}
+        assert capabilities.channels == {"display"}
+        assert capabilities.countries == {"US", "GB"}
+        assert (capabilities.min_cpm, capabilities.max_cpm, capabilities.product_count) == (5.0, 8.0, 2)
+
+    def test_product_without_countries_runs_anywhere(self):
+        """A product with no country list leaves countries unrestricted"""
+        capabilities = AgentCapabilities.from_products([{"formats": ["display_300x250"], "countries": None}])
+
+        assert capabilities.countries is None
+        request = AgentSelectRequest(prompt="news", filters={"countries": ["FR"]})
+        assert capabilities.prune_reason(request) is None
+
+    def test_prune_reasons(self):
+        """Agents are pruned only when a known capability excludes the request"""
+        ctv = AgentCapabilities.from_products(CATALOGS["ctv"])
+
+        assert ctv.prune_reason(AgentSelectRequest(prompt="x", filters={"channels": ["display"]})) is not None
+        assert ctv.prune_reason(AgentSelectRequest(prompt="x", filters={"countries": ["gb"]})) is not None
+        assert ctv.prune_reason(AgentSelectRequest(prompt="x", filters={"max_cpm": 20})) is not None
+        assert ctv.prune_reason(AgentSelectRequest(prompt="x", filters={"channels": ["video", "display"]})) is None
+        assert ctv.prune_reason(AgentSelectRequest(prompt="x", filters={"formats": ["ctv_30s"], "min_cpm": 30})) is None
+
+    def test_unknown_capabilities_never_prune(self):
+        """Remote agents that declare nothing are always called"""
+        capabilities = AgentCapabilities.from_config({})
+        request = AgentSelectRequest(prompt="x", filters={"channels": ["audio"], "countries": ["JP"], "max_cpm": 1})
+
+        assert capabilities.prune_reason(request) is None
+
+    def test_reported_numbers_are_coerced(self):
+        """Numbers reported as strings are used; values that are not numbers count as unknown"""
+        capabilities = AgentCapabilities.from_config({"min_cpm": "5.0", "max_cpm": "a lot", "product_count": "12"})
+
+        assert (capabilities.min_cpm, capabilities.max_cpm, capabilities.product_count) == (5.0, None, 12)
+        assert capabilities.prune_reason(AgentSelectRequest(prompt="x", filters={"max_cpm": "4"})) is not None
+        assert capabilities.prune_reason(AgentSelectRequest(prompt="x", filters={"max_cpm": "cheap"})) is None
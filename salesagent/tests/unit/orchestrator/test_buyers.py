@@ -0,0 +1,83 @@
+"""
+Unit tests for buyer identity in fair scheduling
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from flask import Flask
+
+from src.api.buyer_orchestrator_router import buyer_orchestrator_bp
+from src.orchestrator.buyers import buyer_key, parse_buyer_weights, sign_buyer_id
+from src.orchestrator.scheduler import AgentCallScheduler
+
+pytestmark = pytest.mark.unit
+
+SECRET = "shared-with-gold"
+
+
+def _buyer_id_over_http(headers):
+    """The buyer id the orchestrate endpoint schedules a request under"""
+    app = Flask(__name__)
+    app.register_blueprint(buyer_orchestrator_bp)
+    with patch("src.api.buyer_orchestrator_router.orchestrator_service.orchestrate",
+               new_callable=AsyncMock, return_value={"products": []}) as mock_orchestrate:
+        app.test_client().post("/buyer/orchestrate", json={"prompt": "sports"}, headers=headers)
+    return mock_orchestrate.call_args.kwargs["buyer_id"]
+
+
+@patch("src.orchestrator.buyers._BUYER_ID_SECRET", SECRET)
+def test_buyer_header_cannot_claim_a_weight():
+    """An unsigned (or wrongly signed) X-Buyer-Id only ever yields a one-way key"""
+    unsigned = _buyer_id_over_http({"X-Buyer-Id": "gold"})
+    forged = _buyer_id_over_http({"X-Buyer-Id": "gold", "X-Buyer-Signature": sign_buyer_id("gold", "guess")})
+
+    assert unsigned == forged == buyer_key("gold", "buyer")
+    assert unsigned not in parse_buyer_weights("gold:2")
+
+
+def test_signature_is_ignored_without_a_secret():
+    signed = _buyer_id_over_http({"X-Buyer-Id": "gold", "X-Buyer-Signature": sign_buyer_id("gold", "")})
+
+    assert signed == buyer_key("gold", "buyer")
+
+
+async def _hold(scheduler, order, buyer_id, agent_id, gate):
+    async with scheduler.slot(buyer_id, f"tenant_{agent_id}", agent_id):
+        order.append(buyer_id)
+        await gate.wait()
+
+
+@patch("src.orchestrator.buyers._BUYER_ID_SECRET", SECRET)
+async def test_signed_buyer_gets_its_weighted_share():
+    """A weighted buyer arriving over HTTP with a signed id is scheduled under its configured weight"""
+    gold = _buyer_id_over_http({"X-Buyer-Id": "gold", "X-Buyer-Signature": sign_buyer_id("gold", SECRET)})
+    basic = _buyer_id_over_http({"X-Buyer-Id": "basic"})
+    assert gold == "gold"
+
+    scheduler = AgentCallScheduler(max_inflight_calls=1, buyer_weights=parse_buyer_weights("gold:2"))
+    release, gate, order = asyncio.Event(), asyncio.Event(), []
+    blocker = asyncio.ensure_future(_hold(scheduler, [], "warmup", "a", release))
+    await asyncio.sleep(0)
+    gate.set()
+    tasks = [asyncio.ensure_future(_hold(scheduler, order, buyer_id, f"{buyer_id}{i}", gate))
+             for i in range(6) for buyer_id in (gold, basic)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order[:6].count("gold") == 4
+    assert scheduler.get_stats()["buyer_calls"] == {"gold": 6, "other": 7}
+
+
+def test_buyer_key_is_one_way_and_stable():
+    key = buyer_key("session-token-0", "session")
+
+    assert key.startswith("session_") and "session-token" not in key
+    assert buyer_key("session-token-0", "session") == key
+    assert buyer_key(None) is None
+
+
+def test_parse_buyer_weights():
+    assert parse_buyer_weights("gold:2, basic:0.5,bad:x") == {"gold": 2.0, "basic": 0.5}
+    assert parse_buyer_weights(None) == {}
@@ -0,0 +1,155 @@
+"""
+Unit tests for CacheManager storage backends
+"""
+import os
+import pickle
+import sqlite3
+import stat
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.orchestrator.cache_backends import CacheBackend, create_cache_backend, default_cache_path
+from src.orchestrator.memory_cache_backend import MemoryCacheBackend
+from src.orchestrator.sqlite_cache_backend import SQLiteCacheBackend
+from src.orchestrator.cache_manager import CacheManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def _sqlite_cache(db_path, **kwargs):
+    return CacheManager(backend=SQLiteCacheBackend(db_path, max_size=kwargs.pop("max_size", 100)), **kwargs)
+
+
+class TestSQLiteCacheBackend:
+    """Test cases for the shared SQLite backend"""
+
+    def test_values_are_shared_between_workers(self, db_path):
+        """A value stored by one worker's cache is visible to another's"""
+        worker_a = _sqlite_cache(db_path)
+        worker_b = _sqlite_cache(db_path)
+        worker_a.set("key", {"products": [{"product_id": "p1"}], "metadata": {"total": 1}})
+
+        assert worker_b.get("key") == {"products": [{"product_id": "p1"}], "metadata": {"total": 1}}
+        assert worker_b.shared is True
+
+    def test_lru_eviction(self, db_path):
+        """The least recently used row is evicted at capacity"""
+        cache = _sqlite_cache(db_path, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_add_is_set_if_absent(self, db_path):
+        """add only stores when no unexpired value exists"""
+        cache = _sqlite_cache(db_path)
+
+        assert cache.add("key", "first") is True
+        assert cache.add("key", "second") is False
+        assert cache.get("key") == "first"
+
+    def test_add_replaces_expired_value(self, db_path):
+        """An expired value counts as absent"""
+        cache = _sqlite_cache(db_path)
+        cache.set("key", "old", ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.add("key", "new") is True
+        assert cache.get("key") == "new"
+
+    def test_concurrent_add_has_one_winner(self, db_path):
+        """Concurrent workers racing to fill a key only fill it once"""
+        workers = [_sqlite_cache(db_path) for _ in range(8)]
+        results = []
+        barrier = threading.Barrier(len(workers))
+
+        def race(cache, worker_id):
+            barrier.wait()
+            results.append(cache.add("key", worker_id))
+
+        threads = [threading.Thread(target=race, args=(cache, i)) for i, cache in enumerate(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 1
+
+    def test_file_is_private_and_never_unpickled(self, tmp_path):
+        """The cache file is 0600 and a planted pickle is discarded, not executed"""
+        db_path = str(tmp_path / "cache" / "orchestrator.db")
+        cache = _sqlite_cache(db_path)
+        assert stat.S_IMODE(os.stat(db_path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(os.path.dirname(db_path)).st_mode) == 0o700
+        assert not default_cache_path().startswith("/tmp")
+
+        class Exploit:
+            def __reduce__(self):
+                return (os.system, ("false",))
+
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("INSERT INTO cache_entries VALUES (?, ?, 0, 0, 0, ?)",
+                         ("planted", pickle.dumps(Exploit()), time.time() + 60))
+        with patch("os.system") as system:
+            assert cache.get("planted") is None
+        system.assert_not_called()
+
+    def test_totals_follow_replacements_and_deletes(self, db_path):
+        cache = CacheManager(backend=SQLiteCacheBackend(db_path, max_size=100, max_bytes=10_000), max_bytes=10_000)
+        cache.set("a", "x" * 100)
+        cache.set("a", "x" * 50)
+        cache.set("b", "y" * 10)
+        cache.delete("b")
+
+        stats = cache.backend.get_stats()
+        assert stats["size"] == 1
+        assert stats["size_bytes"] == cache.backend.get("a").size_bytes
+
+    def test_compare_and_delete_only_removes_a_matching_value(self, db_path):
+        """compare_and_delete leaves a key holding another value in place"""
+        cache = _sqlite_cache(db_path)
+        cache.set("claim", "worker-b")
+
+        assert cache.compare_and_delete("claim", "worker-a") is False
+        assert cache.get("claim") == "worker-b"
+        assert cache.compare_and_delete("claim", "worker-b") is True
+        assert cache.get("claim") is None
+        assert cache.backend.get_stats()["size"] == 0
+
+
+def test_memory_compare_and_delete_only_removes_a_matching_value():
+    """The memory backend's compare_and_delete keeps its byte total in step"""
+    cache = CacheManager()
+    cache.set("claim", "worker-b")
+
+    assert cache.compare_and_delete("claim", "worker-a") is False
+    assert cache.compare_and_delete("missing", "worker-b") is False
+    assert cache.compare_and_delete("claim", "worker-b") is True
+    assert cache.get("claim") is None
+    assert cache.backend.size_bytes == 0
+
+
+def test_memory_backend_is_the_default():
+    """CacheManager and the backend factory default to per-process memory"""
+    assert isinstance(CacheManager().backend, MemoryCacheBackend)
+    assert isinstance(create_cache_backend("memory", max_size=10), MemoryCacheBackend)
+    assert CacheManager().shared is False
+
+
+def test_backend_interface_is_abstract():
+    """A backend must implement the whole storage interface"""
+    with pytest.raises(TypeError):
+        CacheBackend()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the orchestrator CacheManager
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.orchestrator.cache_backends import estimate_size_bytes
+from src.orchestrator.cache_entry_policy import default_hard_ttl_seconds
+from src.orchestrator.cache_manager import CacheManager
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Controllable replacement for time.time"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("src.orchestrator.cache_manager.time.time", fake):
+        yield fake
+
+
+class TestCacheManager:
+    """Test cases for CacheManager"""
+
+    def test_lru_eviction(self, clock):
+        """The least recently used entry is evicted at capacity"""
+        cache = CacheManager(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self, clock):
+        """Entries are evicted to stay within the byte budget"""
+        value = {"products": ["x" * 40]}
+        size = estimate_size_bytes(value)
+        cache = CacheManager(max_size=100, max_bytes=size * 2)
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.set("c", value)
+
+        stats = cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["size_bytes"] == size * 2
+        assert cache.get("a") is None
+
+    def test_oversized_value_is_not_cached(self, clock):
+        """A single value larger than the byte budget is rejected"""
+        cache = CacheManager(max_bytes=10)
+        cache.set("big", "x" * 100)
+
+        assert cache.get("big") is None
+        assert cache.get_stats()["rejected"] == 1
+
+    def test_absolute_ttl_expires_hot_entries(self, clock):
+        """Entries expire ttl_seconds after being stored, even if read often"""
+        cache = CacheManager(ttl_seconds=10)
+        cache.set("a", 1)
+        for _ in range(3):
+            clock.now += 4
+            cache.get("a")
+        assert cache.get("a") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_sliding_ttl_expires_idle_entries(self, clock):
+        """Entries not read within idle_ttl_seconds expire before the absolute TTL"""
+        cache = CacheManager(ttl_seconds=100, idle_ttl_seconds=5)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        clock.now += 4
+        assert cache.get("a") == 1
+        clock.now += 4
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_hit_rate(self, clock):
+        """Hits and misses are counted"""
+        cache = CacheManager()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_overwrite_and_clear_track_bytes(self, clock):
+        """Replacing and clearing entries keeps the byte count accurate"""
+        cache = CacheManager(max_bytes=1000)
+        cache.set("a", "x" * 10)
+        cache.set("a", "x" * 20)
+        assert cache.get_stats()["size_bytes"] == estimate_size_bytes("x" * 20)
+
+        cache.clear()
+        assert cache.get_stats()["size_bytes"] == 0
+        assert cache.get("a") is None
+
+    def test_stale_lookup_until_hard_ttl(self, clock):
+        """Expired entries can be read as stale until the hard TTL"""
+        cache = CacheManager(ttl_seconds=10, hard_ttl_seconds=60)
+        cache.set("a", 1)
+        clock.now += 30
+
+        assert cache.get("a") is None
+        assert cache.lookup("a", allow_stale=True) == (1, True)
+        clock.now += 31
+        assert cache.lookup("a", allow_stale=True) == (None, False)
+        assert cache.get_stats()["stale_hits"] == 1
+
+    def test_expired_entry_is_evicted_without_hard_ttl(self, clock):
+        """Without a hard TTL an expired entry is removed on lookup instead of kept"""
+        cache = CacheManager(ttl_seconds=10)
+        cache.set("a", 1)
+        clock.now += 11
+
+        assert cache.lookup("a", allow_stale=True) == (None, False)
+        assert cache.get_stats()["size"] == 0
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_hard_ttl_defaults_to_ttl_without_stale_while_revalidate(self, monkeypatch):
+        """Expired results are only kept past their TTL when they can be served stale"""
+        monkeypatch.delenv("ORCHESTRATOR_CACHE_HARD_TTL_SECONDS", raising=False)
+        monkeypatch.setenv("ORCHESTRATOR_STALE_WHILE_REVALIDATE", "false")
+        assert default_hard_ttl_seconds() is None
+
+        monkeypatch.setenv("ORCHESTRATOR_STALE_WHILE_REVALIDATE", "true")
+        assert default_hard_ttl_seconds() == 900.0
+
+        monkeypatch.setenv("ORCHESTRATOR_CACHE_HARD_TTL_SECONDS", "120")
+        assert default_hard_ttl_seconds() == 120.0
@@ -0,0 +1,117 @@
+"""
+Unit tests for refreshing agent capability summaries, locally and from remote agents
+"""
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.capabilities import AgentCapabilities
+from src.orchestrator.routing import CapabilityRouter
+from tests.unit.orchestrator.capability_catalogs import AGENTS, LOADS, load_catalog
+
+pytestmark = pytest.mark.unit
+
+
+async def _settle(router):
+    """Wait for the router's background refreshes"""
+    await asyncio.gather(*router._tasks)
+
+
+@patch("src.orchestrator.capability_fetch.product_selection_service.load_catalog_attributes", side_effect=load_catalog)
+async def test_summaries_refresh_in_the_background(mock_load):
+    """Routing serves the last snapshot; catalogs are summarized once per refresh interval, not per request"""
+    LOADS.clear()
+    router = CapabilityRouter(refresh_seconds=300)
+    request = AgentSelectRequest(prompt="x", filters={"channels": ["display"]})
+
+    # Nothing is known yet, so nothing is pruned while the first refresh runs
+    kept, pruned = await router.route(AGENTS, request)
+    assert len(kept) == 3 and pruned == []
+    await _settle(router)
+
+    kept, pruned = await router.route(AGENTS, request)
+    assert [agent.agent_id for agent, _, _ in kept] == ["display"]
+    assert sorted(LOADS) == ["ctv", "display", "empty"]
+
+    router.refresh_seconds = 0
+    await router.route(AGENTS, request)
+    await _settle(router)
+    assert len(LOADS) == 6
+
+
+async def test_slow_refresh_does_not_delay_routing():
+    router = CapabilityRouter()
+    started = asyncio.Event()
+
+    async def slow_load(agent, tenant_id):
+        started.set()
+        await asyncio.sleep(1.0)
+        return AgentCapabilities(product_count=0)
+
+    router._load_capabilities = slow_load
+    request = AgentSelectRequest(prompt="x", filters={"channels": ["display"]})
+
+    kept, _ = await asyncio.wait_for(router.route(AGENTS, request), 0.1)
+    await asyncio.wait_for(router.route(AGENTS, request), 0.1)
+
+    assert len(kept) == 3
+    await started.wait()
+    # Both routes share one refresh per agent
+    assert router.get_stats()["refreshing"] == 3
+    for task in router._tasks:
+        task.cancel()
+
+
+class FakeCapabilityPool:
+    """Serves GET /capabilities for external agents"""
+
+    def __init__(self, body, status_code=200):
+        self.data = json.dumps(body).encode()
+        self.status_code = status_code
+        self.urls = []
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.urls.append((method, url))
+        response = type("Response", (), {})()
+        response.status_code = self.status_code
+        response.aiter_bytes = lambda: _chunks(self.data)
+        yield response
+
+
+async def _chunks(data):
+    yield data
+
+
+def _external(**config) -> AgentConfig:
+    return AgentConfig(agent_id="ext", tenant_id="tenant_ext", name="ext", type="external",
+                       endpoint_url="http://agent.example.com", config=config)
+
+
+async def test_remote_agent_reports_its_capabilities():
+    """External agents are asked for their summary; it overrides what their config declares"""
+    router = CapabilityRouter()
+    router.http_pool = FakeCapabilityPool({"channels": ["video"], "countries": ["US"], "product_count": 12})
+    agent = _external(capabilities={"channels": ["display"], "max_cpm": 9})
+
+    await router.refresh([(agent, "tenant_ext")])
+
+    capabilities = router.capabilities[("tenant_ext", "ext")]
+    assert router.http_pool.urls == [("GET", "http://agent.example.com/capabilities")]
+    assert capabilities.channels == {"video"}
+    assert capabilities.countries == {"US"}
+    assert (capabilities.max_cpm, capabilities.product_count) == (9, 12)
+
+
+async def test_remote_fetch_failure_falls_back_to_config():
+    router = CapabilityRouter()
+    router.http_pool = FakeCapabilityPool("unavailable", status_code=503)
+
+    await router.refresh([(_external(capabilities={"channels": ["display"]}), "tenant_ext")])
+
+    assert router.capabilities[("tenant_ext", "ext")].channels == {"display"}
+    assert router.get_stats()["remote_fetch_failures"] == 1
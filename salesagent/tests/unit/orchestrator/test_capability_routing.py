@@ -0,0 +1,65 @@
+"""
+Unit tests for capability-based agent routing
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest, AgentStatus
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.capabilities import AgentCapabilities
+from src.orchestrator.routing import CapabilityRouter
+from tests.unit.orchestrator.capability_catalogs import AGENTS, CATALOGS, LOADS, load_catalog
+
+pytestmark = pytest.mark.unit
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    return [{"product_id": f"p_{agent.agent_id}", "name": agent.agent_id}], 20
+
+
+async def test_agent_whose_check_fails_is_called():
+    """One agent with a summary that cannot be compared does not empty the search"""
+    router = CapabilityRouter()
+    router.capabilities[("tenant_ctv", "ctv")] = AgentCapabilities(min_cpm="40", refreshed_at=float("inf"))
+    router.capabilities[("tenant_display", "display")] = AgentCapabilities.from_products(CATALOGS["display"])
+    router.capabilities[("tenant_empty", "empty")] = AgentCapabilities.from_products(CATALOGS["empty"])
+
+    kept, pruned = await router.route(AGENTS, AgentSelectRequest(prompt="x", filters={"max_cpm": 20}))
+
+    assert [agent.agent_id for agent, _, _ in kept] == ["ctv", "display"]
+    assert [entry[0].agent_id for entry, _ in pruned] == ["empty"]
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.capability_fetch.product_selection_service.load_catalog_attributes", side_effect=load_catalog)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+async def test_fanout_skips_pruned_agents(mock_discover, mock_load):
+    """Agents that cannot match are reported as pruned instead of being called"""
+    fanout = FanoutOrchestrator()
+    fanout.router = CapabilityRouter()
+    await fanout.router.refresh([(agent, tenant_id) for agent, tenant_id, _ in AGENTS])
+    request = AgentSelectRequest(prompt="banner ads", filters={"channels": ["display"], "countries": ["GB"]})
+
+    products, reports = await fanout.fanout_to_agents(request)
+
+    assert [p["product_id"] for p in products] == ["p_display"]
+    statuses = {report.agent_id: report.status for report in reports}
+    assert statuses == {"ctv": AgentStatus.PRUNED, "empty": AgentStatus.PRUNED, "display": AgentStatus.ACTIVE}
+    assert fanout.router.get_stats()["pruned_calls"] == 2
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.capability_fetch.product_selection_service.load_catalog_attributes", side_effect=load_catalog)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+async def test_requests_without_filters_call_every_agent(mock_discover, mock_load):
+    """Without filters there is nothing to route on, so no catalog is loaded"""
+    LOADS.clear()
+    fanout = FanoutOrchestrator()
+    fanout.router = CapabilityRouter()
+
+    products, reports = await fanout.fanout_to_agents(AgentSelectRequest(prompt="anything"))
+
+    assert len(reports) == 3
+    assert all(report.status == AgentStatus.ACTIVE for report in reports)
+    assert LOADS == []
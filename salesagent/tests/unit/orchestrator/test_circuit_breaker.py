@@ -0,0 +1,86 @@
+"""
+Unit tests for the per-agent circuit breaker
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentStatus
+from src.orchestrator.circuit_breaker import AgentCircuitBreaker, CircuitState
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.performance_monitor import PerformanceMonitor
+
+pytestmark = pytest.mark.unit
+
+
+def _breaker(**kwargs) -> AgentCircuitBreaker:
+    options = {"min_calls": 3, "window": 4, "failure_rate_threshold": 0.5, "open_seconds": 30}
+    options.update(kwargs)
+    return AgentCircuitBreaker(PerformanceMonitor(), **options)
+
+
+class TestAgentCircuitBreaker:
+    """Test cases for AgentCircuitBreaker state transitions"""
+
+    def test_opens_after_failure_rate_exceeded(self):
+        """Circuit opens once enough recent calls failed"""
+        breaker = _breaker()
+        breaker.record_result("t1", "a1", True)
+        breaker.record_result("t1", "a1", False)
+        assert breaker.get_state("t1", "a1") == CircuitState.CLOSED
+
+        breaker.record_result("t1", "a1", False)
+
+        assert breaker.get_state("t1", "a1") == CircuitState.OPEN
+        assert not breaker.allow_request("t1", "a1")
+        assert breaker.allow_request("t2", "a1")  # keyed per tenant
+        assert breaker.get_stats()["open_circuits"] == 1
+
+    def test_half_open_probe_closes_on_success(self):
+        """After the cool-down a single probe is allowed and success closes the circuit"""
+        breaker = _breaker(open_seconds=0)
+        for _ in range(3):
+            breaker.record_result("t1", "a1", False)
+
+        assert breaker.allow_request("t1", "a1")
+        assert breaker.get_state("t1", "a1") == CircuitState.HALF_OPEN
+
+        breaker.record_result("t1", "a1", True)
+
+        assert breaker.get_state("t1", "a1") == CircuitState.CLOSED
+        assert breaker.monitor.get_recent_outcomes("t1", "a1", 10) == []
+
+    def test_half_open_probe_failure_reopens(self):
+        """A failed probe opens the circuit again"""
+        breaker = _breaker(open_seconds=0)
+        for _ in range(3):
+            breaker.record_result("t1", "a1", False)
+        breaker.allow_request("t1", "a1")
+
+        breaker.record_result("t1", "a1", False)
+
+        assert breaker.get_state("t1", "a1") == CircuitState.OPEN
+        assert breaker.circuits[("t1", "a1")].times_opened == 2
+
+
+async def _failing_call(self, agent, tenant_id, request):
+    raise Exception("connection refused")
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _failing_call)
+@patch(
+    "src.orchestrator.fanout.agent_management_service.discover_active_agents",
+    return_value=[(AgentConfig(agent_id="a1", tenant_id="t1", name="a1", type="local_ai"), "t1", "Tenant 1")]
+)
+async def test_fanout_skips_open_agents(mock_discover):
+    """Once the circuit opens the agent is reported as circuit_open instead of being called"""
+    fanout = FanoutOrchestrator()
+    fanout.circuit_breaker = _breaker()
+    request = AgentSelectRequest(prompt="x")
+
+    statuses = []
+    for _ in range(4):
+        _, reports = await fanout.fanout_to_agents(request)
+        statuses.append(reports[0].status)
+
+    assert statuses == [AgentStatus.ERROR] * 3 + [AgentStatus.CIRCUIT_OPEN]
@@ -0,0 +1,100 @@
+"""
+Unit tests for single-flight request coalescing
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.coalescing import RequestCoalescer
+from src.orchestrator.cache_manager import cache_manager
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+class TestRequestCoalescer:
+    """Test cases for RequestCoalescer"""
+
+    async def test_concurrent_callers_share_one_run(self):
+        """Concurrent callers with the same key run the work once"""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(coalescer.run("key", work) for _ in range(5)))
+
+        assert calls == 1
+        assert [result for result, _ in results] == [{"value": 42}] * 5
+        assert [coalesced for _, coalesced in results].count(True) == 4
+        stats = coalescer.get_stats()
+        assert stats["leader_requests"] == 1
+        assert stats["coalesced_requests"] == 4
+        assert stats["in_flight"] == 0
+
+    async def test_different_keys_do_not_coalesce(self):
+        """Callers with different keys each run their own work"""
+        coalescer = RequestCoalescer()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(coalescer.run("a", work), coalescer.run("b", work))
+
+        assert results == [("done", False), ("done", False)]
+
+    def test_coalesces_across_event_loops(self):
+        """Requests served by different threads share the in-flight run"""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            return "shared"
+
+        async def leader_then_follower():
+            leader = asyncio.create_task(coalescer.run("key", work))
+            await asyncio.sleep(0.01)
+            follower = await asyncio.to_thread(asyncio.run, coalescer.run("key", work))
+            return await leader, follower
+
+        leader_result, follower_result = asyncio.run(leader_then_follower())
+
+        assert calls == 1
+        assert leader_result == ("shared", False)
+        assert follower_result == ("shared", True)
+
+
+async def test_orchestrate_coalesces_identical_requests():
+    """Identical concurrent orchestrations trigger a single fanout"""
+    service = OrchestratorService()
+    service.coalescer = RequestCoalescer()
+    fanout_calls = 0
+
+    async def fake_fanout(**kwargs):
+        nonlocal fanout_calls
+        fanout_calls += 1
+        await asyncio.sleep(0.05)
+        report = AgentReport(agent_id="a1", agent_name="Agent 1", tenant_id="t1",
+                             status=AgentStatus.ACTIVE, products_count=1, response_time_ms=50)
+        return [{"product_id": "p1", "name": "Product", "publisher_tenant_id": "t1", "score": 0.9}], [report]
+
+    cache_manager.clear()
+    request = AgentSelectRequest(prompt="coalesce me")
+    with patch.object(service.fanout, "fanout_to_agents", side_effect=fake_fanout):
+        responses = await asyncio.gather(*(service.orchestrate(request) for _ in range(3)))
+    cache_manager.clear()
+
+    assert fanout_calls == 1
+    assert all(len(response["products"]) == 1 for response in responses)
+    assert [response["metadata"].get("coalesced", False) for response in responses].count(True) == 2
+    assert service.get_orchestration_statistics()["coalescing_stats"]["coalesced_requests"] == 2
@@ -0,0 +1,78 @@
+"""
+Unit tests for request coalescing when the shared run fails or a caller is cancelled
+"""
+import asyncio
+
+import pytest
+
+from src.orchestrator.coalescing import RequestCoalescer
+
+pytestmark = pytest.mark.unit
+
+
+class TestCoalescerFailures:
+    """Test cases for RequestCoalescer failure and cancellation handling"""
+
+    async def test_leader_exception_propagates_to_followers(self):
+        """Followers see the leader's failure and the key is released"""
+        coalescer = RequestCoalescer()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("agents unavailable")
+
+        results = await asyncio.gather(coalescer.run("key", failing), coalescer.run("key", failing),
+                                       return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert coalescer.get_stats()["in_flight"] == 0
+
+    async def test_cancelled_follower_does_not_cancel_leader(self):
+        """A follower giving up leaves the shared run and the other callers untouched"""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(coalescer.run("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(coalescer.run("key", work))
+        other = asyncio.create_task(coalescer.run("key", work))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+
+        assert await leader == ("done", False)
+        assert await other == ("done", True)
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        assert calls == 1
+        assert coalescer.get_stats()["coalesced_requests"] == 2
+        assert coalescer.get_stats()["in_flight"] == 0
+
+    async def test_cancelled_leader_is_rerun_by_a_follower(self):
+        """When the leader is cancelled one follower takes over instead of failing"""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(coalescer.run("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(coalescer.run("key", work)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert calls == 2
+        assert sorted(coalesced for _, coalesced in results) == [False, True]
+        assert coalescer.get_stats()["in_flight"] == 0
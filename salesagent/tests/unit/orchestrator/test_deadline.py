@@ -0,0 +1,86 @@
+"""
+Unit tests for orchestration deadlines and straggler cancellation
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentStatus
+from src.orchestrator.deadline import DeadlinePolicy, OrchestrationDeadline
+from src.orchestrator.fanout import FanoutOrchestrator
+
+pytestmark = pytest.mark.unit
+
+DELAYS = {"fast": 0.01, "medium": 0.05, "hung": 5.0}
+AGENTS = [
+    (AgentConfig(agent_id=agent_id, tenant_id="t1", name=agent_id, type="local_ai"), "t1", "Tenant 1")
+    for agent_id in DELAYS
+]
+CANCELLED = []
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    try:
+        await asyncio.sleep(DELAYS[agent.agent_id])
+    except asyncio.CancelledError:
+        CANCELLED.append(agent.agent_id)
+        raise
+    return [{"product_id": f"p_{agent.agent_id}", "name": agent.agent_id}], 1
+
+
+class TestOrchestrationDeadline:
+    """Test cases for OrchestrationDeadline"""
+
+    def test_defaults_come_from_request(self):
+        """Without a policy override the request timeout and max_results are used"""
+        deadline = OrchestrationDeadline.start(DeadlinePolicy(), AgentSelectRequest(prompt="x", max_results=7))
+
+        assert deadline.hard_timeout_seconds == 10.0
+        assert deadline.soft_deadline_min_products == 7
+        assert not deadline.soft_deadline_reached(100)
+
+    def test_next_wait_stops_at_soft_deadline(self):
+        """The wait is capped at the soft deadline until it passes"""
+        deadline = OrchestrationDeadline(hard_timeout_seconds=5.0, soft_deadline_seconds=1.0)
+
+        assert deadline.next_wait_seconds() <= 1.0
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+class TestFanoutDeadline:
+    """Test cases for deadline enforcement in the fanout"""
+
+    async def test_hard_deadline_cancels_stragglers(self, mock_discover):
+        """Agents still running at the hard deadline are cancelled and reported as timeouts"""
+        CANCELLED.clear()
+        deadline = OrchestrationDeadline(hard_timeout_seconds=0.2)
+
+        products, reports = await FanoutOrchestrator().fanout_to_agents(
+            AgentSelectRequest(prompt="x"), deadline=deadline
+        )
+
+        statuses = {report.agent_id: report.status for report in reports}
+        assert statuses == {"fast": AgentStatus.ACTIVE, "medium": AgentStatus.ACTIVE, "hung": AgentStatus.TIMEOUT}
+        hung = next(r for r in reports if r.agent_id == "hung")
+        assert not hung.soft_deadline and hung.error_message.startswith("Cancelled at orchestration deadline")
+        assert len(products) == 2
+        assert deadline.elapsed_seconds < 1.0
+        await asyncio.sleep(0)
+        assert CANCELLED == ["hung"]
+
+    async def test_soft_deadline_returns_once_enough_products(self, mock_discover):
+        """After the soft deadline the fanout stops as soon as enough products are in"""
+        deadline = OrchestrationDeadline(
+            hard_timeout_seconds=5.0, soft_deadline_seconds=0.02, soft_deadline_min_products=1
+        )
+
+        products, reports = await FanoutOrchestrator().fanout_to_agents(
+            AgentSelectRequest(prompt="x"), deadline=deadline
+        )
+
+        assert [p["product_id"] for p in products] == ["p_fast"]
+        assert sorted(r.status for r in reports) == [AgentStatus.ACTIVE, AgentStatus.TIMEOUT, AgentStatus.TIMEOUT]
+        cut = [r for r in reports if r.status == AgentStatus.TIMEOUT]
+        assert all(r.soft_deadline and r.error_message.startswith("Cancelled at soft deadline") for r in cut)
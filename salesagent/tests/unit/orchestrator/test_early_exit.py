@@ -0,0 +1,88 @@
+"""
+Unit tests for the early termination rules
+"""
+import pytest
+
+from src.orchestrator.early_exit import EarlyExitPolicy
+
+pytestmark = pytest.mark.unit
+
+
+def _products(*scores):
+    return [{"product_id": f"p{i}", "publisher_tenant_id": "t", "score": score} for i, score in enumerate(scores)]
+
+
+class TestEarlyExitTracker:
+    """Test cases for the early exit rules"""
+
+    def test_waits_without_history(self):
+        """An agent with no score history might still beat the top-k"""
+        policy = EarlyExitPolicy(enabled=True, min_history=2)
+        tracker = policy.start(max_results=2, total_agents=3)
+        tracker.add_result(_products(0.9, 0.8))
+
+        assert tracker.stop_reason(["slow"]) is None
+
+    def test_stops_when_top_k_cannot_be_displaced(self):
+        """Pending agents whose best recent scores are below the k-th score are not awaited"""
+        policy = EarlyExitPolicy(enabled=True, min_history=2)
+        for _ in range(2):
+            policy.record_response("slow", _products(0.3, 0.1))
+            policy.record_response("strong", _products(0.95))
+        tracker = policy.start(max_results=2, total_agents=3)
+        tracker.add_result(_products(0.9, 0.8))
+
+        assert tracker.stop_reason(["slow"]).startswith("top_k_settled")
+        assert tracker.stop_reason(["slow", "strong"]) is None
+
+    def test_ties_keep_waiting(self):
+        """A pending agent matching the k-th score could still win on price or name"""
+        policy = EarlyExitPolicy(enabled=True, min_history=1)
+        policy.record_response("slow", _products(0.8))
+        tracker = policy.start(max_results=2, total_agents=2)
+        tracker.add_result(_products(0.9, 0.8))
+
+        assert tracker.stop_reason(["slow"]) is None
+
+    def test_duplicates_do_not_fill_top_k(self):
+        """The same product from two agents counts once towards k"""
+        policy = EarlyExitPolicy(enabled=True, min_history=1)
+        policy.record_response("slow", _products(0.1))
+        tracker = policy.start(max_results=2, total_agents=3)
+        tracker.add_result(_products(0.9))
+        tracker.add_result(_products(0.9))
+
+        assert tracker.kth_score() is None
+        assert tracker.stop_reason(["slow"]) is None
+
+    def test_target_fraction(self):
+        """Stops once the target fraction of agents has answered"""
+        policy = EarlyExitPolicy(enabled=True, target_fraction=0.5)
+        tracker = policy.start(max_results=10, total_agents=4)
+        tracker.add_result([])
+        assert tracker.stop_reason(["a", "b", "c"]) is None
+        tracker.add_result([])
+        assert tracker.stop_reason(["a", "b"]).startswith("target_fraction")
+
+    def test_repeatedly_cancelled_agent_is_probed(self):
+        """An agent cut off probe_every - 1 times in a row is waited for once, then can be cut off again"""
+        policy = EarlyExitPolicy(enabled=True, min_history=1, probe_every=3)
+        policy.record_response("slow", _products(0.1))
+
+        def stop_reason():
+            tracker = policy.start(max_results=1, total_agents=2)
+            tracker.add_result(_products(0.9))
+            return tracker.stop_reason(["slow"])
+
+        for _ in range(2):
+            assert stop_reason().startswith("top_k_settled")
+            policy.record_exit("top_k_settled", ["slow"])
+        assert stop_reason() is None
+
+        # The probe finishes (even without a better score), so the ceiling applies again
+        tracker = policy.start(max_results=1, total_agents=2)
+        tracker.add_result(_products(0.2), "slow")
+        assert stop_reason().startswith("top_k_settled")
+
+    def test_disabled(self):
+        assert EarlyExitPolicy(enabled=False).start(max_results=10, total_agents=3) is None
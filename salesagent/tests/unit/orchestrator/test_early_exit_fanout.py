@@ -0,0 +1,75 @@
+"""
+Unit tests for early termination of fanouts
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest, AgentStatus
+from src.orchestrator.early_exit import EarlyExitPolicy
+from src.orchestrator.fanout import FanoutOrchestrator
+
+pytestmark = pytest.mark.unit
+
+# agent_id -> (delay seconds, product scores)
+RESPONSES = {
+    "fast": (0.0, [0.9, 0.8]),
+    "medium": (0.01, [0.7]),
+    "slow": (1.0, [0.2])
+}
+
+
+def _agent(agent_id: str) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id=f"tenant_{agent_id}", name=agent_id, type="local_ai")
+
+
+AGENTS = [(_agent(agent_id), f"tenant_{agent_id}", agent_id) for agent_id in RESPONSES]
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    delay, scores = RESPONSES[agent.agent_id]
+    await asyncio.sleep(delay)
+    return [{"product_id": f"{agent.agent_id}_{i}", "score": score} for i, score in enumerate(scores)], 1
+
+
+def _products(*scores):
+    return [{"product_id": f"p{i}", "publisher_tenant_id": "t", "score": score} for i, score in enumerate(scores)]
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+async def test_fanout_cancels_agents_that_cannot_change_top_k(mock_discover):
+    """The slow agent is cancelled and reported once the top-k is settled"""
+    fanout = FanoutOrchestrator()
+    fanout.early_exit = EarlyExitPolicy(enabled=True, min_history=1)
+    fanout.early_exit.record_response("slow", _products(0.2))
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    products, reports = await fanout.fanout_to_agents(AgentSelectRequest(prompt="broad", max_results=3))
+
+    assert loop.time() - started < 0.5
+    statuses = {report.agent_id: report.status for report in reports}
+    assert statuses == {"fast": AgentStatus.ACTIVE, "medium": AgentStatus.ACTIVE, "slow": AgentStatus.CANCELLED}
+    cancelled = next(report for report in reports if report.agent_id == "slow")
+    assert "early exit" in cancelled.error_message
+    assert fanout.early_exit.get_stats()["early_exits"] == {"top_k_settled": 1}
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+async def test_cancelled_agent_is_let_through_periodically(mock_discover):
+    """The slow agent's stale ceiling is re-checked every probe_every orchestrations"""
+    fanout = FanoutOrchestrator()
+    fanout.early_exit = EarlyExitPolicy(enabled=True, min_history=1, probe_every=2)
+    fanout.early_exit.record_response("slow", _products(0.2))
+    request = AgentSelectRequest(prompt="broad", max_results=3)
+
+    with patch.dict(RESPONSES, {"slow": (0.05, [0.2])}):
+        _, first = await fanout.fanout_to_agents(request)
+        _, second = await fanout.fanout_to_agents(request)
+
+    assert {report.agent_id: report.status for report in first}["slow"] == AgentStatus.CANCELLED
+    assert {report.agent_id: report.status for report in second}["slow"] == AgentStatus.ACTIVE
+    assert fanout.early_exit.get_stats()["cancelled_agents"] == 1
@@ -0,0 +1,71 @@
+"""
+Unit tests for request fingerprinting
+"""
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.fingerprint import FingerprintPolicy, RequestFingerprinter
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+def _key(fingerprinter, prompt, **kwargs):
+    return fingerprinter.fingerprint("k_", AgentSelectRequest(prompt=prompt, **kwargs))
+
+
+class TestRequestFingerprinter:
+    """Test cases for RequestFingerprinter"""
+
+    def test_case_and_whitespace_folding(self):
+        """Case and whitespace differences share a key by default"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy())
+
+        assert _key(fingerprinter, "Sports video") == _key(fingerprinter, "  sports   VIDEO ")
+        assert _key(fingerprinter, "sports video") != _key(fingerprinter, "video sports")
+
+    def test_case_folding_can_be_disabled(self):
+        """Case-sensitive deployments keep case differences apart"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy(fold_case=False))
+
+        assert _key(fingerprinter, "Sports video") != _key(fingerprinter, "sports video")
+
+    def test_term_sorting(self):
+        """With sort_terms, word order does not matter"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy(sort_terms=True))
+
+        assert _key(fingerprinter, "video sports") == _key(fingerprinter, "Sports, video")
+
+    def test_stopword_stripping(self):
+        """With strip_stopwords, filler words are ignored"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy(strip_stopwords=True, sort_terms=True))
+
+        assert fingerprinter.canonical_prompt("I want video for the sports fans") == "fans sports video"
+        assert fingerprinter.canonical_prompt("The") == "the"
+
+    def test_filter_lists_sorted_and_empty_fields_dropped(self):
+        """Filter list order and unset optional fields do not change the key"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy())
+
+        assert _key(fingerprinter, "news", filters={"formats": ["video", "display"], "region": None}) == \
+            _key(fingerprinter, "news", filters={"formats": ["display", "video"]})
+        assert _key(fingerprinter, "news", filters={}) == _key(fingerprinter, "news")
+        assert _key(fingerprinter, "news", filters={"formats": ["video"]}) != _key(fingerprinter, "news")
+
+    def test_scope_fields_are_part_of_the_key(self):
+        """Scoping fields distinguish keys but ignore list order"""
+        fingerprinter = RequestFingerprinter(FingerprintPolicy())
+        request = AgentSelectRequest(prompt="news")
+
+        assert fingerprinter.fingerprint("k_", request, include_tenant_ids=["b", "a"]) == \
+            fingerprinter.fingerprint("k_", request, include_tenant_ids=["a", "b"])
+        assert fingerprinter.fingerprint("k_", request, include_tenant_ids=["a"]) != \
+            fingerprinter.fingerprint("k_", request)
+
+
+def test_orchestration_cache_key_uses_fingerprint():
+    """Equivalent orchestration requests share a cache key"""
+    service = OrchestratorService()
+
+    assert service._generate_cache_key(AgentSelectRequest(prompt="Sports video"), agent_types=["mcp", "local_ai"]) == \
+        service._generate_cache_key(AgentSelectRequest(prompt="sports  video "), agent_types=["local_ai", "mcp"])
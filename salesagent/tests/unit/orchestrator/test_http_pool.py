@@ -0,0 +1,166 @@
+"""
+Unit tests for the shared orchestrator HTTP client pool
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.orchestrator.http_pool import HttpClientPool
+from src.orchestrator.runtime import AsyncRuntime
+
+pytestmark = pytest.mark.unit
+
+
+class TestHttpClientPool:
+    """Test cases for HttpClientPool"""
+
+    async def test_reuses_client_per_host(self):
+        """Calls to the same host share one client, other hosts get their own"""
+        pool = HttpClientPool(max_connections_per_host=4)
+
+        first = pool.get_client("http://agent-a.test:8000/select_products")
+        second = pool.get_client("http://agent-a.test:8000/mcp")
+        other = pool.get_client("https://agent-b.test/select_products")
+
+        assert first is second
+        assert first is not other
+        assert pool.clients_created == 2
+        await pool.aclose()
+
+    def test_new_event_loop_gets_fresh_clients(self):
+        """Clients are not reused across event loops"""
+        pool = HttpClientPool()
+
+        async def grab():
+            return pool.get_client("http://agent-a.test/select_products")
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        assert first is not second
+        assert pool.clients_created == 2
+
+    def test_clients_of_a_closed_loop_are_dropped(self):
+        """A new loop drops the clients the previous, now closed, loop left behind"""
+        pool = HttpClientPool()
+
+        async def grab():
+            return asyncio.get_running_loop(), pool.get_client("http://agent-a.test/select_products")
+
+        first_loop, _ = asyncio.run(grab())
+        _, second = asyncio.run(grab())
+
+        assert first_loop not in pool._loop_clients
+        assert pool.get_stats()["stale_clients_dropped"] == 1
+        assert not second.is_closed
+
+    def test_runtime_shutdown_acloses_its_clients(self):
+        """Clients of the runtime loop are aclose()d on that loop when it shuts down"""
+        pool = HttpClientPool()
+        runtime = AsyncRuntime()
+        runtime.add_shutdown_hook(pool.aclose)
+
+        async def grab():
+            return pool.get_client("http://agent-a.test/select_products")
+
+        client = runtime.run(grab())
+        runtime.shutdown()
+
+        assert client.is_closed
+
+    def test_counts_connections_opened(self):
+        """Stats count requests and connections per host from the pool's own counters"""
+        pool = HttpClientPool(http2=False)
+
+        async def answer(reader, writer):
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        async def request_twice():
+            server = await asyncio.start_server(answer, "127.0.0.1", 0)
+            url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/capabilities"
+            for _ in range(2):
+                async with pool.stream("GET", url) as response:
+                    assert await response.aread() == b"{}"
+            await pool.aclose()
+            server.close()
+            return url
+
+        url = asyncio.run(request_twice())
+
+        host = pool.get_stats()["hosts"][url.rsplit("/", 1)[0]]
+        assert host == {"requests_sent": 2, "in_flight_requests": 0, "connections_opened": 1,
+                        "open_connections": 0, "idle_connections": 0}
+
+    def test_reports_idle_connections_from_the_transport_pool(self):
+        """Open and idle counts come from the live pool and drop once its connections close"""
+        pool = HttpClientPool()
+
+        async def answer(reader, writer):
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        async def request_then_close():
+            server = await asyncio.start_server(answer, "127.0.0.1", 0)
+            url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/capabilities"
+            async with pool.stream("GET", url) as response:
+                await response.aread()
+            idle = pool.get_stats()
+            await pool.aclose()
+            server.close()
+            return idle, pool.get_stats()
+
+        idle, closed = asyncio.run(request_then_close())
+
+        assert (idle["open_connections"], idle["idle_connections"], idle["connections_opened"]) == (1, 1, 1)
+        assert (closed["open_connections"], closed["idle_connections"], closed["connections_opened"]) == (0, 0, 1)
+
+    def test_http2_is_off_by_default(self):
+        """HTTP/2 is only used when asked for, since h2 is not a project dependency"""
+        assert HttpClientPool().get_stats()["http2_enabled"] is False
+
+    async def test_post_uses_pooled_client(self, monkeypatch):
+        """post() routes through the host client and counts requests"""
+        pool = HttpClientPool()
+        sent = []
+
+        async def fake_post(self, url, **kwargs):
+            sent.append((url, kwargs["timeout"]))
+            return httpx.Response(200, json={"products": []})
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+        response = await pool.post("http://agent-a.test/select_products", json={}, timeout=3)
+
+        assert response.status_code == 200
+        assert sent == [("http://agent-a.test/select_products", 3)]
+        assert pool.get_stats()["requests_sent"] == 1
+        assert pool.get_stats()["in_flight_requests"] == 0
+        await pool.aclose()
+
+    async def test_stats_report_hosts_and_limits(self):
+        """Stats include configured limits, and hosts only once requests were sent to them"""
+        pool = HttpClientPool(max_connections_per_host=7, max_keepalive_per_host=3)
+        pool.get_client("http://agent-a.test/select_products")
+
+        stats = pool.get_stats()
+
+        assert stats["total_hosts"] == 0
+        assert stats["in_flight_requests"] == 0
+        assert stats["connections_opened"] == 0
+        assert stats["open_connections"] == 0
+        assert stats["clients_created"] == 1
+        assert stats["max_connections_per_host"] == 7
+        assert stats["max_keepalive_per_host"] == 3
+        await pool.aclose()
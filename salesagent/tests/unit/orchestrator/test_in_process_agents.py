@@ -0,0 +1,62 @@
+"""
+Unit tests for in-process local agent execution
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.services.product_selection_service import ProductSelectionService, product_selection_service
+
+pytestmark = pytest.mark.unit
+
+AGENT = AgentConfig(agent_id="t1_local_ai", tenant_id="t1", name="Local", type="local_ai")
+PRODUCTS = [
+    {"product_id": "p1", "name": "Sports Video", "description": "sports", "price_cpm": 5.0,
+     "publisher_tenant_id": "t1", "source_agent_id": "t1_local_ai"},
+    {"product_id": "p2", "name": "News Display", "description": "news", "price_cpm": 2.0,
+     "publisher_tenant_id": "t1", "source_agent_id": "t1_local_ai"},
+]
+
+
+@patch.object(ProductSelectionService, "_load_products", return_value=[dict(p) for p in PRODUCTS])
+class TestProductSelectionService:
+    """Test cases for ProductSelectionService"""
+
+    @patch("src.services.product_selection_service.select_products_for_tenant")
+    async def test_ai_ranking_result(self, mock_rank, mock_load):
+        """AI-ranked products are returned with source information"""
+        mock_rank.return_value = [{"product_id": "p2", "score": 0.9}]
+
+        response = await ProductSelectionService().select_products(AGENT, "t1", AgentSelectRequest(prompt="news"))
+
+        assert response["status"] == "active"
+        assert response["total_found"] == 2
+        assert response["products"] == [
+            {"product_id": "p2", "score": 0.9, "source_agent_id": "t1_local_ai", "publisher_tenant_id": "t1"}
+        ]
+
+    @patch("src.services.product_selection_service.select_products_for_tenant", side_effect=Exception("no key"))
+    async def test_keyword_fallback_when_ai_fails(self, mock_rank, mock_load):
+        """Keyword ranking is used and the error is reported when AI ranking fails"""
+        response = await ProductSelectionService().select_products(AGENT, "t1", AgentSelectRequest(prompt="sports"))
+
+        assert response["status"] == "error"
+        assert "using fallback" in response["error_message"]
+        assert response["products"][0]["product_id"] == "p1"
+
+
+async def test_fanout_calls_local_agents_in_process():
+    """Local agents are served by the selection service without an HTTP round trip"""
+    fanout = FanoutOrchestrator(local_agents_in_process=True)
+    response = {"products": [{"product_id": "p1"}], "execution_time_ms": 12, "error_message": None}
+
+    with patch.object(product_selection_service, "select_products", return_value=response) as mock_select, \
+            patch.object(fanout.http_pool, "post") as mock_post:
+        products, execution_time_ms = await fanout._call_agent_provider(AGENT, "t1", AgentSelectRequest(prompt="x"))
+
+    mock_select.assert_called_once()
+    mock_post.assert_not_called()
+    assert products == [{"product_id": "p1", "source_agent_id": "t1_local_ai", "publisher_tenant_id": "t1"}]
+    assert execution_time_ms == 12
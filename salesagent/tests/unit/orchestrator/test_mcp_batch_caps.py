@@ -0,0 +1,100 @@
+"""
+Unit tests for per-caller product and byte caps on batched MCP replies
+"""
+import asyncio
+import json as jsonlib
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest
+from tests.unit.orchestrator.mcp_fakes import ENDPOINT, FakeMCPServer, fake_client
+
+pytestmark = pytest.mark.unit
+
+
+async def test_batched_replies_are_capped_per_caller():
+    """Each caller's product cap applies to its own reply within a batch"""
+    server = FakeMCPServer()
+    answer = server.answer
+
+    def answer_many(message):
+        reply = answer(message)
+        if message["method"] == "tools/call":
+            reply["result"]["products"] *= 5
+        return reply
+
+    server.answer = answer_many
+    client = fake_client(server, batch_window_seconds=0.01)
+
+    capped, uncapped = await asyncio.gather(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="a"), {"max_response_products": 2}),
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="b"), {})
+    )
+
+    assert len(capped["products"]) == 2
+    assert capped["truncated"] == "product_cap"
+    assert len(uncapped["products"]) == 5
+    assert uncapped["truncated"] is None
+
+
+async def test_batched_replies_are_byte_capped_per_caller():
+    """A caller's byte cap applies to its own reply, not to its share of the batch's combined cap"""
+    server = FakeMCPServer()
+    answer = server.answer
+
+    def answer_many(message):
+        reply = answer(message)
+        if message["method"] == "tools/call":
+            reply["result"]["products"] *= 20
+        return reply
+
+    server.answer = answer_many
+    client = fake_client(server, batch_window_seconds=0.01)
+    await client.get_capabilities(ENDPOINT)
+    reply_bytes = len(jsonlib.dumps(answer_many({"method": "tools/call", "id": "mcp_0",
+                                                 "params": {"arguments": {"prompt": "a"}}})))
+
+    capped, uncapped = await asyncio.gather(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="a"), {"max_response_bytes": reply_bytes // 2}),
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="b"), {})
+    )
+
+    assert capped["status"] == "active"
+    assert 0 < len(capped["products"]) < 20
+    assert capped["truncated"] == "byte_cap"
+    assert len(uncapped["products"]) == 20
+    assert uncapped["truncated"] is None
+
+
+async def test_byte_cap_inside_a_batch_reply_fails_later_callers():
+    """A reply cut off before its id is never handed to another caller"""
+    server = FakeMCPServer()
+    answer = server.answer
+
+    def answer_id_last(message):
+        reply = answer(message)
+        if message["method"] == "tools/call":
+            reply["result"]["products"] *= 20
+            reply["id"] = reply.pop("id")
+        return reply
+
+    server.answer = answer_id_last
+    client = fake_client(server, batch_window_seconds=0.01)
+    await client.get_capabilities(ENDPOINT)
+    reply_bytes = len(jsonlib.dumps(answer_id_last({"method": "tools/call", "id": "mcp_0",
+                                                    "params": {"arguments": {"prompt": "a"}}})))
+    # Three callers share a cap of about one and a half replies: the second is cut off before its id
+    config = {"max_response_bytes": reply_bytes // 2}
+
+    first, second, third = await asyncio.gather(*(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt=prompt), config) for prompt in ("a", "b", "c")
+    ))
+
+    assert first["status"] == "active"
+    assert {product["product_id"] for product in first["products"]} == {"p_a"}
+    # The whole first reply is larger than the first caller's own cap
+    assert first["truncated"] == "byte_cap"
+    for result in (second, third):
+        assert result["status"] == "error"
+        assert "byte cap" in result["error_message"]
+        assert not result.get("products")
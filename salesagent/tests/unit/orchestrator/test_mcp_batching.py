@@ -0,0 +1,80 @@
+"""
+Unit tests for MCP JSON-RPC batching
+"""
+import asyncio
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.deadline import agent_call_deadline
+from tests.unit.orchestrator.mcp_fakes import ENDPOINT, FakeMCPServer, FakeResponse, fake_client
+
+pytestmark = pytest.mark.unit
+
+
+async def test_concurrent_calls_share_one_batch():
+    """Calls to one endpoint within the batch window go out as one JSON-RPC array"""
+    server = FakeMCPServer()
+    client = fake_client(server, batch_window_seconds=0.01)
+    await client.get_capabilities(ENDPOINT)
+
+    results = await asyncio.gather(*(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt=prompt), {}) for prompt in ("a", "b", "c")
+    ))
+
+    assert [result["products"][0]["product_id"] for result in results] == ["p_a", "p_b", "p_c"]
+    # One discovery, then one batch for all three callers
+    assert len(server.posts) == 2
+    assert [message["method"] for message in server.posts[0][0]] == ["tools/list"]
+    assert [message["method"] for message in server.posts[1][0]] == ["tools/call"] * 3
+    assert client.get_stats()["avg_batch_size"] == 3
+
+
+async def test_server_without_batches_gets_single_requests():
+    server = FakeMCPServer(batch=False)
+    client = fake_client(server, batch_window_seconds=0.01)
+
+    results = await asyncio.gather(*(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt=prompt), {}) for prompt in ("a", "b")
+    ))
+
+    assert [result["status"] for result in results] == ["active", "active"]
+    # The background discovery probed with an array, then fell back to a plain request
+    assert (await client.get_capabilities(ENDPOINT))["batch"] is False
+    assert sorted(type(body).__name__ for body, _ in server.posts) == ["dict", "dict", "dict", "list"]
+
+
+async def test_batch_error_fails_every_call():
+    """An error reply without an id applies to the whole batch"""
+    server = FakeMCPServer()
+    client = fake_client(server, batch_window_seconds=0.01)
+    await client.get_capabilities(ENDPOINT)
+
+    async def reject_batch(url, json=None, headers=None, timeout=None):
+        return FakeResponse({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}})
+
+    server.post = reject_batch
+    results = await asyncio.gather(*(
+        client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt=prompt), {}) for prompt in ("a", "b")
+    ))
+
+    assert [result["error_message"] for result in results] == ["MCP error: Invalid Request"] * 2
+
+
+async def test_abandoned_batch_is_cancelled():
+    """A batch waits only as long as its callers and stops once they all give up"""
+    server = FakeMCPServer(delays={"tools/call": 1.0})
+    client = fake_client(server, batch_window_seconds=0.01)
+    await client.get_capabilities(ENDPOINT)
+
+    async def call(prompt):
+        with agent_call_deadline(0.1):
+            return await asyncio.wait_for(client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt=prompt), {}), 0.1)
+
+    results = await asyncio.gather(call("a"), call("b"), return_exceptions=True)
+    await asyncio.sleep(0.01)
+
+    assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+    assert server.timeouts[-1] <= 0.1
+    assert server.cancelled == 1
+    assert client.get_stats()["abandoned_batches"] == 1
@@ -0,0 +1,68 @@
+"""
+Unit tests for MCP capability discovery and caching
+"""
+import asyncio
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest
+from src.orchestrator.mcp_discovery import CAPABILITIES_TOOL
+from src.orchestrator.mcp_transport import MCP_SESSION_HEADER
+from tests.unit.orchestrator.mcp_fakes import ENDPOINT, FakeMCPServer, fake_client
+
+pytestmark = pytest.mark.unit
+
+
+async def test_capabilities_are_cached_until_tested():
+    server = FakeMCPServer(session_id="session-1")
+    client = fake_client(server)
+
+    await client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="a"), {})
+    await client.get_capabilities(ENDPOINT)
+    await client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="b"), {})
+    discoveries = [body for body, _ in server.posts if isinstance(body, list) and body[0]["method"] == "tools/list"]
+    assert len(discoveries) == 1
+    # The session assigned during discovery is reused
+    assert server.posts[-1][1][MCP_SESSION_HEADER] == "session-1"
+
+    result = await client.test_mcp_endpoint(ENDPOINT)
+
+    assert result["status"] == "healthy"
+    assert result["tools"] == ["select_products"]
+    assert result["batch_supported"] is True
+    assert len(server.posts) == 4
+
+
+async def test_discovery_stays_off_the_call_path():
+    """A slow tools/list does not delay calls; they go out unbatched until it lands"""
+    server = FakeMCPServer(delays={"tools/list": 0.5})
+    client = fake_client(server)
+
+    result = await asyncio.wait_for(client.call_mcp_agent(ENDPOINT, AgentSelectRequest(prompt="a"), {}), 0.2)
+
+    assert result["status"] == "active"
+    assert server.posts[0][0]["method"] == "tools/call"
+    assert (await client.get_capabilities(ENDPOINT))["batch"] is True
+
+
+async def test_agent_capabilities_come_from_the_capabilities_tool():
+    """Agents listing get_capabilities report their catalog summary; others report nothing"""
+    server = FakeMCPServer()
+    client = fake_client(server)
+
+    assert await client.get_agent_capabilities(ENDPOINT) is None
+
+    answer = server.answer
+
+    def answer_with_capabilities(message):
+        if message["method"] == "tools/list":
+            return {"jsonrpc": "2.0", "id": message["id"],
+                    "result": {"tools": [{"name": "select_products"}, {"name": CAPABILITIES_TOOL}]}}
+        if message["params"]["name"] == CAPABILITIES_TOOL:
+            return {"jsonrpc": "2.0", "id": message["id"], "result": {"channels": ["video"], "product_count": 3}}
+        return answer(message)
+
+    server.answer = answer_with_capabilities
+    await client.get_capabilities(ENDPOINT, refresh=True)
+
+    assert await client.get_agent_capabilities(ENDPOINT) == {"channels": ["video"], "product_count": 3}
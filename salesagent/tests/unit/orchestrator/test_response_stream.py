@@ -0,0 +1,147 @@
+"""
+Unit tests for incremental agent response parsing under byte and product caps
+"""
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.response_limits import BYTE_CAP, PRODUCT_CAP, ResponseLimits
+from src.orchestrator.response_stream import ANY_ELEMENT, read_json_stream, read_text
+
+pytestmark = pytest.mark.unit
+
+LIMITS = ResponseLimits(max_bytes=1024 * 1024, max_products=100)
+
+
+def _products(count):
+    return [{"product_id": f"p{i}", "name": f"Product {i} é", "price_cpm": 1.5 + i} for i in range(count)]
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+class TestReadJsonStream:
+    """Test cases for read_json_stream"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 4096])
+    async def test_matches_json_loads(self, chunk_size):
+        """Any chunking, including splits inside multi-byte characters and numbers, parses the same"""
+        body = {"status": "ok", "products": _products(5), "execution_time_ms": 12345, "ratio": -1.25e3}
+        data = json.dumps(body, ensure_ascii=False, indent=1).encode()
+
+        value, truncated = await read_json_stream(_chunks(data, chunk_size), LIMITS)
+
+        assert value == body
+        assert truncated is None
+        assert value["products"].truncated is None
+
+    async def test_product_cap_drops_extra_products(self):
+        data = json.dumps({"products": _products(10), "execution_time_ms": 5}).encode()
+
+        value, truncated = await read_json_stream(_chunks(data), ResponseLimits(max_bytes=1 << 20, max_products=3))
+
+        assert [p["product_id"] for p in value["products"]] == ["p0", "p1", "p2"]
+        assert value["products"].truncated == PRODUCT_CAP
+        # Fields after the products array are still read
+        assert value["execution_time_ms"] == 5
+        assert truncated is None
+
+    async def test_byte_cap_keeps_products_read_so_far(self):
+        data = json.dumps({"products": _products(50)}).encode()
+
+        value, truncated = await read_json_stream(_chunks(data), ResponseLimits(max_bytes=len(data) // 2,
+                                                                                max_products=100))
+
+        assert truncated == BYTE_CAP
+        assert value["products"].truncated == BYTE_CAP
+        assert 0 < len(value["products"]) < 50
+        assert value["products"] == _products(50)[:len(value["products"])]
+
+    async def test_batch_replies(self):
+        """Each reply of a JSON-RPC batch gets its own product cap"""
+        replies = [{"jsonrpc": "2.0", "id": f"mcp_{i}", "result": {"products": _products(4)}} for i in range(3)]
+        data = json.dumps(replies).encode()
+
+        value, _ = await read_json_stream(_chunks(data), ResponseLimits(max_bytes=1 << 20, max_products=2),
+                                          (ANY_ELEMENT, "result", "products"))
+
+        assert [reply["id"] for reply in value] == ["mcp_0", "mcp_1", "mcp_2"]
+        assert all(len(reply["result"]["products"]) == 2 for reply in value)
+
+    async def test_malformed_body(self):
+        with pytest.raises(json.JSONDecodeError):
+            await read_json_stream(_chunks(b'{"products": [{"product_id": "p1"} {"product_id": "p2"}]}'), LIMITS)
+
+    async def test_read_text_is_capped(self):
+        assert await read_text(_chunks(b"x" * 5000), 100) == "x" * 100
+
+
+class FakeStreamPool:
+    """Serves one JSON body through stream(), in small chunks"""
+
+    def __init__(self, body, status_code=200):
+        self.data = json.dumps(body).encode()
+        self.status_code = status_code
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        response = type("Response", (), {})()
+        response.status_code = self.status_code
+        response.aiter_bytes = lambda: _chunks(self.data, 256)
+        yield response
+
+
+def _external_agent(**config) -> AgentConfig:
+    return AgentConfig(agent_id="ext", tenant_id="tenant_ext", name="External", type="external",
+                       endpoint_url="http://agent.example.com", config=config)
+
+
+async def test_external_agent_truncation_reaches_report():
+    """A capped external agent is reported active but truncated"""
+    agent = _external_agent(max_response_products=5)
+    fanout = FanoutOrchestrator()
+    fanout.http_pool = FakeStreamPool({"products": _products(20), "execution_time_ms": 7})
+
+    with patch("src.orchestrator.fanout.agent_management_service.discover_active_agents",
+               return_value=[(agent, "tenant_ext", "External")]):
+        products, reports = await fanout.fanout_to_agents(AgentSelectRequest(prompt="capped"))
+
+    assert len(products) == 5
+    assert products[0]["source_agent_id"] == "ext"
+    assert reports[0].status == "active"
+    assert reports[0].truncated is True
+    assert reports[0].truncation_reason == PRODUCT_CAP
+
+
+async def test_truncated_response_is_not_cached():
+    """A capped response is not served from the agent cache as if it were complete"""
+    agent = _external_agent(max_response_products=5)
+    fanout = FanoutOrchestrator()
+    fanout.http_pool = FakeStreamPool({"products": _products(20), "execution_time_ms": 7})
+    request = AgentSelectRequest(prompt="capped twice")
+
+    with patch("src.orchestrator.fanout.agent_management_service.discover_active_agents",
+               return_value=[(agent, "tenant_ext", "External")]):
+        await fanout.fanout_to_agents(request)
+        _, reports = await fanout.fanout_to_agents(request)
+
+    assert fanout.agent_cache.get("tenant_ext", "ext", request) is None
+    assert reports[0].cached is False
+    assert reports[0].truncated is True
+
+
+async def test_external_agent_error_text_is_capped():
+    fanout = FanoutOrchestrator()
+    fanout.http_pool = FakeStreamPool("e" * 10_000, status_code=500)
+
+    with pytest.raises(Exception) as error:
+        await fanout._call_external_agent(_external_agent(), AgentSelectRequest(prompt="x"))
+
+    assert str(error.value).startswith("HTTP 500: ")
+    assert len(str(error.value)) < 2100
@@ -0,0 +1,113 @@
+"""
+Unit tests for the persistent async runtime
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.orchestrator.loop_lag import loop_lag
+from src.orchestrator.runtime import AsyncRuntime
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def runtime():
+    runtime = AsyncRuntime(lag_interval_seconds=0.01)
+    yield runtime
+    runtime.shutdown()
+
+
+class TestAsyncRuntime:
+    """Test cases for AsyncRuntime"""
+
+    def test_runs_coroutines_on_one_long_lived_loop(self, runtime):
+        """Every call from sync code runs on the same loop, off the calling thread"""
+        async def current():
+            return asyncio.get_running_loop(), threading.current_thread()
+
+        first_loop, first_thread = runtime.run(current())
+        second_loop, _ = runtime.run(current())
+
+        assert first_loop is second_loop
+        assert first_thread is not threading.current_thread()
+        assert runtime.get_stats()["submitted"] == 2
+
+    def test_submit_is_thread_safe(self, runtime):
+        """Many request threads can dispatch concurrently and each gets its own result"""
+        async def double(value):
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda value: runtime.run(double(value)), range(32)))
+
+        assert results == [value * 2 for value in range(32)]
+
+    def test_errors_propagate(self, runtime):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runtime.run(fail())
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        """A caller that gives up does not leave the coroutine running"""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+        assert cancelled.wait(1.0)
+
+    def test_run_from_runtime_thread_is_rejected(self, runtime):
+        """Blocking on the runtime from its own loop would deadlock"""
+        async def nested():
+            async def inner():
+                return 1
+            runtime.run(inner())
+
+        with pytest.raises(RuntimeError, match="runtime loop"):
+            runtime.run(nested())
+
+    def test_iterate_closes_stream(self, runtime):
+        """Stopping iteration early closes the async generator on the runtime loop"""
+        closed = threading.Event()
+
+        async def numbers():
+            try:
+                for number in range(10):
+                    yield number
+            finally:
+                closed.set()
+
+        items = runtime.iterate(numbers())
+        assert [next(items), next(items)] == [0, 1]
+        items.close()
+
+        assert closed.is_set()
+
+    def test_reports_loop_lag(self, runtime):
+        """A callback that blocks the loop shows up as lag, in the stats and the lag histogram"""
+        lag_samples = loop_lag.count()
+
+        async def block():
+            time.sleep(0.1)
+
+        runtime.run(block())
+        runtime.run(asyncio.sleep(0.05))
+
+        stats = runtime.get_stats()
+        assert stats["running"] is True
+        assert stats["max_loop_lag_ms"] >= 50
+        assert loop_lag.count() > lag_samples
+        assert loop_lag.summary()["max"] >= 0.05
@@ -0,0 +1,138 @@
+"""
+Unit tests for fair scheduling of agent calls
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.buyers import buyer_key
+from src.orchestrator.scheduler import AgentCallScheduler
+
+pytestmark = pytest.mark.unit
+
+
+async def _hold(scheduler, order, buyer_id, agent_id, release):
+    async with scheduler.slot(buyer_id, f"tenant_{agent_id}", agent_id):
+        order.append(buyer_id)
+        await release.wait()
+
+
+class TestAgentCallScheduler:
+    """Test cases for AgentCallScheduler"""
+
+    async def test_per_agent_cap(self):
+        """A slow agent only holds its own cap; calls to other agents still run"""
+        scheduler = AgentCallScheduler(max_inflight_calls=10, max_calls_per_agent=2)
+        release = asyncio.Event()
+        order = []
+        tasks = [asyncio.ensure_future(_hold(scheduler, order, "b1", "slow", release)) for _ in range(5)]
+        tasks.append(asyncio.ensure_future(_hold(scheduler, order, "b1", "fast", release)))
+        await asyncio.sleep(0.01)
+
+        stats = scheduler.get_stats()
+        assert stats["in_flight"] == 3
+        assert stats["agents"]["slow"]["in_flight"] == 2
+        assert stats["agents"]["fast"]["in_flight"] == 1
+        assert stats["queue_depth"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.get_stats()["in_flight"] == 0
+
+    async def test_fair_share_across_buyers(self):
+        """A light buyer is not stuck behind a heavy buyer's backlog"""
+        scheduler = AgentCallScheduler(max_inflight_calls=1, max_calls_per_agent=10)
+        release = asyncio.Event()
+        order = []
+        blocker = asyncio.ensure_future(_hold(scheduler, [], "warmup", "a", release))
+        await asyncio.sleep(0)
+
+        gate = asyncio.Event()
+        heavy = [asyncio.ensure_future(_hold(scheduler, order, "heavy", f"h{i}", gate)) for i in range(6)]
+        await asyncio.sleep(0)
+        light = [asyncio.ensure_future(_hold(scheduler, order, "light", f"l{i}", gate)) for i in range(2)]
+        await asyncio.sleep(0)
+
+        gate.set()
+        release.set()
+        await asyncio.gather(blocker, *heavy, *light)
+
+        # Light's calls interleave with heavy's instead of waiting for all six
+        assert order[:4].count("light") == 2
+
+    async def test_weights(self):
+        """A buyer with twice the weight gets about twice the slots"""
+        scheduler = AgentCallScheduler(max_inflight_calls=1, buyer_weights={"gold": 2.0})
+        release = asyncio.Event()
+        order = []
+        blocker = asyncio.ensure_future(_hold(scheduler, [], "warmup", "a", release))
+        await asyncio.sleep(0)
+
+        gate = asyncio.Event()
+        gate.set()
+        tasks = [asyncio.ensure_future(_hold(scheduler, order, buyer_id, f"{buyer_id}{i}", gate))
+                 for i in range(6) for buyer_id in ("gold", "basic")]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(blocker, *tasks)
+
+        assert order[:6].count("gold") == 4
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """A call cancelled while queued frees its place"""
+        scheduler = AgentCallScheduler(max_inflight_calls=1)
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(_hold(scheduler, [], "b1", "a", release))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(scheduler.acquire("b2", "t", "b"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.get_stats()["queue_depth"] == 0
+
+        release.set()
+        await holder
+        assert scheduler.get_stats()["in_flight"] == 0
+
+    async def test_buyer_state_is_bounded_and_not_exposed(self):
+        """Stats never name unconfigured buyers, and idle buyers are forgotten"""
+        scheduler = AgentCallScheduler(buyer_weights={"gold": 2.0}, max_tracked_buyers=10)
+        session_keys = [buyer_key(f"session-token-{i}", "session") for i in range(50)]
+        for buyer_id in session_keys + ["gold"]:
+            async with scheduler.slot(buyer_id, "t1", "a1"):
+                pass
+
+        stats = scheduler.get_stats()
+        assert stats["buyer_calls"] == {"other": 50, "gold": 1}
+        assert stats["tracked_buyers"] <= 10
+        assert "session-token-1" not in str(stats)
+
+
+async def _slow_call(self, agent, tenant_id, request):
+    await asyncio.sleep(0.05)
+    return [{"product_id": f"p_{agent.agent_id}", "name": agent.agent_id}], 50
+
+
+AGENT = AgentConfig(agent_id="a", tenant_id="tenant_a", name="a", type="local_ai", config={"max_concurrent_calls": 1})
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _slow_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents",
+       return_value=[(AGENT, "tenant_a", "a")])
+async def test_queue_wait_reported(mock_discover):
+    """Concurrent orchestrations queue on the agent's cap and report the wait"""
+    fanout = FanoutOrchestrator()
+    fanout.scheduler = AgentCallScheduler()
+
+    results = await asyncio.gather(
+        fanout.fanout_to_agents(AgentSelectRequest(prompt="first"), buyer_id="b1"),
+        fanout.fanout_to_agents(AgentSelectRequest(prompt="second"), buyer_id="b2")
+    )
+
+    waits = sorted(reports[0].queue_wait_ms for _, reports in results)
+    assert waits[0] == 0
+    assert waits[1] >= 40
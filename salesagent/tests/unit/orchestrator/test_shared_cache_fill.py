@@ -0,0 +1,89 @@
+"""
+Unit tests for filling a shared orchestration cache once across workers
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.sqlite_cache_backend import SQLiteCacheBackend
+from src.orchestrator.deadline import OrchestrationDeadline
+from src.orchestrator.coalescing import RequestCoalescer
+from src.orchestrator.cache_manager import CacheManager
+from src.orchestrator.performance_monitor import performance_monitor
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def _sqlite_cache(db_path, **kwargs):
+    return CacheManager(backend=SQLiteCacheBackend(db_path, max_size=kwargs.pop("max_size", 100)), **kwargs)
+
+
+async def test_workers_fill_shared_key_once(db_path):
+    """With a shared cache a second worker waits for the first worker's fanout"""
+    fanout_calls = 0
+
+    async def fake_fanout(**kwargs):
+        nonlocal fanout_calls
+        fanout_calls += 1
+        await asyncio.sleep(0.2)
+        report = AgentReport(agent_id="a1", tenant_id="t1", status=AgentStatus.ACTIVE, products_count=1)
+        return [{"product_id": "p1", "name": "Product", "publisher_tenant_id": "t1"}], [report]
+
+    workers = []
+    for _ in range(2):
+        worker = OrchestratorService()
+        worker.coalescer = RequestCoalescer(enabled=False)
+        worker.fill_poll_seconds = 0.01
+        workers.append(worker)
+
+    request = AgentSelectRequest(prompt="shared fill")
+    with patch("src.services.orchestrator_cache.cache_manager", _sqlite_cache(db_path)), \
+            patch.object(workers[0].fanout, "fanout_to_agents", side_effect=fake_fanout):
+        responses = await asyncio.gather(*(worker.orchestrate(request) for worker in workers))
+
+    assert fanout_calls == 1
+    assert [response["products"][0]["product_id"] for response in responses] == ["p1", "p1"]
+
+
+async def test_fill_claim_is_only_released_by_its_owner(db_path):
+    """A worker that never held the claim leaves another worker's claim in place"""
+    cache = _sqlite_cache(db_path)
+    worker = OrchestratorService()
+    deadline = OrchestrationDeadline.start(worker.deadline_policy, AgentSelectRequest(prompt="claims"))
+
+    with patch("src.services.orchestrator_cache.cache_manager", cache):
+        result, claim = await worker._await_cache_fill("key", deadline)
+        assert result is None and claim is not None
+
+        await worker._release_fill_claim("key", "someone-else")
+        assert cache.peek("fill_claim_key") == claim
+        await worker._release_fill_claim("key", claim)
+        assert cache.peek("fill_claim_key") is None
+
+
+async def test_no_fanout_after_deadline_spent_waiting_for_fill(db_path):
+    """Waiting out the deadline on another worker's claim does not start a doomed fanout"""
+    cache = _sqlite_cache(db_path)
+    cache.add("fill_claim_key", "other-worker", ttl_seconds=60)
+    worker = OrchestratorService()
+    worker.fill_poll_seconds = 0.01
+    deadline = OrchestrationDeadline.start(worker.deadline_policy, AgentSelectRequest(prompt="late",
+                                                                                      timeout_seconds=1))
+
+    with patch("src.services.orchestrator_cache.cache_manager", cache), \
+            patch.object(type(deadline), "expired", new=True), \
+            patch.object(worker.fanout, "fanout_to_agents") as fanout:
+        with pytest.raises(Exception, match="deadline passed"):
+            await worker._fanout_and_build(AgentSelectRequest(prompt="late"), None, None, None, None,
+                                           "key", performance_monitor.start_operation(), deadline)
+
+    fanout.assert_not_called()
+    assert cache.peek("fill_claim_key") == "other-worker"
@@ -0,0 +1,102 @@
+"""
+Unit tests for stale-while-revalidate orchestration caching
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core.schemas.agent import AgentSelectRequest, AgentReport, AgentStatus
+from src.orchestrator.cache_manager import CacheManager
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+def make_fanout(product_ids):
+    """Build a fake fanout returning each product id in turn"""
+    calls = []
+
+    async def fake_fanout(**kwargs):
+        product_id = product_ids[min(len(calls), len(product_ids) - 1)]
+        calls.append(product_id)
+        report = AgentReport(agent_id="a1", agent_name="Agent 1", tenant_id="t1",
+                             status=AgentStatus.ACTIVE, products_count=1, response_time_ms=10)
+        return [{"product_id": product_id, "name": "Product", "publisher_tenant_id": "t1"}], [report]
+
+    return fake_fanout, calls
+
+
+@pytest.fixture
+def cache():
+    cache = CacheManager(ttl_seconds=0.05, hard_ttl_seconds=60)
+    with patch("src.services.orchestrator_cache.cache_manager", cache):
+        yield cache
+
+
+async def wait_for_revalidation(service):
+    for _ in range(100):
+        if not service._revalidating:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_stale_result_served_and_refreshed(cache):
+    """An expired entry is returned immediately flagged stale while a refresh runs"""
+    service = OrchestratorService()
+    service.stale_while_revalidate = True
+    fake_fanout, calls = make_fanout(["old", "new"])
+    request = AgentSelectRequest(prompt="refresh me")
+
+    with patch.object(service.fanout, "fanout_to_agents", side_effect=fake_fanout):
+        first = await service.orchestrate(request)
+        time.sleep(0.1)
+        stale = await service.orchestrate(request)
+        await wait_for_revalidation(service)
+        fresh = await service.orchestrate(request)
+
+    assert first["metadata"]["stale"] is False
+    assert stale["metadata"]["stale"] is True
+    assert stale["products"][0]["product_id"] == "old"
+    assert fresh["metadata"]["stale"] is False
+    assert fresh["products"][0]["product_id"] == "new"
+    assert calls == ["old", "new"]
+    assert service.revalidations == 1
+
+
+async def test_expired_result_refetched_when_disabled(cache):
+    """Without stale-while-revalidate an expired entry triggers a full fanout"""
+    service = OrchestratorService()
+    service.stale_while_revalidate = False
+    fake_fanout, calls = make_fanout(["old", "new"])
+    request = AgentSelectRequest(prompt="refresh me")
+
+    with patch.object(service.fanout, "fanout_to_agents", side_effect=fake_fanout):
+        await service.orchestrate(request)
+        time.sleep(0.1)
+        response = await service.orchestrate(request)
+
+    assert response["metadata"]["stale"] is False
+    assert response["products"][0]["product_id"] == "new"
+    assert calls == ["old", "new"]
+
+
+async def test_partial_result_is_not_cached(cache):
+    """A response with agents cut off at a deadline is returned but not served to later buyers"""
+    service = OrchestratorService()
+    calls = []
+
+    async def partial_fanout(**kwargs):
+        calls.append(kwargs)
+        report = AgentReport(agent_id="a1", tenant_id="t1", status=AgentStatus.TIMEOUT, soft_deadline=True)
+        return [], [report]
+
+    request = AgentSelectRequest(prompt="slow agents")
+    with patch.object(service.fanout, "fanout_to_agents", side_effect=partial_fanout):
+        first = await service.orchestrate(request)
+        await service.orchestrate(request)
+
+    assert first["metadata"]["partial_results"] is True
+    assert first["metadata"]["soft_deadline_agents"] == ["a1"]
+    assert len(calls) == 2
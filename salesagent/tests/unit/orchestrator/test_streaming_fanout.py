@@ -0,0 +1,156 @@
+"""
+Unit tests for streaming fanout and the SSE orchestration helpers
+"""
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.api.sse_stream import format_sse_event, iterate_async_stream
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.orchestrator.coalescing import RequestCoalescer
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.orchestrator.cache_manager import cache_manager
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+def _agent(agent_id: str) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id=f"tenant_{agent_id}", name=agent_id, type="local_ai")
+
+
+AGENTS = [
+    (_agent("slow"), "tenant_slow", "Slow Tenant"),
+    (_agent("fast"), "tenant_fast", "Fast Tenant"),
+    (_agent("broken"), "tenant_broken", "Broken Tenant"),
+]
+DELAYS = {"slow": 0.2, "fast": 0.01, "broken": 0.05}
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    await asyncio.sleep(DELAYS[agent.agent_id])
+    if agent.agent_id == "broken":
+        raise Exception("agent exploded")
+    product = {"product_id": f"p_{agent.agent_id}", "name": agent.agent_id, "price_cpm": 1.0, "score": 0.5}
+    return [product], int(DELAYS[agent.agent_id] * 1000)
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents", return_value=AGENTS)
+class TestStreamingFanout:
+    """Test cases for FanoutOrchestrator.stream_agent_results and orchestrate_stream"""
+
+    async def test_results_yield_in_completion_order(self, mock_discover):
+        """Fast agents are yielded before slow ones, failures are reported"""
+        fanout = FanoutOrchestrator()
+        request = AgentSelectRequest(prompt="sports video")
+
+        results = [item async for item in fanout.stream_agent_results(request)]
+
+        assert [report.agent_id for _, report in results] == ["fast", "broken", "slow"]
+        assert results[1][1].status == "error"
+        assert results[0][0][0]["publisher_tenant_id"] == "tenant_fast"
+
+    async def test_fanout_to_agents_collects_everything(self, mock_discover):
+        """The batch API still returns all products and reports"""
+        products, reports = await FanoutOrchestrator().fanout_to_agents(AgentSelectRequest(prompt="news"))
+
+        assert {p["product_id"] for p in products} == {"p_fast", "p_slow"}
+        assert len(reports) == 3
+
+    async def test_discovery_runs_off_the_event_loop(self, mock_discover):
+        """The agent discovery query does not block the loop the fanout runs on"""
+        discovery_threads = []
+
+        def discover(**filters):
+            discovery_threads.append(threading.current_thread())
+            return AGENTS
+
+        mock_discover.side_effect = discover
+
+        await FanoutOrchestrator().fanout_to_agents(AgentSelectRequest(prompt="news"))
+
+        assert discovery_threads and discovery_threads[0] is not threading.current_thread()
+
+    async def test_orchestrate_stream_events(self, mock_discover):
+        """Each agent produces an agent_result event, followed by a merged complete event"""
+        cache_manager.clear()
+        service = OrchestratorService()
+        service.fanout = FanoutOrchestrator()
+
+        events = [e async for e in service.orchestrate_stream(AgentSelectRequest(prompt="streaming test"))]
+
+        assert [e["event"] for e in events] == ["agent_result"] * 3 + ["complete"]
+        assert events[0]["products"][0]["product_id"] == "p_fast"
+        assert "normalized_at" in events[0]["products"][0]
+        assert len(events[-1]["products"]) == 2
+        assert events[-1]["metadata"]["failed_agents"] == 1
+        cache_manager.clear()
+
+    async def test_stream_normalizes_each_product_once(self, mock_discover):
+        """The agent_result events and the merged top-k share one normalization"""
+        cache_manager.clear()
+        service = OrchestratorService()
+        service.fanout = FanoutOrchestrator()
+
+        with patch.object(service.normalizer, "_normalize_single_product",
+                          wraps=service.normalizer._normalize_single_product) as normalize:
+            events = [e async for e in service.orchestrate_stream(AgentSelectRequest(prompt="normalize once"))]
+
+        assert normalize.call_count == 2
+        assert events[0]["products"][0] in events[-1]["products"]
+        cache_manager.clear()
+
+    async def test_identical_streams_share_one_fanout(self, mock_discover):
+        """A stream joining an identical in-flight orchestration gets only the shared complete event"""
+        cache_manager.clear()
+        service = OrchestratorService()
+        service.fanout = FanoutOrchestrator()
+        service.coalescer = RequestCoalescer()
+
+        async def collect():
+            return [e async for e in service.orchestrate_stream(AgentSelectRequest(prompt="shared stream"))]
+
+        leader, follower = await asyncio.gather(collect(), collect())
+
+        assert [e["event"] for e in leader] == ["agent_result"] * 3 + ["complete"]
+        assert [e["event"] for e in follower] == ["complete"]
+        assert follower[0]["metadata"]["coalesced"] is True
+        assert follower[0]["products"] == leader[-1]["products"]
+        assert mock_discover.call_count == 1
+        cache_manager.clear()
+
+    async def test_disconnected_stream_stops_its_fanout(self, mock_discover):
+        cache_manager.clear()
+        service = OrchestratorService()
+        service.fanout = FanoutOrchestrator()
+        service.coalescer = RequestCoalescer()
+        stream = service.orchestrate_stream(AgentSelectRequest(prompt="abandoned stream"))
+
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+
+        assert first["agent_report"]["agent_id"] == "fast"
+        assert service.coalescer.get_stats()["in_flight"] == 0
+        assert cache_manager.get_stats()["size"] == 0
+
+
+class TestSSEHelpers:
+    """Test cases for the SSE formatting and sync bridge"""
+
+    def test_format_sse_event_json_and_multiline(self):
+        """JSON payloads are encoded and HTML is split into data lines"""
+        assert format_sse_event("complete", {"a": 1}) == 'event: complete\ndata: {"a": 1}\n\n'
+        assert format_sse_event("agent_result", "<div>\n</div>") == "event: agent_result\ndata: <div>\ndata: </div>\n\n"
+
+    def test_iterate_async_stream(self):
+        """An async generator can be consumed from sync code"""
+        async def numbers():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        assert list(iterate_async_stream(numbers())) == [0, 1, 2]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the top-k product merge in ProductNormalizer
+"""
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.orchestrator.normalize import ProductNormalizer
+
+pytestmark = pytest.mark.unit
+
+
+def _reference(normalizer, products, max_results):
+    """The original normalize -> dedupe -> sort -> truncate pipeline"""
+    normalized = normalizer.normalize_products(products)
+    return normalizer.truncate_products(
+        normalizer.sort_products(normalizer.deduplicate_products(normalized)), max_results
+    )
+
+
+def _product(product_id, score, price=1.0, name="Product", tenant="t1"):
+    return {"product_id": product_id, "publisher_tenant_id": tenant, "score": score, "price_cpm": price, "name": name}
+
+
+def _ids(products):
+    return [(p["publisher_tenant_id"], p["product_id"], p["score"]) for p in products]
+
+
+class TestTopKProductMerger:
+    """Test cases for TopKProductMerger"""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_full_sort_pipeline(self, seed):
+        """The merge returns exactly what the full normalize/dedupe/sort/truncate did"""
+        rng = random.Random(seed)
+        products = [
+            _product(
+                product_id=f"p{rng.randint(0, 60)}",
+                score=rng.choice([0.1, 0.5, 0.5, 0.9, 1.0]),
+                price=rng.choice([1.0, 2.0, 5.0]),
+                name=rng.choice(["Alpha", "beta", "Gamma"]),
+                tenant=rng.choice(["t1", "t2"])
+            )
+            for _ in range(300)
+        ]
+        products.append({"product_id": "", "publisher_tenant_id": "t1"})
+        products.append({"product_id": "bad", "publisher_tenant_id": "t1", "score": "not a number"})
+        normalizer = ProductNormalizer()
+        max_results = rng.choice([0, 1, 5, 50, 500])
+
+        assert _ids(normalizer.process_products(products, max_results)) == \
+            _ids(_reference(normalizer, products, max_results))
+
+    def test_duplicates_keep_first_highest_score(self):
+        """A later duplicate only replaces a product when its score is strictly higher"""
+        products = [
+            _product("p1", 0.5, name="first"),
+            _product("p1", 0.5, name="second"),
+            _product("p2", 0.4),
+            _product("p1", 0.9, name="third"),
+        ]
+
+        result = ProductNormalizer().process_products(products, 10)
+
+        assert [(p["product_id"], p["name"]) for p in result] == [("p1", "third"), ("p2", "Product")]
+
+    def test_results_folded_in_batches(self):
+        """Agent results can be merged as they arrive"""
+        merger = ProductNormalizer().create_merger(2)
+        merger.add_products([_product("p1", 0.2), _product("p2", 0.3)])
+        merger.add_products([_product("p3", 0.9), _product("p1", 0.8)])
+
+        assert [p["product_id"] for p in merger.results()] == ["p3", "p1"]
+
+    def test_normalized_batches_are_not_renormalized(self):
+        """Products already normalized for streaming are merged as they are"""
+        normalizer = ProductNormalizer()
+        merger = normalizer.create_merger(2)
+        products = normalizer.normalize_products([_product("p1", 0.2), _product("p2", 0.3), _product("p3", 0.9)])
+
+        with patch.object(normalizer, "_normalize_single_product") as normalize:
+            merger.add_normalized_products(products)
+
+        normalize.assert_not_called()
+        assert merger.results() == [products[2], products[1]]
+
+    def test_one_timestamp_per_batch(self):
+        """normalized_at is computed once per batch, not per product"""
+        normalizer = ProductNormalizer()
+        products = [_product(f"p{i}", 0.5) for i in range(50)]
+
+        with patch("src.orchestrator.topk_merge.datetime") as merge_datetime, \
+                patch("src.orchestrator.normalize.datetime") as normalize_datetime:
+            merge_datetime.now.return_value.isoformat.return_value = "2025-01-01T00:00:00+00:00"
+            normalize_datetime.now.return_value.isoformat.return_value = "2025-01-01T00:00:00+00:00"
+            normalizer.process_products(products, 10)
+            normalizer.normalize_products(products)
+
+        assert merge_datetime.now.call_count == 1
+        assert normalize_datetime.now.call_count == 1
+
+    def test_only_top_products_are_normalized(self):
+        """Products that never make the top-k are not normalized"""
+        normalizer = ProductNormalizer()
+        products = [_product(f"p{i}", i / 1000) for i in range(1000)]
+        random.Random(7).shuffle(products)
+
+        with patch.object(normalizer, "_normalize_single_product", wraps=normalizer._normalize_single_product) as spy:
+            result = normalizer.process_products(products, 5)
+
+        assert [p["product_id"] for p in result] == ["p999", "p998", "p997", "p996", "p995"]
+        assert spy.call_count < 100
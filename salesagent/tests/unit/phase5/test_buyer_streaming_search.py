@@ -0,0 +1,47 @@
+"""Test the streaming buyer search partial."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+from flask import Flask
+from api.buyer_ui_router import buyer_ui_bp
+
+
+class TestBuyerStreamingSearch:
+    """Test the streaming search partial wires the grid to the orchestrator's SSE endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client that renders the repository's templates."""
+        templates = os.path.join(os.path.dirname(__file__), "..", "..", "..", "templates")
+        app = Flask(__name__, template_folder=os.path.abspath(templates))
+        app.config['TESTING'] = True
+        app.register_blueprint(buyer_ui_bp)
+        return app.test_client()
+
+    @patch('api.buyer_ui_router.search_products')
+    def test_stream_search_connects_to_orchestrator_stream(self, mock_search, client):
+        """Test GET /buyer/search/stream renders a grid fed by the orchestrator's SSE endpoint."""
+        response = client.get('/buyer/search/stream', query_string={
+            'prompt': 'Sports fans',
+            'max_results': '10',
+            'include_tenant_ids': ['pub1', 'pub2']
+        })
+
+        assert response.status_code == 200
+        html = response.data.decode()
+        assert 'hx-ext="sse"' in html
+        assert ('sse-connect="/buyer/orchestrate/stream?prompt=Sports+fans&amp;max_results=10&amp;format=html'
+                '&amp;include_tenant_ids=pub1&amp;include_tenant_ids=pub2"') in html
+        assert 'sse-swap="agent_result"' in html
+        assert 'sse-swap="complete"' in html
+        mock_search.assert_not_called()
+
+    def test_stream_search_requires_prompt(self, client):
+        """Test GET /buyer/search/stream rejects an empty prompt without streaming."""
+        response = client.get('/buyer/search/stream', query_string={'prompt': ' '})
+
+        assert response.status_code == 200
+        assert b'Please enter a search prompt' in response.data
+        assert b'sse-connect' not in response.data
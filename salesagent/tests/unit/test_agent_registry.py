@@ -0,0 +1,113 @@
+"""
+Unit tests for the cached agent registry
+"""
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.schemas.agent import AgentConfig
+from src.repositories.agent_registry import AgentRegistry
+from src.services.agent_management_service import AgentManagementService
+
+
+def _entry(agent_id, tenant_id, agent_type):
+    agent = AgentConfig(agent_id=agent_id, tenant_id=tenant_id, name=agent_id, type=agent_type)
+    return agent, tenant_id, f"Tenant {tenant_id}"
+
+
+AGENTS = [
+    _entry("t1_local", "t1", "local_ai"),
+    _entry("t1_mcp", "t1", "mcp"),
+    _entry("t2_local", "t2", "local_ai"),
+    _entry("t3_ext", "t3", "external"),
+]
+
+
+@contextmanager
+def _fake_session():
+    yield Mock()
+
+
+class TestAgentRegistry:
+    """Test cases for AgentRegistry"""
+
+    def setup_method(self):
+        self.repository = Mock()
+        self.repository._list_agents_with_session.return_value = list(AGENTS)
+        self.registry = AgentRegistry(self.repository)
+        self.watermark = (3, "2025-01-01 00:00:00")
+
+        patcher_session = patch("src.repositories.agent_registry.get_db_session", _fake_session)
+        patcher_watermark = patch.object(AgentRegistry, "_read_watermark", side_effect=lambda session: self.watermark)
+        self.patchers = [patcher_session, patcher_watermark]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_snapshot_reused_until_configuration_changes(self):
+        """Repeated lookups do not rebuild the snapshot"""
+        for _ in range(5):
+            self.registry.find_agents()
+
+        assert self.repository._list_agents_with_session.call_count == 1
+        assert self.registry.get_stats()["rebuilds"] == 1
+
+    def test_watermark_change_rebuilds(self):
+        """A tenant update moves the watermark and triggers a rebuild"""
+        self.registry.find_agents()
+        self.watermark = (3, "2025-01-01 00:00:05")
+        self.registry.find_agents()
+
+        assert self.repository._list_agents_with_session.call_count == 2
+
+    def test_local_write_version_rebuilds(self):
+        """Agent writes invalidate the snapshot"""
+        self.registry.find_agents()
+        self.registry.invalidate()
+        self.registry.find_agents()
+
+        assert self.repository._list_agents_with_session.call_count == 2
+
+    def test_service_writes_invalidate(self):
+        """Successful agent writes through the management service drop the snapshot"""
+        service = AgentManagementService()
+        service.repository = self.repository
+        service.registry = self.registry
+        self.registry.find_agents()
+
+        self.repository.update_agent_config.return_value = False
+        service.update_agent_config("t1_mcp", "t1", {"name": "renamed"})
+        self.registry.find_agents()
+        assert self.repository._list_agents_with_session.call_count == 1
+
+        self.repository.update_agent_config.return_value = True
+        service.update_agent_config("t1_mcp", "t1", {"name": "renamed"})
+        self.registry.find_agents()
+        assert self.repository._list_agents_with_session.call_count == 2
+
+    def test_max_age_rebuilds(self):
+        """Snapshots older than max_age_seconds are rebuilt"""
+        self.registry.max_age_seconds = 0
+        self.registry.find_agents()
+        self.registry.find_agents()
+
+        assert self.repository._list_agents_with_session.call_count == 2
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({}, ["t1_local", "t1_mcp", "t2_local", "t3_ext"]),
+        ({"include_tenant_ids": ["t1"]}, ["t1_local", "t1_mcp"]),
+        ({"agent_types": ["local_ai"]}, ["t1_local", "t2_local"]),
+        ({"include_tenant_ids": ["t1", "t3"], "agent_types": ["mcp", "external"]}, ["t1_mcp", "t3_ext"]),
+        ({"exclude_tenant_ids": ["t1"]}, ["t2_local", "t3_ext"]),
+        ({"include_agent_ids": ["t2_local", "t3_ext"], "agent_types": ["local_ai"]}, ["t2_local"]),
+        ({"include_tenant_ids": ["missing"]}, []),
+    ])
+    def test_filters(self, filters, expected):
+        """Indexed lookups honour every discovery filter"""
+        result = self.registry.find_agents(**filters)
+
+        assert [agent.agent_id for agent, _, _ in result] == expected
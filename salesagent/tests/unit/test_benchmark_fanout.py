@@ -0,0 +1,49 @@
+"""Smoke test for the fanout benchmark harness."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+SCRIPT = REPO_ROOT / "scripts" / "dev" / "benchmark_fanout.py"
+
+
+def test_benchmark_writes_comparable_json(tmp_path):
+    """A short run against HTTP and MCP stubs produces results a later run can be compared with"""
+    output = tmp_path / "results.json"
+    command = [
+        sys.executable, str(SCRIPT),
+        "--http-agents", "2", "--mcp-agents", "1", "--latency", "uniform:5:15",
+        "--error-rate", "0.2", "--products", "3", "--payload-bytes", "64",
+        "--max-response-products", "2", "--measure-memory", "2",
+        "--rate", "20", "--duration", "0.5", "--output", str(output)
+    ]
+
+    result = subprocess.run(command, capture_output=True, text=True, cwd=REPO_ROOT, timeout=120)
+    assert result.returncode == 0, result.stderr
+
+    data = json.loads(output.read_text())
+    assert data["config"]["rate"] == 20
+    assert [agent["protocol"] for agent in data["config"]["agents"]] == ["http", "http", "mcp"]
+    results = data["results"]
+    assert results["requests"] == 10
+    assert results["outcomes"]["ok"] == 10
+    assert results["latency_ms"]["p50"] <= results["latency_ms"]["p99"]
+    assert results["peak_rss_bytes"] > 0
+    assert results["agent_statuses"]["active"] > 0
+    assert results["truncated_agents"]["product_cap"] == results["agent_statuses"]["active"]
+    assert results["fanout_peak_bytes"]["runs"] == 2
+    assert results["fanout_peak_bytes"]["max"] > 0
+
+    # Comparing a run with itself finds no regression
+    compared = subprocess.run(
+        command[:-2] + ["--output", str(tmp_path / "again.json"), "--baseline", str(output),
+                        "--max-regression", "10"],
+        capture_output=True, text=True, cwd=REPO_ROOT, timeout=120
+    )
+    assert compared.returncode == 0, compared.stderr
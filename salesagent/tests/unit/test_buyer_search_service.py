@@ -0,0 +1,84 @@
+"""Tests for the long-lived buyer search service."""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.buyer_search_service import BuyerSearchService
+from src.orchestrator.runtime import AsyncRuntime
+
+pytestmark = pytest.mark.unit
+
+
+class EchoOrchestrator:
+    """Answers each orchestration with a product naming the request it came from."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def orchestrate(self, request, include_tenant_ids=None, exclude_tenant_ids=None,
+                          include_agent_ids=None, buyer_id=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return {"products": [{
+                "name": request.prompt,
+                "buyer_id": buyer_id,
+                "tenant_ids": include_tenant_ids,
+                "max_results": request.max_results
+            }]}
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def runtime():
+    runtime = AsyncRuntime()
+    yield runtime
+    runtime.shutdown()
+
+
+def test_concurrent_searches_do_not_interfere(runtime):
+    """Concurrent searches each get their own results and leave process state alone."""
+    orchestrator = EchoOrchestrator()
+    service = BuyerSearchService(orchestrator=orchestrator, runtime=runtime, db_config={"type": "sqlite"})
+    environ_before = dict(os.environ)
+    path_before = list(sys.path)
+
+    def search(i):
+        return service.search_products(
+            prompt=f"brief {i}",
+            include_tenant_ids=[f"tenant_{i}"],
+            max_results=i + 1,
+            buyer_id=f"buyer_{i}"
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(search, range(64)))
+
+    for i, products in enumerate(results):
+        assert products == [{
+            "name": f"brief {i}",
+            "buyer_id": f"buyer_{i}",
+            "tenant_ids": [f"tenant_{i}"],
+            "max_results": i + 1
+        }]
+    assert orchestrator.max_active > 1
+    assert dict(os.environ) == environ_before
+    assert sys.path == path_before
+    assert service.get_stats()["searches"] == 64
+    assert service.get_stats()["errors"] == 0
+
+
+def test_falls_back_to_mock_products_without_orchestrator():
+    service = BuyerSearchService()
+
+    products = service.search_products(prompt="video campaign", max_results=5)
+
+    assert [product["id"] for product in products] == ["mock-2"]
+    assert service.get_stats()["mock_searches"] == 1
@@ -0,0 +1,104 @@
+"""Tests for the metrics registry and its Prometheus exposition."""
+
+import pytest
+from flask import Flask
+
+from src.api.performance_monitoring_router import performance_monitoring_bp
+from src.core.metrics import MetricsRegistry
+from src.core.metrics_histogram import Histogram
+from src.orchestrator.fanout import fanout_duration
+from src.orchestrator.performance_monitor import PerformanceMonitor
+
+pytestmark = pytest.mark.unit
+
+
+class TestHistogram:
+    """Test cases for fixed-bucket histograms"""
+
+    def test_quantiles_are_estimated_within_bucket_resolution(self):
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 0.2, 0.5, 1.0))
+        for i in range(1, 101):
+            histogram.observe(i / 100)
+
+        assert histogram.count() == 100
+        assert histogram.mean() == pytest.approx(0.505)
+        assert histogram.quantile(0.5) == pytest.approx(0.5, abs=0.05)
+        assert 0.9 <= histogram.quantile(0.95) <= 1.0
+        assert histogram.quantile(1.0) == 1.0
+
+    def test_summary_merges_label_sets(self):
+        histogram = Histogram("calls_seconds", "Calls", ("agent_id", "status"))
+        histogram.observe(0.01, agent_id="a", status="ok")
+        histogram.observe(0.02, agent_id="a", status="error")
+        histogram.observe(0.03, agent_id="b", status="ok")
+
+        assert histogram.summary(agent_id="a")["count"] == 2
+        assert histogram.summary()["max"] == 0.03
+        assert histogram.summary(agent_id="missing") == {"count": 0}
+
+    def test_rejects_wrong_labels(self):
+        histogram = Histogram("calls_seconds", "Calls", ("agent_id",))
+        with pytest.raises(ValueError):
+            histogram.observe(0.1, tenant_id="t")
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry"""
+
+    def test_get_or_create(self):
+        registry = MetricsRegistry()
+        first = registry.histogram("latency_seconds", "Latency", ("agent_id",))
+
+        assert registry.histogram("latency_seconds", "Latency", ("agent_id",)) is first
+        with pytest.raises(ValueError):
+            registry.counter("latency_seconds", "Latency", ("agent_id",))
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Request latency", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, route="/search")
+        histogram.observe(0.5, route="/search")
+        histogram.observe(2.0, route="/search")
+        registry.counter("calls_total", "Calls", ("call",)).inc(call='say "hi"')
+
+        lines = registry.render_prometheus().splitlines()
+
+        assert "# TYPE latency_seconds histogram" in lines
+        assert 'latency_seconds_bucket{route="/search",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/search",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/search",le="+Inf"} 3' in lines
+        assert 'latency_seconds_sum{route="/search"} 2.55' in lines
+        assert 'latency_seconds_count{route="/search"} 3' in lines
+        assert 'calls_total{call="say \\"hi\\""} 1' in lines
+
+
+def test_performance_summary_uses_histograms():
+    """Duration percentiles come from the histogram rather than sorted raw samples"""
+    monitor = PerformanceMonitor()
+    for duration_ms in (100, 200, 300):
+        metrics = monitor.start_operation()
+        metrics.end_time = metrics.start_time + duration_ms / 1000
+        metrics.agent_response_times = {"agent_1": duration_ms}
+        monitor.end_operation(metrics)
+
+    summary = monitor.get_performance_summary()
+
+    assert monitor.request_latency.count() > 0
+    assert summary["avg_response_time_ms"] == pytest.approx(200)
+    assert 100 <= summary["median_response_time_ms"] <= 300
+    assert monitor.agent_latency.count(agent_id="agent_1") == 3
+
+
+def test_metrics_route_serves_prometheus_text():
+    app = Flask(__name__)
+    app.register_blueprint(performance_monitoring_bp)
+    fanout_duration.observe(0.2)
+
+    response = app.test_client().get("/monitoring/metrics", headers={"Accept": "text/plain;version=0.0.4"})
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    body = response.get_data(as_text=True)
+    assert "# TYPE orchestrator_fanout_duration_seconds histogram" in body
+    assert 'orchestrator_fanout_duration_seconds_bucket{le="+Inf"}' in body
+    assert "# TYPE orchestrator_event_loop_lag_seconds histogram" in body
@@ -0,0 +1,150 @@
+"""Tests for request tracing spans, slow trace retention and OTLP export."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Blueprint, Flask
+
+from src.core.schemas.agent import AgentConfig, AgentSelectRequest
+from src.api.orchestrator_stats_router import orchestrator_stats_bp
+from src.core.tracing import TRACEPARENT_HEADER, Tracer, tracer
+from src.orchestrator.fanout import FanoutOrchestrator
+from src.services.orchestrator_service import OrchestratorService
+
+pytestmark = pytest.mark.unit
+
+
+class TestTracer:
+    """Test cases for Tracer"""
+
+    async def test_spans_nest_across_tasks_and_threads(self):
+        trace_tracer = Tracer(slow_threshold_ms=0)
+
+        def blocking_work():
+            with trace_tracer.span("db.query"):
+                pass
+
+        with trace_tracer.span("orchestrate") as root:
+            with trace_tracer.span("agent.call", agent_id="a1") as child:
+                await asyncio.to_thread(blocking_work)
+            await asyncio.ensure_future(asyncio.sleep(0))
+        assert trace_tracer.current_span() is None
+
+        trace = trace_tracer.get_trace(root.trace_id)
+        spans = {span["name"]: span for span in trace["spans"]}
+        assert spans["orchestrate"]["parent_id"] is None
+        assert spans["agent.call"]["parent_id"] == root.span_id
+        assert spans["db.query"]["parent_id"] == child.span_id
+        assert spans["agent.call"]["attributes"] == {"agent_id": "a1"}
+        assert set(trace_tracer.get_slow_traces()[0]["stages_ms"]) == {"orchestrate", "agent.call", "db.query"}
+
+    def test_only_slow_traces_are_kept(self):
+        trace_tracer = Tracer(slow_threshold_ms=60_000, max_slow_traces=2)
+        with trace_tracer.span("fast"):
+            pass
+
+        assert trace_tracer.get_slow_traces() == []
+        assert trace_tracer.get_stats()["completed_traces"] == 1
+        assert trace_tracer.get_stats()["active_traces"] == 0
+
+    def test_errors_are_recorded(self):
+        trace_tracer = Tracer(slow_threshold_ms=0)
+        with pytest.raises(ValueError):
+            with trace_tracer.span("orchestrate"):
+                raise ValueError("boom")
+
+        assert trace_tracer.get_slow_traces()[0]["error"] == "ValueError: boom"
+
+    def test_continues_remote_traceparent(self):
+        trace_tracer = Tracer(slow_threshold_ms=0)
+        remote = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+        with trace_tracer.span("agent.select_products", traceparent=remote) as span:
+            pass
+
+        assert span.trace_id == "0af7651916cd43dd8448eb211c80319c"
+        assert span.parent_id == "b7ad6b7169203331"
+        assert trace_tracer.get_trace(span.trace_id) is not None
+
+    def test_otlp_file_export(self, tmp_path):
+        export_path = tmp_path / "traces.jsonl"
+        trace_tracer = Tracer(slow_threshold_ms=60_000, export_path=str(export_path))
+        with trace_tracer.span("orchestrate", buyer_id="b1") as root:
+            with trace_tracer.span("normalize", products=3):
+                pass
+
+        lines = export_path.read_text().splitlines()
+        assert len(lines) == 1
+        scope_spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]
+        spans = {span["name"]: span for span in scope_spans["spans"]}
+        assert spans["normalize"]["traceId"] == root.trace_id
+        assert spans["normalize"]["parentSpanId"] == root.span_id
+        assert spans["normalize"]["attributes"] == [{"key": "products", "value": {"intValue": "3"}}]
+        assert int(spans["orchestrate"]["endTimeUnixNano"]) >= int(spans["orchestrate"]["startTimeUnixNano"])
+
+
+def _agent(agent_id: str) -> AgentConfig:
+    return AgentConfig(agent_id=agent_id, tenant_id=f"tenant_{agent_id}", name=agent_id, type="local_ai")
+
+
+async def _fake_call(self, agent, tenant_id, request):
+    await asyncio.sleep(0.01)
+    if agent.agent_id == "broken":
+        raise Exception("agent exploded")
+    return [{"product_id": f"p_{agent.agent_id}", "name": agent.agent_id, "price_cpm": 1.0}], 10
+
+
+@patch.object(FanoutOrchestrator, "_call_agent_provider", _fake_call)
+@patch("src.orchestrator.fanout.agent_management_service.discover_active_agents",
+       return_value=[(_agent("ok"), "tenant_ok", "OK"), (_agent("broken"), "tenant_broken", "Broken")])
+async def test_orchestration_is_one_trace(mock_discover, monkeypatch):
+    """Fanout, each agent call and normalization are spans of the trace named in the response"""
+    monkeypatch.setattr(tracer, "slow_threshold_ms", 0)
+
+    response = await OrchestratorService().orchestrate(AgentSelectRequest(prompt="tracing one trace"))
+
+    trace = tracer.get_trace(response["metadata"]["trace_id"])
+    spans = {}
+    for span in trace["spans"]:
+        spans.setdefault(span["name"], []).append(span)
+    assert trace["name"] == "orchestrate"
+    assert spans["fanout"][0]["parent_id"] == spans["orchestrate"][0]["span_id"]
+    agent_calls = {span["attributes"]["agent_id"]: span for span in spans["agent.call"]}
+    assert {span["parent_id"] for span in agent_calls.values()} == {spans["fanout"][0]["span_id"]}
+    assert agent_calls["broken"]["error"] == "Exception: agent exploded"
+    assert agent_calls["ok"]["attributes"]["products"] == 1
+    assert "normalize" in spans
+
+
+async def test_local_agent_request_carries_traceparent():
+    fanout = FanoutOrchestrator()
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"products": [], "execution_time_ms": 1}
+
+    with patch.object(fanout.http_pool, "post", return_value=response) as mock_post:
+        with tracer.span("agent.call") as span:
+            await fanout._call_local_agent(_agent("a1"), "t1", AgentSelectRequest(prompt="x"))
+
+    assert mock_post.call_args.kwargs["headers"] == {TRACEPARENT_HEADER: span.traceparent()}
+
+
+def test_trace_routes_require_super_admin():
+    app = Flask(__name__)
+    app.secret_key = "test"
+    auth_bp = Blueprint("auth", __name__)
+    auth_bp.add_url_rule("/login", "login", lambda: "login")
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(orchestrator_stats_bp)
+    client = app.test_client()
+
+    assert client.get("/monitoring/traces").status_code == 302
+    assert client.get("/monitoring/traces/0af7651916cd43dd8448eb211c80319c").status_code == 302
+
+    with client.session_transaction() as session:
+        session["user"] = "buyer@example.com"
+    with patch("src.admin.utils.is_super_admin", return_value=False):
+        assert client.get("/monitoring/traces").status_code == 403
+    with patch("src.admin.utils.is_super_admin", return_value=True):
+        assert client.get("/monitoring/traces").status_code == 200